@@ -0,0 +1,181 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from docx_merge import merge_docx
+from engine_registry import engine_lock, load_engine
+from scratch_space import scratch_space
+
+# 환경변수 기반 설정
+ADOBE_MAX_FILE_MB = int(os.environ.get('ADOBE_MAX_FILE_MB', '100'))
+# 청크 하나의 최대 크기 (Adobe 제한보다 여유 있게)
+ADOBE_CHUNK_MAX_MB = int(os.environ.get('ADOBE_CHUNK_MAX_MB', '90'))
+ADOBE_CHUNK_PAGES = int(os.environ.get('ADOBE_CHUNK_PAGES', '40'))
+# 이 페이지 수를 넘으면 한 번에 보내지 않고 청크로 나눠 동시에 변환
+ADOBE_CHUNK_THRESHOLD_PAGES = int(os.environ.get('ADOBE_CHUNK_THRESHOLD_PAGES', '80'))
+ADOBE_CHUNK_CONCURRENCY = int(os.environ.get('ADOBE_CHUNK_CONCURRENCY', '3'))
+# 실패한 청크를 반으로 나눠 다시 보내는 최대 단계 수 (1페이지 청크는 그대로 재시도)
+ADOBE_CHUNK_RETRIES = int(os.environ.get('ADOBE_CHUNK_RETRIES', '2'))
+
+_MB = 1024 * 1024
+
+
+def should_chunk(pdf_path, page_count=None):
+    """Adobe 크기 제한을 넘거나 페이지가 많아 청크 변환이 유리한지 판단"""
+    if os.path.getsize(pdf_path) > ADOBE_MAX_FILE_MB * _MB:
+        return True
+    if page_count is None:
+        with engine_lock, load_engine('fitz').open(pdf_path) as doc:
+            page_count = doc.page_count
+    return page_count > ADOBE_CHUNK_THRESHOLD_PAGES
+
+
+def plan_chunks(page_count, file_size, max_pages=None, max_bytes=None):
+    """
+    페이지 범위 분할 계획 (페이지당 평균 크기로 청크 크기 한도도 반영)
+
+    Returns:
+        list: [(시작, 끝), ...] 0부터 시작, 끝 포함
+    """
+    max_pages = max_pages or ADOBE_CHUNK_PAGES
+    max_bytes = max_bytes or ADOBE_CHUNK_MAX_MB * _MB
+    if page_count <= 0:
+        return []
+    per_page = max(1, file_size // page_count)
+    pages_per_chunk = max(1, min(max_pages, max_bytes // per_page))
+    return [(start, min(start + pages_per_chunk, page_count) - 1)
+            for start in range(0, page_count, pages_per_chunk)]
+
+
+def split_pdf(pdf_path, ranges, output_dir, max_bytes=None):
+    """
+    PyMuPDF로 페이지 범위별 PDF 생성
+
+    저장한 청크가 크기 한도를 넘으면(이미지가 특정 페이지에 몰린 경우) 반으로 다시 나눈다.
+
+    Returns:
+        list: 순서대로 정렬된 (시작, 끝, 경로)
+    """
+    fitz = load_engine('fitz')
+    max_bytes = max_bytes or ADOBE_CHUNK_MAX_MB * _MB
+    chunks = []
+    with fitz.open(pdf_path) as source:
+        pending = list(ranges)
+        while pending:
+            start, end = pending.pop(0)
+            path = os.path.join(output_dir, f'chunk_{start + 1:05d}_{end + 1:05d}.pdf')
+            with fitz.open() as chunk:
+                chunk.insert_pdf(source, from_page=start, to_page=end)
+                chunk.save(path, garbage=3, deflate=True)
+            if os.path.getsize(path) > max_bytes and end > start:
+                os.remove(path)
+                middle = (start + end) // 2
+                pending[:0] = [(start, middle), (middle + 1, end)]
+                continue
+            chunks.append((start, end, path))
+    return chunks
+
+
+def export_docx_with_adobe(pdf_path, docx_path):
+    """Adobe ExportPDF API로 PDF 1개를 DOCX로 변환 (SDK 4.x)"""
+    adobe = load_engine('adobe_sdk')
+    credentials = adobe.ServicePrincipalCredentials(
+        client_id=os.environ['ADOBE_CLIENT_ID'],
+        client_secret=os.environ['ADOBE_CLIENT_SECRET'],
+    )
+    pdf_services = adobe.PDFServices(credentials=credentials)
+    with open(pdf_path, 'rb') as f:
+        input_asset = pdf_services.upload(input_stream=f.read(), mime_type=adobe.PDFServicesMediaType.PDF)
+    params = adobe.ExportPDFParams(target_format=adobe.ExportPDFTargetFormat.DOCX)
+    job = adobe.ExportPDFJob(input_asset=input_asset, export_pdf_params=params)
+    location = pdf_services.submit(job)
+    response = pdf_services.get_job_result(location, adobe.ExportPDFResult)
+    stream_asset = pdf_services.get_content(response.get_result().get_asset())
+    with open(docx_path, 'wb') as f:
+        f.write(stream_asset.get_input_stream())
+
+
+def chunked_pdf_to_docx(input_path, output_path, exporter=None, concurrency=None, max_pages=None, max_bytes=None,
+                        retries=None):
+    """
+    큰 PDF를 페이지 범위로 나눠 동시에 변환한 뒤 순서대로 병합
+
+    변환에 실패한 청크는 반으로 나눠(1페이지면 그대로) 최대 retries 단계까지 다시 보낸 뒤 포기한다.
+
+    Args:
+        exporter: exporter(pdf_path, docx_path) - 청크 1개 변환 (기본값: Adobe ExportPDF)
+        concurrency: 동시에 진행할 청크 수 (기본값: ADOBE_CHUNK_CONCURRENCY)
+        retries: 실패한 청크를 나눠 재시도할 최대 단계 수 (기본값: ADOBE_CHUNK_RETRIES)
+
+    Returns:
+        tuple: (성공 여부, 정보 dict - 청크 수, 소요 시간 또는 오류)
+    """
+    exporter = exporter or export_docx_with_adobe
+    concurrency = concurrency or ADOBE_CHUNK_CONCURRENCY
+    retries = ADOBE_CHUNK_RETRIES if retries is None else retries
+    info = {'retries': 0}
+    started = time.perf_counter()
+
+    with scratch_space('adobe_chunks') as scratch, \
+            scratch.subdir(prefix='chunks_', size_hint=os.path.getsize(input_path)) as work_dir:
+        # 분할만 PyMuPDF 잠금 안에서 수행 (청크 업로드/변환 동안에는 잠금을 잡지 않음)
+        with engine_lock:
+            with load_engine('fitz').open(input_path) as doc:
+                page_count = doc.page_count
+            ranges = plan_chunks(page_count, os.path.getsize(input_path), max_pages, max_bytes)
+            chunks = split_pdf(input_path, ranges, work_dir, max_bytes)
+        info['chunks'] = len(chunks)
+        print(f"📦 Adobe 청크 변환: {page_count}페이지 -> {len(chunks)}개 청크 (동시 {concurrency}개)")
+
+        failures = []
+        lock = threading.Lock()
+
+        def export_with_retry(chunk, level):
+            # 성공하면 페이지 순서대로 된 DOCX 경로 목록을 돌려주고, 재시도까지 실패하면 마지막 예외를 던짐
+            start, end, pdf_path = chunk
+            docx_path = os.path.splitext(pdf_path)[0] + '.docx'
+            try:
+                exporter(pdf_path, docx_path)
+                return [docx_path]
+            except Exception as e:
+                if level >= retries:
+                    raise
+                print(f"🔁 청크 {start + 1}-{end + 1}페이지 변환 실패, 나눠서 재시도: {getattr(e, 'message', str(e))}")
+            with lock:
+                info['retries'] += 1
+            middle = (start + end) // 2
+            ranges = [(start, middle), (middle + 1, end)] if end > start else [(start, end)]
+            retry_dir = os.path.join(work_dir, f'retry_{level + 1}')
+            os.makedirs(retry_dir, exist_ok=True)
+            with engine_lock:
+                pieces = split_pdf(input_path, ranges, retry_dir, max_bytes)
+            return [path for piece in pieces for path in export_with_retry(piece, level + 1)]
+
+        def export(chunk):
+            start, end, _ = chunk
+            try:
+                return export_with_retry(chunk, 0)
+            except Exception as e:
+                with lock:
+                    failures.append((start, {'pages': f'{start + 1}-{end + 1}',
+                                             'message': getattr(e, 'message', str(e))}))
+                return None
+
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='adobe-chunk') as executor:
+            # map은 제출 순서대로 결과를 돌려주므로 병합 순서가 보장됨
+            parts = [path for paths in executor.map(export, chunks) if paths for path in paths]
+
+        if failures or not parts:
+            info['error'] = 'CHUNK_EXPORT_FAILED'
+            # 재시도 때문에 실패 순서가 달라지므로 페이지 순서로 보고
+            failures = [failure for _, failure in sorted(failures, key=lambda item: item[0])]
+            info['failures'] = failures
+            print(f"❌ Adobe 청크 변환 실패: {failures}")
+            return False, info
+
+        merge_docx(parts, output_path)
+
+    info['seconds'] = round(time.perf_counter() - started, 2)
+    print(f"✅ Adobe 청크 변환 완료: {len(chunks)}개 청크, {info['seconds']}s")
+    return True, info
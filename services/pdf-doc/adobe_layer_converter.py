@@ -1,7 +1,7 @@
 import os
 import json
 import logging
-import zipfile
+import shutil
 import tempfile
 import time
 import subprocess
@@ -9,6 +9,11 @@ import sys
 from typing import Dict, List, Any, Optional
 from dotenv import load_dotenv
 
+from scratch_space import scratch_space, scratch_dir
+from extract_archive import ExtractArchive
+from document_ir import cached_source_path
+from html_layer_writer import HtmlLayerBuilder
+
 # .env 파일 로드
 load_dotenv()
 
@@ -330,7 +335,7 @@ class AdobeLayerConverter:
                     pix = None
             
             doc.close()
-            return {'json_data': extracted_data, 'images': {}, 'extract_dir': None}
+            return {'json_data': extracted_data, 'images': {}, 'archive': None}
             
         except ImportError:
             logging.warning("PyMuPDF 라이브러리가 설치되지 않음")
@@ -354,6 +359,7 @@ class AdobeLayerConverter:
                     for char in chars:
                         element = {
                             'Path': '/Text',
+                            'Page': page_num,
                             'Text': char['text'],
                             'Bounds': {
                                 'x': char['x0'],
@@ -368,7 +374,7 @@ class AdobeLayerConverter:
                         }
                         extracted_data['elements'].append(element)
             
-            return {'json_data': extracted_data, 'images': {}, 'extract_dir': None}
+            return {'json_data': extracted_data, 'images': {}, 'archive': None, 'source': 'pdfplumber'}
             
         except ImportError:
             logging.warning("pdfplumber 라이브러리가 설치되지 않음")
@@ -406,7 +412,7 @@ class AdobeLayerConverter:
                 ]
             }
             
-            return {'json_data': extracted_data, 'images': {}, 'extract_dir': None}
+            return {'json_data': extracted_data, 'images': {}, 'archive': None}
             
         except Exception as e:
             logging.error(f"기본 추출 방법도 실패: {e}")
@@ -418,6 +424,19 @@ class AdobeLayerConverter:
             logging.error(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
             return None
         
+        # 같은 PDF를 다시 변환하면 보관해 둔 Extract 결과 ZIP을 그대로 스트림으로 읽음 (Adobe 호출 생략)
+        cached_zip = cached_source_path(pdf_path, 'adobe_extract', '.zip')
+        if cached_zip and os.path.exists(cached_zip):
+            try:
+                logging.info("♻️ 보관된 Adobe 추출 결과 사용")
+                return self._archive_result(ExtractArchive(cached_zip))
+            except Exception as e:
+                logging.warning(f"보관된 Adobe 추출 결과를 읽지 못함 - 다시 추출: {e}")
+                try:
+                    os.remove(cached_zip)
+                except OSError:
+                    pass
+        
         # 1단계: SDK 가용성 실시간 확인 및 자동 복구
         if self._ensure_sdk_availability():
             try:
@@ -441,41 +460,27 @@ class AdobeLayerConverter:
                 # 작업 실행
                 result = extract_pdf_operation.execute(self.execution_context)
                 
-                # 임시 ZIP 파일로 저장
-                temp_zip_path = tempfile.mktemp(suffix='.zip')
-                result.save_as(temp_zip_path)
-                
-                # ZIP 파일 압축 해제
-                extract_dir = tempfile.mkdtemp()
-                with zipfile.ZipFile(temp_zip_path, 'r') as zip_ref:
-                    zip_ref.extractall(extract_dir)
+                # 임시 ZIP 파일로 저장 (SDK가 경로로만 저장하므로 작업 스크래치 디렉토리에 저장)
+                zip_fd, temp_zip_path = tempfile.mkstemp(suffix='.zip', dir=scratch_dir())
+                os.close(zip_fd)
+                try:
+                    result.save_as(temp_zip_path)
+                except Exception:
+                    os.unlink(temp_zip_path)
+                    raise
                 
-                # JSON 파일 읽기
-                json_file_path = os.path.join(extract_dir, 'structuredData.json')
-                if os.path.exists(json_file_path):
-                    with open(json_file_path, 'r', encoding='utf-8') as json_file:
-                        extracted_data = json.load(json_file)
+                # 압축 해제 없이 ZIP에서 바로 읽기 (요소와 그림은 HTML 작성 시 필요할 때 읽음)
+                # 캐시가 켜져 있으면 다음 변환을 위해 캐시 폴더로 옮기고, 아니면 열자마자 삭제
+                if cached_zip:
+                    tmp_path = f'{cached_zip}.{os.getpid()}.tmp'
+                    shutil.move(temp_zip_path, tmp_path)
+                    os.replace(tmp_path, cached_zip)
+                    archive = ExtractArchive(cached_zip)
                 else:
-                    logging.error("추출된 JSON 파일을 찾을 수 없습니다.")
-                    raise Exception("JSON 파일 없음")
-                
-                # 이미지 파일들도 포함
-                figures_dir = os.path.join(extract_dir, 'figures')
-                images = {}
-                if os.path.exists(figures_dir):
-                    for img_file in os.listdir(figures_dir):
-                        img_path = os.path.join(figures_dir, img_file)
-                        images[img_file] = img_path
-                
-                # 정리
-                os.unlink(temp_zip_path)
-                
+                    archive = ExtractArchive(temp_zip_path, remove=True)
+                result = self._archive_result(archive)
                 logging.info("✅ Adobe SDK 추출 성공!")
-                return {
-                    'json_data': extracted_data,
-                    'images': images,
-                    'extract_dir': extract_dir
-                }
+                return result
                 
             except ServiceApiException as e:
                 logging.error(f"Adobe SDK ServiceApiException 발생:")
@@ -520,6 +525,26 @@ class AdobeLayerConverter:
         logging.error("🚨 모든 추출 방법 실패 - 응급 모드 활성화")
         return self._emergency_fallback(pdf_path)
     
+    @staticmethod
+    def _archive_result(archive: ExtractArchive) -> Dict[str, Any]:
+        """Extract 결과 ZIP 리더를 추출 결과 dict로 (structuredData.json이 없으면 예외)"""
+        try:
+            if not archive.has_structured_data():
+                logging.error("추출된 JSON 파일을 찾을 수 없습니다.")
+                raise Exception("JSON 파일 없음")
+            images = archive.figures()
+        except Exception:
+            archive.close()
+            raise
+        return {
+            # structuredData.json은 HTML 작성 시 스트림으로 한 번만 순회
+            'json_data': None,
+            'elements': archive.iter_elements(),
+            'images': images,
+            'archive': archive,
+            'source': 'adobe'
+        }
+    
     def _emergency_fallback(self, pdf_path: str) -> Dict[str, Any]:
         """절대 실패하지 않는 응급 대체 방법"""
         logging.info("🆘 응급 모드: 기본 구조 생성")
@@ -564,7 +589,51 @@ class AdobeLayerConverter:
         return {
             'json_data': emergency_data,
             'images': {},
-            'extract_dir': None
+            'archive': None
+        }
+    
+    def _text_element(self, element: Dict[str, Any]) -> Dict[str, Any]:
+        """텍스트 요소 하나의 내용, 좌표, 스타일"""
+        # 바운딩 박스 좌표
+        bounds = element.get('Bounds', {})
+        
+        # 스타일 정보
+        font_info = element.get('Font', {})
+        
+        return {
+            'page': element.get('Page', 0),
+            'text': element.get('Text', ''),
+            'bounds': {
+                'x': bounds.get('x', 0),
+                'y': bounds.get('y', 0),
+                'width': bounds.get('width', 0),
+                'height': bounds.get('height', 0)
+            },
+            'style': {
+                'font_name': font_info.get('name', ''),
+                'font_size': font_info.get('size', 12),
+                'font_weight': font_info.get('weight', 'normal'),
+                'color': element.get('TextColor', '#000000')
+            }
+        }
+    
+    def _figure_element(self, element: Dict[str, Any]) -> Dict[str, Any]:
+        """이미지/도형 요소 하나의 좌표와 그림 파일 경로"""
+        # 바운딩 박스 좌표
+        bounds = element.get('Bounds', {})
+        
+        # 이미지 파일 경로
+        image_path = element.get('filePaths', [])
+        
+        return {
+            'page': element.get('Page', 0),
+            'bounds': {
+                'x': bounds.get('x', 0),
+                'y': bounds.get('y', 0),
+                'width': bounds.get('width', 0),
+                'height': bounds.get('height', 0)
+            },
+            'image_path': image_path[0] if image_path else None
         }
     
     def parse_text_elements(self, json_data: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -572,36 +641,9 @@ class AdobeLayerConverter:
         text_elements = []
         
         try:
-            elements = json_data.get('elements', [])
-            
-            for element in elements:
+            for element in json_data.get('elements', []):
                 if element.get('Path', '').endswith('/Text'):
-                    # 텍스트 내용
-                    text_content = element.get('Text', '')
-                    
-                    # 바운딩 박스 좌표
-                    bounds = element.get('Bounds', {})
-                    
-                    # 스타일 정보
-                    font_info = element.get('Font', {})
-                    
-                    text_element = {
-                        'text': text_content,
-                        'bounds': {
-                            'x': bounds.get('x', 0),
-                            'y': bounds.get('y', 0),
-                            'width': bounds.get('width', 0),
-                            'height': bounds.get('height', 0)
-                        },
-                        'style': {
-                            'font_name': font_info.get('name', ''),
-                            'font_size': font_info.get('size', 12),
-                            'font_weight': font_info.get('weight', 'normal'),
-                            'color': element.get('TextColor', '#000000')
-                        }
-                    }
-                    
-                    text_elements.append(text_element)
+                    text_elements.append(self._text_element(element))
                     
         except Exception as e:
             logging.error(f"텍스트 요소 파싱 오류: {e}")
@@ -613,214 +655,83 @@ class AdobeLayerConverter:
         figure_elements = []
         
         try:
-            elements = json_data.get('elements', [])
-            
-            for element in elements:
+            for element in json_data.get('elements', []):
                 if element.get('Path', '').endswith('/Figure'):
-                    # 바운딩 박스 좌표
-                    bounds = element.get('Bounds', {})
-                    
-                    # 이미지 파일 경로
-                    image_path = element.get('filePaths', [])
-                    
-                    figure_element = {
-                        'bounds': {
-                            'x': bounds.get('x', 0),
-                            'y': bounds.get('y', 0),
-                            'width': bounds.get('width', 0),
-                            'height': bounds.get('height', 0)
-                        },
-                        'image_path': image_path[0] if image_path else None
-                    }
-                    
-                    figure_elements.append(figure_element)
+                    figure_elements.append(self._figure_element(element))
                     
         except Exception as e:
             logging.error(f"도형 요소 파싱 오류: {e}")
             
         return figure_elements
     
-    def generate_html_layer(self, pdf_path: str, output_dir: str = None) -> Optional[str]:
-        """레이어 결합 방식으로 HTML 파일 생성"""
+    @staticmethod
+    def _parsed_elements(elements):
+        """요소 스트림 (structuredData.json 파싱 오류가 나면 중간까지 읽은 요소만 사용)"""
+        iterator = iter(elements)
+        while True:
+            try:
+                element = next(iterator)
+            except StopIteration:
+                return
+            except Exception as e:
+                logging.error(f"추출 요소 파싱 오류: {e}")
+                return
+            yield element
+    
+    def _add_figure(self, layer: HtmlLayerBuilder, figure: Dict[str, Any], images: Dict[str, str], archive) -> None:
+        # filePaths는 'figures/파일명' 형식, images는 파일명 -> ZIP 항목 이름
+        name = os.path.basename(figure['image_path']) if figure.get('image_path') else None
+        if not name or name not in images or archive is None:
+            return
+        bounds = figure['bounds']
+        layer.add_figure(figure['page'], name, bounds['x'], bounds['y'], bounds['width'], bounds['height'],
+                         archive.read(images[name]))
+    
+    def generate_html_layer(self, pdf_path: str, output_dir: str = None, compress: bool = None,
+                            split_pages: int = None) -> Optional[str]:
+        """레이어 결합 방식으로 HTML 파일 생성 (추출 임시 파일은 완료 후 삭제)
+
+        compress/split_pages: gzip 저장, 페이지별 분할 기준 (기본값은 html_layer_writer 환경변수 설정)
+        """
+        with scratch_space('adobe_layer'):
+            return self._generate_html_layer(pdf_path, output_dir, compress, split_pages)
+    
+    def _generate_html_layer(self, pdf_path: str, output_dir: str = None, compress: bool = None,
+                             split_pages: int = None) -> Optional[str]:
         if output_dir is None:
             output_dir = os.path.join(os.path.dirname(pdf_path), 'layer_output')
         
         os.makedirs(output_dir, exist_ok=True)
         
-        # PDF 데이터 추출
+        # PDF 데이터 추출 (Adobe 결과 ZIP은 캐시 폴더에 보관되어 같은 PDF를 다시 변환하면 재사용)
         extracted_data = self.extract_pdf_data(pdf_path)
         if not extracted_data:
             return None
         
-        json_data = extracted_data['json_data']
+        # Adobe 결과는 structuredData.json 스트림에서 요소를 하나씩 읽음 (대체 방법은 json_data)
+        elements = extracted_data.get('elements')
+        if elements is None:
+            elements = (extracted_data.get('json_data') or {}).get('elements', [])
         images = extracted_data['images']
+        archive = extracted_data.get('archive')
         
-        # 텍스트 및 이미지 요소 파싱
-        text_elements = self.parse_text_elements(json_data)
-        figure_elements = self.parse_figure_elements(json_data)
-        
-        # HTML 생성
-        html_content = self._generate_html_content(
-            text_elements, figure_elements, images, output_dir
-        )
-        
-        # HTML 파일 저장 (BOM 포함하여 Word 호환성 향상)
-        html_file_path = os.path.join(output_dir, 'layered_document.html')
-        with open(html_file_path, 'w', encoding='utf-8-sig') as html_file:
-            html_file.write(html_content)
+        # 요소를 읽는 대로 마크업과 그림 파일을 기록 (문서 전체 IR이나 그림 bytes를 모아 두지 않음,
+        # BOM 포함하여 Word 호환성 향상). 실패하면 이번에 만든 파일은 모두 삭제됨
+        try:
+            with HtmlLayerBuilder(output_dir, compress, split_pages) as layer:
+                for element in self._parsed_elements(elements):
+                    path = element.get('Path', '')
+                    if path.endswith('/Text'):
+                        text = self._text_element(element)
+                        bounds = text['bounds']
+                        layer.add_text(text['page'], bounds['x'], bounds['y'], bounds['width'], bounds['height'],
+                                       text['style'], text['text'])
+                    elif path.endswith('/Figure'):
+                        self._add_figure(layer, self._figure_element(element), images, archive)
+                html_file_path = layer.finish()
+        finally:
+            if archive is not None:
+                archive.close()
         
         logging.info(f"레이어 결합 HTML 파일이 생성되었습니다: {html_file_path}")
         return html_file_path
-    
-    def _generate_html_content(self, text_elements: List[Dict], figure_elements: List[Dict], 
-                              images: Dict[str, str], output_dir: str) -> str:
-        """HTML 콘텐츠 생성 - Word 호환성 개선"""
-        
-        # 이미지 파일들을 output_dir로 복사
-        import shutil
-        copied_images = {}
-        for img_name, img_path in images.items():
-            dest_path = os.path.join(output_dir, img_name)
-            shutil.copy2(img_path, dest_path)
-            copied_images[img_name] = img_name
-        
-        # Word 호환성을 위한 HTML 구조 개선
-        html_content = """
-<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
-<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="ko" lang="ko">
-<head>
-    <meta http-equiv="Content-Type" content="text/html; charset=utf-8" />
-    <meta name="ProgId" content="Word.Document" />
-    <meta name="Generator" content="Microsoft Word" />
-    <meta name="Originator" content="Microsoft Word" />
-    <title>레이어 결합 문서</title>
-    <style type="text/css">
-        /* Word 호환성을 위한 기본 스타일 */
-        body {
-            margin: 0pt;
-            padding: 12pt;
-            font-family: 'Malgun Gothic', '맑은 고딕', Arial, sans-serif;
-            font-size: 11pt;
-            background-color: white;
-            color: black;
-            line-height: 115%;
-            word-wrap: break-word;
-            -ms-word-wrap: break-word;
-        }
-        
-        .document-container {
-            position: relative;
-            background-color: white;
-            margin: 0 auto;
-            width: 210mm;
-            min-height: 297mm;
-            page-break-inside: avoid;
-        }
-        
-        .text-layer {
-            position: absolute;
-            font-family: inherit;
-            white-space: pre-wrap;
-            word-wrap: break-word;
-            -ms-word-wrap: break-word;
-            overflow: visible;
-        }
-        
-        .figure-layer {
-            position: absolute;
-            overflow: visible;
-        }
-        
-        .figure-layer img {
-            width: 100%;
-            height: 100%;
-            border: none;
-        }
-        
-        .search-highlight {
-            background-color: yellow;
-        }
-        
-        /* Word 호환 테이블 스타일 */
-        table {
-            border-collapse: collapse;
-            width: 100%;
-        }
-        
-        td, th {
-            border: 1pt solid black;
-            padding: 2pt;
-            vertical-align: top;
-        }
-        
-        /* 인쇄 및 Word 호환성 */
-        @media print {
-            body {
-                background-color: white;
-                padding: 0;
-            }
-            .document-container {
-                width: auto;
-                min-height: auto;
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="document-container">
-"""
-        
-        # 이미지 레이어 추가
-        for figure in figure_elements:
-            bounds = figure['bounds']
-            img_path = figure.get('image_path')
-            
-            if img_path and img_path in copied_images:
-                html_content += f"""
-        <div class="figure-layer" style="
-            left: {bounds['x']}px;
-            top: {bounds['y']}px;
-            width: {bounds['width']}px;
-            height: {bounds['height']}px;
-        ">
-            <img src="{copied_images[img_path]}" alt="Figure" />
-        </div>
-"""
-        
-        # 텍스트 레이어 추가
-        for text_elem in text_elements:
-            bounds = text_elem['bounds']
-            style = text_elem['style']
-            text = text_elem['text']
-            
-            # HTML 엔티티 이스케이프 (Word 호환성 향상)
-            import html
-            escaped_text = html.escape(text, quote=True)
-            
-            # 폰트명도 안전하게 처리
-            safe_font_name = html.escape(style['font_name'], quote=True) if style['font_name'] else 'Arial'
-            
-            html_content += f"""
-        <div class="text-layer" style="
-            left: {bounds['x']}px;
-            top: {bounds['y']}px;
-            width: {bounds['width']}px;
-            height: {bounds['height']}px;
-            font-family: '{safe_font_name}';
-            font-size: {style['font_size']}px;
-            font-weight: {style['font_weight']};
-            color: {style['color']};
-        ">{escaped_text}</div>
-"""
-        
-        html_content += """
-    </div>
-    
-    <!-- Word 호환성을 위해 JavaScript 제거 -->
-    <!-- 검색 기능은 Word의 기본 찾기 기능 사용 -->
-    
-</body>
-</html>
-"""
-        
-        return html_content
\ No newline at end of file
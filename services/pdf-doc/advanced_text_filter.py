@@ -17,6 +17,7 @@ NUKE_TOKENS = [
 LONG_REPETITIVE_PATTERN = re.compile(r"(해랍북스|DIAT|ITO|수험서|출간사).{0,50}(해랍북스|DIAT|ITO|수험서|출간사)")
 TABLE_METADATA_PATTERN = re.compile(r"^(교재명|출간사|가격|대상|비고)\s*[:：]?\s*")
 REPETITIVE_NUMBERS = re.compile(r"\d{1,2}[,-]\d{1,2}[급단계]")
+HANGUL_PATTERN = re.compile(r"[가-힣]")
 
 # 새로운 강화된 필터링 함수 추가
 def remove_long_repetitive_content(lines: list[str]) -> list[str]:
@@ -75,8 +76,7 @@ def hangul_ratio(line: str) -> float:
     """한글 비율 계산"""
     if not line.strip():
         return 0.0
-    hangul_pattern = re.compile(r"[가-힣]")
-    h = len(hangul_pattern.findall(line))
+    h = len(HANGUL_PATTERN.findall(line))
     return h / max(1, len(line))
 
 def early_block_filter(raw_text: str) -> list[str]:
@@ -107,13 +107,13 @@ def ui_noise_score(line: str) -> int:
     line_lower = line.lower()
     
     # NUKE 토큰 체크
-    for token in NUKE_TOKENS:
-        if token.lower() in line_lower:
+    for token in NUKE_TOKENS_LOWER:
+        if token in line_lower:
             score += 10
     
     # 강한 UI 키워드 체크
-    for keyword in STRONG_UI_KEYWORDS:
-        if keyword.lower() in line_lower:
+    for keyword in STRONG_UI_KEYWORDS_LOWER:
+        if keyword in line_lower:
             score += 5
     
     # 반복 패턴 체크
@@ -280,4 +280,8 @@ NOISE_TRIGGER_KEYWORDS = [
     "변환", "파일", "pptx", "pdf", "템플릿", "업데이트",
     # 새로 추가
     "해랍북스", "수험서", "출간사", "교재명", "도서목록"
-]
\ No newline at end of file
+]
+
+# 소문자 변환을 라인마다 반복하지 않도록 미리 계산 (모듈 로드 시 1회)
+NUKE_TOKENS_LOWER = tuple(token.lower() for token in NUKE_TOKENS)
+STRONG_UI_KEYWORDS_LOWER = tuple(keyword.lower() for keyword in STRONG_UI_KEYWORDS)
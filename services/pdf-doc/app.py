@@ -1,51 +1,46 @@
+# 부팅 시간 측정을 위해 가장 먼저 import
+from engine_registry import lazy_module, load_engine, engine_available, engine_lock, boot_report, mark_boot_complete
 from flask import Flask, request, render_template, send_file, flash, redirect, url_for, jsonify
 from flask_cors import CORS
 import os
 import tempfile
 from werkzeug.utils import secure_filename
 from pdf2image import convert_from_path
-from pptx import Presentation
-from pptx.util import Inches
 import io
 from PIL import Image
 import json
 from dotenv import load_dotenv
 from docx import Document
 from docx.shared import Pt, Inches as DocxInches
-import subprocess
-import platform
-import pytesseract
-import cv2
-import numpy as np
-import fitz  # PyMuPDF
 import re
+import time
+import traceback
 from typing import List, Tuple, Dict, Any
-from pdf2docx import Converter
-# Adobe PDF Services SDK 임포트 및 설정
-try:
-    # 올바른 Adobe PDF Services SDK import 구문
-    from adobe.pdfservices.operation.auth.service_principal_credentials import ServicePrincipalCredentials
-    from adobe.pdfservices.operation.exception.exceptions import ServiceApiException, ServiceUsageException, SdkException
-    from adobe.pdfservices.operation.io.cloud_asset import CloudAsset
-    from adobe.pdfservices.operation.io.stream_asset import StreamAsset
-    from adobe.pdfservices.operation.pdf_services import PDFServices
-    from adobe.pdfservices.operation.pdf_services_media_type import PDFServicesMediaType
-    from adobe.pdfservices.operation.pdfjobs.jobs.export_pdf_job import ExportPDFJob
-    from adobe.pdfservices.operation.pdfjobs.params.export_pdf.export_pdf_params import ExportPDFParams
-    from adobe.pdfservices.operation.pdfjobs.params.export_pdf.export_pdf_target_format import ExportPDFTargetFormat
-    from adobe.pdfservices.operation.pdfjobs.result.export_pdf_result import ExportPDFResult
-    import traceback
-    
-    adobe_available = True
-    ADOBE_SDK_AVAILABLE = True
-    print("Adobe PDF Services SDK가 성공적으로 로드되었습니다.")
-except ImportError as e:
-    print(f"Adobe PDF Services SDK를 가져올 수 없습니다: {e}")
-    print("Adobe SDK 없이 계속 진행합니다.")
-    adobe_available = False
-    ADOBE_SDK_AVAILABLE = False
 
-# Adobe SDK 가용성은 import 성공/실패에 따라 자동 결정됨
+from scratch_space import scratch_space, current_scratch, scratch_dir
+import debug_capture
+import conversion_jobs
+import adobe_chunked
+import pdf2docx_parallel
+import libreoffice_pool
+from file_reaper import mark_in_use, start_reaper
+from page_range import parse_page_range, page_subset
+from document_ir import new_document_ir, page_geometry, cached_document_ir, ir_cache_stats
+from block_store import TextBlockStore, TextBlockBuilder, LAYOUT_SCHEMA, OCR_BBOX_SCHEMA
+from docx_styles import ParagraphWriter, BODY, TITLE, HEADING, STRONG
+from document_templates import new_document, new_presentation
+from output_media import media_for
+
+# 무거운 변환 엔진은 첫 사용 시 로드 (워커 부팅 및 /health 응답 지연 방지)
+pytesseract = lazy_module('pytesseract')
+cv2 = lazy_module('cv2')
+np = lazy_module('numpy')
+fitz = lazy_module('fitz')  # PyMuPDF
+pdf2docx = lazy_module('pdf2docx')
+
+# Adobe PDF Services SDK - 설치 여부만 확인하고 실제 import는 첫 Adobe 호출 시 수행
+adobe = lazy_module('adobe_sdk')
+ADOBE_SDK_AVAILABLE = engine_available('adobe_sdk')
 
 # 환경 변수 로드
 load_dotenv()
@@ -67,6 +62,17 @@ app.config["MAX_CONTENT_LENGTH"] = max_mb * 1024 * 1024
 def health():
     return "ok", 200
 
+@app.route("/health/boot")
+def health_boot():
+    """워커 부팅 보고서 (부팅 소요 시간, 로드된/지연된 변환 엔진)"""
+    return jsonify(boot_report())
+
+@app.route("/health/memory")
+def health_memory():
+    """이 워커의 메모리 보고서 (마스터와 공유 중인/고유 페이지)"""
+    from prefork import memory_report
+    return jsonify(memory_report())
+
 @app.route("/env-check")
 def env_check():
     """환경변수 설정 상태 확인 (디버깅용)"""
@@ -88,6 +94,8 @@ def env_check():
         "app_settings": {
             "max_file_size_mb": MAX_FILE_SIZE_MB,
             "debug_logs_enabled": ENABLE_DEBUG_LOGS,
+            "debug_capture": debug_capture.capture_stats(),
+            "document_ir_cache": ir_cache_stats(),
             "conversion_timeout_seconds": CONVERSION_TIMEOUT,
             "temp_file_cleanup": TEMP_FILE_CLEANUP
         },
@@ -172,75 +180,85 @@ def is_adobe_api_available():
     print("✅ Adobe API 자격증명 완료 - OAuth Server-to-Server 인증 준비됨")
     return True
 
-# Adobe SDK 상태 확인 및 초기화
-print(f"Adobe SDK 가용성: {ADOBE_SDK_AVAILABLE}")
-adobe_api_ready = is_adobe_api_available()
+def adobe_credentials_configured():
+    """Adobe API 필수 자격증명 설정 여부 (출력 없음)"""
+    return all([
+        ADOBE_CONFIG["client_credentials"]["client_id"],
+        ADOBE_CONFIG["client_credentials"]["client_secret"],
+        ADOBE_CONFIG["service_principal_credentials"]["organization_id"],
+        ADOBE_CONFIG["service_principal_credentials"]["account_id"],
+    ])
 
-if adobe_api_ready:
-    client_id = ADOBE_CONFIG['client_credentials']['client_id']
-    print(f"✅ Adobe API 준비 완료 (OAuth Server-to-Server): {client_id[:8]}...")
-else:
-    print("⚠️ Adobe API 사용 불가 - fallback 모드로 작동합니다.")
-    if not ADOBE_SDK_AVAILABLE:
-        print("  - Adobe SDK가 설치되지 않음")
-    else:
-        print("  - Adobe API 환경변수가 설정되지 않음")
-    print("  - pdf2docx 및 OCR 방법을 사용합니다.")
+_adobe_status_logged = False
 
-# Adobe API 가용성을 전역 변수로 설정
-adobe_available = adobe_api_ready
+def log_adobe_status():
+    """Adobe SDK 상태 안내 (import 시점이 아닌 첫 변환 요청 시 1회 출력)"""
+    global _adobe_status_logged
+    if _adobe_status_logged:
+        return
+    _adobe_status_logged = True
 
+    print(f"Adobe SDK 가용성: {ADOBE_SDK_AVAILABLE}")
+    if is_adobe_api_available():
+        client_id = ADOBE_CONFIG['client_credentials']['client_id']
+        print(f"✅ Adobe API 준비 완료 (OAuth Server-to-Server): {client_id[:8]}...")
+    else:
+        print("⚠️ Adobe API 사용 불가 - fallback 모드로 작동합니다.")
+        if not ADOBE_SDK_AVAILABLE:
+            print("  - Adobe SDK가 설치되지 않음")
+        else:
+            print("  - Adobe API 환경변수가 설정되지 않음")
+        print("  - pdf2docx 및 OCR 방법을 사용합니다.")
 
+# Adobe API 가용성을 전역 변수로 설정 (SDK 설치 + 자격증명, SDK import 없이 판단)
+adobe_available = ADOBE_SDK_AVAILABLE and adobe_credentials_configured()
 
-UPLOAD_FOLDER = 'uploads'
-OUTPUT_FOLDER = 'outputs'
 ALLOWED_EXTENSIONS = {'pdf', 'docx', 'jpg', 'jpeg', 'png', 'gif', 'bmp'}
 
-# 폴더 생성
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-os.makedirs(OUTPUT_FOLDER, exist_ok=True)
-os.makedirs('debug_output', exist_ok=True)  # 디버깅용 폴더
-
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-# 디버깅용 중간 결과물 저장 함수들
+# 디버깅용 중간 결과물 저장 함수들 (X-Debug-Capture 헤더 또는 샘플링으로 켜진 요청에서만 저장)
 def save_debug_text(text, filename_prefix):
-    """추출된 텍스트를 디버깅용 .txt 파일로 저장"""
-    try:
-        debug_file = os.path.join('debug_output', f'{filename_prefix}_extracted_text.txt')
-        with open(debug_file, 'w', encoding='utf-8') as f:
-            f.write(text)
-        print(f"디버깅: 텍스트가 {debug_file}에 저장되었습니다. (길이: {len(text)}자)")
-        return debug_file
-    except Exception as e:
-        print(f"디버깅 텍스트 저장 오류: {e}")
-        return None
+    """추출된 텍스트를 디버깅용 .txt 파일로 저장 (백그라운드 기록, 저장 경로 반환)"""
+    return debug_capture.capture_text(text, f'{filename_prefix}_extracted_text.txt')
 
 def save_debug_image(image, filename_prefix, page_num):
-    """변환된 이미지를 디버깅용 .png 파일로 저장"""
-    try:
-        debug_file = os.path.join('debug_output', f'{filename_prefix}_page_{page_num}.png')
-        image.save(debug_file, 'PNG')
-        print(f"디버깅: 이미지가 {debug_file}에 저장되었습니다.")
-        return debug_file
-    except Exception as e:
-        print(f"디버깅 이미지 저장 오류: {e}")
-        return None
+    """변환된 이미지를 디버깅용 .png 파일로 저장 (백그라운드 기록, 저장 경로 반환)"""
+    return debug_capture.capture_image(image, f'{filename_prefix}_page_{page_num}.png')
 
-def pdf_to_docx_with_pdf2docx(pdf_path, output_path):
-    """pdf2docx 라이브러리를 사용한 PDF → DOCX 변환"""
+def pdf_to_docx_with_pdf2docx(pdf_path, output_path, pages=None):
+    """pdf2docx 라이브러리를 사용한 PDF → DOCX 변환 (pages: 0부터 시작하는 페이지 목록, None이면 전체)"""
     try:
-        print("pdf2docx 라이브러리를 사용하여 변환 중...")
-        
-        # Converter 객체 생성
-        cv = Converter(pdf_path)
+        # 페이지가 많으면 페이지 구간별로 여러 프로세스에서 변환 후 병합 (실패 시 단일 변환)
+        if pages is not None:
+            page_count = len(pages)
+        else:
+            with engine_lock, fitz.open(pdf_path) as doc:
+                page_count = doc.page_count
+        if pdf2docx_parallel.should_parallelize(page_count):
+            try:
+                seconds = pdf2docx_parallel.convert_parallel(pdf_path, output_path, pages)
+                print(f"pdf2docx 병렬 변환 완료: {output_path} ({seconds:.1f}s)")
+                return True
+            except Exception as e:
+                print(f"pdf2docx 병렬 변환 실패, 단일 변환으로 재시도: {e}")
         
-        # 변환 실행
-        cv.convert(output_path, start=0, end=None)
+        print("pdf2docx 라이브러리를 사용하여 변환 중...")
         
-        # 객체 닫기
-        cv.close()
+        # 같은 프로세스 안에서 실행되는 단일 변환만 잠금으로 직렬화 (병렬 변환은 별도 프로세스)
+        with engine_lock:
+            # Converter 객체 생성
+            cv = pdf2docx.Converter(pdf_path)
+            
+            # 변환 실행
+            if pages is not None:
+                cv.convert(output_path, pages=list(pages))
+            else:
+                cv.convert(output_path, start=0, end=None)
+            
+            # 객체 닫기
+            cv.close()
         
         print(f"pdf2docx 변환 완료: {output_path}")
         return True
@@ -254,7 +272,7 @@ def ocr_image_to_blocks(pil_image):
     try:
         # OCR 가용성 확인
         try:
-            import pytesseract
+            pytesseract = load_engine('pytesseract')
             # Tesseract 경로 자동 감지 (Render 환경 대응)
             if os.path.exists('/usr/bin/tesseract'):
                 pytesseract.pytesseract.tesseract_cmd = '/usr/bin/tesseract'
@@ -284,26 +302,8 @@ def ocr_image_to_blocks(pil_image):
                 print("OCR 완전 실패")
                 return []
         
-        blocks = []
-        n = len(data["text"])
-        for i in range(n):
-            text = data["text"][i].strip()
-            conf_val = data["conf"][i]
-            if isinstance(conf_val, (int, float)):
-                conf = int(conf_val)
-            elif isinstance(conf_val, str) and conf_val.replace('.', '').replace('-', '').isdigit():
-                conf = int(float(conf_val))
-            else:
-                conf = 0
-            
-            if conf > 30 and len(text) > 0:
-                x, y, w, h = data["left"][i], data["top"][i], data["width"][i], data["height"][i]
-                blocks.append({
-                    "text": text,
-                    "bbox": (x, y, x + w, y + h),
-                    "confidence": conf
-                })
-        return blocks
+        # 신뢰도 30% 초과 단어만 열 기반 저장소로 변환 (블록은 text/bbox/confidence 키로 조회)
+        return TextBlockStore.from_tesseract(data, min_conf=31, schema=OCR_BBOX_SCHEMA)
     except Exception as e:
         print(f"OCR 처리 중 오류: {e}")
         return []
@@ -345,7 +345,7 @@ def clean_special_characters(text: str) -> str:
 def analyze_pdf_orientation(pdf_path: str) -> Dict[str, Any]:
     """PDF 페이지 크기를 분석하여 문서 방향 감지 (pdfplumber 사용)"""
     try:
-        import pdfplumber
+        pdfplumber = load_engine('pdfplumber')
         page_orientations = []
         
         with pdfplumber.open(pdf_path) as pdf:
@@ -399,11 +399,10 @@ def adobe_pdf_to_docx(input_path: str, output_path: str):
         file_size = os.path.getsize(input_path)
         print(f">>> [DEBUG] 파일 크기: {file_size} bytes ({file_size/1024/1024:.2f} MB)", flush=True)
         
-        # Adobe API 파일 크기 제한 확인 (100MB)
-        if file_size > 100 * 1024 * 1024:
-            print(">>> [DEBUG] 파일이 Adobe API 제한(100MB)을 초과함", flush=True)
-            info["error"] = "FILE_TOO_LARGE_FOR_ADOBE"
-            return False, info
+        # Adobe API 파일 크기 제한(100MB) 초과 또는 페이지가 많은 문서는 청크로 나눠 동시 변환
+        if adobe_chunked.should_chunk(input_path):
+            print(">>> [DEBUG] 대용량 PDF -> 청크 분할 변환", flush=True)
+            return adobe_chunked.chunked_pdf_to_docx(input_path, output_path)
         
         # PDF 파일 유효성 검사
         with open(input_path, "rb") as f:
@@ -413,27 +412,27 @@ def adobe_pdf_to_docx(input_path: str, output_path: str):
                 info["error"] = "INVALID_PDF_HEADER"
                 return False, info
         
-        creds = ServicePrincipalCredentials(
+        creds = adobe.ServicePrincipalCredentials(
             client_id=os.environ["ADOBE_CLIENT_ID"],
             client_secret=os.environ["ADOBE_CLIENT_SECRET"],
             organization_id=os.environ["ADOBE_ORGANIZATION_ID"],
             account_id=os.environ["ADOBE_ACCOUNT_ID"],
         )
-        pdf_services = PDFServices(credentials=creds)
+        pdf_services = adobe.PDFServices(credentials=creds)
 
         with open(input_path, "rb") as f:
             input_bytes = f.read()
 
         print(">>> [DEBUG] upload - 파일 업로드 시작", flush=True)
         try:
-            asset = pdf_services.upload(input_bytes, PDFServicesMediaType.PDF)
+            asset = pdf_services.upload(input_bytes, adobe.PDFServicesMediaType.PDF)
             print(">>> [DEBUG] upload - 파일 업로드 성공", flush=True)
         except Exception as upload_error:
             print(f">>> [DEBUG] upload - 파일 업로드 실패: {upload_error}", flush=True)
             raise
 
-        params = ExportPDFParams(ExportPDFTargetFormat.DOCX)
-        job = ExportPDFJob(asset, params)
+        params = adobe.ExportPDFParams(adobe.ExportPDFTargetFormat.DOCX)
+        job = adobe.ExportPDFJob(asset, params)
 
         print(">>> [DEBUG] submit - 작업 제출 시작", flush=True)
         try:
@@ -445,7 +444,7 @@ def adobe_pdf_to_docx(input_path: str, output_path: str):
 
         print(">>> [DEBUG] get_job_result - 결과 대기 시작", flush=True)
         try:
-            result_asset = pdf_services.get_job_result(location, ExportPDFResult)
+            result_asset = pdf_services.get_job_result(location, adobe.ExportPDFResult)
             print(">>> [DEBUG] get_job_result - 결과 대기 성공", flush=True)
         except Exception as result_error:
             print(f">>> [DEBUG] get_job_result - 결과 대기 실패: {result_error}", flush=True)
@@ -494,8 +493,8 @@ def adobe_pdf_to_docx(input_path: str, output_path: str):
 def extract_text_with_layout_from_pdf(pdf_path: str) -> Dict[str, Any]:
     """PDF에서 레이아웃 정보와 함께 텍스트 추출 (pdfplumber 사용)"""
     try:
-        import pdfplumber
-        all_text_blocks = []
+        pdfplumber = load_engine('pdfplumber')
+        all_text_blocks = TextBlockBuilder(LAYOUT_SCHEMA)
         
         # PDF 방향 분석
         orientation_info = analyze_pdf_orientation(pdf_path)
@@ -516,29 +515,28 @@ def extract_text_with_layout_from_pdf(pdf_path: str) -> Dict[str, Any]:
                             elif line.startswith(' ' * 10):  # 많은 공백으로 시작하면 오른쪽 정렬로 추정
                                 alignment = 'right'
                             
-                            all_text_blocks.append({
-                                'text': clean_special_characters(line.strip()),
-                                'bbox': [0, line_num * 12, page.width, (line_num + 1) * 12],  # 추정 bbox
-                                'page': page_num,
-                                'alignment': alignment
-                            })
+                            # 추정 bbox
+                            all_text_blocks.add(clean_special_characters(line.strip()),
+                                                0, line_num * 12, page.width, (line_num + 1) * 12,
+                                                page=page_num, alignment=alignment)
         
+        text_blocks = all_text_blocks.build()
         return {
-            'text_blocks': all_text_blocks,
-            'full_text': '\n'.join([block['text'] for block in all_text_blocks]),
+            'text_blocks': text_blocks,
+            'full_text': '\n'.join(text_blocks.texts()),
             'orientation_info': orientation_info
         }
         
     except Exception as e:
         print(f"PDF 레이아웃 추출 중 오류: {e}")
-        return {'text_blocks': [], 'full_text': ''}
+        return {'text_blocks': TextBlockStore.empty(LAYOUT_SCHEMA), 'full_text': ''}
 
 def extract_text_blocks_with_ocr(image):
     """OCR을 사용하여 이미지에서 텍스트 블록 추출 (개선된 버전)"""
     try:
         # OCR 가용성 확인
         try:
-            import pytesseract
+            pytesseract = load_engine('pytesseract')
             # Tesseract 경로 자동 감지 (Render 환경 대응)
             if os.path.exists('/usr/bin/tesseract'):
                 pytesseract.pytesseract.tesseract_cmd = '/usr/bin/tesseract'
@@ -589,6 +587,118 @@ def extract_text_blocks_with_ocr(image):
         print(f"  - OCR 처리 중 오류: {e}")
         return ""
 
+# 래스터화 품질 설정 (DOCX/PPTX 공용, 최적화됨)
+QUALITY_SETTINGS = {
+    'medium': {
+        'dpi': 120,  # DPI 최적화로 속도 향상
+        'format': 'jpeg',
+        'jpeg_quality': 80,  # 품질과 속도의 균형
+        'max_size': (1600, 1200),  # 적절한 해상도
+        'description': '균형 변환 (최적화된 속도와 품질)'
+    },
+    'high': {
+        'dpi': 180,  # 고품질이지만 속도 고려
+        'format': 'jpeg',  # PNG 대신 JPEG 사용으로 속도 향상
+        'jpeg_quality': 90,
+        'max_size': (2048, 1536),  # 해상도 최적화
+        'description': '고품질 변환 (향상된 속도)'
+    }
+}
+
+def build_layout_ir(pdf_path, quality='medium'):
+    """
+    DOCX/PPTX writer가 공유하는 문서 IR 생성
+
+    pdfplumber 레이아웃 추출 -> (실패 시) Adobe 추출 -> (실패 시) 래스터화 + OCR 순으로 시도한다.
+    텍스트를 얻은 경우에는 페이지를 래스터화하지 않는다.
+    """
+    settings = QUALITY_SETTINGS.get(quality, QUALITY_SETTINGS['medium'])
+    ir = new_document_ir('layout')
+    ir['pages'] = page_geometry(pdf_path)
+
+    print("레이아웃 인식을 통한 텍스트 추출을 시도합니다...")
+    layout_data = extract_text_with_layout_from_pdf(pdf_path)
+    extracted_text = layout_data.get('full_text', '')
+    ir['text_blocks'] = layout_data['text_blocks'].to_columns()
+    ir['orientation_info'] = layout_data.get('orientation_info', {})
+
+    if extracted_text:
+        print(f"레이아웃 인식으로 텍스트 추출 성공: {len(extracted_text)}자")
+    elif adobe_available and is_adobe_api_available():
+        print("레이아웃 인식 실패, Adobe API를 시도합니다...")
+        try:
+            extracted_content = extract_pdf_content_with_adobe(pdf_path)
+            if extracted_content:
+                extracted_text = str(extracted_content)
+                print(f"Adobe API에서 텍스트 추출 성공: {len(extracted_text)}자")
+            else:
+                print("Adobe API 추출 실패, OCR 방법으로 진행합니다.")
+        except adobe.ServiceApiException as e:
+            print(f"❌ Adobe ServiceApiException 발생: {e}")
+            print(f"    - Status Code: {getattr(e, 'status_code', 'N/A')}")
+            print(f"    - Error Message: {getattr(e, 'message', str(e))}")
+            # 일시적인 API 오류로 얻은 OCR 결과는 캐시하지 않음
+            ir['transient'] = True
+        except Exception as e:
+            print(f"❌ Adobe 추출 중 알 수 없는 예외 발생: {str(e)}")
+            traceback.print_exc()
+            ir['transient'] = True
+    else:
+        print("레이아웃 인식 실패, Adobe API 사용 불가 - OCR 방법으로 진행합니다.")
+    ir['full_text'] = extracted_text
+
+    capture = debug_capture.capture_enabled()
+    if extracted_text and not capture:
+        return ir
+
+    # 텍스트가 없으면 PDF를 이미지로 변환 (품질별 최적화)
+    print("PDF를 이미지로 변환 중...")
+    images = convert_from_path(pdf_path, dpi=settings['dpi'], fmt=settings['format'])
+
+    # 디버깅: 변환된 이미지들을 저장 (디버그 캡처가 켜진 요청만)
+    if capture:
+        print("=== 디버깅: 변환된 이미지 저장 ===")
+        filename_prefix = os.path.splitext(os.path.basename(pdf_path))[0]
+        for i, image in enumerate(images):
+            save_debug_image(image, filename_prefix, i+1)
+
+    if extracted_text:
+        return ir
+
+    for i, image in enumerate(images):
+        print(f"페이지 {i+1}/{len(images)} OCR 처리 중...")
+        ocr_text = extract_text_blocks_with_ocr(image)
+        if ocr_text:
+            ir['ocr_text'].append(ocr_text)
+
+    # OCR로도 텍스트를 얻지 못하면 writer가 이미지 기반 문서를 만들 수 있도록 페이지 이미지를 보관
+    if not ir['ocr_text'] and not layout_data['text_blocks']:
+        for i, image in enumerate(images):
+            buffer = io.BytesIO()
+            image.convert('RGB').save(buffer, 'JPEG', quality=settings['jpeg_quality'], optimize=True)
+            page = ir['pages'][i] if i < len(ir['pages']) else {}
+            ir['images'].append({
+                'page': i,
+                'name': f'page_{i + 1}.jpg',
+                'bbox': [0, 0, page.get('width', 0), page.get('height', 0)],
+                'format': 'jpeg',
+                'pixel_size': list(image.size),
+                'data': buffer.getvalue(),
+            })
+    return ir
+
+def layout_document_ir(pdf_path, quality='medium'):
+    """캐시된 문서 IR (같은 PDF를 다른 형식으로 변환할 때는 추출/래스터화/OCR을 건너뜀)"""
+    def build(path):
+        # 래스터화/텍스트 추출은 PyMuPDF를 쓰므로 추출하는 동안만 잠금 (캐시 적중 시에는 잡지 않음)
+        with engine_lock:
+            return build_layout_ir(path, quality)
+
+    if debug_capture.capture_enabled():
+        # 디버그 캡처 요청은 중간 산출물을 남겨야 하므로 항상 새로 추출
+        return build(pdf_path)
+    return cached_document_ir(pdf_path, 'layout', build, variant=quality)
+
 def convert_pdf_to_docx_with_adobe_direct(pdf_path, output_path):
     """Adobe PDF Services API를 사용하여 PDF를 DOCX로 직접 변환하는 함수"""
     if not ADOBE_SDK_AVAILABLE:
@@ -607,27 +717,27 @@ def convert_pdf_to_docx_with_adobe_direct(pdf_path, output_path):
             return False
         
         # ServicePrincipalCredentials 생성 (OAuth Server-to-Server)
-        credentials = ServicePrincipalCredentials(
+        credentials = adobe.ServicePrincipalCredentials(
             client_id=client_id,
             client_secret=client_secret
         )
         
         # PDFServices 인스턴스 생성
-        pdf_services = PDFServices(credentials=credentials)
+        pdf_services = adobe.PDFServices(credentials=credentials)
         
         # 입력 파일을 StreamAsset으로 생성
         with open(pdf_path, 'rb') as file:
             input_stream = file.read()
         
-        input_asset = pdf_services.upload(input_stream=input_stream, mime_type=PDFServicesMediaType.PDF)
+        input_asset = pdf_services.upload(input_stream=input_stream, mime_type=adobe.PDFServicesMediaType.PDF)
         
         # ExportPDF 작업 매개변수 설정
-        export_pdf_params = ExportPDFParams(
-            target_format=ExportPDFTargetFormat.DOCX
+        export_pdf_params = adobe.ExportPDFParams(
+            target_format=adobe.ExportPDFTargetFormat.DOCX
         )
         
         # ExportPDF 작업 생성
-        export_pdf_job = ExportPDFJob(input_asset=input_asset, export_pdf_params=export_pdf_params)
+        export_pdf_job = adobe.ExportPDFJob(input_asset=input_asset, export_pdf_params=export_pdf_params)
         
         print(">>> [DEBUG 1] Adobe 변환 함수 진입")
         try:
@@ -635,12 +745,12 @@ def convert_pdf_to_docx_with_adobe_direct(pdf_path, output_path):
             
             # 작업 제출 및 결과 대기 - 실제 Adobe API 실행 지점
             location = pdf_services.submit(export_pdf_job)
-            pdf_services_response = pdf_services.get_job_result(location, ExportPDFResult)
+            pdf_services_response = pdf_services.get_job_result(location, adobe.ExportPDFResult)
             
             print(">>> [DEBUG 3] execute() 호출 성공")
             conversion_success = True  # 성공했음을 표시
             
-        except ServiceApiException as e:
+        except adobe.ServiceApiException as e:
             # Adobe API 관련 에러 (가장 흔함)
             print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
             print(f"❌ Adobe ServiceApiException 발생: {e}")
@@ -674,7 +784,7 @@ def convert_pdf_to_docx_with_adobe_direct(pdf_path, output_path):
         print(f"Adobe API를 사용하여 PDF를 DOCX로 성공적으로 변환했습니다: {output_path}")
         return True
         
-    except ServiceApiException as e:
+    except adobe.ServiceApiException as e:
         print(f"Adobe ServiceApiException: {e}")
         print(f"Request ID: {getattr(e, 'request_id', 'N/A')}")
         print(f"Status Code: {getattr(e, 'status_code', 'N/A')}")
@@ -694,6 +804,11 @@ def adobe_pdf_to_docx(input_path, output_path):
     try:
         print(">>> [DEBUG] adobe_pdf_to_docx: try 블록 진입. SDK 초기화 시도.")
         
+        # 100MB 초과 또는 페이지가 많은 문서는 청크로 나눠 동시 변환 후 병합
+        if adobe_chunked.should_chunk(input_path):
+            ok, info = adobe_chunked.chunked_pdf_to_docx(input_path, output_path)
+            return ok
+        
         # Adobe API 변환 실행
         result = convert_pdf_to_docx_with_adobe_direct(input_path, output_path)
         
@@ -704,7 +819,7 @@ def adobe_pdf_to_docx(input_path, output_path):
             print(">>> [DEBUG] adobe_pdf_to_docx: execute() 실패.")
             return False
             
-    except ServiceApiException as e:
+    except adobe.ServiceApiException as e:
         print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
         print(f"❌ Adobe ServiceApiException: {e.message if hasattr(e, 'message') else str(e)}")
         print(f"    - Status Code: {e.status_code if hasattr(e, 'status_code') else 'N/A'}, Error Code: {e.error_code if hasattr(e, 'error_code') else 'N/A'}")
@@ -735,25 +850,25 @@ def extract_pdf_content_with_adobe(pdf_path):
         
     try:
         # Adobe API 자격 증명 설정 (올바른 클래스 사용)
-        credentials = ServicePrincipalCredentials(
+        credentials = adobe.ServicePrincipalCredentials(
             client_id=client_id,
             client_secret=client_secret
         )
         
         # PDF Services 인스턴스 생성
-        pdf_services = PDFServices(credentials=credentials)
+        pdf_services = adobe.PDFServices(credentials=credentials)
         
         # PDF 파일을 스트림으로 읽기
         with open(pdf_path, 'rb') as file:
             input_stream = file.read()
         
         # StreamAsset 생성
-        input_asset = pdf_services.upload(input_stream=input_stream, mime_type=PDFServicesMediaType.PDF)
+        input_asset = pdf_services.upload(input_stream=input_stream, mime_type=adobe.PDFServicesMediaType.PDF)
         
         print("Adobe API를 사용하여 PDF 내용을 처리했습니다.")
         return input_asset
             
-    except ServiceApiException as e:
+    except adobe.ServiceApiException as e:
         # Adobe API 관련 에러 (가장 흔함)
         print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
         print(f"❌ Adobe ServiceApiException 발생: {e}")
@@ -763,7 +878,7 @@ def extract_pdf_content_with_adobe(pdf_path):
         print(f"    - Error Message: {getattr(e, 'message', str(e))}")
         print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
         return None
-    except (ServiceUsageException, SdkException) as e:
+    except (adobe.ServiceUsageException, adobe.SdkException) as e:
         print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
         print(f"❌ Adobe SDK 오류 발생: {type(e).__name__}: {str(e)}")
         print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
@@ -777,7 +892,12 @@ def extract_pdf_content_with_adobe(pdf_path):
         print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
         return None
 
-def pdf_to_docx(pdf_path, output_path, quality='medium'):
+def pdf_to_docx(pdf_path, output_path, quality='medium', pages=None):
+    """PDF를 DOCX로 변환하는 함수 (pages 지정 시 선택한 페이지만 담은 PDF로 모든 단계 수행)"""
+    with page_subset(pdf_path, pages) as subset_path:
+        return _pdf_to_docx(subset_path, output_path, quality)
+
+def _pdf_to_docx(pdf_path, output_path, quality='medium'):
     """PDF를 DOCX로 변환하는 함수 (Adobe API 우선, pdf2docx 및 OCR 보조)"""
     try:
         # 파일명에서 확장자 제거하여 디버깅용 prefix 생성
@@ -821,150 +941,58 @@ def pdf_to_docx(pdf_path, output_path, quality='medium'):
                 print("pdf2docx 변환 결과가 부적절함. 대체 방법 시도...")
         
         print("=== 3단계: 기존 OCR 방법으로 fallback ===")
-        # 품질 설정에 따른 파라미터 설정 (최적화됨)
-        quality_settings = {
-            'medium': {
-                'dpi': 120,  # DPI 최적화로 속도 향상
-                'format': 'jpeg',
-                'jpeg_quality': 80,  # 품질과 속도의 균형
-                'max_size': (1600, 1200),  # 적절한 해상도
-                'description': '균형 변환 (최적화된 속도와 품질)'
-            },
-            'high': {
-                'dpi': 180,  # 고품질이지만 속도 고려
-                'format': 'jpeg',  # PNG 대신 JPEG 사용으로 속도 향상
-                'jpeg_quality': 90,
-                'max_size': (2048, 1536),  # 해상도 최적화
-                'description': '고품질 변환 (향상된 속도)'
-            }
-        }
-        
-        settings = quality_settings.get(quality, quality_settings['medium'])
+        settings = QUALITY_SETTINGS.get(quality, QUALITY_SETTINGS['medium'])
         print(f"변환 설정: {settings['description']}")
         
-        # 1단계: 레이아웃 인식을 통한 텍스트 추출 시도
-        print("레이아웃 인식을 통한 텍스트 추출을 시도합니다...")
-        layout_data = extract_text_with_layout_from_pdf(pdf_path)
-        extracted_text = layout_data.get('full_text', '')
-        text_blocks = layout_data.get('text_blocks', [])
-        orientation_info = layout_data.get('orientation_info', {})
+        # 텍스트/방향/OCR 결과는 문서 IR로 한 번만 추출 (같은 PDF의 PPTX 변환과 공유)
+        ir = layout_document_ir(pdf_path, quality)
+        extracted_text = ir['full_text']
+        text_blocks = TextBlockStore.from_columns(ir['text_blocks'])
+        orientation_info = ir['orientation_info']
+        page_count = len(ir['pages'])
         
-        if extracted_text:
-            print(f"레이아웃 인식으로 텍스트 추출 성공: {len(extracted_text)}자")
-        else:
-            print("레이아웃 인식 실패, Adobe API를 시도합니다...")
-            
-            # 2단계: Adobe API를 사용한 PDF 내용 추출 시도
-            if adobe_available and is_adobe_api_available():
-                print("✅ Adobe API로 변환을 시작합니다.")
-                try:
-                    # 이 부분이 실제 Adobe SDK를 사용하는 코드입니다.
-                    extracted_content = extract_pdf_content_with_adobe(pdf_path)
-                    if extracted_content:
-                        extracted_text = str(extracted_content)
-                        print(f"Adobe API에서 텍스트 추출 성공: {len(extracted_text)}자")
-                    else:
-                        print("Adobe API 추출 실패, OCR 방법으로 진행합니다.")
-                        
-                except ServiceApiException as e:
-                    # Adobe API 관련 에러 (가장 흔함)
-                    print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
-                    print(f"❌ Adobe ServiceApiException 발생: {e}")
-                    print(f"    - Request ID: {getattr(e, 'request_id', 'N/A')}")
-                    print(f"    - Status Code: {getattr(e, 'status_code', 'N/A')}")
-                    print(f"    - Error Code: {getattr(e, 'error_code', 'N/A')}")
-                    print(f"    - Error Message: {getattr(e, 'message', str(e))}")
-                    print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
-                    extracted_text = ''
-                    
-                except Exception as e:
-                    # 그 외 모든 예상치 못한 에러
-                    print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
-                    print(f"❌ 변환 중 알 수 없는 예외 발생: {str(e)}")
-                    import traceback
-                    traceback.print_exc()
-                    print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
-                    extracted_text = ''
-            else:
-                # Adobe API를 사용할 수 없을 때의 대체 로직
-                print("⚠️ Adobe API 사용 불가 - fallback 모드로 변환합니다.")
-        
-        # 기본 방법: PDF를 이미지로 변환 (품질별 최적화)
-        print("PDF를 이미지로 변환 중...")
-        images = convert_from_path(pdf_path, dpi=settings['dpi'], fmt=settings['format'])
-        
-        # 디버깅: 변환된 이미지들을 저장
-        print("=== 디버깅: 변환된 이미지 저장 ===")
-        for i, image in enumerate(images):
-            save_debug_image(image, filename_prefix, i+1)
-        
-        # 새 Word 문서 생성 - 호환성 개선 및 방향 자동 감지
-        doc = Document()
-        
-        # 페이지 설정 (문서 방향에 따라 자동 조정)
-        section = doc.sections[0]
+        # 새 Word 문서 생성 - 문서 방향에 맞춰 미리 설정된 템플릿 복사 (용지/여백, 한글 글꼴, 문서 속성)
         primary_orientation = orientation_info.get('primary_orientation', 'portrait')
         
         if primary_orientation == 'landscape':
-            # 가로형 문서 설정
-            section.page_width = Inches(11)
-            section.page_height = Inches(8.5)
-            section.left_margin = Inches(0.8)
-            section.right_margin = Inches(0.8)
-            section.top_margin = Inches(0.6)
-            section.bottom_margin = Inches(0.6)
+            doc = new_document('letter_landscape')
             print("가로형 문서로 설정됨")
         else:
-            # 세로형 문서 설정
-            section.page_width = Inches(8.5)
-            section.page_height = Inches(11)
-            section.left_margin = Inches(1)
-            section.right_margin = Inches(1)
-            section.top_margin = Inches(1)
-            section.bottom_margin = Inches(1)
+            doc = new_document('letter_portrait')
             print("세로형 문서로 설정됨")
         
-        # 문서 속성 설정 (Microsoft Word 호환성 향상)
+        # 문서 제목 설정 (Microsoft Word 호환성 향상)
         try:
             # 안전한 파일명 생성 (특수문자 제거)
             safe_filename = re.sub(r'[^\w\s-]', '', os.path.splitext(os.path.basename(pdf_path))[0])
             doc.core_properties.title = safe_filename[:50]  # 제목 길이 제한
-            doc.core_properties.author = "Document Converter"
-            doc.core_properties.subject = "PDF to DOCX Conversion"
-            doc.core_properties.comments = "Converted using advanced OCR and layout recognition"
         except Exception as e:
             print(f"문서 속성 설정 중 오류 (무시됨): {e}")
         
-        all_ocr_text = []
-        
-        print(f"총 {len(images)}페이지 처리 중...")
-        # OCR로 텍스트 추출 (Adobe API가 실패한 경우)
-        if not extracted_text:
-            for i, image in enumerate(images):
-                print(f"페이지 {i+1}/{len(images)} OCR 처리 중...")
-                ocr_text = extract_text_blocks_with_ocr(image)
-                if ocr_text:
-                    all_ocr_text.append(ocr_text)
+        # OCR 텍스트 (Adobe API가 실패한 경우 IR 생성 시 추출됨)
+        all_ocr_text = ir['ocr_text']
+        print(f"총 {page_count}페이지 처리 중...")
         
         # 편집 가능한 텍스트만 추가 (원본 이미지 제거)
         final_text = extracted_text if extracted_text else '\n'.join(all_ocr_text)
         
-        # 디버깅: 추출된 텍스트를 파일로 저장
-        print("=== 디버깅: 추출된 텍스트 저장 ===")
-        if final_text:
-            save_debug_text(final_text, filename_prefix)
-        elif all_ocr_text:
-            combined_ocr_text = '\n'.join(all_ocr_text)
-            save_debug_text(combined_ocr_text, filename_prefix + "_ocr")
-        else:
-            save_debug_text("텍스트 추출 실패", filename_prefix + "_no_text")
+        # 디버깅: 추출된 텍스트를 파일로 저장 (디버그 캡처가 켜진 요청만)
+        if debug_capture.capture_enabled():
+            print("=== 디버깅: 추출된 텍스트 저장 ===")
+            if final_text:
+                save_debug_text(final_text, filename_prefix)
+            elif all_ocr_text:
+                combined_ocr_text = '\n'.join(all_ocr_text)
+                save_debug_text(combined_ocr_text, filename_prefix + "_ocr")
+            else:
+                save_debug_text("텍스트 추출 실패", filename_prefix + "_no_text")
         
         # --- 핵심 수정 부분: OCR 텍스트 추출 실패 시 None 반환 ---
         if not final_text.strip() and not text_blocks:
             print(f"'{pdf_path}' 파일에서 유효한 텍스트를 찾지 못했습니다.")
             print(f"OCR 텍스트 길이: {len(final_text)}, 텍스트 블록 수: {len(text_blocks) if text_blocks else 0}")
             print(f"이미지 품질이 낮거나 텍스트가 없는 PDF 파일일 수 있습니다: {pdf_path}")
-            print(f"변환 품질 설정: {quality}, 이미지 수: {len(images) if 'images' in locals() else 'N/A'}")
+            print(f"변환 품질 설정: {quality}, 페이지 수: {page_count}")
             return None  # 텍스트가 없으면 None을 반환
         
         if final_text or text_blocks:
@@ -975,92 +1003,52 @@ def pdf_to_docx(pdf_path, output_path, quality='medium'):
                 print("레이아웃 정보를 활용하여 텍스트 구조화...")
                 
                 # 페이지별로 텍스트 구성 (페이지 번호 헤더 없이)
-                for page_num in range(len(images)):
-                    if page_num > 0:
-                        doc.add_page_break()
-                    
-                    # 해당 페이지의 텍스트 블록 추가
-                    page_text_blocks = [block for block in text_blocks if block['page'] == page_num]
-                    
-                    if page_text_blocks:
+                # 서식은 문서에 한 번 정의한 스타일로 참조 (런마다 글꼴/간격을 지정하지 않음)
+                blocks_by_page = dict(text_blocks.page_groups())
+                with ParagraphWriter(doc) as writer:
+                    for page_num in range(page_count):
+                        if page_num > 0:
+                            writer.page_break()
+                        
+                        # 해당 페이지의 텍스트 블록 추가
+                        page_text_blocks = blocks_by_page.get(page_num)
+                        if not page_text_blocks:
+                            continue
+                        
                         for block in page_text_blocks:
-                            text_paragraph = doc.add_paragraph()
-                            text_run = text_paragraph.add_run(block['text'])
-                            
-                            # 텍스트 정렬 적용 (원본과 동일하게)
-                            if block['alignment'] == 'center':
-                                text_paragraph.alignment = 1  # 중앙 정렬
-                                text_run.bold = True  # 중앙 정렬 텍스트는 굵게
-                            elif block['alignment'] == 'right':
-                                text_paragraph.alignment = 2  # 오른쪽 정렬
+                            text = block['text']
+                            alignment = block['alignment']
+                            # 원본과 동일한 정렬, 중앙 정렬 텍스트는 굵게 / 짧은 중앙 정렬 텍스트와 제목은 제목 스타일
+                            if alignment == 'center' and len(text) < 50:
+                                writer.add(text, HEADING)
+                            elif '제목' in text or '공문' in text:
+                                writer.add(text, TITLE, alignment=alignment)
+                            elif alignment == 'center':
+                                writer.add(text, BODY, alignment='center', char_style=STRONG)
                             else:
-                                text_paragraph.alignment = 0  # 왼쪽 정렬
-                            
-                            # 원본과 동일한 텍스트 스타일 적용 (Microsoft Word 호환성 개선)
-                            try:
-                                # 폰트 설정 (한글 문서에 적합한 폰트)
-                                text_run.font.name = '맑은 고딕'
-                                text_run.font.size = Pt(11)  # 표준 문서 크기
-                                
-                                # 제목 스타일 적용
-                                if len(block['text']) < 50 and block['alignment'] == 'center':
-                                    text_run.font.size = Pt(14)
-                                    text_run.bold = True
-                                elif '제목' in block['text'] or '공문' in block['text']:
-                                    text_run.font.size = Pt(13)
-                                    text_run.bold = True
-                                
-                                # 줄간격 및 단락 간격 설정 (원본과 동일하게)
-                                text_paragraph.paragraph_format.line_spacing = 1.2
-                                text_paragraph.paragraph_format.space_after = Pt(3)
-                                text_paragraph.paragraph_format.space_before = Pt(0)
-                                
-                                # 들여쓰기 설정 (원본 레이아웃 유지)
-                                if block['alignment'] == 'left':
-                                    text_paragraph.paragraph_format.left_indent = Pt(0)
-                                elif block['alignment'] == 'center':
-                                    text_paragraph.paragraph_format.left_indent = Pt(0)
-                                    
-                            except Exception as e:
-                                print(f"텍스트 스타일 설정 중 오류 (무시됨): {e}")
+                                writer.add(text, BODY, alignment='right' if alignment == 'right' else 'left')
             else:
                 # 레이아웃 정보가 없는 경우 일반 텍스트로 추가 (Microsoft Word 호환성 개선)
                 clean_final_text = final_text.replace('\x00', '').replace('\ufffd', '').strip()
-                if clean_final_text:
-                    paragraphs = clean_final_text.split('\n\n')
-                    for para_text in paragraphs:
-                        if para_text.strip():
-                            text_paragraph = doc.add_paragraph()
-                            text_run = text_paragraph.add_run(para_text.strip())
-                            
-                            # 일반 텍스트에도 표준 스타일 적용
-                            try:
-                                text_run.font.name = '맑은 고딕'
-                                text_run.font.size = Pt(11)
-                                text_paragraph.paragraph_format.line_spacing = 1.2
-                                text_paragraph.paragraph_format.space_after = Pt(3)
-                                text_paragraph.paragraph_format.space_before = Pt(0)
-                            except Exception as e:
-                                print(f"일반 텍스트 스타일 설정 중 오류 (무시됨): {e}")
-                else:
-                    text_paragraph = doc.add_paragraph()
-                    text_run = text_paragraph.add_run("텍스트를 추출할 수 없었습니다.")
-                    try:
-                        text_run.font.name = '맑은 고딕'
-                        text_run.font.size = Pt(11)
-                    except Exception as e:
-                        print(f"오류 메시지 스타일 설정 중 오류 (무시됨): {e}")
+                with ParagraphWriter(doc) as writer:
+                    if clean_final_text:
+                        for para_text in clean_final_text.split('\n\n'):
+                            if para_text.strip():
+                                writer.add(para_text.strip(), BODY)
+                    else:
+                        writer.add("텍스트를 추출할 수 없었습니다.", BODY)
             
             print("편집 가능한 텍스트 문서가 생성되었습니다.")
         else:
             print("추출할 수 있는 텍스트가 없습니다. 이미지 기반 문서를 생성합니다.")
             
-            # 텍스트가 없는 경우에만 이미지 추가
-            for i, image in enumerate(images):
-                print(f"페이지 {i+1}/{len(images)} 처리 중...")
+            # 텍스트가 없는 경우에만 이미지 추가 (IR에 JPEG로 저장된 페이지 이미지)
+            page_images = ir['images']
+            for i, image in enumerate(page_images):
+                print(f"페이지 {i+1}/{len(page_images)} 처리 중...")
                 
                 # 이미지 크기 최적화 (원본 문서와 동일한 크기 유지)
-                original_width, original_height = image.size
+                original_width, original_height = image['pixel_size']
                 
                 # 문서 방향에 따른 이미지 크기 조정
                 if primary_orientation == 'landscape':
@@ -1074,28 +1062,13 @@ def pdf_to_docx(pdf_path, output_path, quality='medium'):
                     aspect_ratio = original_height / original_width
                     target_height = target_width * aspect_ratio
                 
-                # 이미지를 임시 파일로 저장 (JPEG 최적화)
-                temp_img_path = None
-                try:
-                    with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as temp_img:
-                        temp_img_path = temp_img.name
-                        # JPEG로 저장 (품질별 압축, 빠른 처리)
-                        image.save(temp_img_path, 'JPEG', quality=settings['jpeg_quality'], optimize=True)
-                    
-                    # 문서에 이미지 추가 (원본 비율 유지)
-                    doc.add_picture(temp_img_path, width=DocxInches(target_width))
-                    
-                    # 페이지 구분을 위한 페이지 브레이크 추가 (마지막 페이지 제외)
-                    if i < len(images) - 1:
-                        doc.add_page_break()
-                    
-                finally:
-                    # 임시 파일 삭제 (빠른 처리)
-                    if temp_img_path and os.path.exists(temp_img_path):
-                        try:
-                            os.unlink(temp_img_path)
-                        except (OSError, PermissionError) as e:
-                            print(f"임시 파일 삭제 실패 (무시됨): {e}")
+                # 문서에 이미지 추가 (원본 비율 유지, 같은 이미지는 한 번만 저장하고 배치 크기보다 큰 이미지만 축소)
+                media_for(doc).add_docx_picture(doc, image['data'], width=DocxInches(target_width))
+                
+                # 페이지 구분을 위한 페이지 브레이크 추가 (마지막 페이지 제외)
+                if i < len(page_images) - 1:
+                    doc.add_page_break()
+            print(media_for(doc).summary())
         
         # DOCX 파일 저장 (Microsoft Word 호환성 최적화)
         try:
@@ -1132,74 +1105,33 @@ def pdf_to_docx(pdf_path, output_path, quality='medium'):
 def pdf_to_pptx(pdf_path, output_path, quality='medium'):
     """PDF를 PPTX로 변환하는 함수 (Adobe API 통합 및 OCR 텍스트 추출, 방향 자동 감지)"""
     try:
-        # 품질 설정에 따른 파라미터 설정 (최적화됨)
-        quality_settings = {
-            'medium': {
-                'dpi': 120,  # DPI 최적화로 속도 향상
-                'format': 'jpeg',
-                'jpeg_quality': 80,  # 품질과 속도의 균형
-                'max_size': (1600, 1200),  # 적절한 해상도
-                'description': '균형 변환 (최적화된 속도와 품질)'
-            },
-            'high': {
-                'dpi': 180,  # 고품질이지만 속도 고려
-                'format': 'jpeg',  # PNG 대신 JPEG 사용으로 속도 향상
-                'jpeg_quality': 90,
-                'max_size': (2048, 1536),  # 해상도 최적화
-                'description': '고품질 변환 (향상된 속도)'
-            }
-        }
-        
-        settings = quality_settings.get(quality, quality_settings['medium'])
+        settings = QUALITY_SETTINGS.get(quality, QUALITY_SETTINGS['medium'])
         print(f"변환 설정: {settings['description']}")
         
-        # 1단계: 레이아웃 인식을 통한 텍스트 추출 시도 (방향 정보 포함)
-        print("레이아웃 인식을 통한 텍스트 추출을 시도합니다...")
-        layout_data = extract_text_with_layout_from_pdf(pdf_path)
-        extracted_text = layout_data.get('full_text', '')
-        text_blocks = layout_data.get('text_blocks', [])
-        orientation_info = layout_data.get('orientation_info', {})
-        all_ocr_text = []
-        
-        if extracted_text:
-            print(f"레이아웃 인식으로 텍스트 추출 성공: {len(extracted_text)}자")
-        else:
-            print("레이아웃 인식 실패, Adobe API를 시도합니다...")
-            
-            # 2단계: Adobe API를 사용한 PDF 내용 추출 시도
-            if adobe_available:
-                print("Adobe API를 사용하여 PDF 처리를 시작합니다...")
-                extracted_content = extract_pdf_content_with_adobe(pdf_path)
-                if extracted_content:
-                    extracted_text = str(extracted_content)
-                    print(f"Adobe API에서 텍스트 추출 성공: {len(extracted_text)}자")
-                else:
-                    print("Adobe API 추출 실패, OCR 방법으로 진행합니다.")
-        
-        # 기본 방법: PDF를 이미지로 변환 (품질별 최적화)
-        print("PDF를 이미지로 변환 중...")
-        images = convert_from_path(pdf_path, dpi=settings['dpi'], fmt=settings['format'])
+        # 텍스트/방향/OCR 결과는 문서 IR로 한 번만 추출 (같은 PDF의 DOCX 변환과 공유)
+        ir = layout_document_ir(pdf_path, quality)
+        extracted_text = ir['full_text']
+        text_blocks = TextBlockStore.from_columns(ir['text_blocks'])
+        orientation_info = ir['orientation_info']
+        page_count = len(ir['pages'])
         
-        # 새 PowerPoint 프레젠테이션 생성 (방향에 따른 슬라이드 설정)
-        prs = Presentation()
-        
-        # 슬라이드 크기 설정 (문서 방향에 따라 자동 조정)
+        # 새 PowerPoint 프레젠테이션 생성 (문서 방향에 따라 슬라이드 크기가 설정된 템플릿 복사)
+        Inches = load_engine('pptx.util').Inches
         primary_orientation = orientation_info.get('primary_orientation', 'portrait')
         
         if primary_orientation == 'landscape':
             # 가로형 슬라이드 (16:9 비율)
-            prs.slide_width = Inches(13.33)
-            prs.slide_height = Inches(7.5)
+            prs = new_presentation('slides_16_9')
             print("가로형 슬라이드로 설정됨 (16:9)")
         else:
             # 세로형 슬라이드 (9:16 비율)
-            prs.slide_width = Inches(7.5)
-            prs.slide_height = Inches(13.33)
+            prs = new_presentation('slides_9_16')
             print("세로형 슬라이드로 설정됨 (9:16)")
         
-        all_ocr_text = []
+        # OCR 텍스트 (Adobe API가 실패한 경우 IR 생성 시 추출됨)
+        all_ocr_text = ir['ocr_text']
         
-        print(f"총 {len(images)}페이지 처리 중...")
+        print(f"총 {page_count}페이지 처리 중...")
         def get_blank_slide_layout(prs):
             """안전한 빈 슬라이드 레이아웃 가져오기"""
             try:
@@ -1223,22 +1155,14 @@ def pdf_to_pptx(pdf_path, output_path, quality='medium'):
                     raise Exception("사용 가능한 슬라이드 레이아웃이 없습니다")
         
         # 편집 가능한 텍스트 슬라이드 생성 (원본 이미지 제거)
-        # OCR로 텍스트 추출 (Adobe API가 실패한 경우)
-        if not extracted_text:
-            for i, image in enumerate(images):
-                print(f"페이지 {i+1}/{len(images)} OCR 처리 중...")
-                ocr_text = extract_text_blocks_with_ocr(image)
-                if ocr_text:
-                    all_ocr_text.append(ocr_text)
-        
-        # 편집 가능한 텍스트 슬라이드 생성
         final_text = extracted_text if extracted_text else '\n'.join(all_ocr_text)
         
         if text_blocks:
             print(f"편집 가능한 텍스트 슬라이드 생성: {len(text_blocks)}개 블록")
             
             # 페이지별로 슬라이드 구성
-            for page_num in range(len(images)):
+            blocks_by_page = dict(text_blocks.page_groups())
+            for page_num in range(page_count):
                 # 새 슬라이드 추가 (제목과 내용 레이아웃)
                 try:
                     slide_layout = prs.slide_layouts[1]  # 제목과 내용 레이아웃
@@ -1262,7 +1186,7 @@ def pdf_to_pptx(pdf_path, output_path, quality='medium'):
                     title_frame.text = f"페이지 {page_num + 1}"
                 
                 # 해당 페이지의 텍스트 블록 추가
-                page_text_blocks = [block for block in text_blocks if block['page'] == page_num]
+                page_text_blocks = blocks_by_page.get(page_num)
                 
                 if page_text_blocks:
                     # 내용 텍스트박스 가져오기
@@ -1374,16 +1298,17 @@ def pdf_to_pptx(pdf_path, output_path, quality='medium'):
         else:
             print("추출할 수 있는 텍스트가 없습니다. 이미지 기반 슬라이드를 생성합니다.")
             
-            # 텍스트가 없는 경우에만 이미지 슬라이드 생성
-            for i, image in enumerate(images):
-                print(f"페이지 {i+1}/{len(images)} 처리 중...")
+            # 텍스트가 없는 경우에만 이미지 슬라이드 생성 (IR에 JPEG로 저장된 페이지 이미지)
+            page_images = ir['images']
+            for i, image in enumerate(page_images):
+                print(f"페이지 {i+1}/{len(page_images)} 처리 중...")
                 
                 # 슬라이드 추가 - 안전한 레이아웃 사용
                 slide_layout = get_blank_slide_layout(prs)
                 slide = prs.slides.add_slide(slide_layout)
                 
                 # 이미지 크기 최적화 (원본 문서와 동일한 크기 유지)
-                original_width, original_height = image.size
+                original_width, original_height = image['pixel_size']
                 
                 # 슬라이드 방향에 따른 이미지 크기 조정
                 if primary_orientation == 'landscape':
@@ -1407,27 +1332,12 @@ def pdf_to_pptx(pdf_path, output_path, quality='medium'):
                         target_height = max_slide_height
                         target_width = target_height / aspect_ratio
                 
-                # 이미지를 임시 파일로 저장 (JPEG 최적화)
-                temp_img_path = None
-                try:
-                    with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as temp_img:
-                        temp_img_path = temp_img.name
-                        # JPEG로 저장 (품질별 압축, 빠른 처리)
-                        image.save(temp_img_path, 'JPEG', quality=settings['jpeg_quality'], optimize=True)
-                    
-                    # 슬라이드에 이미지 추가 (원본 비율 유지, 중앙 배치)
-                    left = Inches((13.33 - target_width) / 2) if primary_orientation == 'landscape' else Inches((7.5 - target_width) / 2)
-                    top = Inches((7.5 - target_height) / 2) if primary_orientation == 'landscape' else Inches((13.33 - target_height) / 2)
-                    slide.shapes.add_picture(temp_img_path, left, top, width=Inches(target_width), height=Inches(target_height))
-                    
-                finally:
-                    # 임시 파일 삭제 (빠른 처리)
-                    if temp_img_path and os.path.exists(temp_img_path):
-                        try:
-                            os.unlink(temp_img_path)
-                        except (OSError, PermissionError) as e:
-                            print(f"임시 파일 삭제 실패 (무시됨): {e}")
-                            # 임시 파일 삭제 실패는 무시하고 계속 진행
+                # 슬라이드에 이미지 추가 (원본 비율 유지, 중앙 배치, 같은 이미지는 한 번만 저장하고 큰 이미지만 축소)
+                left = Inches((13.33 - target_width) / 2) if primary_orientation == 'landscape' else Inches((7.5 - target_width) / 2)
+                top = Inches((7.5 - target_height) / 2) if primary_orientation == 'landscape' else Inches((13.33 - target_height) / 2)
+                media_for(prs).add_slide_picture(slide.shapes, image['data'], left, top,
+                                                 width=Inches(target_width), height=Inches(target_height))
+            print(media_for(prs).summary())
         
         # 하이브리드 변환: 추출된 텍스트를 편집 가능한 형태로 마지막 슬라이드에 추가
         final_text = extracted_text if extracted_text else '\n'.join(all_ocr_text)
@@ -1583,53 +1493,22 @@ def image_to_docx(image_path, output_path):
         return False
 
 def docx_to_pdf(docx_path, output_path):
-    """DOCX를 PDF로 변환하는 함수"""
+    """DOCX를 PDF로 변환하는 함수 (LibreOffice 상주 풀 우선, reportlab 대체)"""
     try:
-        # Windows에서 LibreOffice 사용
-        if platform.system() == "Windows":
-            # LibreOffice 경로 찾기
-            libreoffice_paths = [
-                r"C:\Program Files\LibreOffice\program\soffice.exe",
-                r"C:\Program Files (x86)\LibreOffice\program\soffice.exe",
-                "soffice"  # PATH에 있는 경우
-            ]
-            
-            libreoffice_path = None
-            for path in libreoffice_paths:
-                if os.path.exists(path) or path == "soffice":
-                    libreoffice_path = path
-                    break
-            
-            if libreoffice_path:
-                # LibreOffice를 사용하여 변환
-                output_dir = os.path.dirname(output_path)
-                cmd = [
-                    libreoffice_path,
-                    "--headless",
-                    "--convert-to", "pdf",
-                    "--outdir", output_dir,
-                    docx_path
-                ]
-                
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode == 0:
-                    # 생성된 PDF 파일명 확인 및 이동
-                    base_name = os.path.splitext(os.path.basename(docx_path))[0]
-                    generated_pdf = os.path.join(output_dir, base_name + ".pdf")
-                    
-                    if os.path.exists(generated_pdf) and generated_pdf != output_path:
-                        os.rename(generated_pdf, output_path)
-                    
-                    return os.path.exists(output_path)
-                else:
-                    print(f"LibreOffice 변환 실패: {result.stderr}")
-                    return False
-            else:
-                print("LibreOffice를 찾을 수 없습니다.")
-                return False
+        if libreoffice_pool.find_soffice():
+            if libreoffice_pool.convert_docx_to_pdf(docx_path, output_path):
+                return True
+            print("LibreOffice 변환 실패 - reportlab 경로로 대체합니다.")
         else:
-            print("현재 Linux/Mac에서의 DOCX → PDF 변환은 지원되지 않습니다.")
-            return False
+            print("LibreOffice를 찾을 수 없습니다 - reportlab 경로로 대체합니다.")
+        
+        # soffice가 없거나 실패한 경우 final_server의 reportlab 렌더러 사용
+        from final_server import docx_to_pdf_reportlab, clean_temp_files
+        temp_files = []
+        try:
+            return docx_to_pdf_reportlab(docx_path, output_path, temp_files) and os.path.exists(output_path)
+        finally:
+            clean_temp_files(temp_files)
             
     except Exception as e:
         print(f"DOCX → PDF 변환 중 오류: {str(e)}")
@@ -1645,9 +1524,96 @@ def too_large(e):
 def index():
     return render_template('index.html')
 
+def convert_pdf_to_docx(input_path, output_path, quality='medium', adobe_ready=False, pages=None):
+    """
+    /convert의 PDF → DOCX 변환 (Adobe 우선, 실패 시 pdf2docx/OCR)
+
+    pages가 지정되면 선택한 페이지만 담은 PDF를 한 번 만들어 Adobe와 fallback이 함께 사용한다.
+    같은 워커의 백그라운드 변환 작업과는 PyMuPDF/pdf2docx 호출 구간에서만 engine_lock으로 직렬화한다.
+
+    Returns:
+        tuple: (성공 여부, 실패 시 오류 코드)
+    """
+    with page_subset(input_path, pages) as pdf_path:
+        if adobe_ready:
+            print(">>> [DEBUG] image-only or vector PDF detected -> try Adobe first", flush=True)
+            if adobe_pdf_to_docx(pdf_path, output_path):
+                return True, None
+            print(">>> [DEBUG] Adobe failed -> fallback to pdf2docx/image_to_docx", flush=True)
+            if pdf_to_docx(pdf_path, output_path, quality):
+                return True, None
+            return False, "ADOBE_AND_FALLBACK_FAILED"
+        if pdf_to_docx(pdf_path, output_path, quality):
+            return True, None
+        return False, "PDF2DOCX_FAIL"
+
+def preview_pdf_to_docx(input_path, output_filename, quality, adobe_ready, pages):
+    """
+    미리보기 변환: 선택 범위의 첫 페이지만 빠르게 변환해 바로 응답하고,
+    선택 범위 전체 변환은 백그라운드 작업으로 계속 진행한다.
+
+    응답 헤더 X-Conversion-Job-Url 로 전체 결과의 상태/다운로드 위치를 알려준다.
+    """
+    started = time.perf_counter()
+    base = output_filename.rsplit('.', 1)[0]
+    preview_filename = f"{base}_preview.docx"
+    preview_path = current_scratch().path(preview_filename)
+    
+    # 백그라운드 작업과는 PyMuPDF/pdf2docx 호출 구간에서만 engine_lock으로 직렬화됨
+    job_id = conversion_jobs.submit_job(
+        lambda src, dst: convert_pdf_to_docx(src, dst, quality, adobe_ready, pages)[0],
+        input_path, output_filename)
+    
+    # 첫 페이지는 가장 빠른 pdf2docx로 (실패 시 전체 fallback 경로로 첫 페이지만)
+    ok = pdf_to_docx_with_pdf2docx(input_path, preview_path, pages=pages[:1])
+    if not ok:
+        ok = pdf_to_docx(input_path, preview_path, quality, pages=pages[:1])
+    if not ok:
+        return jsonify(success=False, error="PREVIEW_FAIL", job_id=job_id,
+                       job_url=url_for('conversion_job_status', job_id=job_id)), 500
+    
+    elapsed = time.perf_counter() - started
+    print(f"미리보기 변환 완료: {elapsed:.2f}s (전체 작업 {job_id} 진행 중)")
+    response = send_file(preview_path, as_attachment=True, download_name=preview_filename)
+    response.headers['X-Conversion-Job'] = job_id
+    response.headers['X-Conversion-Job-Url'] = url_for('conversion_job_status', job_id=job_id)
+    response.headers['X-Preview-Seconds'] = f"{elapsed:.3f}"
+    return response
+
+@app.route('/convert/jobs/<job_id>')
+def conversion_job_status(job_id):
+    """미리보기 요청의 전체 변환 작업 상태"""
+    state = conversion_jobs.job_status(job_id)
+    if state is None:
+        return jsonify(success=False, error="JOB_NOT_FOUND"), 404
+    if state.get('status') == 'done':
+        state['download_url'] = url_for('conversion_job_download', job_id=job_id)
+    return jsonify(state)
+
+@app.route('/convert/jobs/<job_id>/download')
+def conversion_job_download(job_id):
+    """완료된 전체 변환 결과 다운로드"""
+    output_path = conversion_jobs.job_output_path(job_id)
+    if output_path is None:
+        state = conversion_jobs.job_status(job_id)
+        if state is None:
+            return jsonify(success=False, error="JOB_NOT_FOUND"), 404
+        return jsonify(success=False, error="JOB_NOT_READY", status=state.get('status')), 409
+    
+    state = conversion_jobs.job_status(job_id)
+    response = send_file(output_path, as_attachment=True, download_name=state['download_name'])
+    # 전송이 끝날 때까지 정리 대상에서 제외
+    response.call_on_close(mark_in_use(output_path))
+    return response
+
 @app.route('/convert', methods=['POST'])
 def convert_file_api():
     """API 방식의 파일 변환 엔드포인트"""
+    # 요청 전용 스크래치 디렉토리 (tmpfs, 용량 초과 시 디스크) - 응답 후 모두 삭제
+    with scratch_space('convert'), debug_capture.debug_capture(debug_capture.capture_requested(request.headers)):
+        return _convert_file_api()
+
+def _convert_file_api():
     try:
         if ENABLE_DEBUG_LOGS:
             print("파일 업로드 요청 시작")
@@ -1655,6 +1621,8 @@ def convert_file_api():
             print(f"Request form: {request.form}")
             print(f"Request content type: {request.content_type}")
         
+        log_adobe_status()
+
         # 환경변수 기반 설정 확인
         adobe_ready = is_adobe_api_available()
         conversion_method = "Adobe API" if adobe_ready else "pdf2docx + OCR"
@@ -1780,10 +1748,9 @@ def convert_file_api():
             import time
             timestamp = str(int(time.time()))
             safe_filename = f"{timestamp}_{filename}"
-            input_path = os.path.join(UPLOAD_FOLDER, safe_filename)
+            input_path = current_scratch().path(safe_filename, size_hint=request.content_length or 0)
             
             try:
-                os.makedirs(UPLOAD_FOLDER, exist_ok=True)
                 file.save(input_path)
                 
                 saved_file_size = os.path.getsize(input_path)
@@ -1813,36 +1780,44 @@ def convert_file_api():
                     # PDF → DOCX 변환 - 출력 파일명 미리 고정
                     base = filename.rsplit(".", 1)[0] if "." in filename else filename
                     output_filename = base + ".docx"
-                    output_path = os.path.join(OUTPUT_FOLDER, output_filename)
+                    output_path = current_scratch().path(output_filename)
                     
                     quality = request.form.get('quality', 'medium')
                     print(f"PDF → DOCX 변환 시작 - {input_path} -> {output_path}")
                     
-                    # 암호화된 PDF 체크
+                    # 암호화된 PDF 체크 (페이지 수도 함께 확인)
                     import fitz
+                    page_count = None
                     try:
-                        with fitz.open(input_path) as doc:
-                            if doc.isEncrypted:
+                        with engine_lock, fitz.open(input_path) as doc:
+                            if doc.is_encrypted:
                                 return jsonify(success=False, error="ENCRYPTED_PDF"), 400
+                            page_count = doc.page_count
                     except Exception as e:
                         print(f"PDF 암호화 체크 실패: {e}")
                     
+                    # 페이지 범위 (pages=1-3,5) - 모든 변환 단계를 선택한 페이지로 제한
+                    pages = None
+                    pages_spec = request.values.get('pages', '').strip()
+                    preview = request.values.get('preview', '').lower() == 'true'
+                    if (pages_spec or preview) and page_count:
+                        try:
+                            pages = parse_page_range(pages_spec, page_count)
+                        except ValueError as e:
+                            return jsonify(success=False, error="INVALID_PAGE_RANGE", detail=str(e)), 400
+                        if pages == list(range(page_count)) and not preview:
+                            pages = None
+                    
                     # ADOBE_DISABLED 환경변수 체크
                     if os.getenv("ADOBE_DISABLED") == "true":
                         adobe_ready = False
                     
-                    if adobe_ready:
-                        print(">>> [DEBUG] image-only or vector PDF detected -> try Adobe first", flush=True)
-                        ok, info = adobe_pdf_to_docx(input_path, output_path)
-                        if not ok:
-                            print(">>> [DEBUG] Adobe failed -> fallback to pdf2docx/image_to_docx", flush=True)
-                            ok = pdf_to_docx(input_path, output_path, quality)
-                            if not ok:
-                                return jsonify(success=False, error="ADOBE_AND_FALLBACK_FAILED", detail=info), 400
-                    else:
-                        ok = pdf_to_docx(input_path, output_path, quality)
-                        if not ok:
-                            return jsonify(success=False, error="PDF2DOCX_FAIL"), 400
+                    if preview and pages:
+                        return preview_pdf_to_docx(input_path, output_filename, quality, adobe_ready, pages)
+                    
+                    ok, error = convert_pdf_to_docx(input_path, output_path, quality, adobe_ready, pages)
+                    if not ok:
+                        return jsonify(success=False, error=error), 400
                     
                     conversion_success = True
                     
@@ -1850,7 +1825,7 @@ def convert_file_api():
                     # DOCX → PDF 변환
                     base_filename = filename.rsplit('.', 1)[0] if '.' in filename else filename
                     output_filename = base_filename + '.pdf'
-                    output_path = os.path.join(OUTPUT_FOLDER, output_filename)
+                    output_path = current_scratch().path(output_filename)
                     
                     print(f"DOCX → PDF 변환 시작 - {input_path} -> {output_path}")
                     conversion_success = docx_to_pdf(input_path, output_path)
@@ -1859,7 +1834,7 @@ def convert_file_api():
                     # 이미지 → DOCX 변환
                     base_filename = filename.rsplit('.', 1)[0] if '.' in filename else filename
                     output_filename = base_filename + '.docx'
-                    output_path = os.path.join(OUTPUT_FOLDER, output_filename)
+                    output_path = current_scratch().path(output_filename)
                     
                     print(f"이미지 → DOCX 변환 시작 - {input_path} -> {output_path}")
                     conversion_success = image_to_docx(input_path, output_path)
@@ -1927,7 +1902,12 @@ def convert_file_api():
 @app.route('/upload', methods=['POST'])
 def upload_file():
     """기존 웹 인터페이스용 업로드 (리다이렉트 방식)"""
+    with scratch_space('upload'), debug_capture.debug_capture(debug_capture.capture_requested(request.headers)):
+        return _upload_file()
+
+def _upload_file():
     try:
+        log_adobe_status()
         print("파일 업로드 요청 시작")
         
         # 1단계: 파일 존재 여부 확인
@@ -2042,12 +2022,10 @@ def upload_file():
             import time
             timestamp = str(int(time.time()))
             safe_filename = f"{timestamp}_{filename}"
-            input_path = os.path.join(UPLOAD_FOLDER, safe_filename)
+            input_path = current_scratch().path(safe_filename, size_hint=request.content_length or 0)
             
             print(f"파일 저장 중 - {input_path}")
             try:
-                # 파일 저장 전 디렉토리 존재 확인
-                os.makedirs(UPLOAD_FOLDER, exist_ok=True)
                 file.save(input_path)
                 
                 # 저장된 파일 크기 재확인
@@ -2072,7 +2050,7 @@ def upload_file():
                 # 파일명에서 확장자 제거 (안전하게)
                 base_filename = filename.rsplit('.', 1)[0] if '.' in filename else filename
                 output_filename = base_filename + '.docx'
-                output_path = os.path.join(OUTPUT_FOLDER, output_filename)
+                output_path = current_scratch().path(output_filename)
                 
                 quality = request.form.get('quality', 'medium')
                 print(f"PDF → DOCX 변환 시작 - {input_path} -> {output_path}")
@@ -2104,7 +2082,7 @@ def upload_file():
                 # 파일명에서 확장자 제거 (안전하게)
                 base_filename = filename.rsplit('.', 1)[0] if '.' in filename else filename
                 output_filename = base_filename + '.pdf'
-                output_path = os.path.join(OUTPUT_FOLDER, output_filename)
+                output_path = current_scratch().path(output_filename)
                 
                 print(f"DOCX → PDF 변환 시작 - {input_path} -> {output_path}")
                 
@@ -2119,7 +2097,7 @@ def upload_file():
                 # 파일명에서 확장자 제거 (안전하게)
                 base_filename = filename.rsplit('.', 1)[0] if '.' in filename else filename
                 output_filename = base_filename + '.docx'
-                output_path = os.path.join(OUTPUT_FOLDER, output_filename)
+                output_path = current_scratch().path(output_filename)
                 
                 print(f"이미지 → DOCX 변환 시작 - {input_path} -> {output_path}")
                 
@@ -2170,6 +2148,70 @@ def upload_file():
         flash('파일 처리 중 오류가 발생했습니다.')
         return redirect(url_for('index'))
 
+# 문서 이력 조회 API (keyset 페이지네이션)
+_document_manager = None
+
+def get_document_manager():
+    """DocumentManager 지연 생성 (첫 조회 시 DB 마이그레이션 수행)"""
+    global _document_manager
+    if _document_manager is None:
+        from document_manager import DocumentManager
+        _document_manager = DocumentManager()
+    return _document_manager
+
+def _history_filters():
+    """공통 조회 필터 파싱 (limit, cursor, date_from, date_to, method)"""
+    limit = request.args.get('limit', type=int)
+    return {
+        'limit': limit,
+        'cursor': request.args.get('cursor') or None,
+        'date_from': request.args.get('date_from') or None,
+        'date_to': request.args.get('date_to') or None,
+        'method': request.args.get('method') or None,
+    }
+
+@app.route('/api/documents/failed')
+def api_failed_documents():
+    """검수 대상 실패 문서 페이지 조회"""
+    try:
+        page = get_document_manager().get_failed_documents_page(
+            status=request.args.get('status', 'pending') or None, **_history_filters())
+        return jsonify(success=True, **page)
+    except ValueError as e:
+        return jsonify(success=False, error=str(e)), 400
+
+@app.route('/api/documents')
+def api_documents():
+    """문서 변환 이력 페이지 조회"""
+    success_arg = request.args.get('success')
+    success = None if success_arg is None else success_arg.lower() == 'true'
+    try:
+        page = get_document_manager().get_documents_page(success=success, **_history_filters())
+        return jsonify(success=True, **page)
+    except ValueError as e:
+        return jsonify(success=False, error=str(e)), 400
+
+@app.route('/api/stats/daily')
+def api_daily_stats():
+    """일자별 변환 통계 페이지 조회"""
+    page = get_document_manager().get_daily_stats_page(
+        limit=request.args.get('limit', type=int),
+        before=request.args.get('before') or None,
+        method=request.args.get('method') or None)
+    return jsonify(success=True, **page)
+
+@app.route('/review/failed')
+def review_failed():
+    """실패 문서 수기 검수 페이지 (첫 페이지만 렌더링, 이후는 JSON API로 로드)"""
+    page = get_document_manager().get_failed_documents_page()
+    return render_template('review_failed.html', failed_items=page['items'],
+                           next_cursor=page['next_cursor'])
+
+# DOCX → PDF 변환 경로 안내 (UNO/soffice가 없어 상주 풀이 꺼진 경우 사유 출력)
+libreoffice_pool.log_pool_status()
+mark_boot_complete()
+
 if __name__ == '__main__':
+    start_reaper()
     port = int(os.environ.get("PORT", "5000"))
     app.run(debug=True, host='0.0.0.0', port=port)
\ No newline at end of file
@@ -0,0 +1,389 @@
+from collections.abc import Mapping
+
+from engine_registry import lazy_module
+
+# 서버 부팅 시 numpy를 import 하지 않도록 지연 로딩
+np = lazy_module('numpy')
+
+# 블록 종류 (kind 열 값)
+KIND_NAMES = ('text', 'vector_image', 'table')
+_KIND_CODES = {name: code for code, name in enumerate(KIND_NAMES)}
+
+# 정렬 (flags 열의 하위 2비트)
+ALIGNMENTS = ('left', 'center', 'right')
+_ALIGN_CODES = {name: code for code, name in enumerate(ALIGNMENTS)}
+_ALIGN_MASK = 0b11
+
+_COLUMNS = ('page', 'x0', 'y0', 'x1', 'y1', 'conf', 'kind', 'flags', 'text_id')
+_DTYPES = {
+    'page': 'int32',
+    'x0': 'float64', 'y0': 'float64', 'x1': 'float64', 'y1': 'float64',
+    'conf': 'float32',
+    'kind': 'uint8',
+    'flags': 'uint8',
+    'text_id': 'int32',
+}
+
+# 기존 dict 블록 형식별 키 (뷰가 노출하는 키 목록)
+LAYOUT_SCHEMA = ('text', 'bbox', 'page', 'alignment')
+OCR_WORD_SCHEMA = ('text', 'x', 'y', 'w', 'h', 'conf')
+OCR_BBOX_SCHEMA = ('text', 'bbox', 'confidence')
+BOX_SCHEMA = ('text', 'left', 'top', 'width', 'height', 'confidence')
+ADOBE_SCHEMA = ('type', 'text', 'left', 'top', 'width', 'height', 'confidence')
+
+
+def _number(value):
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+class BlockView(Mapping):
+    """
+    블록 저장소의 한 행을 기존 dict 블록처럼 읽는 가벼운 뷰
+
+    block['text'], block.get('confidence', 85) 같은 기존 코드를 그대로 쓸 수 있다.
+    copy()는 수정 가능한 dict를 돌려준다.
+    """
+
+    __slots__ = ('_store', '_index')
+
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, key):
+        return self._store.value(self._index, key)
+
+    def __iter__(self):
+        extras = self._store.extras.get(self._index)
+        yield from self._store.schema
+        if extras:
+            yield from extras
+
+    def __len__(self):
+        return len(self._store.schema) + len(self._store.extras.get(self._index, ()))
+
+    def copy(self):
+        return dict(self.items())
+
+    def __repr__(self):
+        return f"BlockView({self.copy()!r})"
+
+
+class TextBlockStore:
+    """
+    열 기반 텍스트 블록 저장소
+
+    페이지/좌표/신뢰도/종류/플래그는 NumPy 배열로, 텍스트는 중복을 제거한 하나의 문자열
+    버퍼와 오프셋으로 보관한다. 단어 단위 블록이 수만 개인 페이지에서도 dict를 만들지 않고
+    정렬/그룹화/겹침 검사를 배열 연산으로 처리한다.
+    """
+
+    def __init__(self, columns, text_buffer='', text_offsets=None, extras=None, schema=BOX_SCHEMA):
+        self.columns = {name: np.asarray(columns[name], dtype=_DTYPES[name]) for name in _COLUMNS}
+        self.text_buffer = text_buffer
+        self.text_offsets = np.asarray(text_offsets if text_offsets is not None else [0], dtype=np.int64)
+        self.extras = extras or {}
+        self.schema = tuple(schema)
+
+    # 생성
+
+    @classmethod
+    def empty(cls, schema=BOX_SCHEMA):
+        return cls({name: [] for name in _COLUMNS}, schema=schema)
+
+    @classmethod
+    def from_arrays(cls, texts, x0, y0, x1, y1, page=0, conf=100, kind='text', alignments=None,
+                    schema=BOX_SCHEMA):
+        """열 배열로 직접 생성 (OCR 결과처럼 이미 열 형태인 데이터용)"""
+        count = len(texts)
+        text_buffer, text_offsets, text_ids = _intern(texts)
+        flags = np.zeros(count, dtype=np.uint8)
+        if alignments is not None:
+            flags |= np.array([_ALIGN_CODES.get(a, 0) for a in alignments], dtype=np.uint8)
+        columns = {
+            'page': np.full(count, page, dtype=np.int32) if np.ndim(page) == 0 else page,
+            'x0': x0, 'y0': y0, 'x1': x1, 'y1': y1,
+            'conf': np.full(count, conf, dtype=np.float32) if np.ndim(conf) == 0 else conf,
+            'kind': np.full(count, _KIND_CODES[kind], dtype=np.uint8),
+            'flags': flags,
+            'text_id': text_ids,
+        }
+        return cls(columns, text_buffer, text_offsets, schema=schema)
+
+    @classmethod
+    def from_tesseract(cls, data, min_conf=0, schema=OCR_WORD_SCHEMA):
+        """
+        pytesseract.image_to_data(Output.DICT) 결과를 단어 블록 저장소로 변환
+
+        신뢰도가 min_conf 미만이거나(숫자가 아닌 값은 -1) 텍스트가 빈 단어는 제외한다.
+        """
+        try:
+            conf = np.asarray(data['conf'], dtype=np.float64)
+        except (TypeError, ValueError):
+            conf = np.array([_parse_conf(value) for value in data['conf']], dtype=np.float64)
+        conf = np.trunc(conf)
+        texts = [text.strip() for text in data['text']]
+        keep = np.flatnonzero((conf >= min_conf) & np.fromiter(map(bool, texts), dtype=bool, count=len(texts)))
+        left = np.asarray(data['left'], dtype=np.float64)[keep]
+        top = np.asarray(data['top'], dtype=np.float64)[keep]
+        width = np.asarray(data['width'], dtype=np.float64)[keep]
+        height = np.asarray(data['height'], dtype=np.float64)[keep]
+        return cls.from_arrays([texts[index] for index in keep.tolist()], left, top, left + width, top + height,
+                               conf=conf[keep], schema=schema)
+
+    @classmethod
+    def from_dicts(cls, blocks, schema=None):
+        """기존 dict 블록 목록 변환 (bbox / left·top·width·height / x·y·w·h 형식 모두 지원)"""
+        if isinstance(blocks, TextBlockStore):
+            return blocks
+        builder = TextBlockBuilder(schema or BOX_SCHEMA)
+        for block in blocks:
+            builder.add_dict(block)
+        return builder.build()
+
+    @classmethod
+    def from_columns(cls, data):
+        """to_columns() 결과(직렬화된 IR 등)에서 복원"""
+        extras = {int(index): value for index, value in data.get('extras', {}).items()}
+        return cls({name: data[name] for name in _COLUMNS}, data['text_buffer'], data['text_offsets'],
+                   extras, data['schema'])
+
+    def to_columns(self):
+        """msgpack/JSON으로 직렬화할 수 있는 열 dict"""
+        data = {name: self.columns[name].tolist() for name in _COLUMNS}
+        data['text_buffer'] = self.text_buffer
+        data['text_offsets'] = self.text_offsets.tolist()
+        data['extras'] = {str(index): value for index, value in self.extras.items()}
+        data['schema'] = list(self.schema)
+        return data
+
+    # 조회
+
+    def __len__(self):
+        return len(self.columns['page'])
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield BlockView(self, index)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(np.arange(len(self))[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return BlockView(self, index)
+
+    def text(self, index):
+        text_id = self.columns['text_id'][index]
+        return self.text_buffer[self.text_offsets[text_id]:self.text_offsets[text_id + 1]]
+
+    def texts(self):
+        return [self.text(index) for index in range(len(self))]
+
+    def value(self, index, key):
+        columns = self.columns
+        if key == 'text':
+            return self.text(index)
+        if key in ('left', 'x'):
+            return _number(columns['x0'][index])
+        if key in ('top', 'y'):
+            return _number(columns['y0'][index])
+        if key in ('width', 'w'):
+            return _number(columns['x1'][index] - columns['x0'][index])
+        if key in ('height', 'h'):
+            return _number(columns['y1'][index] - columns['y0'][index])
+        if key == 'bbox':
+            return [_number(columns[name][index]) for name in ('x0', 'y0', 'x1', 'y1')]
+        if key == 'page':
+            return int(columns['page'][index])
+        if key in ('confidence', 'conf'):
+            return _number(columns['conf'][index])
+        if key == 'type':
+            return KIND_NAMES[columns['kind'][index]]
+        if key == 'alignment':
+            return ALIGNMENTS[columns['flags'][index] & _ALIGN_MASK]
+        extras = self.extras.get(index)
+        if extras and key in extras:
+            return extras[key]
+        raise KeyError(key)
+
+    @property
+    def widths(self):
+        return self.columns['x1'] - self.columns['x0']
+
+    @property
+    def heights(self):
+        return self.columns['y1'] - self.columns['y0']
+
+    def areas(self):
+        return self.widths * self.heights
+
+    def kind_counts(self):
+        counts = np.bincount(self.columns['kind'], minlength=len(KIND_NAMES))
+        return {name: int(counts[code]) for code, name in enumerate(KIND_NAMES)}
+
+    def kind_mask(self, kind):
+        return self.columns['kind'] == _KIND_CODES[kind]
+
+    # 변환 (항상 새 저장소 반환, 텍스트 버퍼는 공유)
+
+    def take(self, indices):
+        indices = np.asarray(indices)
+        if indices.dtype == bool:
+            indices = np.flatnonzero(indices)
+        indices = indices.astype(np.int64, copy=False)
+        columns = {name: self.columns[name][indices] for name in _COLUMNS}
+        extras = {}
+        if self.extras:
+            for new_index, old_index in enumerate(indices.tolist()):
+                if old_index in self.extras:
+                    extras[new_index] = self.extras[old_index]
+        return TextBlockStore(columns, self.text_buffer, self.text_offsets, extras, self.schema)
+
+    def filter(self, mask):
+        return self.take(np.flatnonzero(mask))
+
+    def sorted(self, *keys):
+        """안정 정렬 (예: sorted('top', 'left') == sorted(blocks, key=lambda b: (b['top'], b['left'])))"""
+        if len(self) <= 1:
+            return self
+        sort_columns = {'page': 'page', 'top': 'y0', 'left': 'x0', 'bottom': 'y1', 'right': 'x1'}
+        order = np.lexsort([self.columns[sort_columns[key]] for key in reversed(keys)])
+        return self.take(order)
+
+    def page_groups(self):
+        """페이지 번호 순으로 (페이지, 블록 저장소) 목록 (페이지 내 순서 유지)"""
+        pages = self.columns['page']
+        if not len(pages):
+            return []
+        order = np.argsort(pages, kind='stable')
+        boundaries = np.flatnonzero(np.diff(pages[order])) + 1
+        return [(int(pages[chunk[0]]), self.take(chunk)) for chunk in np.split(order, boundaries)]
+
+    def page(self, page_number):
+        return self.filter(self.columns['page'] == page_number)
+
+    def group_lines(self, tolerance):
+        """
+        같은 줄 블록 묶기 (줄 키 = round(top / 허용오차) * 허용오차)
+
+        Args:
+            tolerance: 블록별 허용오차 배열 또는 단일 값
+
+        Returns:
+            list: 줄 키 오름차순, 줄마다 왼쪽부터 정렬된 블록 인덱스 배열
+        """
+        if not len(self):
+            return []
+        tolerance = np.broadcast_to(np.asarray(tolerance, dtype=np.float64), (len(self),))
+        line_keys = np.round(self.columns['y0'] / tolerance) * tolerance
+        order = np.lexsort((self.columns['x0'], line_keys))
+        boundaries = np.flatnonzero(np.diff(line_keys[order])) + 1
+        return np.split(order, boundaries)
+
+    def with_columns(self, **updates):
+        """일부 열만 바꾼 새 저장소 (예: 겹침 방지로 조정한 y0/y1)"""
+        columns = dict(self.columns)
+        for name, values in updates.items():
+            columns[name] = values
+        return TextBlockStore(columns, self.text_buffer, self.text_offsets, self.extras, self.schema)
+
+
+def _parse_conf(value):
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str) and value.replace('.', '').replace('-', '').isdigit():
+        return float(value)
+    return -1
+
+
+def _intern(texts):
+    """문자열 중복 제거 후 하나의 버퍼와 오프셋, 블록별 텍스트 ID로 변환"""
+    ids = {}
+    parts = []
+    offsets = [0]
+    text_ids = np.empty(len(texts), dtype=np.int32)
+    for index, text in enumerate(texts):
+        text_id = ids.get(text)
+        if text_id is None:
+            text_id = ids[text] = len(parts)
+            parts.append(text)
+            offsets.append(offsets[-1] + len(text))
+        text_ids[index] = text_id
+    return ''.join(parts), offsets, text_ids
+
+
+class TextBlockBuilder:
+    """블록을 하나씩 추가한 뒤 build()로 저장소 생성 (파서용)"""
+
+    def __init__(self, schema=BOX_SCHEMA):
+        self.schema = schema
+        self._columns = {name: [] for name in ('page', 'x0', 'y0', 'x1', 'y1', 'conf', 'kind', 'flags')}
+        self._texts = []
+        self._extras = {}
+
+    def __len__(self):
+        return len(self._texts)
+
+    def add(self, text, x0, y0, x1, y1, page=0, conf=100, kind='text', alignment='left', **extras):
+        columns = self._columns
+        if extras:
+            self._extras[len(self._texts)] = extras
+        self._texts.append(text)
+        columns['page'].append(page)
+        columns['x0'].append(x0)
+        columns['y0'].append(y0)
+        columns['x1'].append(x1)
+        columns['y1'].append(y1)
+        columns['conf'].append(conf)
+        columns['kind'].append(_KIND_CODES[kind])
+        columns['flags'].append(_ALIGN_CODES.get(alignment, 0))
+
+    def add_dict(self, block):
+        block = dict(block)
+        text = block.pop('text', '')
+        if 'bbox' in block:
+            x0, y0, x1, y1 = block.pop('bbox')
+        elif 'left' in block:
+            x0, y0 = block.pop('left'), block.pop('top')
+            x1, y1 = x0 + block.pop('width'), y0 + block.pop('height')
+        else:
+            x0, y0 = block.pop('x'), block.pop('y')
+            x1, y1 = x0 + block.pop('w'), y0 + block.pop('h')
+        conf = block.pop('confidence', block.pop('conf', 100))
+        self.add(text, x0, y0, x1, y1, page=block.pop('page', 0), conf=conf,
+                 kind=block.pop('type', 'text'), alignment=block.pop('alignment', 'left'), **block)
+
+    def build(self):
+        text_buffer, text_offsets, text_ids = _intern(self._texts)
+        columns = dict(self._columns, text_id=text_ids)
+        return TextBlockStore(columns, text_buffer, text_offsets, self._extras, self.schema)
+
+
+def as_block_store(blocks, schema=None):
+    """dict 블록 목록이나 저장소를 모두 받아 저장소로 반환"""
+    if isinstance(blocks, TextBlockStore):
+        return blocks
+    return TextBlockStore.from_dicts(blocks or [], schema)
+
+
+def box_overlaps(x0, y0, x1, y1, boxes):
+    """
+    블록 1개와 여러 박스의 겹침 폭/높이 (배열 연산)
+
+    Args:
+        boxes: (x0, y0, x1, y1) 배열 4개
+
+    Returns:
+        tuple: (x 겹침, y 겹침) 배열 (겹치지 않으면 0)
+    """
+    bx0, by0, bx1, by1 = boxes
+    x_overlap = np.maximum(0, np.minimum(x1, bx1) - np.maximum(x0, bx0))
+    y_overlap = np.maximum(0, np.minimum(y1, by1) - np.maximum(y0, by0))
+    return x_overlap, y_overlap
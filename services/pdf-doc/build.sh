@@ -55,6 +55,10 @@ python -m pip install --no-cache-dir --disable-pip-version-check opencv-python-h
 echo "Installing utilities..."
 python -m pip install --no-cache-dir --disable-pip-version-check "qrcode>=7.4.2" "requests>=2.31.0"
 
+# Fetch Korean fonts at build time (the server never downloads fonts at runtime)
+echo "Installing Korean fonts..."
+python download_nanumgothic.py || echo "NanumGothic download failed; system fonts will be used"
+
 # Verify installation
 echo "Verifying critical packages..."
 python -c "import numpy, cv2, PIL, flask; print('All critical packages imported successfully')"
@@ -30,6 +30,9 @@ BUILDER1_NOISE_PATTERNS = [
     r"템플릿\s*파일.*"
 ]
 
+# 모든 노이즈 패턴을 하나의 정규식으로 미리 컴파일 (모듈 로드 시 1회)
+BUILDER1_NOISE_REGEX = re.compile("|".join(f"(?:{p})" for p in BUILDER1_NOISE_PATTERNS), re.IGNORECASE)
+
 def filter_builder1_content(text: str) -> str:
     """Builder1 문서 전용 필터링"""
     if not text:
@@ -44,13 +47,7 @@ def filter_builder1_content(text: str) -> str:
             continue
         
         # Builder1 노이즈 패턴 확인
-        is_noise = False
-        for pattern in BUILDER1_NOISE_PATTERNS:
-            if re.search(pattern, line, re.IGNORECASE):
-                is_noise = True
-                break
-        
-        if not is_noise:
+        if not BUILDER1_NOISE_REGEX.search(line):
             filtered_lines.append(line)
     
     # 기본 필터링도 적용
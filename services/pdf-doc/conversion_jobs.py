@@ -0,0 +1,126 @@
+import json
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import file_reaper
+from file_reaper import mark_in_use
+from scratch_space import scratch_space
+
+# 백그라운드 변환 결과 보관 폴더 (여러 워커가 공유하도록 상태도 파일로 기록)
+JOB_OUTPUT_FOLDER = os.environ.get('JOB_OUTPUT_FOLDER', os.path.join('outputs', 'jobs'))
+CONVERSION_JOB_WORKERS = int(os.environ.get('CONVERSION_JOB_WORKERS', '2'))
+
+_JOB_ID = re.compile(r'^[0-9a-f]{32}$')
+
+_executor = None
+_executor_pid = None
+_lock = threading.Lock()
+
+
+def _get_executor():
+    # fork 된 워커에는 부모의 스레드 풀이 동작하지 않으므로 프로세스별로 생성
+    global _executor, _executor_pid
+    with _lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(max_workers=CONVERSION_JOB_WORKERS,
+                                           thread_name_prefix='conversion-job')
+            _executor_pid = os.getpid()
+            os.makedirs(JOB_OUTPUT_FOLDER, exist_ok=True)
+            # 찾아가지 않은 결과 파일은 TTL/용량 한도로 정리 (이미 실행 중인 정리기에도 등록)
+            file_reaper.add_directories([JOB_OUTPUT_FOLDER])
+        return _executor
+
+
+def _state_path(job_id):
+    return os.path.join(JOB_OUTPUT_FOLDER, f'{job_id}.json')
+
+
+def _write_state(job_id, **state):
+    tmp_path = _state_path(job_id) + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False)
+    os.replace(tmp_path, _state_path(job_id))
+
+
+def submit_job(convert, input_path, download_name):
+    """
+    전체 변환을 백그라운드로 실행
+
+    요청 스크래치 공간은 응답 후 삭제되므로 입력 파일을 작업 폴더로 복사한 뒤 실행한다.
+
+    Args:
+        convert: convert(input_path, output_path) -> bool
+        input_path: 입력 파일 경로
+        download_name: 완료 후 다운로드 파일명
+
+    Returns:
+        str: 작업 ID
+    """
+    executor = _get_executor()
+    job_id = uuid.uuid4().hex
+    ext = os.path.splitext(download_name)[1]
+    staged_input = os.path.join(JOB_OUTPUT_FOLDER, f'{job_id}.input{os.path.splitext(input_path)[1]}')
+    output_path = os.path.join(JOB_OUTPUT_FOLDER, f'{job_id}{ext}')
+
+    shutil.copyfile(input_path, staged_input)
+    _write_state(job_id, status='running', download_name=download_name, created_at=time.time())
+    executor.submit(_run_job, job_id, convert, staged_input, output_path, download_name)
+    return job_id
+
+
+def _run_job(job_id, convert, input_path, output_path, download_name):
+    started = time.time()
+    # 실행 중에는 정리기가 입력/결과 파일을 지우지 않도록 표시
+    releases = [mark_in_use(input_path), mark_in_use(output_path)]
+    try:
+        # PyMuPDF/pdf2docx 호출 구간만 engine_registry.engine_lock 으로 직렬화되므로
+        # Adobe 변환이나 프로세스 풀 변환 동안에는 같은 워커의 요청 변환이 막히지 않음
+        with scratch_space('job'):
+            ok = convert(input_path, output_path)
+        if ok and os.path.exists(output_path):
+            _write_state(job_id, status='done', download_name=download_name,
+                         output=os.path.basename(output_path), seconds=round(time.time() - started, 2))
+        else:
+            _write_state(job_id, status='failed', download_name=download_name, error='CONVERSION_FAILED')
+    except Exception as e:
+        print(f"❌ 백그라운드 변환 실패 ({job_id}): {e}")
+        _write_state(job_id, status='failed', download_name=download_name, error=str(e))
+    finally:
+        for release in releases:
+            release()
+        try:
+            os.remove(input_path)
+        except OSError:
+            pass
+
+
+def job_status(job_id):
+    """
+    작업 상태 (running / done / failed)
+
+    Returns:
+        dict: 상태 정보 (작업이 없거나 정리된 경우 None)
+    """
+    if not _JOB_ID.match(job_id or ''):
+        return None
+    try:
+        with open(_state_path(job_id), 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    state['job_id'] = job_id
+    return state
+
+
+def job_output_path(job_id):
+    """완료된 작업의 결과 파일 경로 (없으면 None)"""
+    state = job_status(job_id)
+    if not state or state.get('status') != 'done':
+        return None
+    path = os.path.abspath(os.path.join(JOB_OUTPUT_FOLDER, state['output']))
+    return path if os.path.exists(path) else None
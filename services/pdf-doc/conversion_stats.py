@@ -0,0 +1,189 @@
+import sqlite3
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence
+
+# 처리 시간 히스토그램 버킷 상한 (초) - 마지막 버킷은 상한 없는 overflow 버킷
+LATENCY_BUCKETS = (0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0)
+BUCKET_COLUMNS = [f"h{i}" for i in range(len(LATENCY_BUCKETS) + 1)]
+
+STATS_TABLE = "conversion_stats_daily"
+
+
+def bucket_index(seconds: float) -> int:
+    """처리 시간이 속하는 히스토그램 버킷 인덱스"""
+    for i, upper in enumerate(LATENCY_BUCKETS):
+        if seconds <= upper:
+            return i
+    return len(LATENCY_BUCKETS)
+
+
+def percentile_from_histogram(counts: Sequence[int], q: float,
+                              min_time: Optional[float] = None,
+                              max_time: Optional[float] = None) -> Optional[float]:
+    """
+    고정 버킷 히스토그램에서 백분위수 추정 (버킷 내부 선형 보간)
+
+    Args:
+        counts: 버킷별 건수 (LATENCY_BUCKETS + overflow)
+        q: 0~100 사이 백분위
+        min_time/max_time: 관측된 최소/최대값 (양 끝 버킷 경계 보정용)
+
+    Returns:
+        float: 추정 처리 시간 (초), 데이터가 없으면 None
+    """
+    total = sum(counts)
+    if total == 0:
+        return None
+
+    rank = max(1.0, q / 100.0 * total)
+    cumulative = 0
+    for i, c in enumerate(counts):
+        if c == 0:
+            continue
+        if cumulative + c >= rank:
+            lower = LATENCY_BUCKETS[i - 1] if i > 0 else 0.0
+            upper = LATENCY_BUCKETS[i] if i < len(LATENCY_BUCKETS) else (max_time or lower)
+            if min_time is not None:
+                lower = max(lower, min(min_time, upper))
+            if max_time is not None:
+                upper = min(upper, max_time)
+            fraction = (rank - cumulative) / c
+            return lower + (upper - lower) * fraction
+        cumulative += c
+
+    return max_time
+
+
+class ConversionStatsStore:
+    """
+    일/변환방식/결과 단위 변환 통계 집계
+
+    행마다 건수, 합계, 최소/최대, 고정 버킷 히스토그램을 유지하며
+    갱신은 단일 UPSERT 문으로 처리된다 (SELECT 후 UPDATE 경쟁 없음).
+    """
+
+    def __init__(self, db_file: str):
+        self.db_file = db_file
+        self.ensure_schema()
+
+    def ensure_schema(self):
+        """통계 테이블 생성"""
+        bucket_defs = ",\n".join(f"    {col} INTEGER NOT NULL DEFAULT 0" for col in BUCKET_COLUMNS)
+        with sqlite3.connect(self.db_file) as conn:
+            conn.execute(f'''
+                CREATE TABLE IF NOT EXISTS {STATS_TABLE} (
+                    date TEXT NOT NULL,
+                    method TEXT NOT NULL,
+                    outcome TEXT NOT NULL,
+                    count INTEGER NOT NULL DEFAULT 0,
+                    total_time REAL NOT NULL DEFAULT 0,
+                    min_time REAL,
+                    max_time REAL,
+                {bucket_defs},
+                    PRIMARY KEY (date, method, outcome)
+                )
+            ''')
+            conn.commit()
+
+    def record(self, success: bool, method: str, processing_time: float,
+               day: Optional[date] = None):
+        """변환 1건 기록 (단일 UPSERT)"""
+        day = day or date.today()
+        outcome = 'success' if success else 'failure'
+        processing_time = max(0.0, float(processing_time or 0.0))
+
+        buckets = [0] * len(BUCKET_COLUMNS)
+        buckets[bucket_index(processing_time)] = 1
+
+        columns = ", ".join(BUCKET_COLUMNS)
+        placeholders = ", ".join("?" for _ in BUCKET_COLUMNS)
+        bucket_updates = ",\n".join(f"{col} = {col} + excluded.{col}" for col in BUCKET_COLUMNS)
+
+        with sqlite3.connect(self.db_file) as conn:
+            conn.execute(f'''
+                INSERT INTO {STATS_TABLE} (
+                    date, method, outcome, count, total_time, min_time, max_time, {columns}
+                ) VALUES (?, ?, ?, 1, ?, ?, ?, {placeholders})
+                ON CONFLICT(date, method, outcome) DO UPDATE SET
+                    count = count + 1,
+                    total_time = total_time + excluded.total_time,
+                    min_time = MIN(min_time, excluded.min_time),
+                    max_time = MAX(max_time, excluded.max_time),
+                    {bucket_updates}
+            ''', (day.isoformat(), method or 'unknown', outcome,
+                  processing_time, processing_time, processing_time, *buckets))
+            conn.commit()
+
+    def _fetch_rows(self, start: date, end: date, method: Optional[str] = None,
+                    outcome: Optional[str] = None) -> List[sqlite3.Row]:
+        query = f"SELECT * FROM {STATS_TABLE} WHERE date >= ? AND date <= ?"
+        params: List = [start.isoformat(), end.isoformat()]
+        if method:
+            query += " AND method = ?"
+            params.append(method)
+        if outcome:
+            query += " AND outcome = ?"
+            params.append(outcome)
+
+        with sqlite3.connect(self.db_file) as conn:
+            conn.row_factory = sqlite3.Row
+            return conn.execute(query, params).fetchall()
+
+    def latency_summary(self, start: date, end: date, method: Optional[str] = None,
+                        outcome: Optional[str] = None,
+                        percentiles: Iterable[int] = (50, 95, 99)) -> Dict[str, Dict]:
+        """
+        기간 내 변환방식별 처리 시간 요약
+
+        Returns:
+            dict: {method: {'count', 'avg', 'min', 'max', 'p50', 'p95', 'p99'}}
+        """
+        merged: Dict[str, Dict] = {}
+        for row in self._fetch_rows(start, end, method, outcome):
+            entry = merged.setdefault(row['method'], {
+                'count': 0, 'total_time': 0.0, 'min': None, 'max': None,
+                'buckets': [0] * len(BUCKET_COLUMNS)
+            })
+            entry['count'] += row['count']
+            entry['total_time'] += row['total_time']
+            if row['min_time'] is not None:
+                entry['min'] = row['min_time'] if entry['min'] is None else min(entry['min'], row['min_time'])
+            if row['max_time'] is not None:
+                entry['max'] = row['max_time'] if entry['max'] is None else max(entry['max'], row['max_time'])
+            for i, col in enumerate(BUCKET_COLUMNS):
+                entry['buckets'][i] += row[col]
+
+        summary = {}
+        for name, entry in merged.items():
+            result = {
+                'count': entry['count'],
+                'avg': entry['total_time'] / entry['count'] if entry['count'] else None,
+                'min': entry['min'],
+                'max': entry['max'],
+            }
+            for q in percentiles:
+                result[f'p{q}'] = percentile_from_histogram(
+                    entry['buckets'], q, entry['min'], entry['max'])
+            summary[name] = result
+        return summary
+
+    def daily_totals(self, days: int = 7) -> List[Dict]:
+        """최근 N일 일자별 합계 (기존 conversion_stats 형식 호환)"""
+        start = date.today() - timedelta(days=days)
+        with sqlite3.connect(self.db_file) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(f'''
+                SELECT date,
+                       SUM(count) AS total_conversions,
+                       SUM(CASE WHEN outcome = 'success' THEN count ELSE 0 END) AS successful_conversions,
+                       SUM(CASE WHEN method = 'text' THEN count ELSE 0 END) AS text_based_conversions,
+                       SUM(CASE WHEN method = 'ocr' THEN count ELSE 0 END) AS ocr_based_conversions,
+                       SUM(total_time) / SUM(count) AS avg_processing_time,
+                       MIN(min_time) AS min_processing_time,
+                       MAX(max_time) AS max_processing_time
+                FROM {STATS_TABLE}
+                WHERE date >= ?
+                GROUP BY date
+                ORDER BY date DESC
+            ''', (start.isoformat(),)).fetchall()
+            return [dict(row) for row in rows]
@@ -1,6 +1,19 @@
 import re
 from advanced_text_filter import filter_text_blocks
 
+# 완전 제거할 UI 패턴
+UI_SKIP_PATTERNS = [
+    r"변환\s*방식\s*[:：].*",  # 변환 방식: ...
+    r"###\s*HTML\s*템플릿.*",   # ### HTML 템플릿...
+    r"##\s*🎯\s*\d+\..*",      # ## 🎯 4. ...
+    r"```\s*html.*",           # ```html
+    r"표준\s*변환\s*\(빠름\)",   # 표준 변환 (빠름)
+    r"웹\s*인터페이스\s*개선",   # 웹 인터페이스 개선
+]
+
+# 하나의 정규식으로 미리 컴파일 (모듈 로드 시 1회)
+UI_SKIP_REGEX = re.compile("|".join(f"(?:{p})" for p in UI_SKIP_PATTERNS), re.IGNORECASE)
+
 def enhanced_ui_filter(text: str) -> str:
     """더 강력한 UI 노이즈 제거"""
     if not text:
@@ -15,22 +28,7 @@ def enhanced_ui_filter(text: str) -> str:
             continue
         
         # 특정 패턴 완전 제거
-        skip_patterns = [
-            r"변환\s*방식\s*[:：].*",  # 변환 방식: ...
-            r"###\s*HTML\s*템플릿.*",   # ### HTML 템플릿...
-            r"##\s*🎯\s*\d+\..*",      # ## 🎯 4. ...
-            r"```\s*html.*",           # ```html
-            r"표준\s*변환\s*\(빠름\)",   # 표준 변환 (빠름)
-            r"웹\s*인터페이스\s*개선",   # 웹 인터페이스 개선
-        ]
-        
-        should_skip = False
-        for pattern in skip_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
-                should_skip = True
-                break
-        
-        if not should_skip:
+        if not UI_SKIP_REGEX.search(line):
             filtered_lines.append(line)
     
     # 기본 필터링도 적용
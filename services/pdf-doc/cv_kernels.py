@@ -0,0 +1,53 @@
+import threading
+
+from engine_registry import load_engine
+
+# 서버 이미지 전처리에서 사용하는 형태학 커널 (pre-fork 워밍업 대상)
+COMMON_KERNELS = [
+    ('MORPH_RECT', (2, 1)),
+    ('MORPH_ELLIPSE', (2, 2)),
+    ('MORPH_RECT', (30, 1)),
+    ('MORPH_RECT', (1, 30)),
+]
+COMMON_ONES = [(2, 2), (3, 3), (4, 4)]
+
+_kernels = {}
+_lock = threading.Lock()
+
+
+def _cached(key, build):
+    kernel = _kernels.get(key)
+    if kernel is None:
+        with _lock:
+            kernel = _kernels.get(key)
+            if kernel is None:
+                kernel = build()
+                # 워커 간 공유(copy-on-write) 페이지가 수정되지 않도록 읽기 전용
+                kernel.setflags(write=False)
+                _kernels[key] = kernel
+    return kernel
+
+
+def structuring_element(shape, size):
+    """cv2.getStructuringElement 결과 캐시 (shape는 'MORPH_RECT' 등 상수 이름)"""
+    def build():
+        cv2 = load_engine('cv2')
+        return cv2.getStructuringElement(getattr(cv2, shape), size)
+    return _cached((shape, size), build)
+
+
+def ones_kernel(size):
+    """np.ones(size, np.uint8) 커널 캐시"""
+    def build():
+        np = load_engine('numpy')
+        return np.ones(size, np.uint8)
+    return _cached(('ones', size), build)
+
+
+def warm_up():
+    """자주 쓰는 커널을 미리 생성 (생성한 커널 수 반환)"""
+    for shape, size in COMMON_KERNELS:
+        structuring_element(shape, size)
+    for size in COMMON_ONES:
+        ones_kernel(size)
+    return len(_kernels)
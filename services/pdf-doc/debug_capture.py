@@ -0,0 +1,146 @@
+import contextvars
+import os
+import queue
+import random
+import threading
+from contextlib import contextmanager
+
+# 환경변수 기반 설정 (기본값: 꺼짐)
+DEBUG_CAPTURE_DIR = os.environ.get('DEBUG_CAPTURE_DIR', 'debug_output')
+DEBUG_CAPTURE_SAMPLE_RATE = float(os.environ.get('DEBUG_CAPTURE_SAMPLE_RATE', '0'))
+DEBUG_CAPTURE_QUEUE_SIZE = int(os.environ.get('DEBUG_CAPTURE_QUEUE_SIZE', '32'))
+# 요청별로 캡처를 켜는 헤더 (예: X-Debug-Capture: 1)
+DEBUG_CAPTURE_HEADER = 'X-Debug-Capture'
+
+_enabled = contextvars.ContextVar('debug_capture', default=False)
+
+
+def capture_requested(headers):
+    """요청 헤더 또는 샘플링 비율로 이 요청의 디버그 캡처 여부 결정"""
+    value = (headers.get(DEBUG_CAPTURE_HEADER) or '').strip().lower()
+    if value in ('1', 'true', 'yes', 'on'):
+        return True
+    if value in ('0', 'false', 'no', 'off'):
+        return False
+    return DEBUG_CAPTURE_SAMPLE_RATE > 0 and random.random() < DEBUG_CAPTURE_SAMPLE_RATE
+
+
+@contextmanager
+def debug_capture(enabled):
+    """블록 동안 현재 작업의 디버그 캡처를 켜거나 끔"""
+    token = _enabled.set(bool(enabled))
+    try:
+        yield
+    finally:
+        _enabled.reset(token)
+
+
+def capture_enabled():
+    return _enabled.get()
+
+
+class DebugWriter:
+    """
+    디버그 산출물 백그라운드 기록기
+
+    PNG 인코딩과 파일 쓰기를 별도 스레드에서 수행한다. 큐가 가득 차면 기다리지 않고
+    버리므로(dropped) 변환 요청이 디버그 출력 때문에 느려지지 않는다.
+    """
+
+    def __init__(self, output_dir=None, queue_size=None):
+        self.output_dir = output_dir or DEBUG_CAPTURE_DIR
+        self.queue_size = DEBUG_CAPTURE_QUEUE_SIZE if queue_size is None else queue_size
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self._queue = None
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _ensure_thread(self):
+        # fork 된 워커에는 스레드가 복사되지 않으므로 프로세스별로 시작
+        if self._pid == os.getpid() and self._thread is not None:
+            return
+        with self._lock:
+            if self._pid == os.getpid() and self._thread is not None:
+                return
+            self._queue = queue.Queue(maxsize=self.queue_size)
+            self._thread = threading.Thread(target=self._run, name='debug-writer', daemon=True)
+            self._pid = os.getpid()
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            kind, payload, path = self._queue.get()
+            try:
+                os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+                if kind == 'image':
+                    payload.save(path, 'PNG')
+                else:
+                    with open(path, 'w', encoding='utf-8') as f:
+                        f.write(payload)
+                self.written += 1
+            except Exception as e:
+                self.failed += 1
+                print(f"디버깅 산출물 저장 오류 ({path}): {e}")
+            finally:
+                self._queue.task_done()
+
+    def submit(self, kind, payload, filename):
+        """
+        기록 작업 추가
+
+        Returns:
+            str: 기록될 파일 경로 (큐가 가득 차 버린 경우 None)
+        """
+        self._ensure_thread()
+        path = os.path.join(self.output_dir, filename)
+        try:
+            self._queue.put_nowait((kind, payload, path))
+        except queue.Full:
+            self.dropped += 1
+            return None
+        return path
+
+    def flush(self):
+        """대기 중인 기록 작업이 모두 끝날 때까지 대기 (테스트/종료용)"""
+        if self._queue is not None and self._pid == os.getpid():
+            self._queue.join()
+
+    def stats(self):
+        pending = self._queue.qsize() if self._queue is not None and self._pid == os.getpid() else 0
+        return {
+            'output_dir': self.output_dir,
+            'sample_rate': DEBUG_CAPTURE_SAMPLE_RATE,
+            'queue_size': self.queue_size,
+            'pending': pending,
+            'written': self.written,
+            'dropped': self.dropped,
+            'failed': self.failed,
+        }
+
+
+_writer = DebugWriter()
+
+
+def capture_text(text, filename):
+    """디버그 캡처가 켜진 작업에서만 텍스트 저장을 예약"""
+    if not _enabled.get():
+        return None
+    return _writer.submit('text', text, filename)
+
+
+def capture_image(image, filename):
+    """디버그 캡처가 켜진 작업에서만 이미지(PNG) 저장을 예약"""
+    if not _enabled.get():
+        return None
+    return _writer.submit('image', image, filename)
+
+
+def flush():
+    _writer.flush()
+
+
+def capture_stats():
+    return _writer.stats()
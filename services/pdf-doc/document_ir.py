@@ -0,0 +1,218 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+from block_store import TextBlockStore, LAYOUT_SCHEMA
+from engine_registry import engine_available, load_engine
+import file_reaper
+
+# 환경변수 기반 설정
+# 추출 결과(IR) 캐시 폴더 (여러 워커가 공유하도록 파일로 저장)
+DOCUMENT_IR_CACHE_DIR = os.environ.get('DOCUMENT_IR_CACHE_DIR', os.path.join('outputs', 'ir_cache'))
+DOCUMENT_IR_CACHE_ENABLED = os.environ.get('DOCUMENT_IR_CACHE_ENABLED', 'true').lower() == 'true'
+# 프로세스 메모리에 보관할 최근 IR 개수
+DOCUMENT_IR_MEMORY_ITEMS = int(os.environ.get('DOCUMENT_IR_MEMORY_ITEMS', '8'))
+
+# IR 구조가 바뀌면 올려서 이전 캐시를 무효화
+IR_VERSION = 2
+
+_FORMAT_MSGPACK = b'M'
+_FORMAT_JSON = b'Z'
+
+_memory = OrderedDict()
+_memory_lock = threading.Lock()
+_reaper_pid = None
+_stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'stored': 0}
+
+
+def new_document_ir(extractor):
+    """
+    빈 문서 IR (여러 출력 형식이 공유하는 중간 표현)
+
+    - pages: [{'number', 'width', 'height', 'orientation'}] (pt 단위)
+    - text_blocks: TextBlockStore.to_columns() 열 형식 (page, x0~y1, text 버퍼 등)
+    - images: [{'page', 'name', 'bbox', 'format', 'data'}] (data는 bytes)
+    - tables: [{'page', 'bbox', 'rows'}]
+    - ocr_text: 페이지별 OCR 텍스트 (OCR을 수행한 경우)
+    - transient: True이면 캐시하지 않음 (응급 대체 결과 등)
+    """
+    return {
+        'version': IR_VERSION,
+        'extractor': extractor,
+        'pages': [],
+        'text_blocks': TextBlockStore.empty(LAYOUT_SCHEMA).to_columns(),
+        'images': [],
+        'tables': [],
+        'orientation_info': {},
+        'full_text': '',
+        'ocr_text': [],
+    }
+
+
+def page_geometry(pdf_path):
+    """PyMuPDF로 페이지 크기/방향만 읽기 (렌더링 없음)"""
+    pages = []
+    with load_engine('fitz').open(pdf_path) as doc:
+        for number, page in enumerate(doc):
+            rect = page.rect
+            pages.append({
+                'number': number,
+                'width': round(rect.width, 2),
+                'height': round(rect.height, 2),
+                'orientation': 'landscape' if rect.width > rect.height else 'portrait',
+            })
+    return pages
+
+
+def document_key(pdf_path):
+    """파일 내용 해시 (업로드마다 파일명이 달라도 같은 문서면 같은 키)"""
+    digest = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _encode_bytes(value):
+    if isinstance(value, bytes):
+        return {'__bytes__': base64.b64encode(value).decode('ascii')}
+    raise TypeError(f"직렬화할 수 없는 값: {type(value).__name__}")
+
+
+def _decode_bytes(value):
+    if '__bytes__' in value and len(value) == 1:
+        return base64.b64decode(value['__bytes__'])
+    return value
+
+
+def dumps(ir):
+    """IR 직렬화 (msgpack이 설치되어 있으면 사용, 없으면 zlib 압축 JSON)"""
+    if engine_available('msgpack'):
+        return _FORMAT_MSGPACK + load_engine('msgpack').packb(ir, use_bin_type=True)
+    payload = json.dumps(ir, ensure_ascii=False, separators=(',', ':'), default=_encode_bytes)
+    return _FORMAT_JSON + zlib.compress(payload.encode('utf-8'), 6)
+
+
+def loads(blob):
+    kind, payload = blob[:1], blob[1:]
+    if kind == _FORMAT_MSGPACK:
+        return load_engine('msgpack').unpackb(payload, raw=False)
+    if kind == _FORMAT_JSON:
+        return json.loads(zlib.decompress(payload).decode('utf-8'), object_hook=_decode_bytes)
+    raise ValueError("알 수 없는 IR 캐시 형식")
+
+
+def _cache_path(cache_key):
+    return os.path.join(DOCUMENT_IR_CACHE_DIR, f'{cache_key}.ir')
+
+
+def _ensure_cache_dir():
+    # 오래된 캐시는 TTL/용량 한도로 정리 (이미 실행 중인 프로세스 전역 정리기에도 등록)
+    global _reaper_pid
+    if _reaper_pid != os.getpid():
+        os.makedirs(DOCUMENT_IR_CACHE_DIR, exist_ok=True)
+        file_reaper.add_directories([DOCUMENT_IR_CACHE_DIR])
+        _reaper_pid = os.getpid()
+
+
+def _remember(cache_key, ir):
+    with _memory_lock:
+        _memory[cache_key] = ir
+        _memory.move_to_end(cache_key)
+        while len(_memory) > DOCUMENT_IR_MEMORY_ITEMS:
+            _memory.popitem(last=False)
+
+
+def load_ir(cache_key):
+    """캐시된 IR (메모리 -> 디스크 순으로 확인, 없으면 None)"""
+    with _memory_lock:
+        ir = _memory.get(cache_key)
+        if ir is not None:
+            _memory.move_to_end(cache_key)
+            _stats['memory_hits'] += 1
+            return ir
+    try:
+        with open(_cache_path(cache_key), 'rb') as f:
+            ir = loads(f.read())
+    except (OSError, ValueError, zlib.error):
+        return None
+    except Exception as e:
+        # msgpack 미설치 환경에서 msgpack 캐시를 읽는 경우 등
+        print(f"IR 캐시 읽기 실패 (무시됨): {e}")
+        return None
+    if ir.get('version') != IR_VERSION:
+        return None
+    _stats['disk_hits'] += 1
+    _remember(cache_key, ir)
+    return ir
+
+
+def store_ir(cache_key, ir):
+    _remember(cache_key, ir)
+    try:
+        _ensure_cache_dir()
+        tmp_path = f'{_cache_path(cache_key)}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(dumps(ir))
+        os.replace(tmp_path, _cache_path(cache_key))
+        _stats['stored'] += 1
+    except Exception as e:
+        print(f"IR 캐시 저장 실패 (무시됨): {e}")
+
+
+def cached_document_ir(pdf_path, extractor, build, variant=''):
+    """
+    문서 IR을 한 번만 추출하고 이후 출력 형식은 캐시된 IR을 사용
+
+    같은 PDF를 DOCX와 PPTX로 각각 변환할 때 텍스트 추출/래스터화/OCR은 처음 한 번만
+    수행되고, 두 번째 형식은 writer 시간만 든다.
+
+    Args:
+        pdf_path: PDF 경로
+        extractor: 추출기 이름 (추출기마다 IR을 따로 캐시)
+        build: build(pdf_path) -> IR dict
+        variant: 추출 결과에 영향을 주는 옵션 (예: 래스터화 품질)
+
+    Returns:
+        dict: 문서 IR (writer는 수정하지 말고 읽기만 할 것)
+    """
+    if not DOCUMENT_IR_CACHE_ENABLED:
+        return build(pdf_path)
+
+    started = time.perf_counter()
+    cache_key = f"{document_key(pdf_path)}_{extractor}{'_' + variant if variant else ''}"
+    ir = load_ir(cache_key)
+    if ir is not None:
+        print(f"♻️ 문서 IR 캐시 사용: {extractor} ({(time.perf_counter() - started) * 1000:.0f}ms)")
+        return ir
+
+    _stats['misses'] += 1
+    ir = build(pdf_path)
+    if ir is not None and not ir.get('transient'):
+        store_ir(cache_key, ir)
+    return ir
+
+
+def cached_source_path(pdf_path, extractor, suffix):
+    """
+    추출 원본 결과(예: Adobe Extract ZIP)를 IR 대신 보관할 캐시 파일 경로
+
+    IR로 만들면 그림 bytes까지 메모리에 올라가는 추출기는 원본 결과 파일을 보관해 두고 다시 스트림으로
+    읽는다. 캐시가 꺼져 있으면 None.
+    """
+    if not DOCUMENT_IR_CACHE_ENABLED:
+        return None
+    _ensure_cache_dir()
+    return os.path.join(DOCUMENT_IR_CACHE_DIR, f"{document_key(pdf_path)}_{extractor}{suffix}")
+
+
+def ir_cache_stats():
+    with _memory_lock:
+        memory_items = len(_memory)
+    return dict(_stats, memory_items=memory_items, cache_dir=DOCUMENT_IR_CACHE_DIR,
+                enabled=DOCUMENT_IR_CACHE_ENABLED)
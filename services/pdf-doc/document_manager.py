@@ -5,6 +5,22 @@ import os
 from datetime import datetime, date
 from typing import Dict, List, Optional
 
+from conversion_stats import ConversionStatsStore
+from document_queries import DocumentQueries
+
+# PRAGMA user_version 으로 관리되는 스키마 버전
+SCHEMA_VERSION = 1
+
+# documents 테이블에 나중에 추가된 컬럼들 (구 DB 마이그레이션용)
+DOCUMENT_COLUMNS = {
+    'original_path': 'TEXT',
+    'document_number': 'VARCHAR(100)',
+    'business_number': 'VARCHAR(100)',
+    'phone_number': 'VARCHAR(100)',
+    'file_size': 'INTEGER',
+    'processing_time_seconds': 'REAL',
+}
+
 class DocumentManager:
     def __init__(self, data_dir="document_data"):
         self.data_dir = data_dir
@@ -17,6 +33,9 @@ class DocumentManager:
         
         # 데이터베이스 초기화
         self.init_database()
+        self.migrate_database()
+        self.stats = ConversionStatsStore(self.db_file)
+        self.queries = DocumentQueries(self.db_file)
     
     def init_database(self):
         """데이터베이스 초기화 및 테이블 생성"""
@@ -62,6 +81,50 @@ class DocumentManager:
         except Exception as e:
             print(f"❌ 기본 테이블 생성 오류: {e}")
     
+    def migrate_database(self):
+        """스키마 마이그레이션 (누락 컬럼/테이블 및 조회용 인덱스 추가)"""
+        try:
+            with sqlite3.connect(self.db_file) as conn:
+                version = conn.execute('PRAGMA user_version').fetchone()[0]
+                if version >= SCHEMA_VERSION:
+                    return
+                
+                # v1: 폴백 스키마에 누락된 컬럼/테이블 보완 + 인덱스
+                existing = {row[1] for row in conn.execute('PRAGMA table_info(documents)')}
+                for column, column_type in DOCUMENT_COLUMNS.items():
+                    if column not in existing:
+                        conn.execute(f'ALTER TABLE documents ADD COLUMN {column} {column_type}')
+                
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS extraction_failures (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        document_id INTEGER NOT NULL,
+                        failure_reason TEXT,
+                        failure_type VARCHAR(50),
+                        manual_review_status VARCHAR(20) DEFAULT 'pending',
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        FOREIGN KEY (document_id) REFERENCES documents(id)
+                    )
+                ''')
+                
+                conn.executescript('''
+                    CREATE INDEX IF NOT EXISTS idx_documents_created_at
+                        ON documents(created_at, id);
+                    CREATE INDEX IF NOT EXISTS idx_documents_method_created_at
+                        ON documents(conversion_method, created_at, id);
+                    CREATE INDEX IF NOT EXISTS idx_failures_review_status
+                        ON extraction_failures(manual_review_status, document_id);
+                    CREATE INDEX IF NOT EXISTS idx_failures_document_id
+                        ON extraction_failures(document_id, manual_review_status);
+                ''')
+                
+                conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+                conn.commit()
+                print(f"✅ 데이터베이스 마이그레이션 완료: v{version} → v{SCHEMA_VERSION}")
+                
+        except Exception as e:
+            print(f"❌ 데이터베이스 마이그레이션 오류: {e}")
+    
     def save_document_data(self, pdf_path: str, extracted_numbers: Dict, 
                           conversion_method: str, success: bool = True, 
                           processing_time: float = 0.0) -> int:
@@ -148,92 +211,63 @@ class DocumentManager:
             print(f"❌ 실패 케이스 저장 오류: {e}")
     
     def _update_daily_stats(self, success: bool, method: str, processing_time: float):
-        """일일 통계 업데이트"""
+        """일일 통계 업데이트 (일/방식/결과 단위 UPSERT)"""
         try:
-            today = date.today()
-            
-            with sqlite3.connect(self.db_file) as conn:
-                # 오늘 통계 확인
-                cursor = conn.cursor()
-                cursor.execute('SELECT id FROM conversion_stats WHERE date = ?', (today,))
-                
-                if cursor.fetchone():
-                    # 기존 통계 업데이트
-                    conn.execute('''
-                        UPDATE conversion_stats SET 
-                            total_conversions = total_conversions + 1,
-                            successful_conversions = successful_conversions + ?,
-                            text_based_conversions = text_based_conversions + ?,
-                            ocr_based_conversions = ocr_based_conversions + ?,
-                            avg_processing_time = (avg_processing_time + ?) / 2
-                        WHERE date = ?
-                    ''', (
-                        1 if success else 0,
-                        1 if method == 'text' else 0,
-                        1 if method == 'ocr' else 0,
-                        processing_time,
-                        today
-                    ))
-                else:
-                    # 새 통계 생성
-                    conn.execute('''
-                        INSERT INTO conversion_stats (
-                            date, total_conversions, successful_conversions,
-                            text_based_conversions, ocr_based_conversions, avg_processing_time
-                        ) VALUES (?, 1, ?, ?, ?, ?)
-                    ''', (
-                        today,
-                        1 if success else 0,
-                        1 if method == 'text' else 0,
-                        1 if method == 'ocr' else 0,
-                        processing_time
-                    ))
-                
-                conn.commit()
-                
+            self.stats.record(success, method, processing_time)
         except Exception as e:
             print(f"❌ 통계 업데이트 오류: {e}")
     
     def get_failed_documents(self) -> List[Dict]:
-        """검수가 필요한 실패 문서 목록 조회"""
+        """검수가 필요한 실패 문서 목록 조회 (전체)"""
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                
-                cursor.execute('''
-                    SELECT d.*, ef.failure_reason, ef.manual_review_status
-                    FROM documents d
-                    JOIN extraction_failures ef ON d.id = ef.document_id
-                    WHERE ef.manual_review_status = 'pending'
-                    ORDER BY d.created_at DESC
-                ''')
-                
-                return [dict(row) for row in cursor.fetchall()]
+            items = []
+            cursor = None
+            while True:
+                page = self.queries.failed_documents(cursor=cursor)
+                items.extend(page['items'])
+                cursor = page['next_cursor']
+                if not cursor:
+                    return items
                 
         except Exception as e:
             print(f"❌ 실패 문서 조회 오류: {e}")
             return []
     
+    def get_failed_documents_page(self, limit: Optional[int] = None, cursor: Optional[str] = None,
+                                  date_from: Optional[str] = None, date_to: Optional[str] = None,
+                                  method: Optional[str] = None, status: Optional[str] = 'pending') -> Dict:
+        """실패 문서 한 페이지 조회 (keyset 페이지네이션)"""
+        return self.queries.failed_documents(limit=limit, cursor=cursor, date_from=date_from,
+                                             date_to=date_to, method=method, status=status)
+    
+    def get_documents_page(self, limit: Optional[int] = None, cursor: Optional[str] = None,
+                           date_from: Optional[str] = None, date_to: Optional[str] = None,
+                           method: Optional[str] = None, success: Optional[bool] = None) -> Dict:
+        """문서 변환 이력 한 페이지 조회 (keyset 페이지네이션)"""
+        return self.queries.documents(limit=limit, cursor=cursor, date_from=date_from,
+                                      date_to=date_to, method=method, success=success)
+    
+    def get_daily_stats_page(self, limit: Optional[int] = None, before: Optional[str] = None,
+                             method: Optional[str] = None) -> Dict:
+        """일자별 통계 한 페이지 조회"""
+        return self.queries.daily_stats(limit=limit, before=before, method=method)
+    
     def get_daily_stats(self, days: int = 7) -> List[Dict]:
         """최근 N일 통계 조회"""
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                
-                cursor.execute('''
-                    SELECT * FROM conversion_stats 
-                    WHERE date >= date('now', '-{} days')
-                    ORDER BY date DESC
-                '''.format(days))
-                
-                return [dict(row) for row in cursor.fetchall()]
-                
+            return self.stats.daily_totals(days)
         except Exception as e:
             print(f"❌ 통계 조회 오류: {e}")
             return []
     
+    def get_latency_stats(self, start: date, end: date, method: Optional[str] = None) -> Dict[str, Dict]:
+        """기간 내 변환방식별 처리 시간 p50/p95/p99 조회 (documents 테이블 스캔 없음)"""
+        try:
+            return self.stats.latency_summary(start, end, method=method)
+        except Exception as e:
+            print(f"❌ 처리 시간 통계 조회 오류: {e}")
+            return {}
+    
     def _save_to_json(self, document_data: Dict):
         """JSON 백업 저장"""
         try:
@@ -0,0 +1,173 @@
+import base64
+import json
+import sqlite3
+from typing import Any, Dict, List, Optional, Tuple
+
+from conversion_stats import STATS_TABLE
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(created_at: Any, row_id: int, *tie_breakers: int) -> str:
+    """마지막 행의 (created_at, id[, 보조 id...])를 불투명 커서 문자열로 인코딩"""
+    raw = json.dumps([created_at, row_id, *tie_breakers], ensure_ascii=False).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[Any, ...]]:
+    """커서 문자열 디코딩 (잘못된 커서는 ValueError)"""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, *ids = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        if not ids:
+            raise ValueError(cursor)
+        return (created_at, *(int(row_id) for row_id in ids))
+    except Exception:
+        raise ValueError(f"잘못된 페이지 커서: {cursor}")
+
+
+def clamp_page_size(limit: Optional[int]) -> int:
+    if not limit or limit <= 0:
+        return DEFAULT_PAGE_SIZE
+    return min(int(limit), MAX_PAGE_SIZE)
+
+
+class DocumentQueries:
+    """
+    문서 이력 조회 계층 (keyset 페이지네이션)
+
+    OFFSET 대신 (created_at, id) 기준 커서를 사용하므로 페이지 깊이와 무관하게
+    인덱스 범위 탐색 + LIMIT 만으로 결과를 반환한다.
+    """
+
+    def __init__(self, db_file: str):
+        self.db_file = db_file
+
+    def _page(self, sql: str, params: List, limit: int,
+              cursor_keys: Tuple[str, ...] = ('created_at', 'id')) -> Dict[str, Any]:
+        with sqlite3.connect(self.db_file) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = [dict(row) for row in conn.execute(sql, params + [limit + 1]).fetchall()]
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(*(last[key] for key in cursor_keys))
+
+        return {'items': rows, 'next_cursor': next_cursor}
+
+    @staticmethod
+    def _apply_filters(where: List[str], params: List, date_from: Optional[str],
+                       date_to: Optional[str], method: Optional[str],
+                       cursor: Optional[str],
+                       cursor_columns: Tuple[str, ...] = ('d.created_at', 'd.id')):
+        if date_from:
+            where.append("d.created_at >= ?")
+            params.append(date_from)
+        if date_to:
+            where.append("d.created_at < date(?, '+1 day')")
+            params.append(date_to)
+        if method:
+            where.append("d.conversion_method = ?")
+            params.append(method)
+
+        position = decode_cursor(cursor)
+        if position:
+            if len(position) != len(cursor_columns):
+                raise ValueError(f"잘못된 페이지 커서: {cursor}")
+            where.append(f"({', '.join(cursor_columns)}) < ({', '.join('?' * len(cursor_columns))})")
+            params.extend(position)
+
+    def failed_documents(self, limit: Optional[int] = None, cursor: Optional[str] = None,
+                         date_from: Optional[str] = None, date_to: Optional[str] = None,
+                         method: Optional[str] = None,
+                         status: Optional[str] = 'pending') -> Dict[str, Any]:
+        """
+        검수 대상 실패 문서 한 페이지 조회
+
+        문서 하나에 실패 기록이 여러 개일 수 있으므로 실패 id까지 정렬/커서 키에 포함해
+        페이지가 한 문서의 실패 기록 중간에서 끝나도 나머지를 다음 페이지에서 이어 반환한다.
+        """
+        limit = clamp_page_size(limit)
+        where: List[str] = []
+        params: List = []
+
+        if status:
+            where.append("ef.manual_review_status = ?")
+            params.append(status)
+        self._apply_filters(where, params, date_from, date_to, method, cursor,
+                            cursor_columns=('d.created_at', 'd.id', 'ef.id'))
+
+        sql = f'''
+            SELECT d.*, ef.id AS failure_id, ef.failure_reason, ef.manual_review_status
+            FROM documents d
+            JOIN extraction_failures ef ON ef.document_id = d.id
+            {"WHERE " + " AND ".join(where) if where else ""}
+            ORDER BY d.created_at DESC, d.id DESC, ef.id DESC
+            LIMIT ?
+        '''
+        return self._page(sql, params, limit, cursor_keys=('created_at', 'id', 'failure_id'))
+
+    def documents(self, limit: Optional[int] = None, cursor: Optional[str] = None,
+                  date_from: Optional[str] = None, date_to: Optional[str] = None,
+                  method: Optional[str] = None,
+                  success: Optional[bool] = None) -> Dict[str, Any]:
+        """문서 변환 이력 한 페이지 조회"""
+        limit = clamp_page_size(limit)
+        where: List[str] = []
+        params: List = []
+
+        if success is not None:
+            where.append("d.success = ?")
+            params.append(1 if success else 0)
+        self._apply_filters(where, params, date_from, date_to, method, cursor)
+
+        sql = f'''
+            SELECT d.*
+            FROM documents d
+            {"WHERE " + " AND ".join(where) if where else ""}
+            ORDER BY d.created_at DESC, d.id DESC
+            LIMIT ?
+        '''
+        return self._page(sql, params, limit)
+
+    def daily_stats(self, limit: Optional[int] = None, before: Optional[str] = None,
+                    method: Optional[str] = None) -> Dict[str, Any]:
+        """일자별 통계 한 페이지 조회 (before 이전 날짜부터 내림차순)"""
+        limit = clamp_page_size(limit)
+        where: List[str] = []
+        params: List = []
+        if before:
+            where.append("date < ?")
+            params.append(before)
+        if method:
+            where.append("method = ?")
+            params.append(method)
+
+        sql = f'''
+            SELECT date,
+                   SUM(count) AS total_conversions,
+                   SUM(CASE WHEN outcome = 'success' THEN count ELSE 0 END) AS successful_conversions,
+                   SUM(total_time) / SUM(count) AS avg_processing_time,
+                   MIN(min_time) AS min_processing_time,
+                   MAX(max_time) AS max_processing_time
+            FROM {STATS_TABLE}
+            {"WHERE " + " AND ".join(where) if where else ""}
+            GROUP BY date
+            ORDER BY date DESC
+            LIMIT ?
+        '''
+        with sqlite3.connect(self.db_file) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = [dict(row) for row in conn.execute(sql, params + [limit + 1]).fetchall()]
+
+        next_before = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_before = rows[-1]['date']
+
+        return {'items': rows, 'next_before': next_before}
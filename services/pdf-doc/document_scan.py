@@ -0,0 +1,310 @@
+import logging
+import os
+import random
+import re
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import List
+
+from engine_registry import load_engine
+
+# 환경변수 기반 설정
+# 내용 스트림을 검사할 최대 페이지 수 (첫/마지막 페이지 + 구간별 무작위 페이지)
+SCAN_SAMPLE_PAGES = int(os.environ.get('SCAN_SAMPLE_PAGES', '12'))
+# 사전 분석 시간 한도 (초과하면 그때까지 검사한 페이지로 판단)
+SCAN_TIME_BUDGET_SECONDS = float(os.environ.get('SCAN_TIME_BUDGET_SECONDS', '0.5'))
+# 텍스트 출력 연산자의 문자열이 이 바이트 이상이면 텍스트 페이지로 간주
+SCAN_MIN_TEXT_BYTES = int(os.environ.get('SCAN_MIN_TEXT_BYTES', '50'))
+# OCR 예상 시간 계산용 페이지당 OCR 시간(초)
+SCAN_OCR_SECONDS_PER_PAGE = float(os.environ.get('SCAN_OCR_SECONDS_PER_PAGE', '2.5'))
+
+# 공문서 키워드 패턴
+OFFICIAL_KEYWORDS = [
+    '공문', '시행', '수신', '발신', '시행일자', '문서번호', '담당부서',
+    '결재', '시장', '구청장', '과장', '팀장', '담당자',
+    '붙임', '끝.', '협조사항', '시행근거', '추진계획',
+    '○', '가.', '나.', '다.', '라.', '마.',
+    '1.', '2.', '3.', '4.', '5.',
+    '기안자', '검토자', '결재권자', '시행자'
+]
+
+# 공문서 레이아웃 패턴
+OFFICIAL_PATTERNS = [
+    r'문서번호\s*:', r'시행일자\s*:', r'수신\s*:', r'발신\s*:',
+    r'제\s*목\s*:', r'담당부서\s*:', r'담당자\s*:',
+    r'\d{4}-\d+', r'\d{4}\.\d{1,2}\.\d{1,2}',  # 문서번호, 날짜 패턴
+    r'붙임\s*\d*\s*부', r'끝\s*\.',
+    r'[가-힣]+시장|[가-힣]+구청장|[가-힣]+과장'
+]
+
+# 내용 스트림 토큰 (BT ... ET 텍스트 객체 안의 문자열과 Tj/TJ 연산자)
+_TEXT_OBJECT = re.compile(rb'\bBT\b(.*?)\bET\b', re.S)
+_TEXT_SHOW = re.compile(rb'T[jJ](?![A-Za-z])')
+_STRING_START = re.compile(rb'[(<]')
+_LITERAL_TOKEN = re.compile(rb'\\.|[()]', re.S)
+_HEX_STRING = re.compile(rb'<([0-9A-Fa-f\s]*)>')
+# XObject 그리기 연산자 (/이름 Do)와 인라인 이미지 (BI /키 ...)
+_XOBJECT_DO = re.compile(rb'/([^\s/\[\]()<>{}%]+)\s*Do(?![A-Za-z])')
+_INLINE_IMAGE = re.compile(rb'\bBI\s*/')
+
+
+@dataclass
+class DocumentScan:
+    """PDF 사전 분석 결과 (표본 페이지 기준)"""
+    pdf_type: str                      # text_based / scanned_image / mixed / empty
+    page_count: int
+    sampled_pages: List[int] = field(default_factory=list)
+    text_pages: int = 0
+    image_pages: int = 0
+    text_ratio: float = 0.0
+    orientation: str = 'unknown'       # portrait / landscape
+    orientation_ratio: float = 0.0
+    landscape_pages: int = 0
+    portrait_pages: int = 0
+    is_official: bool = False
+    official_score: float = 0.0
+    keyword_count: int = 0
+    pattern_count: int = 0
+    estimated_ocr_pages: int = 0
+    estimated_ocr_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+    budget_exhausted: bool = False
+
+    def to_analysis(self):
+        """smart_converter 분석 결과 dict 형식 (type / text_ratio / orientation / official_document)"""
+        if self.pdf_type == 'empty':
+            return {'type': 'empty'}
+        return {
+            'type': self.pdf_type,
+            'text_ratio': self.text_ratio,
+            'orientation': {
+                'orientation': self.orientation,
+                'ratio': self.orientation_ratio,
+                'landscape_pages': self.landscape_pages,
+                'portrait_pages': self.portrait_pages,
+            },
+            'official_document': {
+                'is_official': self.is_official,
+                'confidence': self.official_score,
+                'keyword_count': self.keyword_count,
+                'pattern_count': self.pattern_count,
+            },
+            'estimated_ocr_seconds': self.estimated_ocr_seconds,
+            'scan': asdict(self),
+        }
+
+
+def sample_pages(page_count, limit=None, seed=None):
+    """
+    검사할 페이지 번호 (검사 순서)
+
+    첫 페이지, 마지막 페이지, 나머지 구간을 균등하게 나눈 각 구간의 무작위 페이지 1개.
+    seed가 같으면 항상 같은 페이지를 고른다. limit이 1 이하이면 첫 페이지만 검사한다.
+    """
+    limit = max(1, SCAN_SAMPLE_PAGES if limit is None else limit)
+    if page_count <= limit:
+        return list(range(page_count))
+    if limit == 1:
+        return [0]
+    pages = [0, page_count - 1]
+    strata = limit - 2
+    rng = random.Random(seed if seed is not None else page_count)
+    span = (page_count - 2) / strata if strata else 0
+    for index in range(strata):
+        start = 1 + int(index * span)
+        end = 1 + int((index + 1) * span)
+        pages.append(rng.randrange(start, max(start + 1, end)))
+    return pages
+
+
+def official_document_score(text):
+    """첫 페이지 텍스트의 공문서 키워드/패턴 점수"""
+    keyword_count = sum(1 for keyword in OFFICIAL_KEYWORDS if keyword in text)
+    pattern_count = sum(1 for pattern in OFFICIAL_PATTERNS if re.search(pattern, text))
+    confidence = (keyword_count * 0.3 + pattern_count * 0.7) / 10
+    return {
+        'is_official': keyword_count >= 3 or pattern_count >= 2,
+        'confidence': min(confidence, 1.0),
+        'keyword_count': keyword_count,
+        'pattern_count': pattern_count,
+    }
+
+
+def _string_bytes(body):
+    """텍스트 객체 안 문자열의 바이트 수 (리터럴 문자열은 괄호 깊이를 세어 (a(b)c) 같은 중첩도 처리)"""
+    total = 0
+    position = 0
+    while True:
+        start = _STRING_START.search(body, position)
+        if start is None:
+            return total
+        position = start.start()
+        if body[position:position + 1] == b'(':
+            depth = 0
+            for token in _LITERAL_TOKEN.finditer(body, position):
+                if token.group() == b'(':
+                    depth += 1
+                elif token.group() == b')':
+                    depth -= 1
+                    if depth == 0:
+                        total += token.end() - position - 2
+                        position = token.end()
+                        break
+            else:
+                # 닫히지 않은 문자열은 끝까지 문자열로 간주
+                return total + len(body) - position - 1
+        else:
+            hex_string = _HEX_STRING.match(body, position)
+            if hex_string is None:
+                position += 1
+            else:
+                total += len(re.sub(rb'\s', b'', hex_string.group(1))) // 2
+                position = hex_string.end()
+
+
+def content_text_stats(stream):
+    """
+    내용 스트림의 텍스트 출력 연산자 수와 출력 문자열 바이트 수 (텍스트 추출/글꼴 해석 없음)
+
+    문자열 바이트 수는 글자 수 추정치: CID 글꼴(한글 등)은 보통 글자당 2바이트.
+    """
+    operators = 0
+    text_bytes = 0
+    for text_object in _TEXT_OBJECT.finditer(stream):
+        body = text_object.group(1)
+        operators += len(_TEXT_SHOW.findall(body))
+        text_bytes += _string_bytes(body)
+    return operators, text_bytes
+
+
+def _draws_image(page, streams):
+    """
+    페이지 내용 스트림이 이미지를 실제로 그리는지 (인라인 이미지 또는 이미지 XObject의 Do 연산자)
+
+    page.get_images()는 여러 페이지가 공유하는 리소스의 이미지까지 돌려주므로 내용에서 Do로
+    그리는 이름과 대조한다.
+    """
+    drawn = set()
+    for stream in streams:
+        if _INLINE_IMAGE.search(stream):
+            return True
+        drawn.update(name.decode('latin-1') for name in _XOBJECT_DO.findall(stream))
+    return bool(drawn) and any(image[7] in drawn for image in page.get_images(full=True))
+
+
+def _page_streams(doc, page):
+    for xref in page.get_contents():
+        yield doc.xref_stream(xref) or b''
+    # 페이지 내용을 Form XObject로 감싸는 PDF도 있으므로 폼 내용도 포함
+    for xobject in page.get_xobjects():
+        yield doc.xref_stream(xobject[0]) or b''
+
+
+def scan_document(pdf_path, sample_limit=None, time_budget=None):
+    """
+    PDF 사전 분석: 표본 페이지의 내용 스트림에서 텍스트 연산자/이미지 수만 읽어 분류
+
+    전체 페이지 텍스트 추출 대신 첫/마지막/구간별 무작위 페이지만 검사하고, time_budget(초)을
+    넘으면 그때까지 검사한 페이지로 판단한다 (첫 페이지는 항상 검사). 공문서 점수는 첫 페이지
+    텍스트로만 계산한다.
+
+    Returns:
+        DocumentScan
+    """
+    started = time.perf_counter()
+    budget = SCAN_TIME_BUDGET_SECONDS if time_budget is None else time_budget
+    fitz = load_engine('fitz')
+
+    with fitz.open(pdf_path) as doc:
+        page_count = doc.page_count
+        if page_count == 0:
+            return DocumentScan('empty', 0, elapsed_seconds=time.perf_counter() - started)
+
+        scan = DocumentScan('unknown', page_count)
+        for number in sample_pages(page_count, sample_limit, seed=f'{page_count}:{os.path.getsize(pdf_path)}'):
+            if scan.sampled_pages and time.perf_counter() - started > budget:
+                scan.budget_exhausted = True
+                break
+            page = doc.load_page(number)
+            scan.sampled_pages.append(number)
+
+            # page.rect는 회전(/Rotate)이 반영된 크기
+            if page.rect.width > page.rect.height:
+                scan.landscape_pages += 1
+            else:
+                scan.portrait_pages += 1
+
+            streams = list(_page_streams(doc, page))
+            operators, text_bytes = 0, 0
+            for stream in streams:
+                stream_operators, stream_bytes = content_text_stats(stream)
+                operators += stream_operators
+                text_bytes += stream_bytes
+            if operators and text_bytes >= SCAN_MIN_TEXT_BYTES:
+                scan.text_pages += 1
+            elif _draws_image(page, streams):
+                scan.image_pages += 1
+
+            if number == 0 and operators:
+                official = official_document_score(page.get_text())
+                scan.is_official = official['is_official']
+                scan.official_score = official['confidence']
+                scan.keyword_count = official['keyword_count']
+                scan.pattern_count = official['pattern_count']
+
+    sampled = len(scan.sampled_pages)
+    scan.text_ratio = scan.text_pages / sampled
+    if scan.text_ratio > 0.8:
+        scan.pdf_type = 'text_based'
+    elif scan.text_ratio < 0.2:
+        scan.pdf_type = 'scanned_image'
+    else:
+        scan.pdf_type = 'mixed'
+
+    if scan.landscape_pages > scan.portrait_pages:
+        scan.orientation, scan.orientation_ratio = 'landscape', scan.landscape_pages / sampled
+    else:
+        scan.orientation, scan.orientation_ratio = 'portrait', scan.portrait_pages / sampled
+
+    # 텍스트가 없는 표본 비율만큼 전체 페이지를 OCR해야 한다고 추정
+    scan.estimated_ocr_pages = round(page_count * (1 - scan.text_ratio))
+    scan.estimated_ocr_seconds = round(scan.estimated_ocr_pages * SCAN_OCR_SECONDS_PER_PAGE, 1)
+    scan.elapsed_seconds = round(time.perf_counter() - started, 4)
+    return scan
+
+
+def analyze_page_orientation(pdf_path, scan=None):
+    """PDF 페이지 방향 분석 (가로형/세로형 자동감지, 표본 페이지 기준, 이미 분석한 scan이 있으면 재사용)"""
+    try:
+        orientation_info = (scan or scan_document(pdf_path)).to_analysis().get('orientation')
+        if orientation_info is None:
+            return {'orientation': 'unknown', 'ratio': 0}
+        logging.info(f"페이지 방향 분석: {orientation_info['orientation']} ({orientation_info['ratio']:.2f} 비율)")
+        return orientation_info
+
+    except Exception as e:
+        logging.error(f"페이지 방향 분석 중 오류 발생: {e}")
+        return {'orientation': 'unknown', 'ratio': 0}
+
+
+def detect_official_document(pdf_path, scan=None):
+    """공문서 자동감지 (첫 페이지 텍스트 패턴, 이미 분석한 scan이 있으면 재사용)"""
+    try:
+        official_info = (scan or scan_document(pdf_path)).to_analysis().get('official_document')
+        if official_info is None:
+            return {'is_official': False, 'confidence': 0}
+        logging.info(f"공문서 감지: {'예' if official_info['is_official'] else '아니오'} (키워드: {official_info['keyword_count']}, 패턴: {official_info['pattern_count']}, 신뢰도: {official_info['confidence']:.2f})")
+        return official_info
+
+    except Exception as e:
+        logging.error(f"공문서 감지 중 오류 발생: {e}")
+        return {'is_official': False, 'confidence': 0}
+
+
+if __name__ == '__main__':
+    for path in sys.argv[1:]:
+        result = scan_document(path)
+        print(f"{path}: {result.pdf_type} (텍스트 비율 {result.text_ratio:.2f}, 표본 {len(result.sampled_pages)}/"
+              f"{result.page_count}쪽), {result.orientation}, 공문서 점수 {result.official_score:.2f}, "
+              f"OCR 예상 {result.estimated_ocr_seconds}s, 분석 {result.elapsed_seconds * 1000:.1f}ms")
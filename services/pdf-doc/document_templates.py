@@ -0,0 +1,139 @@
+import copy
+import threading
+import time
+
+from docx_styles import DOCX_BODY_FONT, install_styles
+from engine_registry import engine_available, load_engine
+
+# DOCX 출력 프로필: (단위, 용지 너비, 높이, 위/아래 여백, 왼쪽/오른쪽 여백, 방향) - 방향 None이면 지정하지 않음
+DOCX_PROFILES = {
+    'a4_portrait': ('Mm', 210, 297, 15, 15, 'portrait'),
+    'a4_landscape': ('Mm', 297, 210, 15, 15, 'landscape'),
+    'letter_portrait': ('Inches', 8.5, 11, 1, 1, None),
+    'letter_landscape': ('Inches', 11, 8.5, 0.6, 0.8, None),
+}
+
+# PPTX 출력 프로필: (슬라이드 너비, 높이) - 단위 inch
+PPTX_PROFILES = {
+    'slides_16_9': (13.33, 7.5),
+    'slides_9_16': (7.5, 13.33),
+}
+
+# 변환 결과 문서 공통 속성 (제목은 요청마다 설정)
+CORE_PROPERTIES = {
+    'author': 'Document Converter',
+    'subject': 'PDF to DOCX Conversion',
+    'comments': 'Converted using advanced OCR and layout recognition',
+}
+
+_templates = {}
+_lock = threading.Lock()
+
+
+def _build_docx(profile):
+    unit, width, height, vertical_margin, horizontal_margin, orientation = DOCX_PROFILES[profile]
+    length = getattr(load_engine('docx.shared'), unit)
+    Pt = load_engine('docx.shared').Pt
+    qn = load_engine('docx.oxml.ns').qn
+    doc = load_engine('docx').Document()
+
+    section = doc.sections[0]
+    if orientation:
+        enum = load_engine('docx.enum.section').WD_ORIENT
+        section.orientation = enum.LANDSCAPE if orientation == 'landscape' else enum.PORTRAIT
+    section.page_width = length(width)
+    section.page_height = length(height)
+    section.top_margin = section.bottom_margin = length(vertical_margin)
+    section.left_margin = section.right_margin = length(horizontal_margin)
+
+    # Normal 스타일 한글 글꼴 (동아시아 글꼴 포함)과 변환용 스타일
+    font = doc.styles['Normal'].font
+    font.name = DOCX_BODY_FONT
+    font.size = Pt(11)
+    font.element.rPr.rFonts.set(qn('w:eastAsia'), DOCX_BODY_FONT)
+    install_styles(doc)
+
+    for name, value in CORE_PROPERTIES.items():
+        setattr(doc.core_properties, name, value)
+    return doc
+
+
+def _build_pptx(profile):
+    width, height = PPTX_PROFILES[profile]
+    Inches = load_engine('pptx.util').Inches
+    prs = load_engine('pptx').Presentation()
+    prs.slide_width = Inches(width)
+    prs.slide_height = Inches(height)
+    return prs
+
+
+def _template(kind, profile, build):
+    key = (kind, profile)
+    template = _templates.get(key)
+    if template is None:
+        with _lock:
+            template = _templates.get(key)
+            if template is None:
+                template = _templates[key] = build(profile)
+    return template
+
+
+def _copy(template):
+    # 원본 템플릿은 수정하지 않고 복사본만 넘김 (복사는 기본 템플릿 압축 해제/파싱보다 빠름)
+    with _lock:
+        return copy.deepcopy(template)
+
+
+def new_document(profile='a4_portrait'):
+    """
+    설정이 끝난 DOCX 문서 (용지 크기/여백, 한글 글꼴, 변환용 스타일, 문서 속성)
+
+    프로필별 원본은 한 번만 만들고 요청마다 깊은 복사본을 반환한다.
+    """
+    if profile not in DOCX_PROFILES:
+        raise ValueError(f"알 수 없는 DOCX 프로필: {profile}")
+    return _copy(_template('docx', profile, _build_docx))
+
+
+def new_presentation(profile='slides_16_9'):
+    """슬라이드 크기가 설정된 PPTX 프레젠테이션 (프로필별 원본의 깊은 복사본)"""
+    if profile not in PPTX_PROFILES:
+        raise ValueError(f"알 수 없는 PPTX 프로필: {profile}")
+    return _copy(_template('pptx', profile, _build_pptx))
+
+
+def warm_up():
+    """모든 프로필의 원본을 미리 생성 (pre-fork 워밍업에서 호출, 생성한 템플릿 수 반환)"""
+    if engine_available('docx'):
+        for profile in DOCX_PROFILES:
+            _template('docx', profile, _build_docx)
+    if engine_available('pptx'):
+        for profile in PPTX_PROFILES:
+            _template('pptx', profile, _build_pptx)
+    return len(_templates)
+
+
+def benchmark(repeat=50):
+    """
+    기본 템플릿에서 매번 생성/설정하는 방식과 템플릿 복사 방식의 문서 1개당 준비 시간(ms) 비교
+    """
+    warm_up()
+
+    def per_call(func):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        return round((time.perf_counter() - started) / repeat * 1000, 2)
+
+    return {
+        'docx_build_ms': per_call(lambda: _build_docx('a4_portrait')),
+        'docx_copy_ms': per_call(lambda: new_document('a4_portrait')),
+        'pptx_build_ms': per_call(lambda: _build_pptx('slides_16_9')),
+        'pptx_copy_ms': per_call(lambda: new_presentation('slides_16_9')),
+    }
+
+
+if __name__ == '__main__':
+    result = benchmark()
+    print(f"DOCX: 생성 {result['docx_build_ms']}ms -> 복사 {result['docx_copy_ms']}ms, "
+          f"PPTX: 생성 {result['pptx_build_ms']}ms -> 복사 {result['pptx_copy_ms']}ms")
@@ -0,0 +1,181 @@
+import copy
+import io
+import re
+
+from engine_registry import load_engine
+
+_NS_R = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_NS_W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+_RT_IMAGE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/image'
+_RT_NUMBERING = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/numbering'
+# 머리글/바닥글은 첫 조각의 것을 이어서 사용하므로 복사하지 않음
+_SKIPPED_RELS = (
+    'http://schemas.openxmlformats.org/officeDocument/2006/relationships/header',
+    'http://schemas.openxmlformats.org/officeDocument/2006/relationships/footer',
+)
+
+
+def _copy_relationships(element, source_part, target_part):
+    """이미지/하이퍼링크/차트 등 관계(rId)를 대상 문서로 옮기고 요소의 rId를 새 값으로 교체"""
+    for node in element.iter():
+        for attr in ('{%s}embed' % _NS_R, '{%s}link' % _NS_R, '{%s}id' % _NS_R):
+            old_rid = node.get(attr)
+            if not old_rid or old_rid not in source_part.rels:
+                continue
+            rel = source_part.rels[old_rid]
+            if rel.is_external:
+                new_rid = target_part.relate_to(rel.target_ref, rel.reltype, is_external=True)
+            elif rel.reltype in _SKIPPED_RELS:
+                continue
+            elif rel.reltype == _RT_IMAGE:
+                # 조각마다 image1.png 같은 같은 파트 이름을 쓰므로 대상 문서에서 새 이름으로 등록 (중복 이미지는 재사용)
+                new_rid, _ = target_part.get_or_add_image(io.BytesIO(rel.target_part.blob))
+            else:
+                # 차트 등 기타 파트는 이름만 겹치지 않게 바꿔 연결 (저장 시 관계를 따라 함께 기록됨)
+                related = rel.target_part
+                related.partname = target_part.package.next_partname(
+                    re.sub(r'\d*(\.\w+)$', r'%d\1', str(related.partname)))
+                new_rid = target_part.relate_to(related, rel.reltype)
+            node.set(attr, new_rid)
+
+
+def _w(tag):
+    return '{%s}%s' % (_NS_W, tag)
+
+
+def _numbering_part(document):
+    for rel in document.part.rels.values():
+        if rel.reltype == _RT_NUMBERING and not rel.is_external:
+            return rel.target_part
+    return None
+
+
+def _merge_numbering(source, target):
+    """
+    조각의 목록 번호 정의(numbering.xml)를 대상 문서로 옮김
+
+    조각마다 numId/abstractNumId가 1부터 시작하므로 대상 문서의 마지막 번호 뒤로 다시 매긴다.
+
+    Returns:
+        dict: {조각의 numId: 대상 문서의 numId} (본문/스타일의 w:numId 교체용)
+    """
+    source_part = _numbering_part(source)
+    if source_part is None:
+        return {}
+    target_part = _numbering_part(target)
+    if target_part is None:
+        # 대상에 번호 정의가 없으면 조각의 파트를 그대로 연결 (번호가 겹치지 않음)
+        target.part.relate_to(source_part, _RT_NUMBERING)
+        return {}
+
+    numbering = target_part.element
+    next_abstract = max((int(e.get(_w('abstractNumId'))) for e in numbering.iterchildren(_w('abstractNum'))),
+                        default=-1) + 1
+    next_num = max((int(e.get(_w('numId'))) for e in numbering.iterchildren(_w('num'))), default=0) + 1
+    # 스키마 순서: abstractNum들 -> num들 -> numIdMacAtCleanup
+    first_num = next(numbering.iterchildren(_w('num'), _w('numIdMacAtCleanup')), None)
+    cleanup = next(numbering.iterchildren(_w('numIdMacAtCleanup')), None)
+
+    abstract_map = {}
+    for abstract in source_part.element.iterchildren(_w('abstractNum')):
+        abstract = copy.deepcopy(abstract)
+        abstract_map[abstract.get(_w('abstractNumId'))] = str(next_abstract)
+        abstract.set(_w('abstractNumId'), str(next_abstract))
+        next_abstract += 1
+        # nsid가 같으면 Word가 다른 조각의 목록과 이어진 하나의 목록으로 취급
+        for nsid in abstract.findall(_w('nsid')):
+            abstract.remove(nsid)
+        if first_num is not None:
+            first_num.addprevious(abstract)
+        else:
+            numbering.append(abstract)
+
+    num_map = {}
+    for num in source_part.element.iterchildren(_w('num')):
+        num = copy.deepcopy(num)
+        num_map[num.get(_w('numId'))] = str(next_num)
+        num.set(_w('numId'), str(next_num))
+        next_num += 1
+        abstract_ref = num.find(_w('abstractNumId'))
+        if abstract_ref is not None and abstract_ref.get(_w('val')) in abstract_map:
+            abstract_ref.set(_w('val'), abstract_map[abstract_ref.get(_w('val'))])
+        if cleanup is not None:
+            cleanup.addprevious(num)
+        else:
+            numbering.append(num)
+    return num_map
+
+
+def _remap_numbering(element, num_map):
+    if not num_map:
+        return
+    for num_id in element.iter(_w('numId')):
+        new_id = num_map.get(num_id.get(_w('val')))
+        if new_id is not None:
+            num_id.set(_w('val'), new_id)
+
+
+def _copy_missing_styles(source, target, num_map=None):
+    target_styles = target.styles.element
+    existing = {style.get('{%s}styleId' % _NS_W) for style in target_styles.iterchildren('{%s}style' % _NS_W)}
+    for style in source.styles.element.iterchildren('{%s}style' % _NS_W):
+        if style.get('{%s}styleId' % _NS_W) not in existing:
+            style = copy.deepcopy(style)
+            _remap_numbering(style, num_map)
+            target_styles.append(style)
+
+
+def _strip_header_footer_refs(sect_pr):
+    # 머리글/바닥글 파트는 복사하지 않으므로 참조 제거 (첫 문서의 머리글을 이어서 사용)
+    for tag in ('headerReference', 'footerReference'):
+        for ref in sect_pr.findall('{%s}%s' % (_NS_W, tag)):
+            sect_pr.remove(ref)
+
+
+def merge_docx(part_paths, output_path):
+    """
+    DOCX 조각들을 순서대로 하나로 병합
+
+    각 조각의 마지막 구역 속성(sectPr: 용지 방향/크기/여백)을 구역 나누기로 보존해
+    가로/세로가 섞인 문서도 원래 방향을 유지한다. 이미지와 하이퍼링크 관계, 없는 스타일, 목록 번호
+    정의는 함께 복사한다.
+    """
+    Document = load_engine('docx').Document
+    merged = Document(part_paths[0])
+    body = merged.element.body
+
+    for part_path in part_paths[1:]:
+        part = Document(part_path)
+        num_map = _merge_numbering(part, merged)
+        _copy_missing_styles(part, merged, num_map)
+
+        # 현재 마지막 구역을 문단 수준 구역 나누기로 닫음
+        final_sect = body.sectPr
+        if final_sect is not None:
+            paragraph = body.makeelement('{%s}p' % _NS_W, {})
+            paragraph_pr = paragraph.makeelement('{%s}pPr' % _NS_W, {})
+            paragraph_pr.append(copy.deepcopy(final_sect))
+            paragraph.append(paragraph_pr)
+            final_sect.addprevious(paragraph)
+
+        for element in part.element.body.iterchildren():
+            element = copy.deepcopy(element)
+            _copy_relationships(element, part.part, merged.part)
+            _remap_numbering(element, num_map)
+            if element.tag == '{%s}sectPr' % _NS_W:
+                _strip_header_footer_refs(element)
+                if final_sect is not None:
+                    body.replace(final_sect, element)
+                else:
+                    body.append(element)
+                final_sect = element
+            else:
+                for sect_pr in element.iter('{%s}sectPr' % _NS_W):
+                    _strip_header_footer_refs(sect_pr)
+                if final_sect is not None:
+                    final_sect.addprevious(element)
+                else:
+                    body.append(element)
+
+    merged.save(output_path)
+    return output_path
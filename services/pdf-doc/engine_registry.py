@@ -0,0 +1,212 @@
+import importlib
+import importlib.util
+import os
+import subprocess
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+# 워커 부팅 시작 시각 (서버 모듈이 가장 먼저 import 하므로 부팅 시작으로 간주)
+BOOT_STARTED = time.perf_counter()
+_boot_completed = None
+
+# 엔진명 -> (로더, 가용성 확인용 모듈명)
+_engines = {}
+_loaded = {}
+_load_times = {}
+_lock = threading.RLock()
+
+# PyMuPDF/pdf2docx는 스레드 간 동시 사용에 안전하지 않으므로 같은 프로세스 안의 호출만 이 잠금으로 직렬화
+# (Adobe 네트워크 변환, 프로세스 풀 변환처럼 다른 곳에서 실행되는 단계에서는 잡지 않음)
+engine_lock = threading.RLock()
+
+
+def register_engine(name, loader, probe=None):
+    """
+    변환 엔진 등록 (import는 첫 사용 시 loader 호출로 수행)
+
+    Args:
+        name: 엔진 이름
+        loader: 엔진 객체(모듈 등)를 반환하는 함수
+        probe: import 없이 설치 여부를 확인할 모듈명 (기본값: name)
+    """
+    with _lock:
+        _engines[name] = (loader, probe or name)
+
+
+def _ensure_registered(name):
+    if name not in _engines:
+        register_engine(name, lambda: importlib.import_module(name))
+
+
+def load_engine(name):
+    """엔진을 처음 사용할 때 import 하고 소요 시간을 기록 (이후 캐시 반환)"""
+    engine = _loaded.get(name)
+    if engine is not None:
+        return engine
+
+    with _lock:
+        if name in _loaded:
+            return _loaded[name]
+        _ensure_registered(name)
+        loader, _ = _engines[name]
+        started = time.perf_counter()
+        engine = loader()
+        _load_times[name] = time.perf_counter() - started
+        _loaded[name] = engine
+        if _boot_completed is not None:
+            print(f"⚙️ 엔진 로드: {name} ({_load_times[name] * 1000:.0f}ms)")
+        return engine
+
+
+def engine_available(name):
+    """엔진 설치 여부 (모듈을 import 하지 않고 find_spec으로 확인)"""
+    if name in _loaded:
+        return True
+    _ensure_registered(name)
+    probe = _engines[name][1]
+    try:
+        return importlib.util.find_spec(probe) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyModule:
+    """속성에 처음 접근할 때 엔진을 로드하는 모듈 대리 객체"""
+
+    def __init__(self, name):
+        self.__dict__['_engine_name'] = name
+
+    def __getattr__(self, attr):
+        return getattr(load_engine(self._engine_name), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(load_engine(self._engine_name), attr, value)
+
+    def __repr__(self):
+        state = 'loaded' if self._engine_name in _loaded else 'not loaded'
+        return f"<LazyModule {self._engine_name!r} ({state})>"
+
+
+def lazy_module(name):
+    """import 문 대신 사용하는 지연 로딩 모듈 (예: cv2 = lazy_module('cv2'))"""
+    _ensure_registered(name)
+    return LazyModule(name)
+
+
+def _load_adobe_sdk():
+    """Adobe PDF Services SDK 4.2 클래스 모음 (두 서버가 공용으로 사용)"""
+    from adobe.pdfservices.operation.auth.service_principal_credentials import ServicePrincipalCredentials
+    from adobe.pdfservices.operation.io.cloud_asset import CloudAsset
+    from adobe.pdfservices.operation.io.stream_asset import StreamAsset
+    from adobe.pdfservices.operation.pdf_services import PDFServices
+    from adobe.pdfservices.operation.pdf_services_media_type import PDFServicesMediaType
+    from adobe.pdfservices.operation.pdfjobs.jobs.export_pdf_job import ExportPDFJob
+    from adobe.pdfservices.operation.pdfjobs.jobs.extract_pdf_job import ExtractPDFJob
+    from adobe.pdfservices.operation.pdfjobs.params.export_pdf.export_pdf_params import ExportPDFParams
+    from adobe.pdfservices.operation.pdfjobs.params.export_pdf.export_pdf_target_format import ExportPDFTargetFormat
+    from adobe.pdfservices.operation.pdfjobs.params.extract_pdf.extract_element_type import ExtractElementType
+    from adobe.pdfservices.operation.pdfjobs.params.extract_pdf.extract_pdf_params import ExtractPDFParams
+    from adobe.pdfservices.operation.pdfjobs.result.export_pdf_result import ExportPDFResult
+    from adobe.pdfservices.operation.pdfjobs.result.extract_pdf_result import ExtractPDFResult
+
+    # SDK 버전에 따라 예외 클래스 경로가 다를 수 있음
+    try:
+        from adobe.pdfservices.operation.exception.exceptions import (
+            SdkException, ServiceApiException, ServiceUsageException)
+    except ImportError:
+        SdkException = ServiceApiException = ServiceUsageException = Exception
+
+    print("✅ Adobe PDF Services SDK 로드 완료")
+    return SimpleNamespace(
+        ServicePrincipalCredentials=ServicePrincipalCredentials,
+        CloudAsset=CloudAsset,
+        StreamAsset=StreamAsset,
+        PDFServices=PDFServices,
+        PDFServicesMediaType=PDFServicesMediaType,
+        ExportPDFJob=ExportPDFJob,
+        ExtractPDFJob=ExtractPDFJob,
+        ExportPDFParams=ExportPDFParams,
+        ExportPDFTargetFormat=ExportPDFTargetFormat,
+        ExtractElementType=ExtractElementType,
+        ExtractPDFParams=ExtractPDFParams,
+        ExportPDFResult=ExportPDFResult,
+        ExtractPDFResult=ExtractPDFResult,
+        SdkException=SdkException,
+        ServiceApiException=ServiceApiException,
+        ServiceUsageException=ServiceUsageException,
+    )
+
+
+register_engine('adobe_sdk', _load_adobe_sdk, probe='adobe.pdfservices')
+
+# 부팅 보고서에서 추적하는 무거운 엔진
+HEAVY_ENGINES = ('cv2', 'numpy', 'fitz', 'pdf2docx', 'pptx', 'pytesseract', 'pdfplumber', 'adobe_sdk')
+
+
+def mark_boot_complete():
+    """서버 모듈 로드 완료 시점 기록"""
+    global _boot_completed
+    if _boot_completed is None:
+        _boot_completed = time.perf_counter()
+
+
+def boot_report():
+    """
+    워커 부팅 보고서
+
+    Returns:
+        dict: 부팅 소요 시간, 로드된 엔진별 import 시간, 아직 로드되지 않은 엔진
+    """
+    boot_seconds = None
+    if _boot_completed is not None:
+        boot_seconds = round(_boot_completed - BOOT_STARTED, 4)
+    return {
+        'pid': os.getpid(),
+        'boot_seconds': boot_seconds,
+        'uptime_seconds': round(time.perf_counter() - BOOT_STARTED, 3),
+        'loaded_engines': {name: round(seconds, 4) for name, seconds in _load_times.items()},
+        'deferred_engines': [name for name in HEAVY_ENGINES if name not in _loaded],
+        'module_count': len(sys.modules),
+    }
+
+
+def importtime_report(module='app', top=20, python=sys.executable):
+    """
+    `python -X importtime -c "import <module>"` 결과를 누적 시간 순으로 요약
+
+    별도 프로세스에서 실행하므로 현재 워커의 상태에는 영향이 없다.
+
+    Returns:
+        list: [{'module', 'self_ms', 'cumulative_ms'}] (누적 시간 내림차순)
+    """
+    result = subprocess.run(
+        [python, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # 헤더 줄
+        entries.append({
+            'module': parts[2].strip(),
+            'self_ms': self_us / 1000,
+            'cumulative_ms': cumulative_us / 1000,
+        })
+    entries.sort(key=lambda e: e['cumulative_ms'], reverse=True)
+    return entries[:top]
+
+
+if __name__ == '__main__':
+    target = sys.argv[1] if len(sys.argv) > 1 else 'app'
+    print(f"=== import {target} 소요 시간 (누적 상위) ===")
+    for entry in importtime_report(target):
+        print(f"{entry['cumulative_ms']:10.1f}ms  {entry['self_ms']:8.1f}ms  {entry['module']}")
@@ -0,0 +1,76 @@
+import io
+import json
+import os
+import zipfile
+
+from structured_data import iter_elements
+
+# Adobe Extract 결과 ZIP 구성
+STRUCTURED_DATA = 'structuredData.json'
+FIGURES_PREFIX = 'figures/'
+
+
+class ExtractArchive:
+    """
+    Adobe Extract 결과 ZIP 리더 (압축 해제 없음)
+
+    structuredData.json과 그림 항목을 필요할 때 ZIP 스트림에서 바로 읽는다. 임시 폴더에
+    전부 풀어 두고 다시 열거나 복사하지 않으므로 /tmp에 남는 파일이 없다.
+
+    Args:
+        source: ZIP 파일 경로, bytes, 또는 읽기 가능한 파일 객체
+        remove: 경로로 연 경우 열자마자 파일을 삭제 (열린 파일 핸들로 계속 읽음)
+    """
+
+    def __init__(self, source, remove=False):
+        self._file = None
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            source = io.BytesIO(source)
+        elif isinstance(source, (str, os.PathLike)):
+            self._file = open(source, 'rb')
+            if remove:
+                os.unlink(source)
+            source = self._file
+        try:
+            self._zip = zipfile.ZipFile(source)
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if getattr(self, '_zip', None) is not None:
+            self._zip.close()
+            self._zip = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def names(self):
+        return self._zip.namelist()
+
+    def has_structured_data(self):
+        return STRUCTURED_DATA in self._zip.NameToInfo
+
+    def structured_data(self):
+        """structuredData.json 파싱 결과 (ZIP 항목 스트림에서 바로 읽음)"""
+        with self._zip.open(STRUCTURED_DATA) as stream:
+            return json.load(stream)
+
+    def iter_elements(self):
+        """structuredData.json의 elements를 하나씩 (전체 JSON을 파싱하지 않고 스트림에서 디코딩)"""
+        with self._zip.open(STRUCTURED_DATA) as stream:
+            yield from iter_elements(stream)
+
+    def figures(self):
+        """그림 파일명 -> ZIP 항목 이름 (filePaths의 'figures/파일명'에서 파일명 기준)"""
+        return {name[len(FIGURES_PREFIX):]: name for name in self._zip.namelist()
+                if name.startswith(FIGURES_PREFIX) and not name.endswith('/')}
+
+    def read(self, member):
+        return self._zip.read(member)
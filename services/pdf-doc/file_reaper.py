@@ -0,0 +1,241 @@
+import os
+import threading
+import time
+
+from file_utils import cleanup_temp_files
+
+# 환경변수 기반 설정
+REAPER_ENABLED = os.environ.get('REAPER_ENABLED', 'true').lower() == 'true'
+REAPER_TTL_HOURS = float(os.environ.get('REAPER_TTL_HOURS', '6'))
+REAPER_MAX_TOTAL_MB = int(os.environ.get('REAPER_MAX_TOTAL_MB', '2048'))
+REAPER_INTERVAL_SECONDS = int(os.environ.get('REAPER_INTERVAL_SECONDS', '300'))
+
+_MB = 1024 * 1024
+
+# 다운로드(전송) 중인 파일: 절대경로 -> 사용 중인 요청 수
+_in_use = {}
+_in_use_lock = threading.Lock()
+
+
+def mark_in_use(path):
+    """
+    파일을 사용 중으로 표시 (정리 대상에서 제외)
+
+    Returns:
+        callable: 사용 해제 함수 (Flask 응답의 call_on_close에 등록)
+    """
+    key = os.path.abspath(path)
+    with _in_use_lock:
+        _in_use[key] = _in_use.get(key, 0) + 1
+
+    released = []
+
+    def release():
+        if released:
+            return
+        released.append(True)
+        with _in_use_lock:
+            count = _in_use.get(key, 0) - 1
+            if count > 0:
+                _in_use[key] = count
+            else:
+                _in_use.pop(key, None)
+
+    return release
+
+
+def is_in_use(path):
+    return os.path.abspath(path) in _in_use
+
+
+def scan_files(directories):
+    """
+    디렉토리들의 파일 목록 (하위 디렉토리 제외)
+
+    Returns:
+        list: (mtime, size, path) - 오래된 순 정렬
+    """
+    files = []
+    for directory in directories:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            continue
+    files.sort()
+    return files
+
+
+class FileReaper:
+    """
+    uploads/, outputs/ 주기적 정리기
+
+    1) 보관 시간(TTL)이 지난 파일을 삭제하고 (cleanup_temp_files)
+    2) 남은 파일 전체 용량이 한도를 넘으면 오래된 파일부터 삭제한다.
+    다운로드 중인 파일(mark_in_use)은 어느 단계에서도 삭제하지 않는다.
+    """
+
+    def __init__(self, directories, ttl_hours=None, max_total_mb=None, interval_seconds=None):
+        self.directories = [os.path.abspath(d) for d in directories]
+        self.ttl_hours = REAPER_TTL_HOURS if ttl_hours is None else ttl_hours
+        self.max_total_bytes = (REAPER_MAX_TOTAL_MB if max_total_mb is None else max_total_mb) * _MB
+        self.interval_seconds = REAPER_INTERVAL_SECONDS if interval_seconds is None else interval_seconds
+
+        self.runs = 0
+        self.reclaimed_bytes_total = 0
+        self.expired_bytes_total = 0
+        self.evicted_files_total = 0
+        self.last_run_at = None
+        self.last_reclaimed_bytes = 0
+        self.current_bytes = 0
+
+        self._run_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._pid = os.getpid()
+
+    def add_directories(self, directories):
+        """정리 대상 디렉토리 추가 (실행 중이면 다음 정리부터 포함, 하위 디렉토리는 따로 등록해야 함)"""
+        added = [os.path.abspath(d) for d in directories]
+        # 정리 루프가 목록을 순회하는 중일 수 있으므로 새 목록으로 교체
+        self.directories = self.directories + [d for d in dict.fromkeys(added) if d not in self.directories]
+        return self
+
+    def reap_once(self):
+        """
+        정리 1회 실행
+
+        Returns:
+            int: 이번 실행에서 확보한 용량 (바이트)
+        """
+        with self._run_lock:
+            expired = 0
+            for directory in self.directories:
+                expired += cleanup_temp_files(directory, '*', self.ttl_hours, skip=is_in_use)
+
+            files = scan_files(self.directories)
+            total = sum(size for _, size, _ in files)
+            evicted = 0
+            evicted_files = 0
+            for _, size, path in files:
+                if total <= self.max_total_bytes:
+                    break
+                if is_in_use(path):
+                    continue
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    total -= size  # 다른 워커가 먼저 삭제
+                    continue
+                except OSError as e:
+                    print(f"⚠️ 용량 한도 정리 실패 {path}: {e}")
+                    continue
+                total -= size
+                evicted += size
+                evicted_files += 1
+
+            if evicted_files:
+                print(f"🧹 용량 한도 초과로 오래된 파일 {evicted_files}개 삭제 ({evicted / _MB:.1f}MB)")
+
+            reclaimed = expired + evicted
+            self.runs += 1
+            self.expired_bytes_total += expired
+            self.evicted_files_total += evicted_files
+            self.reclaimed_bytes_total += reclaimed
+            self.last_reclaimed_bytes = reclaimed
+            self.last_run_at = time.time()
+            self.current_bytes = total
+            return reclaimed
+
+    def _loop(self):
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.reap_once()
+            except Exception as e:
+                print(f"⚠️ 파일 정리 오류: {e}")
+
+    def start(self):
+        """백그라운드 데몬 스레드 시작 (즉시 1회 정리 후 주기적으로 반복)"""
+        if self._pid != os.getpid():
+            # fork 된 자식에는 부모의 스레드가 없으므로 잠금/상태를 새로 만들어 시작
+            self._run_lock = threading.Lock()
+            self._stop = threading.Event()
+            self._thread = None
+            self._pid = os.getpid()
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='file-reaper', daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            self.reap_once()
+        except Exception as e:
+            print(f"⚠️ 파일 정리 오류: {e}")
+        self._loop()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def metrics(self):
+        return {
+            'directories': self.directories,
+            'ttl_hours': self.ttl_hours,
+            'max_total_bytes': self.max_total_bytes,
+            'runs': self.runs,
+            'reclaimed_bytes_total': self.reclaimed_bytes_total,
+            'expired_bytes_total': self.expired_bytes_total,
+            'evicted_files_total': self.evicted_files_total,
+            'last_reclaimed_bytes': self.last_reclaimed_bytes,
+            'last_run_at': self.last_run_at,
+            'current_bytes': self.current_bytes,
+            'in_use_files': len(_in_use),
+        }
+
+
+_reaper = None
+
+
+def add_directories(directories):
+    """
+    프로세스 전역 정리기에 디렉토리 등록 (REAPER_ENABLED=false 이면 무시)
+
+    정리기가 이미 시작되었으면 다음 정리부터 포함되고, 아직이면 시작할 때 함께 정리된다.
+    모듈 import 시에 호출해도 스레드는 시작하지 않는다.
+    """
+    global _reaper
+    if not REAPER_ENABLED:
+        return None
+    if _reaper is None:
+        _reaper = FileReaper([])
+    return _reaper.add_directories(directories)
+
+
+def start_reaper(directories=()):
+    """
+    프로세스 전역 정리기 시작 (REAPER_ENABLED=false 이면 시작하지 않음)
+
+    gunicorn에서는 post_fork 훅(gunicorn.conf.py)이 워커마다 호출하고, 직접 실행할 때는 각 서버의
+    __main__에서 호출한다. 변환용 자식 프로세스(multiprocessing 등)에서는 시작하지 않는다.
+    """
+    reaper = add_directories(directories)
+    return reaper.start() if reaper is not None else None
+
+
+def reaper_metrics():
+    """정리기 지표 (확보 용량 등, 정리기가 없으면 enabled=False)"""
+    if _reaper is None:
+        return {'enabled': False}
+    return dict(_reaper.metrics(), enabled=True)
@@ -1,7 +1,5 @@
 import os
 import time
-import psutil
-from pathlib import Path
 
 def is_file_locked(file_path):
     """
@@ -40,6 +38,8 @@ def find_processes_using_file(file_path):
     file_path = os.path.abspath(file_path)
     
     try:
+        # psutil은 requirements.txt에 없으므로 필요할 때만 import
+        import psutil
         for proc in psutil.process_iter(['pid', 'name', 'open_files']):
             try:
                 if proc.info['open_files']:
@@ -164,39 +164,55 @@ def generate_safe_filename(original_name, max_length=100):
     
     return f"{safe_name}_{timestamp}{ext_part}"
 
-def cleanup_temp_files(temp_dir, pattern="*.png", max_age_hours=24):
+def cleanup_temp_files(temp_dir, pattern="*.png", max_age_hours=24, skip=None):
     """
     임시 파일 정리
     
     Args:
         temp_dir (str): 임시 파일 디렉토리
         pattern (str): 삭제할 파일 패턴
-        max_age_hours (int): 최대 보관 시간 (시간)
+        max_age_hours (float): 최대 보관 시간 (시간)
+        skip (callable): 삭제하지 않을 파일 경로 판단 함수 (예: 다운로드 중인 파일)
+    
+    Returns:
+        int: 삭제로 확보한 용량 (바이트)
     """
-    import glob
-    from datetime import datetime, timedelta
+    import fnmatch
     
+    reclaimed = 0
     try:
-        temp_path = Path(temp_dir)
-        if not temp_path.exists():
-            return
+        if not os.path.isdir(temp_dir):
+            return 0
         
-        cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
+        cutoff_time = time.time() - max_age_hours * 3600
         
-        for file_path in glob.glob(os.path.join(temp_dir, pattern)):
-            try:
-                file_stat = os.stat(file_path)
-                file_time = datetime.fromtimestamp(file_stat.st_mtime)
-                
-                if file_time < cutoff_time:
-                    os.remove(file_path)
-                    print(f"임시 파일 삭제: {file_path}")
+        # os.scandir는 디렉토리 항목과 함께 stat 정보를 캐시해 glob + os.stat보다 가벼움
+        with os.scandir(temp_dir) as entries:
+            for entry in entries:
+                if not fnmatch.fnmatch(entry.name, pattern):
+                    continue
+                try:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    file_stat = entry.stat(follow_symlinks=False)
+                    if file_stat.st_mtime >= cutoff_time:
+                        continue
+                    if skip and skip(entry.path):
+                        continue
+                    
+                    os.remove(entry.path)
+                    reclaimed += file_stat.st_size
+                    print(f"임시 파일 삭제: {entry.path}")
                     
-            except Exception as e:
-                print(f"임시 파일 삭제 실패 {file_path}: {e}")
+                except FileNotFoundError:
+                    continue  # 다른 워커가 먼저 삭제
+                except Exception as e:
+                    print(f"임시 파일 삭제 실패 {entry.path}: {e}")
                 
     except Exception as e:
         print(f"임시 파일 정리 오류: {e}")
+    
+    return reclaimed
 
 if __name__ == "__main__":
     # 테스트 코드
@@ -12,13 +12,16 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.pdfbase.cidfonts import UnicodeCIDFont
 from reportlab.lib.utils import ImageReader
-import urllib.request
 import PyPDF2
 import unicodedata
 import sys
 from PIL import Image as PILImage
 import io
 
+from font_registry import get_font_registry
+from text_layout import wrap_text, draw_text_lines
+from file_reaper import add_directories, start_reaper, mark_in_use, reaper_metrics
+
 # OCR 기능 확인 및 설정
 try:
     import pytesseract
@@ -38,75 +41,31 @@ os.makedirs('uploads', exist_ok=True)
 os.makedirs('outputs', exist_ok=True)
 os.makedirs('fonts', exist_ok=True)
 
+# 오래된 업로드/결과 파일 정리 대상 등록 (정리 스레드는 gunicorn post_fork 또는 __main__에서 시작)
+add_directories(['uploads', 'outputs'])
+
 # 한글 폰트 설정
 KOREAN_FONT = 'Helvetica'
 KOREAN_FONT_AVAILABLE = False
 AVAILABLE_FONTS = {}  # 추가된 변수 정의
+_FONT_SETUP_DONE = False
 
 def setup_korean_font_advanced():
-    """고급 한글 폰트 설정"""
-    global KOREAN_FONT, KOREAN_FONT_AVAILABLE, AVAILABLE_FONTS
+    """고급 한글 폰트 설정 (폰트 레지스트리 사용, 첫 사용 시 1회 등록, 네트워크 사용 안 함)"""
+    global KOREAN_FONT, KOREAN_FONT_AVAILABLE, AVAILABLE_FONTS, _FONT_SETUP_DONE
     
-    # 1. 나눔고딕 TTF 시도
-    try:
-        font_path = os.path.join('fonts', 'NanumGothic.ttf')
-        
-        if not os.path.exists(font_path):
-            print("📥 나눔고딕 폰트 다운로드 중...")
-            font_url = "https://github.com/naver/nanumfont/raw/master/TTF/NanumGothic.ttf"
-            
-            req = urllib.request.Request(font_url, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
-            
-            with urllib.request.urlopen(req, timeout=30) as response:
-                with open(font_path, 'wb') as f:
-                    f.write(response.read())
-        
-        if os.path.exists(font_path):
-            pdfmetrics.registerFont(TTFont('NanumGothic', font_path))
-            KOREAN_FONT = 'NanumGothic'
-            KOREAN_FONT_AVAILABLE = True
-            AVAILABLE_FONTS['NanumGothic'] = {
-                'path': font_path,
-                'display_name': '나눔고딕'
-            }
-            print("✅ 나눔고딕 TTF 폰트 등록 완료")
-            return True
-            
-    except Exception as e:
-        print(f"나눔고딕 TTF 등록 실패: {e}")
-    
-    # 2. 시스템 한글 폰트 시도
-    system_fonts = [
-        (r'C:\Windows\Fonts\malgun.ttf', 'Malgun', '맑은 고딕'),
-        (r'C:\Windows\Fonts\gulim.ttc', 'Gulim', '굴림'),
-        (r'C:\Windows\Fonts\batang.ttc', 'Batang', '바탕'),
-    ]
+    if _FONT_SETUP_DONE:
+        return KOREAN_FONT_AVAILABLE
     
-    for font_path, font_name, display_name in system_fonts:
-        try:
-            if os.path.exists(font_path):
-                pdfmetrics.registerFont(TTFont(font_name, font_path))
-                KOREAN_FONT = font_name
-                KOREAN_FONT_AVAILABLE = True
-                AVAILABLE_FONTS[font_name] = {
-                    'path': font_path,
-                    'display_name': display_name
-                }
-                print(f"✅ 시스템 한글 폰트 등록: {display_name}")
-                return True
-        except Exception as e:
-            continue
+    registry = get_font_registry()
+    AVAILABLE_FONTS = registry.available_fonts()
+    font = registry.korean_font()
+    if font:
+        KOREAN_FONT = font[0]
+        KOREAN_FONT_AVAILABLE = True
     
-    print("⚠️ 한글 폰트 등록 실패, 기본 폰트 사용")
-    return False
-
-# 앱 시작 시 한글 폰트 설정
-# 기존 setup_korean_font_advanced() 함수를 setup_korean_font_simple()로 교체
-# 온라인 폰트 다운로드 코드 제거
-# 시스템 폰트만 사용
-setup_korean_font_advanced()
+    _FONT_SETUP_DONE = True
+    return KOREAN_FONT_AVAILABLE
 
 def safe_korean_text(text):
     """한글 텍스트 안전 처리"""
@@ -121,6 +80,19 @@ def safe_korean_text(text):
     except Exception as e:
         return str(text) if text else ""
 
+def current_font_name():
+    """현재 출력에 사용할 폰트 이름"""
+    setup_korean_font_advanced()
+    return KOREAN_FONT if KOREAN_FONT_AVAILABLE else 'Helvetica'
+
+def korean_display_text(safe_text):
+    """한글 폰트가 없으면 한글을 대체 문자로 치환"""
+    if setup_korean_font_advanced():
+        return safe_text
+    if any('\uac00' <= char <= '\ud7af' for char in safe_text):
+        return ''.join('한' if '\uac00' <= char <= '\ud7af' else char for char in safe_text)
+    return safe_text
+
 def draw_korean_text(canvas_obj, x, y, text, font_size=11):
     """한글 텍스트 그리기"""
     if not text or not text.strip():
@@ -131,18 +103,8 @@ def draw_korean_text(canvas_obj, x, y, text, font_size=11):
         if not safe_text:
             return
         
-        if KOREAN_FONT_AVAILABLE:
-            canvas_obj.setFont(KOREAN_FONT, font_size)
-            canvas_obj.drawString(x, y, safe_text)
-        else:
-            canvas_obj.setFont('Helvetica', font_size)
-            # 한글이 있으면 대체 문자 사용
-            has_korean = any('\uac00' <= char <= '\ud7af' for char in safe_text)
-            if has_korean:
-                display_text = ''.join('한' if '\uac00' <= char <= '\ud7af' else char for char in safe_text)
-            else:
-                display_text = safe_text
-            canvas_obj.drawString(x, y, display_text)
+        canvas_obj.setFont(current_font_name(), font_size)
+        canvas_obj.drawString(x, y, korean_display_text(safe_text))
             
     except Exception as e:
         try:
@@ -442,6 +404,263 @@ def clean_temp_files(file_list):
         except:
             pass
 
+def docx_to_pdf_reportlab(input_path, output_path, temp_files):
+    """reportlab 기반 DOCX → PDF 변환 (LibreOffice가 없는 환경의 대체 경로)
+
+    Returns:
+        bool: 변환 성공 여부 (추출할 내용이 없으면 False)
+    """
+    print("📄 DOCX → PDF 변환 시작 (다중 폰트 지원)")
+    
+    # 방향 감지
+    docx_orientation = detect_docx_orientation(input_path)
+    
+    # 강화된 서식 정보와 함께 내용 추출 (이미지 포함)
+    # 557번째 줄 확인
+    # 변경 전: extract_docx_with_complete_formatting_enhanced
+    # 변경 후: extract_docx_with_complete_formatting
+    content_list = extract_docx_with_complete_formatting(input_path, temp_files)
+    
+    if not content_list:
+        return False
+    
+    # PDF 페이지 크기 설정
+    if docx_orientation == 'landscape':
+        page_size = landscape(A4)
+        base_font_size = 10
+        line_height_base = 16
+        max_chars_per_line = 70
+    else:
+        page_size = portrait(A4)
+        base_font_size = 11
+        line_height_base = 18
+        max_chars_per_line = 50
+    
+    # PDF 생성
+    c = canvas.Canvas(output_path, pagesize=page_size)
+    width, height = page_size
+    
+    print(f"📄 PDF 생성: {width:.0f} x {height:.0f} ({docx_orientation})")
+    
+    margin_left = 50
+    margin_right = width - 50
+    margin_top = height - 50
+    margin_bottom = 50
+    
+    y_pos = margin_top
+    
+    # 내용 처리 (다중 폰트 지원)
+    processed_items = 0
+    image_count = 0
+    
+    for item in content_list:
+        try:
+            if item['type'] == 'paragraph':
+                # 문단 처리 (다중 폰트 지원)
+                text = item['content']
+                font_size = item.get('font_size', base_font_size)
+                is_bold = item.get('is_bold', False)
+                style = item.get('style', 'Normal')
+                font_name = item.get('font_name', None)
+                
+                # 줄 높이 조정 (폰트 크기에 비례)
+                line_height = max(line_height_base, int(font_size * 1.4))
+                
+                # 제목 스타일 추가 간격
+                if 'Heading' in style or 'Title' in style:
+                    y_pos -= 15  # 제목 전 추가 간격
+                
+                # 글리프 폭 기준 줄바꿈 후 페이지별 텍스트 객체 하나로 출력
+                display_text = korean_display_text(safe_korean_text(text))
+                if display_text:
+                    lines = wrap_text(display_text, current_font_name(), font_size,
+                                      margin_right - margin_left)
+                    y_pos = draw_text_lines(c, margin_left, y_pos, lines, current_font_name(),
+                                            font_size, line_height, margin_top, margin_bottom,
+                                            fake_bold=True)
+                
+                # 문단 간격 (스타일에 따라)
+                if 'Heading' in style or 'Title' in style:
+                    y_pos -= 15  # 제목 후 추가 간격
+                else:
+                    y_pos -= 8   # 일반 문단 간격
+            
+            elif item['type'] == 'image':
+                # 개선된 이미지 처리 (레이아웃 보존)
+                try:
+                    image_path = item['path']
+                    img_width = item['width']
+                    img_height = item['height']
+                    ocr_text = item.get('ocr_text', '')
+                    
+                    # 이미지 크기 계산 (원본 비율 유지)
+                    aspect_ratio = img_width / img_height
+                    max_width = (width - margin_left - 50) * 0.8  # 페이지 너비의 80%
+                    max_height = (height - margin_top - margin_bottom) * 0.6  # 페이지 높이의 60%
+                    
+                    if max_width / aspect_ratio <= max_height:
+                        final_width = max_width
+                        final_height = max_width / aspect_ratio
+                    else:
+                        final_height = max_height
+                        final_width = max_height * aspect_ratio
+                    
+                    # 이미지 여백 설정
+                    image_margin_top = 20
+                    image_margin_bottom = 15
+                    
+                    # 페이지 넘김 확인
+                    required_space = final_height + image_margin_top + image_margin_bottom
+                    if y_pos - required_space < margin_bottom:
+                        c.showPage()
+                        y_pos = margin_top
+                    
+                    # 이미지 중앙 정렬 계산
+                    # 이미지 중앙 정렬 계산
+                    page_width = width - margin_left - 50  # 사용 가능한 페이지 너비
+                    image_x = margin_left + (page_width - final_width) / 2
+                    
+                    # 이미지 파일 존재 확인
+                    if os.path.exists(image_path):
+                        try:
+                            # 메모리 최적화된 이미지 처리 (Render 환경 고려)
+                            from PIL import Image as PILImage
+                            
+                            # 이미지 크기 사전 확인 및 최적화
+                            with PILImage.open(image_path) as pil_img:
+                                # 이미지가 너무 크면 임시로 리사이즈
+                                max_dimension = 2000  # Render 환경 메모리 제한 고려
+                                if pil_img.width > max_dimension or pil_img.height > max_dimension:
+                                    # 임시 리사이즈된 이미지 생성
+                                    temp_img = pil_img.copy()
+                                    temp_img.thumbnail((max_dimension, max_dimension), PILImage.Resampling.LANCZOS)
+                                    
+                                    # 임시 파일로 저장
+                                    import tempfile
+                                    with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as temp_file:
+                                        temp_img.save(temp_file.name, 'PNG', optimize=True)
+                                        optimized_image_path = temp_file.name
+                                        temp_files.append(optimized_image_path)
+                                    temp_img.close()
+                                else:
+                                    optimized_image_path = image_path
+                            
+                            # 이미지 그리기 (메모리 최적화된 경로 사용)
+                            img_reader = ImageReader(optimized_image_path)
+                            c.drawImage(img_reader, image_x, y_pos - final_height, 
+                                      width=final_width, height=final_height,
+                                      preserveAspectRatio=True, anchor='c')
+                            
+                            print(f"✅ 이미지 {image_count + 1} 삽입: {final_width:.0f}x{final_height:.0f} (원본: {img_width}x{img_height})")
+                            
+                            # 이미지 하단 여백
+                            y_pos -= final_height + image_margin_bottom
+                            image_count += 1
+                            
+                            # OCR 텍스트 처리 (이미지 성공 시)
+                            if ocr_text and len(ocr_text.strip()) > 0:
+                                y_pos -= 5
+                                # OCR 텍스트를 이미지 아래 중앙에 배치
+                                ocr_lines = [ocr_text[i:i+60] for i in range(0, len(ocr_text), 60)]
+                                for ocr_line in ocr_lines[:3]:  # 최대 3줄
+                                    if y_pos < margin_bottom + line_height_base:
+                                        c.showPage()
+                                        y_pos = margin_top
+                                    draw_korean_text(c, margin_left + 20, y_pos, f"📝 {ocr_line}", base_font_size - 1)
+                                    y_pos -= line_height_base
+                    
+                        except Exception as e:
+                            error_msg = f"이미지 처리 오류 ({os.path.basename(image_path)}): {str(e)}"
+                            print(f"❌ {error_msg}")
+                            
+                            # 상세한 에러 로깅 (Render 환경 디버깅용)
+                            import traceback
+                            print(f"상세 에러 정보: {traceback.format_exc()}")
+                            
+                            # 에러 유형별 메시지 제공
+                            if "Memory" in str(e) or "memory" in str(e):
+                                error_display = f"[메모리 부족으로 이미지 로드 실패: {os.path.basename(image_path)}]"
+                            elif "Permission" in str(e) or "permission" in str(e):
+                                error_display = f"[권한 오류로 이미지 로드 실패: {os.path.basename(image_path)}]"
+                            elif "format" in str(e).lower() or "Format" in str(e):
+                                error_display = f"[지원되지 않는 이미지 형식: {os.path.basename(image_path)}]"
+                            else:
+                                error_display = f"[이미지 로드 실패: {os.path.basename(image_path)}]"
+                            
+                            # 이미지 오류 시 대체 텍스트
+                            draw_korean_text(c, margin_left, y_pos, error_display, base_font_size)
+                            y_pos -= line_height_base * 2
+                            image_count += 1
+                            
+                            # OCR 텍스트만 표시 (이미지 실패 시)
+                            if ocr_text and len(ocr_text.strip()) > 0:
+                                ocr_lines = [ocr_text[i:i+60] for i in range(0, len(ocr_text), 60)]
+                                for ocr_line in ocr_lines[:3]:  # 최대 3줄
+                                    if y_pos < margin_bottom + line_height_base:
+                                        c.showPage()
+                                        y_pos = margin_top
+                                    draw_korean_text(c, margin_left + 20, y_pos, f"📝 {ocr_line}", base_font_size - 1)
+                                    y_pos -= line_height_base
+                    
+                    else:
+                        print(f"이미지 파일 없음: {image_path}")
+                        draw_korean_text(c, margin_left, y_pos, f"[이미지 {image_count + 1} - 파일 없음]", base_font_size)
+                        y_pos -= line_height_base
+                        image_count += 1
+                        
+                        # OCR 텍스트만 표시 (파일 없음 시)
+                        if ocr_text and len(ocr_text.strip()) > 0:
+                            ocr_lines = [ocr_text[i:i+60] for i in range(0, len(ocr_text), 60)]
+                            for ocr_line in ocr_lines[:3]:  # 최대 3줄
+                                if y_pos < margin_bottom + line_height_base:
+                                    c.showPage()
+                                    y_pos = margin_top
+                                draw_korean_text(c, margin_left + 20, y_pos, f"📝 {ocr_line}", base_font_size - 1)
+                                y_pos -= line_height_base
+                    
+                except Exception as e:
+                    print(f"이미지 처리 오류: {e}")
+                    draw_korean_text(c, margin_left, y_pos, f"[이미지 처리 오류: {str(e)[:50]}]", base_font_size)
+                    y_pos -= line_height_base * 2
+            
+            elif item['type'] == 'table':
+                # 표 처리 (다중 폰트)
+                table_data = item['content']
+                
+                # 표 제목
+                if y_pos < margin_bottom + line_height_base:
+                    c.showPage()
+                    y_pos = margin_top
+                
+                draw_korean_text(c, margin_left, y_pos, f"[표 {item['index'] + 1}]", base_font_size + 1, 'Heading')
+                y_pos -= line_height_base + 5
+                
+                # 표 내용
+                for row in table_data:
+                    if y_pos < margin_bottom + line_height_base:
+                        c.showPage()
+                        y_pos = margin_top
+                    
+                    row_text = " | ".join(str(cell) for cell in row)
+                    if len(row_text) > max_chars_per_line:
+                        row_text = row_text[:max_chars_per_line] + "..."
+                    
+                    draw_korean_text(c, margin_left + 10, y_pos, row_text, base_font_size - 1)
+                    y_pos -= line_height_base
+                
+                y_pos -= 10  # 표 간격
+            
+            processed_items += 1
+            
+        except Exception as e:
+            print(f"항목 처리 오류: {e}")
+            continue
+    
+    c.save()
+    print(f"✅ PDF 저장 완료: {processed_items}개 항목 (이미지 {image_count}개 포함)")
+    return True
+
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -449,6 +668,7 @@ def index():
 @app.route('/fonts')
 def list_fonts():
     """사용 가능한 폰트 목록 API"""
+    setup_korean_font_advanced()
     font_list = []
     for font_name, font_info in AVAILABLE_FONTS.items():
         font_list.append({
@@ -554,277 +774,9 @@ def convert_file():
             output_path = os.path.join('outputs', f"{name_without_ext}_{timestamp}.pdf")
             
             try:
-                print("📄 DOCX → PDF 변환 시작 (다중 폰트 지원)")
-                
-                # 방향 감지
-                docx_orientation = detect_docx_orientation(input_path)
-                
-                # 강화된 서식 정보와 함께 내용 추출 (이미지 포함)
-                # 557번째 줄 확인
-                # 변경 전: extract_docx_with_complete_formatting_enhanced
-                # 변경 후: extract_docx_with_complete_formatting
-                content_list = extract_docx_with_complete_formatting(input_path, temp_files)
-                
-                if not content_list:
+                if not docx_to_pdf_reportlab(input_path, output_path, temp_files):
                     return jsonify({'success': False, 'error': 'DOCX 파일에서 내용을 추출할 수 없습니다.'}), 400
                 
-                # PDF 페이지 크기 설정
-                if docx_orientation == 'landscape':
-                    page_size = landscape(A4)
-                    base_font_size = 10
-                    line_height_base = 16
-                    max_chars_per_line = 70
-                else:
-                    page_size = portrait(A4)
-                    base_font_size = 11
-                    line_height_base = 18
-                    max_chars_per_line = 50
-                
-                # PDF 생성
-                c = canvas.Canvas(output_path, pagesize=page_size)
-                width, height = page_size
-                
-                print(f"📄 PDF 생성: {width:.0f} x {height:.0f} ({docx_orientation})")
-                
-                margin_left = 50
-                margin_right = width - 50
-                margin_top = height - 50
-                margin_bottom = 50
-                
-                y_pos = margin_top
-                
-                # 내용 처리 (다중 폰트 지원)
-                processed_items = 0
-                image_count = 0
-                
-                for item in content_list:
-                    try:
-                        if processed_items >= 200:  # 처리 제한
-                            break
-                        
-                        if item['type'] == 'paragraph':
-                            # 문단 처리 (다중 폰트 지원)
-                            text = item['content']
-                            font_size = item.get('font_size', base_font_size)
-                            is_bold = item.get('is_bold', False)
-                            style = item.get('style', 'Normal')
-                            font_name = item.get('font_name', None)
-                            
-                            # 줄 높이 조정 (폰트 크기에 비례)
-                            line_height = max(line_height_base, int(font_size * 1.4))
-                            
-                            # 제목 스타일 추가 간격
-                            if 'Heading' in style or 'Title' in style:
-                                y_pos -= 15  # 제목 전 추가 간격
-                            
-                            # 줄 단위로 분할 (폰트 크기 고려)
-                            chars_per_line = max(20, int(max_chars_per_line * base_font_size / font_size))
-                            
-                            lines = []
-                            current_line = ""
-                            
-                            for char in text:
-                                if len(current_line) >= chars_per_line:
-                                    lines.append(current_line)
-                                    current_line = char
-                                else:
-                                    current_line += char
-                            
-                            if current_line:
-                                lines.append(current_line)
-                            
-                            # 각 줄 출력 (다중 폰트 적용)
-                            for line in lines:
-                                if y_pos < margin_bottom + line_height:
-                                    c.showPage()
-                                    y_pos = margin_top
-                                
-                                # 향상된 텍스트 그리기 (다중 폰트 적용)
-                                draw_korean_text(c, margin_left, y_pos, line, font_size)
-                                draw_korean_text(c, margin_left + 0.5, y_pos, line, font_size)
-                                
-                                y_pos -= line_height
-                            
-                            # 문단 간격 (스타일에 따라)
-                            if 'Heading' in style or 'Title' in style:
-                                y_pos -= 15  # 제목 후 추가 간격
-                            else:
-                                y_pos -= 8   # 일반 문단 간격
-                        
-                        elif item['type'] == 'image':
-                            # 개선된 이미지 처리 (레이아웃 보존)
-                            try:
-                                image_path = item['path']
-                                img_width = item['width']
-                                img_height = item['height']
-                                ocr_text = item.get('ocr_text', '')
-                                
-                                # 이미지 크기 계산 (원본 비율 유지)
-                                aspect_ratio = img_width / img_height
-                                max_width = (width - margin_left - 50) * 0.8  # 페이지 너비의 80%
-                                max_height = (height - margin_top - margin_bottom) * 0.6  # 페이지 높이의 60%
-                                
-                                if max_width / aspect_ratio <= max_height:
-                                    final_width = max_width
-                                    final_height = max_width / aspect_ratio
-                                else:
-                                    final_height = max_height
-                                    final_width = max_height * aspect_ratio
-                                
-                                # 이미지 여백 설정
-                                image_margin_top = 20
-                                image_margin_bottom = 15
-                                
-                                # 페이지 넘김 확인
-                                required_space = final_height + image_margin_top + image_margin_bottom
-                                if y_pos - required_space < margin_bottom:
-                                    c.showPage()
-                                    y_pos = margin_top
-                                
-                                # 이미지 중앙 정렬 계산
-                                # 이미지 중앙 정렬 계산
-                                page_width = width - margin_left - 50  # 사용 가능한 페이지 너비
-                                image_x = margin_left + (page_width - final_width) / 2
-                                
-                                # 이미지 파일 존재 확인
-                                if os.path.exists(image_path):
-                                    try:
-                                        # 메모리 최적화된 이미지 처리 (Render 환경 고려)
-                                        from PIL import Image as PILImage
-                                        
-                                        # 이미지 크기 사전 확인 및 최적화
-                                        with PILImage.open(image_path) as pil_img:
-                                            # 이미지가 너무 크면 임시로 리사이즈
-                                            max_dimension = 2000  # Render 환경 메모리 제한 고려
-                                            if pil_img.width > max_dimension or pil_img.height > max_dimension:
-                                                # 임시 리사이즈된 이미지 생성
-                                                temp_img = pil_img.copy()
-                                                temp_img.thumbnail((max_dimension, max_dimension), PILImage.Resampling.LANCZOS)
-                                                
-                                                # 임시 파일로 저장
-                                                import tempfile
-                                                with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as temp_file:
-                                                    temp_img.save(temp_file.name, 'PNG', optimize=True)
-                                                    optimized_image_path = temp_file.name
-                                                    temp_files.append(optimized_image_path)
-                                                temp_img.close()
-                                            else:
-                                                optimized_image_path = image_path
-                                        
-                                        # 이미지 그리기 (메모리 최적화된 경로 사용)
-                                        img_reader = ImageReader(optimized_image_path)
-                                        c.drawImage(img_reader, image_x, y_pos - final_height, 
-                                                  width=final_width, height=final_height,
-                                                  preserveAspectRatio=True, anchor='c')
-                                        
-                                        print(f"✅ 이미지 {image_count + 1} 삽입: {final_width:.0f}x{final_height:.0f} (원본: {img_width}x{img_height})")
-                                        
-                                        # 이미지 하단 여백
-                                        y_pos -= final_height + image_margin_bottom
-                                        image_count += 1
-                                        
-                                        # OCR 텍스트 처리 (이미지 성공 시)
-                                        if ocr_text and len(ocr_text.strip()) > 0:
-                                            y_pos -= 5
-                                            # OCR 텍스트를 이미지 아래 중앙에 배치
-                                            ocr_lines = [ocr_text[i:i+60] for i in range(0, len(ocr_text), 60)]
-                                            for ocr_line in ocr_lines[:3]:  # 최대 3줄
-                                                if y_pos < margin_bottom + line_height_base:
-                                                    c.showPage()
-                                                    y_pos = margin_top
-                                                draw_korean_text(c, margin_left + 20, y_pos, f"📝 {ocr_line}", base_font_size - 1)
-                                                y_pos -= line_height_base
-                                
-                                    except Exception as e:
-                                        error_msg = f"이미지 처리 오류 ({os.path.basename(image_path)}): {str(e)}"
-                                        print(f"❌ {error_msg}")
-                                        
-                                        # 상세한 에러 로깅 (Render 환경 디버깅용)
-                                        import traceback
-                                        print(f"상세 에러 정보: {traceback.format_exc()}")
-                                        
-                                        # 에러 유형별 메시지 제공
-                                        if "Memory" in str(e) or "memory" in str(e):
-                                            error_display = f"[메모리 부족으로 이미지 로드 실패: {os.path.basename(image_path)}]"
-                                        elif "Permission" in str(e) or "permission" in str(e):
-                                            error_display = f"[권한 오류로 이미지 로드 실패: {os.path.basename(image_path)}]"
-                                        elif "format" in str(e).lower() or "Format" in str(e):
-                                            error_display = f"[지원되지 않는 이미지 형식: {os.path.basename(image_path)}]"
-                                        else:
-                                            error_display = f"[이미지 로드 실패: {os.path.basename(image_path)}]"
-                                        
-                                        # 이미지 오류 시 대체 텍스트
-                                        draw_korean_text(c, margin_left, y_pos, error_display, base_font_size)
-                                        y_pos -= line_height_base * 2
-                                        image_count += 1
-                                        
-                                        # OCR 텍스트만 표시 (이미지 실패 시)
-                                        if ocr_text and len(ocr_text.strip()) > 0:
-                                            ocr_lines = [ocr_text[i:i+60] for i in range(0, len(ocr_text), 60)]
-                                            for ocr_line in ocr_lines[:3]:  # 최대 3줄
-                                                if y_pos < margin_bottom + line_height_base:
-                                                    c.showPage()
-                                                    y_pos = margin_top
-                                                draw_korean_text(c, margin_left + 20, y_pos, f"📝 {ocr_line}", base_font_size - 1)
-                                                y_pos -= line_height_base
-                                
-                                else:
-                                    print(f"이미지 파일 없음: {image_path}")
-                                    draw_korean_text(c, margin_left, y_pos, f"[이미지 {image_count + 1} - 파일 없음]", base_font_size)
-                                    y_pos -= line_height_base
-                                    image_count += 1
-                                    
-                                    # OCR 텍스트만 표시 (파일 없음 시)
-                                    if ocr_text and len(ocr_text.strip()) > 0:
-                                        ocr_lines = [ocr_text[i:i+60] for i in range(0, len(ocr_text), 60)]
-                                        for ocr_line in ocr_lines[:3]:  # 최대 3줄
-                                            if y_pos < margin_bottom + line_height_base:
-                                                c.showPage()
-                                                y_pos = margin_top
-                                            draw_korean_text(c, margin_left + 20, y_pos, f"📝 {ocr_line}", base_font_size - 1)
-                                            y_pos -= line_height_base
-                                
-                            except Exception as e:
-                                print(f"이미지 처리 오류: {e}")
-                                draw_korean_text(c, margin_left, y_pos, f"[이미지 처리 오류: {str(e)[:50]}]", base_font_size)
-                                y_pos -= line_height_base * 2
-                        
-                        elif item['type'] == 'table':
-                            # 표 처리 (다중 폰트)
-                            table_data = item['content']
-                            
-                            # 표 제목
-                            if y_pos < margin_bottom + line_height_base:
-                                c.showPage()
-                                y_pos = margin_top
-                            
-                            draw_korean_text(c, margin_left, y_pos, f"[표 {item['index'] + 1}]", base_font_size + 1, 'Heading')
-                            y_pos -= line_height_base + 5
-                            
-                            # 표 내용
-                            for row in table_data:
-                                if y_pos < margin_bottom + line_height_base:
-                                    c.showPage()
-                                    y_pos = margin_top
-                                
-                                row_text = " | ".join(str(cell) for cell in row)
-                                if len(row_text) > max_chars_per_line:
-                                    row_text = row_text[:max_chars_per_line] + "..."
-                                
-                                draw_korean_text(c, margin_left + 10, y_pos, row_text, base_font_size - 1)
-                                y_pos -= line_height_base
-                            
-                            y_pos -= 10  # 표 간격
-                        
-                        processed_items += 1
-                        
-                    except Exception as e:
-                        print(f"항목 처리 오류: {e}")
-                        continue
-                
-                c.save()
-                print(f"✅ PDF 저장 완료: {processed_items}개 항목 (이미지 {image_count}개 포함)")
-                
             except Exception as e:
                 print(f"❌ DOCX 변환 오류: {e}")
                 # 오류 시에도 기본 PDF 생성
@@ -844,7 +796,10 @@ def convert_file():
                 download_name = f"{name_without_ext}.pdf"
             
             print(f"✅ 변환 완료: {download_name}")
-            return send_file(output_path, as_attachment=True, download_name=download_name)
+            response = send_file(output_path, as_attachment=True, download_name=download_name)
+            # 전송이 끝날 때까지 정리 대상에서 제외
+            response.call_on_close(mark_in_use(output_path))
+            return response
         else:
             return jsonify({'success': False, 'error': '변환된 파일을 찾을 수 없습니다.'}), 500
     
@@ -875,8 +830,14 @@ def handle_error(e):
 def health():
     return "ok", 200
 
+@app.route('/health/reaper')
+def health_reaper():
+    return jsonify(reaper_metrics())
+
 if __name__ == '__main__':
+    start_reaper()
     print("🚀 PDF ↔ DOCX 변환기 (빠른 시작 버전)")
+    setup_korean_font_advanced()
     print(f"🔤 한글 폰트: {KOREAN_FONT} (사용가능: {KOREAN_FONT_AVAILABLE})")
     for font_name, font_info in AVAILABLE_FONTS.items():
         print(f"   - {font_info['display_name']} ({font_name})")
@@ -1,47 +1,27 @@
 import os
-import platform
-from pathlib import Path
+
+from font_registry import get_font_registry
 
 def check_system_fonts():
     """
-    시스템에 설치된 한글 폰트 확인
+    시스템에 설치된 한글 폰트 확인 (공용 폰트 레지스트리 인덱스 사용)
     """
     print("=== 시스템 폰트 확인 ===")
     
-    # Windows 폰트 경로
-    if platform.system() == "Windows":
-        font_paths = [
-            "C:\\Windows\\Fonts",
-            os.path.expanduser("~\\AppData\\Local\\Microsoft\\Windows\\Fonts")
-        ]
-    else:
-        font_paths = ["/usr/share/fonts", "/System/Library/Fonts"]
-    
-    korean_fonts = []
-    target_fonts = ['malgun', 'noto', 'gulim', 'dotum', 'batang']
-    
-    for font_path in font_paths:
-        if os.path.exists(font_path):
-            for font_file in os.listdir(font_path):
-                font_lower = font_file.lower()
-                if any(target in font_lower for target in target_fonts):
-                    korean_fonts.append(font_file)
-    
-    print(f"발견된 한글 폰트: {len(korean_fonts)}개")
-    for font in korean_fonts[:10]:  # 처음 10개만 표시
-        print(f"  - {font}")
+    registry = get_font_registry()
+    available = registry.available_fonts()
     
-    # 맑은 고딕 확인
-    malgun_fonts = [f for f in korean_fonts if 'malgun' in f.lower()]
-    if malgun_fonts:
-        print(f"\n✅ 맑은 고딕 폰트 발견: {malgun_fonts}")
-        return True, '맑은 고딕'
+    print(f"검색 디렉토리: {', '.join(registry.font_dirs)}")
+    print(f"발견된 한글 폰트: {len(available)}개")
+    for font_name, info in available.items():
+        print(f"  - {info['display_name']} ({info['path']})")
     
-    # Noto Sans CJK 확인
-    noto_fonts = [f for f in korean_fonts if 'noto' in f.lower() and 'cjk' in f.lower()]
-    if noto_fonts:
-        print(f"\n✅ Noto Sans CJK 폰트 발견: {noto_fonts}")
-        return True, 'Noto Sans CJK KR'
+    # 파일이 있어도 reportlab이 읽지 못하면 Helvetica로 대체되므로 실제 등록에 성공한 폰트만 보고
+    font = registry.korean_font()
+    if font:
+        font_name, display_name, path = font
+        print(f"\n✅ 한글 폰트 등록 확인: {display_name} ({path})")
+        return True, display_name
     
     print("\n❌ 적절한 한글 폰트를 찾을 수 없습니다.")
     return False, None
@@ -0,0 +1,194 @@
+import json
+import os
+import platform
+import threading
+
+# 검색할 폰트 디렉토리 (FONT_DIRS 환경변수로 재정의, os.pathsep 구분)
+DEFAULT_FONT_DIRS = [
+    'fonts',
+    '/usr/share/fonts',
+    '/usr/local/share/fonts',
+    os.path.expanduser('~/.fonts'),
+    os.path.expanduser('~/.local/share/fonts'),
+    '/System/Library/Fonts',
+    '/Library/Fonts',
+]
+if platform.system() == "Windows":
+    DEFAULT_FONT_DIRS += [
+        r"C:\Windows\Fonts",
+        os.path.expanduser(r"~\AppData\Local\Microsoft\Windows\Fonts"),
+    ]
+
+# 인덱스 파일은 스캔 대상 디렉토리 밖에 둔다 (인덱스 기록이 디렉토리 mtime을 바꾸지 않도록)
+FONT_INDEX_PATH = os.environ.get('FONT_INDEX_PATH', '.font_index.json')
+INDEX_VERSION = 2
+
+# 우선순위 순 한글 폰트 후보: (reportlab 폰트명, 표시명, 파일명 소문자)
+# reportlab TTFont는 TrueType(glyf) 외곽선만 읽을 수 있으므로 CFF 외곽선인 Noto Sans CJK(.ttc/.otf)는 넣지 않는다
+KOREAN_FONT_CANDIDATES = [
+    ('NanumGothic', '나눔고딕', 'nanumgothic.ttf'),
+    ('Malgun', '맑은 고딕', 'malgun.ttf'),
+    ('NanumBarunGothic', '나눔바른고딕', 'nanumbarungothic.ttf'),
+    ('UnDotum', '은돋움', 'undotum.ttf'),
+    ('Gulim', '굴림', 'gulim.ttc'),
+    ('Batang', '바탕', 'batang.ttc'),
+    ('Dotum', '돋움', 'dotum.ttc'),
+    # Google Fonts 배포본 (TrueType 외곽선)
+    ('NotoSansKR', 'Noto Sans KR', 'notosanskr-regular.ttf'),
+]
+_CANDIDATE_FILES = {filename for _, _, filename in KOREAN_FONT_CANDIDATES}
+
+
+def configured_font_dirs():
+    env_dirs = os.environ.get('FONT_DIRS')
+    if env_dirs:
+        return [d for d in env_dirs.split(os.pathsep) if d]
+    return list(DEFAULT_FONT_DIRS)
+
+
+def _dir_mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+class FontRegistry:
+    """
+    한글 폰트 레지스트리
+
+    설정된 폰트 디렉토리를 한 번만 스캔해 결과를 mtime 기반 인덱스 파일에 캐시하고,
+    reportlab TTFont 등록은 처음 사용할 때 수행한다. 네트워크는 사용하지 않는다.
+    """
+
+    def __init__(self, font_dirs=None, index_path=FONT_INDEX_PATH):
+        self.font_dirs = font_dirs if font_dirs is not None else configured_font_dirs()
+        self.index_path = index_path
+        self._fonts = None          # {파일명 소문자: 경로}
+        self._registered = None     # (폰트명, 표시명, 경로) 또는 False
+        self._lock = threading.Lock()
+
+    def _scan(self):
+        """폰트 디렉토리 재귀 스캔 (os.scandir) - 한글 폰트 후보와 디렉토리 mtime 수집"""
+        fonts = {}
+        dir_mtimes = {}
+        stack = list(self.font_dirs)
+        for root in self.font_dirs:
+            dir_mtimes[root] = _dir_mtime(root)
+
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            dir_mtimes[entry.path] = _dir_mtime(entry.path)
+                            stack.append(entry.path)
+                        else:
+                            name = entry.name.lower()
+                            if name in _CANDIDATE_FILES and name not in fonts:
+                                fonts[name] = entry.path
+            except OSError:
+                continue
+
+        return fonts, dir_mtimes
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if index.get('version') != INDEX_VERSION or index.get('roots') != self.font_dirs:
+            return None
+        for path, mtime in index.get('dirs', {}).items():
+            if _dir_mtime(path) != mtime:
+                return None
+        return index.get('fonts', {})
+
+    def _save_index(self, fonts, dir_mtimes):
+        try:
+            os.makedirs(os.path.dirname(self.index_path) or '.', exist_ok=True)
+            tmp_path = self.index_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': INDEX_VERSION, 'roots': self.font_dirs,
+                           'dirs': dir_mtimes, 'fonts': fonts}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"⚠️ 폰트 인덱스 저장 실패 (무시됨): {e}")
+
+    def discover(self):
+        """발견된 한글 폰트 파일 {파일명 소문자: 경로} (인덱스가 유효하면 스캔 생략)"""
+        with self._lock:
+            if self._fonts is None:
+                fonts = self._load_index()
+                if fonts is None:
+                    fonts, dir_mtimes = self._scan()
+                    self._save_index(fonts, dir_mtimes)
+                self._fonts = fonts
+            return dict(self._fonts)
+
+    def available_fonts(self):
+        """
+        발견된 후보 폰트 {폰트명: {'path', 'display_name'}} (우선순위 순)
+
+        파일만 확인한 목록이므로 실제로 렌더링에 쓸 폰트는 korean_font()로 등록해 확인한다.
+        """
+        fonts = self.discover()
+        return {
+            font_name: {'path': fonts[filename], 'display_name': display_name}
+            for font_name, display_name, filename in KOREAN_FONT_CANDIDATES
+            if filename in fonts
+        }
+
+    def korean_font(self):
+        """
+        첫 사용 시 우선순위가 가장 높은 한글 폰트를 reportlab에 등록
+
+        Returns:
+            tuple: (폰트명, 표시명, 경로) 또는 등록 가능한 폰트가 없으면 None
+        """
+        if self._registered is not None:
+            return self._registered or None
+
+        available = self.available_fonts()
+        with self._lock:
+            if self._registered is None:
+                self._registered = self._register_first(available)
+        return self._registered or None
+
+    @staticmethod
+    def _register_first(available):
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+
+        for font_name, info in available.items():
+            try:
+                if font_name in pdfmetrics.getRegisteredFontNames():
+                    return font_name, info['display_name'], info['path']
+                pdfmetrics.registerFont(TTFont(font_name, info['path']))
+                print(f"✅ 한글 폰트 등록: {info['display_name']} ({info['path']})")
+                return font_name, info['display_name'], info['path']
+            except Exception as e:
+                print(f"폰트 등록 실패: {info['path']} - {e}")
+
+        print("⚠️ 한글 폰트를 찾을 수 없습니다. 기본 폰트를 사용합니다.")
+        return False
+
+    def korean_font_name(self, default='Helvetica'):
+        font = self.korean_font()
+        return font[0] if font else default
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_font_registry():
+    """프로세스 전역 폰트 레지스트리"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = FontRegistry()
+        return _registry
@@ -0,0 +1,26 @@
+# gunicorn 설정 (gunicorn 실행 디렉토리의 이 파일을 자동으로 읽음)
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '10000')}"
+# 워커마다 pdf2docx 병렬 변환용 spawn 프로세스 풀(PDF2DOCX_WORKERS개)이 따로 생기며 preload 공유 메모리를 쓰지 못함
+# 병렬 변환이 겹치면 프로세스 수는 최대 WEB_CONCURRENCY x (1 + PDF2DOCX_WORKERS)개까지 늘고
+# PDF2DOCX_POOL_IDLE_SECONDS 동안 변환이 없으면 풀이 종료되어 워커 수만큼으로 돌아옴
+workers = int(os.environ.get('WEB_CONCURRENCY', '2'))
+timeout = int(os.environ.get('CONVERSION_TIMEOUT_SECONDS', '300')) + 30
+
+# 마스터에서 앱을 로드한 뒤 fork 해야 워커가 로드된 자원을 copy-on-write로 공유함
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'true').lower() == 'true'
+
+
+def when_ready(server):
+    """워커 fork 직전(마스터) - 폰트/엔진/필터/커널 워밍업"""
+    if not preload_app:
+        return
+    import prefork
+    prefork.warm_up()
+
+
+def post_fork(server, worker):
+    """워커 fork 직후 - 업로드/결과/캐시 파일 정리 스레드를 워커마다 시작"""
+    import file_reaper
+    file_reaper.start_reaper()
@@ -0,0 +1,78 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from html_layer_writer import (DEFAULT_TITLE, HtmlLayerBuilder, _HEAD_AFTER_TITLE, _HEAD_BEFORE_TITLE, _TAIL,
+                               text_markup)
+
+
+def sample_elements(block_count):
+    """벤치마크용 텍스트 요소 (페이지당 60줄)"""
+    style = {'font_name': 'Malgun Gothic', 'font_size': 11, 'font_weight': 'normal', 'color': '#000000'}
+    for index in range(block_count):
+        yield index // 60, f'{index + 1}번째 텍스트 블록 <본문> & sample', (index % 60) * 13, style
+
+
+def render_html_legacy(block_count):
+    """문서 전체를 문자열로 이어 붙이는 기존 방식"""
+    content = _HEAD_BEFORE_TITLE + f'<title>{DEFAULT_TITLE}</title>' + _HEAD_AFTER_TITLE
+    for page, text, y, style in sample_elements(block_count):
+        content += text_markup(72, y, 448, 12, style, text)
+    return content + _TAIL
+
+
+def write_streamed(block_count, output_dir, compress=False):
+    with HtmlLayerBuilder(output_dir, compress, split_pages=0) as layer:
+        for page, text, y, style in sample_elements(block_count):
+            layer.add_text(page, 72, y, 448, 12, style, text)
+        return layer.finish()
+
+
+def benchmark(block_count=200000, output_dir=None):
+    """
+    문자열 연결 후 저장하는 방식과 스트리밍 저장의 시간/최대 추가 메모리 비교
+
+    Returns:
+        dict: 블록 수, 출력 크기(MB), 각 방식 시간(초)과 최대 메모리(MB)
+    """
+    def measure(func):
+        # 시간은 tracemalloc 없이, 최대 메모리는 따로 한 번 더 실행해 측정
+        started = time.perf_counter()
+        result = func()
+        seconds = time.perf_counter() - started
+        tracemalloc.start()
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return result, round(seconds, 3), round(peak / 1024 / 1024, 1)
+
+    with tempfile.TemporaryDirectory(dir=output_dir) as directory:
+        legacy_path = os.path.join(directory, 'legacy.html')
+
+        def legacy():
+            with open(legacy_path, 'w', encoding='utf-8-sig') as f:
+                f.write(render_html_legacy(block_count))
+            return legacy_path
+
+        _, legacy_seconds, legacy_peak = measure(legacy)
+        _, stream_seconds, stream_peak = measure(lambda: write_streamed(block_count, directory))
+        gzip_path, gzip_seconds, _ = measure(lambda: write_streamed(block_count, directory, compress=True))
+        return {
+            'blocks': block_count,
+            'output_mb': round(os.path.getsize(legacy_path) / 1024 / 1024, 1),
+            'gzip_mb': round(os.path.getsize(gzip_path) / 1024 / 1024, 1),
+            'legacy_seconds': legacy_seconds,
+            'legacy_peak_mb': legacy_peak,
+            'stream_seconds': stream_seconds,
+            'stream_peak_mb': stream_peak,
+            'gzip_seconds': gzip_seconds,
+        }
+
+
+if __name__ == '__main__':
+    result = benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
+    print(f"텍스트 블록 {result['blocks']}개 ({result['output_mb']}MB, gzip {result['gzip_mb']}MB): "
+          f"문자열 연결 {result['legacy_seconds']}s / 최대 {result['legacy_peak_mb']}MB, "
+          f"스트리밍 {result['stream_seconds']}s / 최대 {result['stream_peak_mb']}MB, gzip {result['gzip_seconds']}s")
@@ -0,0 +1,322 @@
+import gzip
+import html
+import io
+import os
+import tempfile
+
+# 환경변수 기반 설정
+# 레이어 HTML을 gzip(.html.gz)으로 저장
+HTML_LAYER_GZIP = os.environ.get('HTML_LAYER_GZIP', 'false').lower() == 'true'
+# 이 페이지 수를 넘는 문서는 페이지별 HTML 파일로 나눔 (0이면 나누지 않음)
+HTML_LAYER_SPLIT_PAGES = int(os.environ.get('HTML_LAYER_SPLIT_PAGES', '0'))
+# 출력 파일 쓰기 버퍼 크기
+HTML_LAYER_BUFFER_BYTES = int(os.environ.get('HTML_LAYER_BUFFER_BYTES', str(256 * 1024)))
+
+HTML_LAYER_FILENAME = 'layered_document'
+DEFAULT_TITLE = '레이어 결합 문서'
+
+# Word 호환 HTML 머리말 (제목 앞/뒤)
+_HEAD_BEFORE_TITLE = """
+<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
+<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="ko" lang="ko">
+<head>
+    <meta http-equiv="Content-Type" content="text/html; charset=utf-8" />
+    <meta name="ProgId" content="Word.Document" />
+    <meta name="Generator" content="Microsoft Word" />
+    <meta name="Originator" content="Microsoft Word" />
+    """
+_HEAD_AFTER_TITLE = """
+    <style type="text/css">
+        /* Word 호환성을 위한 기본 스타일 */
+        body {
+            margin: 0pt;
+            padding: 12pt;
+            font-family: 'Malgun Gothic', '맑은 고딕', Arial, sans-serif;
+            font-size: 11pt;
+            background-color: white;
+            color: black;
+            line-height: 115%;
+            word-wrap: break-word;
+            -ms-word-wrap: break-word;
+        }
+        
+        .document-container {
+            position: relative;
+            background-color: white;
+            margin: 0 auto;
+            width: 210mm;
+            min-height: 297mm;
+            page-break-inside: avoid;
+        }
+        
+        .text-layer {
+            position: absolute;
+            font-family: inherit;
+            white-space: pre-wrap;
+            word-wrap: break-word;
+            -ms-word-wrap: break-word;
+            overflow: visible;
+        }
+        
+        .figure-layer {
+            position: absolute;
+            overflow: visible;
+        }
+        
+        .figure-layer img {
+            width: 100%;
+            height: 100%;
+            border: none;
+        }
+        
+        .search-highlight {
+            background-color: yellow;
+        }
+        
+        /* Word 호환 테이블 스타일 */
+        table {
+            border-collapse: collapse;
+            width: 100%;
+        }
+        
+        td, th {
+            border: 1pt solid black;
+            padding: 2pt;
+            vertical-align: top;
+        }
+        
+        /* 인쇄 및 Word 호환성 */
+        @media print {
+            body {
+                background-color: white;
+                padding: 0;
+            }
+            .document-container {
+                width: auto;
+                min-height: auto;
+            }
+        }
+    </style>
+</head>
+<body>
+    <div class="document-container">
+"""
+
+_TAIL = """
+    </div>
+    
+    <!-- Word 호환성을 위해 JavaScript 제거 -->
+    <!-- 검색 기능은 Word의 기본 찾기 기능 사용 -->
+    
+</body>
+</html>
+"""
+
+
+def figure_markup(name, x, y, width, height):
+    """그림 레이어 div (그림 파일은 HTML과 같은 폴더)"""
+    return f"""
+        <div class="figure-layer" style="
+            left: {x}px;
+            top: {y}px;
+            width: {width}px;
+            height: {height}px;
+        ">
+            <img src="{html.escape(name, quote=True)}" alt="Figure" />
+        </div>
+"""
+
+
+def text_markup(x, y, width, height, style, text):
+    """텍스트 레이어 div (HTML 엔티티 이스케이프로 Word 호환성 향상)"""
+    # 폰트명도 안전하게 처리
+    safe_font_name = html.escape(style['font_name'], quote=True) if style['font_name'] else 'Arial'
+    return f"""
+        <div class="text-layer" style="
+            left: {x}px;
+            top: {y}px;
+            width: {width}px;
+            height: {height}px;
+            font-family: '{safe_font_name}';
+            font-size: {style['font_size']}px;
+            font-weight: {style['font_weight']};
+            color: {style['color']};
+        ">{html.escape(text, quote=True)}</div>
+"""
+
+
+class HtmlLayerWriter:
+    """
+    레이어 HTML 스트리밍 작성기
+
+    머리말과 스타일, 요소별 마크업을 버퍼가 있는 파일 핸들에 바로 쓴다. 문서 전체를 문자열로
+    이어 붙이지 않으므로 메모리 사용량이 출력 크기와 무관하다. BOM(utf-8-sig)을 포함해 Word
+    호환성을 유지하고, compress=True이면 gzip으로 압축해 쓴다.
+
+    with 문으로 사용하면 끝날 때 꼬리말을 쓰고 파일을 닫는다. 예외로 끝나면 꼬리말 없이 닫고
+    파일을 삭제해 중간에 잘린 문서가 완성된 문서처럼 남지 않게 한다.
+    """
+
+    def __init__(self, path, compress=False, title=None):
+        self.path = path
+        self.compress = compress
+        self.title = title or DEFAULT_TITLE
+        self._file = None
+
+    def open(self):
+        if self.compress:
+            raw = gzip.GzipFile(self.path, 'wb', mtime=0)
+            self._file = io.TextIOWrapper(io.BufferedWriter(raw, HTML_LAYER_BUFFER_BYTES), encoding='utf-8-sig')
+        else:
+            self._file = open(self.path, 'w', encoding='utf-8-sig', buffering=HTML_LAYER_BUFFER_BYTES)
+        self._file.write(_HEAD_BEFORE_TITLE)
+        self._file.write(f'<title>{html.escape(self.title)}</title>')
+        self._file.write(_HEAD_AFTER_TITLE)
+        return self
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, markup):
+        self._file.write(markup)
+
+    def close(self):
+        if self._file is not None:
+            self._file.write(_TAIL)
+            self._file.close()
+            self._file = None
+
+    def abort(self):
+        """꼬리말 없이 닫고 작성 중이던 파일 삭제"""
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+            self._file = None
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+def _filename(suffix, compress):
+    return f"{HTML_LAYER_FILENAME}{suffix}.html{'.gz' if compress else ''}"
+
+
+class HtmlLayerBuilder:
+    """
+    추출 요소를 읽는 대로 레이어 HTML을 만드는 작성기
+
+    그림 bytes는 받는 즉시 출력 폴더에 쓰고, 요소 마크업은 출력 폴더의 임시 스풀 파일에 바로 기록한다.
+    메모리에는 요소별 (페이지, 스풀 위치, 길이)만 남으므로 문서 IR이나 그림 bytes를 모아 두지 않는다.
+    finish()에서 그림 레이어 다음 텍스트 레이어 순서로 HTML 파일을 조립하고, 페이지 수가
+    split_pages를 넘으면 페이지별 파일과 목차 파일로 나눈다.
+
+    with 문 안에서 예외가 나면 이번에 만든 그림/페이지/목차 파일을 모두 삭제한다.
+
+    Args:
+        output_dir: HTML과 그림 파일을 저장할 폴더
+        compress: gzip 저장 여부 (기본 HTML_LAYER_GZIP)
+        split_pages: 이 페이지 수를 넘으면 페이지별 파일로 저장 (기본 HTML_LAYER_SPLIT_PAGES, 0이면 나누지 않음)
+    """
+
+    def __init__(self, output_dir, compress=None, split_pages=None):
+        self.output_dir = output_dir
+        self.compress = HTML_LAYER_GZIP if compress is None else compress
+        self.split_pages = HTML_LAYER_SPLIT_PAGES if split_pages is None else split_pages
+        self._spool = None
+        self._figures = []   # (페이지, 스풀 위치, 길이)
+        self._texts = []
+        self._created = []   # 이번에 만든 파일 (실패 시 삭제)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self._close_spool()
+        else:
+            self.abort()
+
+    def _append(self, entries, page, markup):
+        if self._spool is None:
+            self._spool = tempfile.TemporaryFile(prefix='.layer_spool_', dir=self.output_dir)
+        data = markup.encode('utf-8')
+        entries.append((page, self._spool.tell(), len(data)))
+        self._spool.write(data)
+
+    def add_figure(self, page, name, x, y, width, height, data):
+        """그림 파일을 바로 저장하고 그림 레이어 마크업을 기록"""
+        path = os.path.join(self.output_dir, name)
+        self._created.append(path)
+        with open(path, 'wb') as f:
+            f.write(data)
+        self._append(self._figures, page, figure_markup(name, x, y, width, height))
+
+    def add_text(self, page, x, y, width, height, style, text):
+        self._append(self._texts, page, text_markup(x, y, width, height, style, text))
+
+    def _write_file(self, suffix, title, entries):
+        path = os.path.join(self.output_dir, _filename(suffix, self.compress))
+        self._created.append(path)
+        with HtmlLayerWriter(path, self.compress, title) as writer:
+            for _, offset, length in entries:
+                self._spool.seek(offset)
+                writer.write(self._spool.read(length).decode('utf-8'))
+        return path
+
+    def finish(self, page_count=0):
+        """
+        스풀한 마크업으로 HTML 파일 작성
+
+        Args:
+            page_count: 문서 페이지 수 (텍스트가 있는 페이지 수보다 작으면 그 값을 사용)
+
+        Returns:
+            str: HTML 파일 경로 (페이지별 저장이면 각 페이지 파일로 연결되는 목차 파일)
+        """
+        text_pages = {page for page, _, _ in self._texts}
+        page_count = max(page_count, len(text_pages))
+        if not self.split_pages or page_count <= self.split_pages:
+            path = self._write_file('', DEFAULT_TITLE, self._figures + self._texts)
+            self._close_spool()
+            return path
+
+        # 페이지별 파일: 그림만 있는 페이지도 포함
+        entries_by_page = {page: [] for page in sorted(text_pages | {page for page, _, _ in self._figures})}
+        for entry in self._figures + self._texts:
+            entries_by_page[entry[0]].append(entry)
+        page_files = []
+        for page, entries in entries_by_page.items():
+            self._write_file(f'_p{page + 1:04d}', f'{DEFAULT_TITLE} - {page + 1}페이지', entries)
+            page_files.append((page, _filename(f'_p{page + 1:04d}', self.compress)))
+        self._close_spool()
+
+        index_path = os.path.join(self.output_dir, _filename('', self.compress))
+        self._created.append(index_path)
+        with HtmlLayerWriter(index_path, self.compress) as writer:
+            for page, filename in page_files:
+                writer.write(f'\n        <p><a href="{filename}">{page + 1}페이지</a></p>\n')
+        return index_path
+
+    def _close_spool(self):
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+
+    def abort(self):
+        """스풀을 닫고 이번에 만든 그림/HTML 파일 삭제"""
+        self._close_spool()
+        for path in dict.fromkeys(self._created):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._created = []
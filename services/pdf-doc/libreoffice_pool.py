@@ -0,0 +1,357 @@
+import atexit
+import os
+import platform
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# 환경변수 기반 설정
+POOL_SIZE = int(os.environ.get('LIBREOFFICE_POOL_SIZE', '2'))
+MAX_DOCS_PER_INSTANCE = int(os.environ.get('LIBREOFFICE_MAX_DOCS', '50'))
+CONVERT_TIMEOUT = int(os.environ.get('LIBREOFFICE_TIMEOUT_SECONDS', '120'))
+QUEUE_TIMEOUT = int(os.environ.get('LIBREOFFICE_QUEUE_TIMEOUT_SECONDS', '300'))
+STARTUP_TIMEOUT = int(os.environ.get('LIBREOFFICE_STARTUP_TIMEOUT_SECONDS', '30'))
+# UNO 연결 파이프 이름 접두사 (프로세스 PID와 인스턴스 번호를 붙여 gunicorn 워커끼리 겹치지 않게 함)
+PIPE_PREFIX = os.environ.get('LIBREOFFICE_PIPE_PREFIX', 'lo_pool')
+
+# UNO 브리지 (LibreOffice 번들 파이썬 또는 python3-uno 패키지)
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+    from com.sun.star.connection import NoConnectException
+    UNO_AVAILABLE = True
+except ImportError:
+    UNO_AVAILABLE = False
+
+SOFFICE_CANDIDATES = [
+    r"C:\Program Files\LibreOffice\program\soffice.exe",
+    r"C:\Program Files (x86)\LibreOffice\program\soffice.exe",
+    "/usr/bin/soffice",
+    "/usr/lib/libreoffice/program/soffice",
+    "/opt/libreoffice/program/soffice",
+    "/Applications/LibreOffice.app/Contents/MacOS/soffice",
+]
+
+
+def find_soffice():
+    """soffice 실행 파일 경로 탐색 (없으면 None)"""
+    configured = os.environ.get('LIBREOFFICE_PATH')
+    if configured and os.path.exists(configured):
+        return configured
+
+    for name in ('soffice', 'libreoffice'):
+        found = shutil.which(name)
+        if found:
+            return found
+
+    for path in SOFFICE_CANDIDATES:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _prop(name, value):
+    prop = PropertyValue()
+    prop.Name = name
+    prop.Value = value
+    return prop
+
+
+def pipe_name(index, pid=None):
+    """프로세스별 UNO 파이프 이름 (고정 포트를 쓰면 다른 워커의 인스턴스에 연결해 재시작할 수 있음)"""
+    return f"{PIPE_PREFIX}_{pid or os.getpid()}_{index}"
+
+
+class SofficeInstance:
+    """UNO 파이프로 제어하는 상주형 headless LibreOffice 프로세스 1개"""
+
+    def __init__(self, soffice_path, name):
+        self.soffice_path = soffice_path
+        self.name = name
+        self.profile_dir = None
+        self.process = None
+        self.desktop = None
+        self.doc_count = 0
+
+    def start(self):
+        # 인스턴스마다 별도 사용자 프로필 (프로필 잠금 충돌 방지)
+        self.profile_dir = tempfile.mkdtemp(prefix=f'lo_profile_{self.name}_')
+        cmd = [
+            self.soffice_path,
+            '--headless', '--invisible', '--nologo', '--norestore',
+            '--nodefault', '--nolockcheck',
+            f'-env:UserInstallation={Path(self.profile_dir).as_uri()}',
+            f'--accept=pipe,name={self.name};urp;StarOffice.ComponentContext',
+        ]
+        self.process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.doc_count = 0
+
+        deadline = time.time() + STARTUP_TIMEOUT
+        while time.time() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"soffice 프로세스가 시작 직후 종료됨 ({self.name})")
+            try:
+                self._connect()
+                print(f"✅ LibreOffice 인스턴스 시작: {self.name} (PID {self.process.pid})")
+                return
+            except NoConnectException:
+                time.sleep(0.25)
+
+        self.stop()
+        raise TimeoutError(f"LibreOffice 인스턴스 시작 시간 초과 ({self.name})")
+
+    def _connect(self):
+        local_ctx = uno.getComponentContext()
+        resolver = local_ctx.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_ctx)
+        ctx = resolver.resolve(
+            f"uno:pipe,name={self.name};urp;StarOffice.ComponentContext")
+        self.desktop = ctx.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
+
+    def is_alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def convert(self, input_path, output_path):
+        """문서 1개를 PDF로 저장 (호출자가 타임아웃 관리)"""
+        input_url = uno.systemPathToFileUrl(os.path.abspath(input_path))
+        output_url = uno.systemPathToFileUrl(os.path.abspath(output_path))
+
+        document = self.desktop.loadComponentFromURL(
+            input_url, "_blank", 0, (_prop('Hidden', True), _prop('ReadOnly', True)))
+        if document is None:
+            raise RuntimeError(f"LibreOffice가 문서를 열지 못함: {input_path}")
+        try:
+            document.storeToURL(output_url, (_prop('FilterName', 'writer_pdf_Export'),))
+        finally:
+            document.close(True)
+        self.doc_count += 1
+
+    def stop(self):
+        try:
+            if self.desktop is not None:
+                self.desktop.terminate()
+        except Exception:
+            pass
+        self.desktop = None
+
+        if self.process is not None:
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            self.process = None
+
+        if self.profile_dir:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+            self.profile_dir = None
+
+    def kill(self):
+        """응답 없는 인스턴스 강제 종료"""
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+        self.desktop = None
+        self.stop()
+
+    def restart(self):
+        self.stop()
+        self.start()
+
+
+class LibreOfficePool:
+    """
+    상주형 LibreOffice 인스턴스 풀
+
+    요청은 유휴 인스턴스 큐에서 대기하며, 인스턴스는 N건 처리 후 또는
+    변환이 시간 초과(hang)되면 재시작된다. 문서당 지연은 변환 시간만 남는다.
+    """
+
+    def __init__(self, soffice_path, size=POOL_SIZE, max_docs=MAX_DOCS_PER_INSTANCE,
+                 timeout=CONVERT_TIMEOUT):
+        self.soffice_path = soffice_path
+        self.size = max(1, size)
+        self.max_docs = max_docs
+        self.timeout = timeout
+        self._instances = []
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._started = False
+
+    def start(self):
+        """인스턴스 기동 (첫 변환 시 자동 호출, 워밍업 시 직접 호출 가능)"""
+        with self._lock:
+            if self._started:
+                return
+            for i in range(self.size):
+                instance = SofficeInstance(self.soffice_path, pipe_name(i))
+                try:
+                    instance.start()
+                except Exception as e:
+                    print(f"⚠️ LibreOffice 인스턴스 시작 실패 ({instance.name}): {e}")
+                self._instances.append(instance)
+                self._idle.put(instance)
+            self._started = True
+
+    def _ensure_healthy(self, instance):
+        if not instance.is_alive() or instance.desktop is None:
+            instance.restart()
+        elif self.max_docs and instance.doc_count >= self.max_docs:
+            print(f"♻️ LibreOffice 인스턴스 재활용: {instance.name} ({instance.doc_count}건 처리)")
+            instance.restart()
+
+    def convert(self, input_path, output_path):
+        """DOCX → PDF 변환 (성공 시 True)"""
+        self.start()
+        try:
+            instance = self._idle.get(timeout=QUEUE_TIMEOUT)
+        except queue.Empty:
+            print("❌ LibreOffice 풀 대기 시간 초과")
+            return False
+
+        try:
+            self._ensure_healthy(instance)
+
+            result = {}
+
+            def run():
+                try:
+                    instance.convert(input_path, output_path)
+                    result['ok'] = True
+                except Exception as e:
+                    result['error'] = e
+
+            worker = threading.Thread(target=run, daemon=True)
+            worker.start()
+            worker.join(self.timeout)
+
+            if worker.is_alive():
+                print(f"❌ LibreOffice 변환 시간 초과 ({self.timeout}s) - 인스턴스 재시작: {instance.name}")
+                instance.kill()
+                instance.start()
+                return False
+
+            if 'error' in result:
+                print(f"❌ LibreOffice 변환 오류: {result['error']}")
+                if not instance.is_alive():
+                    instance.restart()
+                return False
+
+            return os.path.exists(output_path)
+
+        except Exception as e:
+            print(f"❌ LibreOffice 풀 처리 오류: {e}")
+            return False
+        finally:
+            self._idle.put(instance)
+
+    def shutdown(self):
+        with self._lock:
+            for instance in self._instances:
+                instance.stop()
+            self._instances = []
+            self._idle = queue.Queue()
+            self._started = False
+
+
+def convert_with_cli(soffice_path, input_path, output_path, timeout=CONVERT_TIMEOUT):
+    """UNO가 없을 때의 1회성 soffice --convert-to 변환"""
+    work_dir = tempfile.mkdtemp(prefix='lo_convert_')
+    try:
+        cmd = [
+            soffice_path, '--headless', '--norestore',
+            f'-env:UserInstallation={Path(work_dir, "profile").as_uri()}',
+            '--convert-to', 'pdf', '--outdir', work_dir, input_path,
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        generated = os.path.join(work_dir, os.path.splitext(os.path.basename(input_path))[0] + '.pdf')
+        if result.returncode != 0 or not os.path.exists(generated):
+            print(f"LibreOffice 변환 실패: {result.stderr}")
+            return False
+        shutil.move(generated, output_path)
+        return True
+    except subprocess.TimeoutExpired:
+        print(f"LibreOffice 변환 시간 초과 ({timeout}s)")
+        return False
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """프로세스 전역 풀 (soffice 또는 UNO가 없으면 None)"""
+    global _pool, _pool_pid
+    if not UNO_AVAILABLE:
+        return None
+    with _pool_lock:
+        # fork로 물려받은 풀의 인스턴스는 부모 프로세스 것이므로 새로 만듦
+        if _pool is None or _pool_pid != os.getpid():
+            _pool, _pool_pid = None, os.getpid()
+            soffice_path = find_soffice()
+            if not soffice_path:
+                return None
+            _pool = LibreOfficePool(soffice_path)
+        return _pool
+
+
+def pool_status():
+    """
+    상주 풀 사용 여부와 사유
+
+    Returns:
+        tuple: (사용 여부, 안내 메시지)
+    """
+    soffice_path = find_soffice()
+    if not soffice_path:
+        return False, "soffice를 찾을 수 없음 - DOCX → PDF는 reportlab 렌더러로 대체"
+    if not UNO_AVAILABLE:
+        return False, (f"UNO 모듈(python3-uno)을 불러올 수 없음 - 요청마다 1회성 soffice 변환 사용 "
+                       f"({soffice_path}), 실패 시 reportlab 렌더러로 대체")
+    return True, f"{POOL_SIZE}개 인스턴스, 인스턴스당 최대 {MAX_DOCS_PER_INSTANCE}건 ({soffice_path})"
+
+
+def log_pool_status():
+    """기동 시 상주 풀 사용 여부를 한 번 출력 (비활성화된 경우 사유 포함)"""
+    enabled, message = pool_status()
+    if enabled:
+        print(f"✅ LibreOffice 상주 풀 사용: {message}")
+    else:
+        print(f"⚠️ LibreOffice 상주 풀 비활성화: {message}")
+    return enabled
+
+
+def convert_docx_to_pdf(input_path, output_path):
+    """
+    LibreOffice로 DOCX → PDF 변환
+
+    UNO 사용 가능 시 상주 인스턴스 풀, 아니면 1회성 CLI 변환을 사용한다.
+
+    Returns:
+        bool: 성공 여부 (soffice가 없으면 False)
+    """
+    soffice_path = find_soffice()
+    if not soffice_path:
+        return False
+
+    pool = get_pool()
+    if pool is not None:
+        return pool.convert(input_path, output_path)
+
+    if platform.system() != "Windows":
+        print("⚠️ UNO 모듈 없음 - 1회성 soffice 변환 사용 (python3-uno 설치 권장)")
+    return convert_with_cli(soffice_path, input_path, output_path)
+
+
+def shutdown_pool():
+    if _pool is not None and _pool_pid == os.getpid():
+        _pool.shutdown()
+
+
+atexit.register(shutdown_pool)
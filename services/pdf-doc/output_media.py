@@ -0,0 +1,154 @@
+import hashlib
+import io
+import math
+import os
+import threading
+import weakref
+
+from engine_registry import load_engine
+
+# 환경변수 기반 설정
+# 배치 크기 기준 최대 해상도 (배치에 필요한 것보다 큰 이미지만 축소)
+OUTPUT_IMAGE_MAX_DPI = int(os.environ.get('OUTPUT_IMAGE_MAX_DPI', '220'))
+# 이미지 1개 최대 용량 (초과하면 투명도 없는 이미지는 JPEG로 재압축)
+OUTPUT_IMAGE_MAX_BYTES = int(os.environ.get('OUTPUT_IMAGE_MAX_BYTES', str(2 * 1024 * 1024)))
+OUTPUT_IMAGE_JPEG_QUALITY = int(os.environ.get('OUTPUT_IMAGE_JPEG_QUALITY', '85'))
+# 필요한 크기보다 이 비율 이하로 크면 축소하지 않음 (불필요한 재인코딩 방지)
+OUTPUT_IMAGE_SLACK = float(os.environ.get('OUTPUT_IMAGE_SLACK', '1.15'))
+
+_documents = weakref.WeakKeyDictionary()
+_documents_lock = threading.Lock()
+
+
+def _inches(length):
+    # docx/pptx Length 또는 계산 결과로 나온 EMU 숫자(float 등)
+    if not length:
+        return None
+    return length.inches if hasattr(length, 'inches') else length / 914400
+
+
+def _has_alpha(image):
+    return image.mode in ('RGBA', 'LA', 'PA') or (image.mode == 'P' and 'transparency' in image.info)
+
+
+class OutputMedia:
+    """
+    출력 문서 하나의 이미지 관리자
+
+    - 원본 바이트 해시로 같은 이미지(로고, 반복 도장 등)를 한 번만 처리하고, 다시 배치될 때는
+      같은 바이트를 넘겨 OOXML 패키지에 이미지 파트 하나만 저장되고 관계(rId)로 참조되게 한다.
+    - 배치 크기 x OUTPUT_IMAGE_MAX_DPI보다 큰 이미지만 축소하고, 용량 한도를 넘으면 재압축한다.
+    """
+
+    def __init__(self, max_dpi=None, max_bytes=None):
+        self.max_dpi = max_dpi or OUTPUT_IMAGE_MAX_DPI
+        self.max_bytes = max_bytes or OUTPUT_IMAGE_MAX_BYTES
+        self._sources = {}
+        self.stats = {'placements': 0, 'unique_images': 0, 'reused': 0, 'downsampled': 0,
+                      'recompressed': 0, 'source_bytes': 0, 'output_bytes': 0}
+
+    def _needed_pixels(self, size, width_in, height_in):
+        width, height = size
+        if width_in is None and height_in is None:
+            return width, height
+        if width_in is None:
+            width_in = height_in * width / height
+        if height_in is None:
+            height_in = width_in * height / width
+        return math.ceil(width_in * self.max_dpi), math.ceil(height_in * self.max_dpi)
+
+    def prepare(self, data, width_in=None, height_in=None):
+        """
+        배치용 이미지 바이트
+
+        Args:
+            data: 원본 이미지 바이트
+            width_in, height_in: 배치 크기(inch), 없으면 축소하지 않음
+
+        Returns:
+            bytes: 같은 원본은 (해상도가 충분하면) 항상 같은 바이트
+        """
+        self.stats['placements'] += 1
+        digest = hashlib.sha1(data).hexdigest()
+        entry = self._sources.get(digest)
+        if entry is None:
+            self.stats['source_bytes'] += len(data)
+
+        Image = load_engine('PIL.Image')
+        try:
+            image = Image.open(io.BytesIO(data))
+            size, source_format = image.size, image.format
+        except Exception:
+            # PIL로 열 수 없는 형식은 그대로 사용
+            if entry is None:
+                entry = self._store(digest, None, data)
+            return entry['data']
+
+        needed = self._needed_pixels(size, width_in, height_in)
+        # 이미 저장한 버전의 해상도가 충분하면 재사용 (같은 이미지 파트 참조)
+        if entry is not None and (entry['pixels'] is None or entry['pixels'][0] >= min(needed[0], size[0])):
+            self.stats['reused'] += 1
+            return entry['data']
+
+        scale = min(1.0, needed[0] / size[0], needed[1] / size[1])
+        oversized = scale * OUTPUT_IMAGE_SLACK < 1.0
+        if not oversized and len(data) <= self.max_bytes:
+            return self._store(digest, size, data)['data']
+
+        if oversized:
+            image = image.resize((max(1, round(size[0] * scale)), max(1, round(size[1] * scale))),
+                                 Image.LANCZOS)
+            self.stats['downsampled'] += 1
+        output = self._encode(image, source_format)
+        return self._store(digest, image.size, output)['data']
+
+    def _encode(self, image, source_format):
+        alpha = _has_alpha(image)
+        buffer = io.BytesIO()
+        if source_format == 'JPEG' and not alpha:
+            image.convert('RGB').save(buffer, 'JPEG', quality=OUTPUT_IMAGE_JPEG_QUALITY, optimize=True)
+        else:
+            if image.mode not in ('1', 'L', 'LA', 'P', 'RGB', 'RGBA'):
+                image = image.convert('RGBA' if alpha else 'RGB')
+            image.save(buffer, 'PNG', optimize=True)
+        if buffer.tell() > self.max_bytes and not alpha:
+            # 용량 한도 초과: 투명도가 없으면 JPEG로 재압축
+            buffer = io.BytesIO()
+            image.convert('RGB').save(buffer, 'JPEG', quality=OUTPUT_IMAGE_JPEG_QUALITY, optimize=True)
+            self.stats['recompressed'] += 1
+        return buffer.getvalue()
+
+    def _store(self, digest, pixels, data):
+        previous = self._sources.get(digest)
+        if previous is None:
+            self.stats['unique_images'] += 1
+        self.stats['output_bytes'] += len(data)
+        entry = self._sources[digest] = {'pixels': pixels, 'data': data}
+        return entry
+
+    def add_docx_picture(self, target, data, width=None, height=None):
+        """python-docx Document/Run에 이미지 추가 (width/height는 docx Length 또는 EMU)"""
+        prepared = self.prepare(data, _inches(width), _inches(height))
+        return target.add_picture(io.BytesIO(prepared), width=width, height=height)
+
+    def add_slide_picture(self, shapes, data, left, top, width=None, height=None):
+        """python-pptx 슬라이드 도형 목록에 이미지 추가 (위치/크기는 pptx Length 또는 EMU)"""
+        prepared = self.prepare(data, _inches(width), _inches(height))
+        return shapes.add_picture(io.BytesIO(prepared), left, top, width=width, height=height)
+
+    def summary(self):
+        stats = self.stats
+        return (f"이미지 배치 {stats['placements']}회, 고유 이미지 {stats['unique_images']}개 "
+                f"(재사용 {stats['reused']}회, 축소 {stats['downsampled']}개, 재압축 {stats['recompressed']}개), "
+                f"{stats['source_bytes'] / 1024:.0f}KB -> {stats['output_bytes'] / 1024:.0f}KB")
+
+
+def media_for(document):
+    """출력 문서(python-docx Document / python-pptx Presentation)마다 하나의 이미지 관리자"""
+    # 문서 객체는 해시할 수 없으므로 문서 파트를 키로 사용 (문서가 사라지면 함께 정리)
+    key = document.part
+    with _documents_lock:
+        media = _documents.get(key)
+        if media is None:
+            media = _documents[key] = OutputMedia()
+        return media
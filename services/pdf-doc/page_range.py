@@ -0,0 +1,91 @@
+import os
+import tempfile
+from contextlib import contextmanager
+
+from engine_registry import engine_lock, load_engine
+from scratch_space import scratch_dir
+
+
+def parse_page_range(spec, page_count):
+    """
+    페이지 범위 문자열 해석 (1부터 시작, 예: "1-3,5,8-", "-2")
+
+    Args:
+        spec: 페이지 범위 문자열 (비어 있으면 전체 페이지)
+        page_count: 문서의 전체 페이지 수
+
+    Returns:
+        list: 0부터 시작하는 페이지 번호 (중복 제거, 오름차순)
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 범위가 문서를 벗어난 경우
+    """
+    if not spec or not spec.strip():
+        return list(range(page_count))
+
+    pages = set()
+    for part in spec.replace(' ', '').split(','):
+        if not part:
+            continue
+        if '-' in part:
+            start_text, end_text = part.split('-', 1)
+            start = int(start_text) if start_text else 1
+            end = int(end_text) if end_text else page_count
+        else:
+            start = end = int(part)
+        if start < 1 or end > page_count or start > end:
+            raise ValueError(f"페이지 범위가 잘못되었습니다: {part} (전체 {page_count}페이지)")
+        pages.update(range(start - 1, end))
+
+    if not pages:
+        raise ValueError(f"선택된 페이지가 없습니다: {spec}")
+    return sorted(pages)
+
+
+def page_runs(pages):
+    """연속된 페이지 묶음 [(시작, 끝), ...] (끝 포함)"""
+    runs = []
+    for page in pages:
+        if runs and page == runs[-1][1] + 1:
+            runs[-1][1] = page
+        else:
+            runs.append([page, page])
+    return [tuple(run) for run in runs]
+
+
+@contextmanager
+def page_subset(pdf_path, pages):
+    """
+    선택한 페이지만 담은 PDF 경로 (블록 종료 시 삭제)
+
+    페이지를 지정하지 않았거나 전체 페이지를 선택한 경우 원본 경로를 그대로 사용한다.
+    Adobe 업로드, 래스터화, OCR 등 파일 단위로 동작하는 모든 단계가 선택한 페이지만 처리하게 된다.
+    """
+    if pages is None:
+        yield pdf_path
+        return
+
+    fitz = load_engine('fitz')
+    base = os.path.splitext(os.path.basename(pdf_path))[0]
+    subset_path = None
+    try:
+        with engine_lock, fitz.open(pdf_path) as source:
+            if list(pages) != list(range(source.page_count)):
+                subset = fitz.open()
+                for start, end in page_runs(pages):
+                    subset.insert_pdf(source, from_page=start, to_page=end)
+                fd, subset_path = tempfile.mkstemp(prefix=f'{base}_pages_', suffix='.pdf', dir=scratch_dir())
+                os.close(fd)
+                subset.save(subset_path, garbage=3, deflate=True)
+                subset.close()
+
+        if subset_path is None:
+            yield pdf_path
+            return
+        yield subset_path
+    finally:
+        if subset_path is not None:
+            try:
+                os.remove(subset_path)
+            except OSError:
+                pass
@@ -0,0 +1,238 @@
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from concurrent.futures.process import BrokenProcessPool
+
+from docx_merge import merge_docx
+from engine_registry import load_engine
+from scratch_space import scratch_space
+
+# 환경변수 기반 설정
+# 이 페이지 수 이상이면 페이지 범위를 나눠 여러 프로세스에서 동시에 변환
+PDF2DOCX_PARALLEL_MIN_PAGES = int(os.environ.get('PDF2DOCX_PARALLEL_MIN_PAGES', '12'))
+PDF2DOCX_WORKERS = int(os.environ.get('PDF2DOCX_WORKERS', str(min(4, os.cpu_count() or 1))))
+PDF2DOCX_MIN_PAGES_PER_PART = int(os.environ.get('PDF2DOCX_MIN_PAGES_PER_PART', '3'))
+# 워커 프로세스 시작 방식 (서버 워커에는 스레드가 있으므로 fork 대신 spawn)
+PDF2DOCX_MP_START = os.environ.get('PDF2DOCX_MP_START', 'spawn')
+# 마지막 병렬 변환 후 이 시간(초) 동안 쓰이지 않으면 프로세스 풀 종료 (0이면 변환마다 종료)
+PDF2DOCX_POOL_IDLE_SECONDS = float(os.environ.get('PDF2DOCX_POOL_IDLE_SECONDS', '60'))
+
+# 메모리: spawn 워커는 gunicorn preload/gc.freeze로 공유된 페이지를 물려받지 못하고
+# pdf2docx/PyMuPDF를 새로 import 하는 독립 인터프리터다. 풀은 gunicorn 워커마다 따로 생기므로
+# 병렬 변환이 겹치면 프로세스 수가 최대 WEB_CONCURRENCY x (1 + PDF2DOCX_WORKERS)까지 늘어나고,
+# 유휴 시간이 지나면 풀이 종료되어 WEB_CONCURRENCY개로 돌아온다.
+
+_pool = None
+_pool_pid = None
+_pool_workers = None
+_pool_users = 0
+_idle_timer = None
+_pool_lock = threading.Lock()
+
+
+@contextmanager
+def _checkout_pool(workers):
+    """
+    프로세스 풀을 빌려 쓰고 반납
+
+    풀은 변환마다 새로 띄우지 않고 재사용하되 (spawn 시 pdf2docx import 비용이 큼)
+    마지막 반납 후 PDF2DOCX_POOL_IDLE_SECONDS 동안 다시 쓰이지 않으면 종료한다.
+    """
+    global _pool, _pool_pid, _pool_workers, _pool_users
+    with _pool_lock:
+        _cancel_idle_timer()
+        if _pool is None or _pool_pid != os.getpid() or _pool_workers != workers:
+            if _pool is not None and _pool_pid == os.getpid():
+                _pool.shutdown(wait=False)
+            if _pool_pid != os.getpid():
+                _pool_users = 0
+            context = multiprocessing.get_context(PDF2DOCX_MP_START)
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+            _pool_pid = os.getpid()
+            _pool_workers = workers
+        _pool_users += 1
+        pool = _pool
+    try:
+        yield pool
+    finally:
+        with _pool_lock:
+            _pool_users -= 1
+            if _pool_users == 0 and _pool is pool:
+                _schedule_idle_shutdown(pool)
+
+
+def _cancel_idle_timer():
+    global _idle_timer
+    if _idle_timer is not None:
+        _idle_timer.cancel()
+        _idle_timer = None
+
+
+def _schedule_idle_shutdown(pool):
+    # _pool_lock을 잡은 상태에서 호출
+    global _idle_timer
+    if PDF2DOCX_POOL_IDLE_SECONDS <= 0:
+        _shutdown_idle_pool(pool)
+        return
+    _idle_timer = threading.Timer(PDF2DOCX_POOL_IDLE_SECONDS, _shutdown_idle_pool, args=(pool, True))
+    _idle_timer.daemon = True
+    _idle_timer.start()
+
+
+def _shutdown_idle_pool(pool, lock=False):
+    """유휴 시간이 지난 풀의 워커 프로세스 종료 (그 사이 다시 빌려 갔으면 유지)"""
+    global _pool, _pool_workers, _idle_timer
+    if lock:
+        with _pool_lock:
+            return _shutdown_idle_pool(pool)
+    if _pool is not pool or _pool_users:
+        return False
+    _idle_timer = None
+    _pool = None
+    _pool_workers = None
+    pool.shutdown(wait=False)
+    print(f"💤 pdf2docx 프로세스 풀 종료 (유휴 {PDF2DOCX_POOL_IDLE_SECONDS:g}s)")
+    return True
+
+
+def _discard_pool(pool):
+    """워커가 죽어 깨진 풀을 버려 다음 변환에서 새 풀을 만들게 함"""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is pool:
+            pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+            _pool_workers = None
+
+
+def should_parallelize(page_count, workers=None):
+    workers = workers or PDF2DOCX_WORKERS
+    return workers > 1 and page_count >= PDF2DOCX_PARALLEL_MIN_PAGES
+
+
+def partition_pages(pages, workers, min_pages_per_part=None):
+    """
+    페이지 목록을 연속된 구간으로 분할
+
+    페이지마다 처리 시간이 달라(표가 많은 페이지 등) 워커 수의 2배로 나눠 부하를 고르게 한다.
+
+    Returns:
+        list: 페이지 번호 목록들 (순서 유지)
+    """
+    min_pages_per_part = min_pages_per_part or PDF2DOCX_MIN_PAGES_PER_PART
+    pages = list(pages)
+    if not pages:
+        return []
+    part_count = max(1, min(workers * 2, len(pages) // min_pages_per_part))
+    size, extra = divmod(len(pages), part_count)
+    parts = []
+    start = 0
+    for index in range(part_count):
+        end = start + size + (1 if index < extra else 0)
+        parts.append(pages[start:end])
+        start = end
+    return parts
+
+
+def _convert_part(pdf_path, docx_path, pages):
+    """워커 프로세스: 페이지 구간 하나를 DOCX로 변환"""
+    from pdf2docx import Converter
+    converter = Converter(pdf_path)
+    try:
+        converter.convert(docx_path, pages=pages)
+    finally:
+        converter.close()
+    return docx_path
+
+
+def convert_parallel(pdf_path, output_path, pages=None, workers=None):
+    """
+    pdf2docx 병렬 변환: 페이지 구간별로 워커 프로세스에서 변환한 뒤 본문/스타일/미디어를 병합
+
+    Args:
+        pages: 변환할 페이지 번호 목록 (0부터 시작, None이면 전체)
+        workers: 워커 프로세스 수 (기본값: PDF2DOCX_WORKERS)
+
+    Returns:
+        float: 소요 시간(초)
+    """
+    workers = workers or PDF2DOCX_WORKERS
+    started = time.perf_counter()
+    if pages is None:
+        with load_engine('fitz').open(pdf_path) as doc:
+            pages = list(range(doc.page_count))
+    parts = partition_pages(pages, workers)
+    print(f"⚡ pdf2docx 병렬 변환: {len(pages)}페이지 -> {len(parts)}개 구간, 워커 {workers}개")
+
+    with scratch_space('pdf2docx') as scratch, scratch.subdir(prefix='parts_') as work_dir:
+        part_paths = [os.path.join(work_dir, f'part_{index:03d}.docx') for index in range(len(parts))]
+        with _checkout_pool(workers) as pool:
+            try:
+                # map은 제출 순서대로 결과를 돌려주므로 병합 순서가 보장됨
+                list(pool.map(_convert_part, [pdf_path] * len(parts), part_paths, parts))
+            except BrokenProcessPool:
+                _discard_pool(pool)
+                raise
+        merge_docx(part_paths, output_path)
+
+    return time.perf_counter() - started
+
+
+def convert_serial(pdf_path, output_path, pages=None):
+    """기존 단일 스레드 변환 (벤치마크 비교용, 소요 시간 반환)"""
+    started = time.perf_counter()
+    converter = load_engine('pdf2docx').Converter(pdf_path)
+    try:
+        if pages is not None:
+            converter.convert(output_path, pages=list(pages))
+        else:
+            converter.convert(output_path, start=0, end=None)
+    finally:
+        converter.close()
+    return time.perf_counter() - started
+
+
+def benchmark(pdf_path, workers=None, repeat=1):
+    """
+    직렬/병렬 변환 소요 시간 비교
+
+    Returns:
+        dict: 페이지 수, 직렬/병렬 최소 시간(초), 속도 향상 배율
+    """
+    import tempfile
+
+    workers = workers or PDF2DOCX_WORKERS
+    with load_engine('fitz').open(pdf_path) as doc:
+        page_count = doc.page_count
+    # 첫 실행에 포함되는 프로세스 시작/import 비용은 제외
+    with _checkout_pool(workers) as pool:
+        list(pool.map(int, range(workers)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        serial = min(convert_serial(pdf_path, os.path.join(tmp, f'serial_{i}.docx')) for i in range(repeat))
+        parallel = min(convert_parallel(pdf_path, os.path.join(tmp, f'parallel_{i}.docx'), workers=workers)
+                       for i in range(repeat))
+    return {
+        'pages': page_count,
+        'workers': workers,
+        'cpu_count': os.cpu_count(),
+        'serial_seconds': round(serial, 3),
+        'parallel_seconds': round(parallel, 3),
+        'speedup': round(serial / parallel, 2) if parallel else None,
+    }
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("사용법: python pdf2docx_parallel.py <PDF 파일> [워커 수] [반복 횟수]")
+        sys.exit(1)
+
+    result = benchmark(sys.argv[1],
+                       int(sys.argv[2]) if len(sys.argv) > 2 else None,
+                       int(sys.argv[3]) if len(sys.argv) > 3 else 1)
+    print(f"페이지 {result['pages']}개, 워커 {result['workers']}개 (CPU {result['cpu_count']}개)")
+    print(f"직렬: {result['serial_seconds']}s, 병렬: {result['parallel_seconds']}s, 속도 향상: {result['speedup']}배")
@@ -6,6 +6,8 @@ from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from collections import defaultdict
 
+from scratch_space import scratch_space
+
 # OCR 준비
 try:
     import pytesseract
@@ -254,15 +256,11 @@ def convert_pdf(pdf_path, output_path,
                     try:
                         imgs = page_to_images(pdf_path, p, dpi=dpi_image)
                         if imgs:
-                            tmp = f"__temp_p{p}_{os.getpid()}.png"
-                            imgs[0].save(tmp, "PNG")
-                            add_page_image(slide, tmp)
-                            
-                            # 임시 파일 정리
-                            try:
-                                os.remove(tmp)
-                            except:
-                                pass
+                            # 작업 스크래치 디렉토리에 저장 (블록 종료 시 자동 삭제)
+                            with scratch_space('pptx') as scratch:
+                                tmp = scratch.path(f"page_{p}.png")
+                                imgs[0].save(tmp, "PNG")
+                                add_page_image(slide, tmp)
                     except Exception as e:
                         log(f"[p{p+1}] 이미지 변환 실패: {e}")
                 else:
@@ -0,0 +1,171 @@
+import gc
+import os
+import sys
+import time
+
+from engine_registry import engine_available, load_engine
+
+# 마스터에서 미리 로드할 엔진 (PREFORK_ENGINES 환경변수로 재정의, 쉼표 구분)
+DEFAULT_PREFORK_ENGINES = ('numpy', 'cv2', 'fitz', 'pdfplumber', 'pytesseract', 'pptx', 'pdf2docx', 'adobe_sdk')
+
+# 마스터에서 미리 import 할 필터 모듈 (모듈 로드 시 정규식/토큰 테이블이 컴파일됨)
+FILTER_MODULES = ('advanced_text_filter', 'builder1_filter', 'custom_filter_rules')
+
+# smaps_rollup에서 읽는 항목 (kB)
+SMAPS_FIELDS = ('Rss', 'Pss', 'Shared_Clean', 'Shared_Dirty', 'Private_Clean', 'Private_Dirty')
+
+
+def prefork_engines():
+    env_engines = os.environ.get('PREFORK_ENGINES')
+    if env_engines is not None:
+        return [name.strip() for name in env_engines.split(',') if name.strip()]
+    return list(DEFAULT_PREFORK_ENGINES)
+
+
+def read_memory(pid='self'):
+    """
+    /proc/<pid>/smaps_rollup 메모리 사용량 (kB)
+
+    Returns:
+        dict: Rss, Pss, Shared_*, Private_* 값 (Linux 이외 환경에서는 None)
+    """
+    try:
+        with open(f'/proc/{pid}/smaps_rollup', 'r') as f:
+            lines = f.readlines()
+    except OSError:
+        return None
+
+    memory = {}
+    for line in lines:
+        parts = line.split()
+        if len(parts) >= 2 and parts[0].rstrip(':') in SMAPS_FIELDS:
+            memory[parts[0].rstrip(':')] = int(parts[1])
+    return memory
+
+
+def warm_up():
+    """
+    gunicorn 마스터에서 fork 전에 변하지 않는 자원을 한 번만 로드
+
+    폰트 레지스트리, 필터 정규식, OpenCV 커널, DOCX/PPTX 템플릿, 변환 엔진을 로드한 뒤 gc.freeze()로
+    이 객체들을 GC 추적에서 제외해, 포크된 워커가 해당 페이지를 복사하지 않고
+    copy-on-write로 공유하게 한다.
+
+    Returns:
+        dict: 자원별 로드 시간(초)과 마스터 RSS 증가량(kB)
+    """
+    before = read_memory()
+    timings = {}
+
+    def step(name, func):
+        started = time.perf_counter()
+        try:
+            func()
+        except Exception as e:
+            print(f"⚠️ 워밍업 실패 ({name}): {e}")
+        timings[name] = round(time.perf_counter() - started, 4)
+
+    for engine in prefork_engines():
+        if engine_available(engine):
+            step(f'engine:{engine}', lambda engine=engine: load_engine(engine))
+
+    def load_fonts():
+        from font_registry import get_font_registry
+        get_font_registry().korean_font()
+
+    def load_filters():
+        for module in FILTER_MODULES:
+            __import__(module)
+
+    def load_kernels():
+        import cv_kernels
+        cv_kernels.warm_up()
+
+    def load_templates():
+        import document_templates
+        document_templates.warm_up()
+
+    step('fonts', load_fonts)
+    step('filters', load_filters)
+    if engine_available('cv2'):
+        step('cv_kernels', load_kernels)
+    step('document_templates', load_templates)
+
+    # 이후 GC가 공유 객체 헤더를 건드려 페이지가 복사되는 것을 방지
+    gc.collect()
+    if hasattr(gc, 'freeze'):
+        gc.freeze()
+
+    after = read_memory()
+    report = {'timings': timings}
+    if before and after:
+        report['master_rss_growth_kb'] = after['Rss'] - before['Rss']
+    print(f"🔥 pre-fork 워밍업 완료: {sum(timings.values()):.2f}s, "
+          f"마스터 RSS 증가 {report.get('master_rss_growth_kb', '?')}kB")
+    return report
+
+
+def worker_pids(master_pid):
+    """마스터 프로세스의 자식(워커) PID 목록"""
+    pids = []
+    try:
+        for tid in os.listdir(f'/proc/{master_pid}/task'):
+            with open(f'/proc/{master_pid}/task/{tid}/children', 'r') as f:
+                pids.extend(int(pid) for pid in f.read().split())
+    except OSError:
+        pass
+    return sorted(set(pids))
+
+
+def memory_report(master_pid=None):
+    """
+    워커별 메모리 보고서
+
+    Shared_* 는 마스터와 copy-on-write로 공유 중인 페이지, Private_* 는 워커 고유 페이지.
+    워커 1개를 추가할 때 실제로 늘어나는 메모리는 Private에 가깝다.
+
+    Args:
+        master_pid: gunicorn 마스터 PID (None이면 현재 프로세스만 보고)
+
+    Returns:
+        dict: 워커별 rss/pss/shared/private(kB)과 합계
+    """
+    pids = worker_pids(master_pid) if master_pid else [os.getpid()]
+    workers = []
+    for pid in pids:
+        memory = read_memory(pid)
+        if not memory:
+            continue
+        shared = memory.get('Shared_Clean', 0) + memory.get('Shared_Dirty', 0)
+        private = memory.get('Private_Clean', 0) + memory.get('Private_Dirty', 0)
+        workers.append({
+            'pid': pid,
+            'rss_kb': memory.get('Rss', 0),
+            'pss_kb': memory.get('Pss', 0),
+            'shared_kb': shared,
+            'private_kb': private,
+        })
+
+    report = {'workers': workers}
+    if workers:
+        report['total_rss_kb'] = sum(w['rss_kb'] for w in workers)
+        report['total_pss_kb'] = sum(w['pss_kb'] for w in workers)
+        report['saved_per_worker_kb'] = sum(w['shared_kb'] for w in workers) // len(workers)
+        report['avg_private_kb'] = sum(w['private_kb'] for w in workers) // len(workers)
+    if master_pid:
+        report['master'] = read_memory(master_pid)
+    return report
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("사용법: python prefork.py <gunicorn 마스터 PID>")
+        sys.exit(1)
+
+    result = memory_report(int(sys.argv[1]))
+    print(f"{'PID':>8} {'RSS':>10} {'PSS':>10} {'공유':>10} {'고유':>10}  (kB)")
+    for w in result['workers']:
+        print(f"{w['pid']:>8} {w['rss_kb']:>10} {w['pss_kb']:>10} {w['shared_kb']:>10} {w['private_kb']:>10}")
+    if result['workers']:
+        print(f"워커당 공유(절약) 메모리: {result['saved_per_worker_kb']}kB, "
+              f"워커당 고유 메모리: {result['avg_private_kb']}kB, 전체 PSS: {result['total_pss_kb']}kB")
@@ -0,0 +1,190 @@
+import contextvars
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+
+
+def default_scratch_root():
+    """RAM 디스크(/dev/shm)가 쓰기 가능하면 사용, 아니면 시스템 임시 디렉토리"""
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        return '/dev/shm'
+    return tempfile.gettempdir()
+
+
+# 환경변수 기반 설정
+SCRATCH_ROOT = os.environ.get('SCRATCH_ROOT') or default_scratch_root()
+SCRATCH_SPILL_ROOT = os.environ.get('SCRATCH_SPILL_ROOT') or tempfile.gettempdir()
+SCRATCH_QUOTA_MB = int(os.environ.get('SCRATCH_QUOTA_MB', '256'))
+# tmpfs 전체가 가득 차지 않도록 남겨둘 최소 여유 공간
+SCRATCH_MIN_FREE_MB = int(os.environ.get('SCRATCH_MIN_FREE_MB', '64'))
+
+_MB = 1024 * 1024
+_current = contextvars.ContextVar('scratch_space', default=None)
+
+
+class ScratchSpace:
+    """
+    작업(요청) 1건 전용 임시 디렉토리
+
+    파일은 tmpfs(RAM 디스크) 루트 아래 작업 디렉토리에 만들고, 작업별 용량 한도를
+    넘거나 tmpfs 여유 공간이 부족하면 디스크 임시 디렉토리로 넘긴다(spill).
+    사용량은 할당할 때 받은 예상 크기(size_hint)를 더하고 release할 때 빼는 누적값으로,
+    할당마다 디렉토리 트리를 다시 읽지 않는다. 컨텍스트 종료 시 두 디렉토리를 모두 삭제한다.
+    """
+
+    def __init__(self, prefix='job', root=None, quota_mb=None, spill_root=None):
+        self.prefix = prefix
+        self.root = root or SCRATCH_ROOT
+        self.quota_bytes = (SCRATCH_QUOTA_MB if quota_mb is None else quota_mb) * _MB
+        self.spill_root = spill_root or SCRATCH_SPILL_ROOT
+        self.ram_dir = None
+        self.spill_dir = None
+        self.spilled_files = 0
+        self._used = 0
+        self._allocations = {}
+        self._lock = threading.Lock()
+        self._token = None
+
+    def open(self):
+        try:
+            self.ram_dir = tempfile.mkdtemp(prefix=f'{self.prefix}_', dir=self.root)
+        except OSError as e:
+            print(f"⚠️ 스크래치 루트 사용 불가 ({self.root}): {e} - 디스크 임시 디렉토리 사용")
+            self.ram_dir = None
+        return self
+
+    def __enter__(self):
+        self.open()
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._token is not None:
+            _current.reset(self._token)
+            self._token = None
+        self.cleanup()
+        return False
+
+    def usage(self):
+        """RAM 디렉토리 사용량(바이트) - RAM에 할당한 뒤 아직 release하지 않은 예상 크기의 합"""
+        return self._used if self.ram_dir else 0
+
+    def _fits_in_ram(self, size_hint):
+        if not self.ram_dir:
+            return False
+        if self.usage() + size_hint > self.quota_bytes:
+            return False
+        try:
+            free = shutil.disk_usage(self.root).free
+        except OSError:
+            return False
+        return free - size_hint > SCRATCH_MIN_FREE_MB * _MB
+
+    def _spill_base(self):
+        if self.spill_dir is None:
+            self.spill_dir = tempfile.mkdtemp(prefix=f'{self.prefix}_spill_', dir=self.spill_root)
+        return self.spill_dir
+
+    def directory(self, size_hint=0):
+        """새 파일을 둘 디렉토리 (용량 한도 초과 시 디스크 spill 디렉토리)"""
+        with self._lock:
+            return self._allocate(size_hint)
+
+    def _allocate(self, size_hint):
+        # _lock을 잡은 상태에서 호출
+        if self._fits_in_ram(size_hint):
+            self._used += size_hint
+            return self.ram_dir
+        self.spilled_files += 1
+        return self._spill_base()
+
+    def path(self, name, size_hint=0):
+        """
+        작업 디렉토리 안의 파일 경로
+
+        Args:
+            name: 파일 이름 (디렉토리 부분은 무시됨)
+            size_hint: 예상 파일 크기(바이트) - 용량 한도 판단에 사용
+
+        Returns:
+            str: RAM 디렉토리 또는 (한도 초과 시) 디스크 spill 디렉토리 아래 경로
+        """
+        with self._lock:
+            path = os.path.join(self._allocate(size_hint or 0), os.path.basename(name))
+            self._track(path, size_hint or 0)
+        return path
+
+    def mkdtemp(self, prefix='', size_hint=0):
+        """작업 디렉토리 안의 하위 디렉토리 생성 (ZIP 압축 해제 등)"""
+        with self._lock:
+            path = tempfile.mkdtemp(prefix=prefix, dir=self._allocate(size_hint or 0))
+            self._track(path, size_hint or 0)
+        return path
+
+    @contextmanager
+    def subdir(self, prefix='', size_hint=0):
+        """블록 안에서만 쓰는 하위 디렉토리 (상위 작업의 공간을 재사용해도 블록 종료 시 바로 삭제)"""
+        path = self.mkdtemp(prefix, size_hint)
+        try:
+            yield path
+        finally:
+            self.release(path)
+
+    def _track(self, path, size_hint):
+        # RAM에 할당한 경로만 release 시 사용량에서 뺄 크기를 기억
+        if size_hint and self.ram_dir and path.startswith(self.ram_dir + os.sep):
+            self._allocations[path] = self._allocations.get(path, 0) + size_hint
+
+    def release(self, path):
+        """path()/mkdtemp()로 받은 파일이나 디렉토리를 작업 종료 전에 삭제하고 사용량에서 제외"""
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        with self._lock:
+            self._used = max(0, self._used - self._allocations.pop(path, 0))
+
+    def cleanup(self):
+        for directory in (self.ram_dir, self.spill_dir):
+            if directory:
+                shutil.rmtree(directory, ignore_errors=True)
+        self.ram_dir = None
+        self.spill_dir = None
+        self._used = 0
+        self._allocations.clear()
+
+
+def current_scratch():
+    """현재 작업의 스크래치 공간 (없으면 None)"""
+    return _current.get()
+
+
+def scratch_dir(size_hint=0):
+    """
+    현재 작업의 임시 파일 디렉토리 (tempfile의 dir 인자용)
+
+    작업 밖에서 호출되면 None을 반환해 시스템 임시 디렉토리를 사용하게 한다.
+    """
+    scratch = _current.get()
+    return scratch.directory(size_hint) if scratch is not None else None
+
+
+@contextmanager
+def scratch_space(prefix='job', **kwargs):
+    """
+    작업 스크래치 공간 컨텍스트
+
+    이미 상위 작업의 스크래치 공간이 열려 있으면 그것을 그대로 사용하고(정리는 상위에서),
+    없으면 새로 만들어 블록 종료 시 삭제한다.
+    """
+    existing = _current.get()
+    if existing is not None:
+        yield existing
+        return
+    with ScratchSpace(prefix, **kwargs) as scratch:
+        yield scratch
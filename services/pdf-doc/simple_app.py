@@ -7,6 +7,7 @@ from dotenv import load_dotenv
 
 # Local imports
 from smart_converter import smart_pdf_to_docx
+from file_reaper import add_directories, start_reaper, mark_in_use, reaper_metrics
 
 # .env 파일 로드
 load_dotenv()
@@ -20,6 +21,9 @@ app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024  # 100MB
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 os.makedirs(app.config['OUTPUT_FOLDER'], exist_ok=True)
 
+# 오래된 업로드/결과 파일 정리 대상 등록 (정리 스레드는 gunicorn post_fork 또는 __main__에서 시작)
+add_directories([app.config['UPLOAD_FOLDER'], app.config['OUTPUT_FOLDER']])
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -64,7 +68,15 @@ def convert():
 
 @app.route('/download/<filename>')
 def download(filename):
-    return send_from_directory(app.config['OUTPUT_FOLDER'], filename, as_attachment=True)
+    response = send_from_directory(app.config['OUTPUT_FOLDER'], filename, as_attachment=True)
+    # 전송이 끝날 때까지 정리 대상에서 제외
+    response.call_on_close(mark_in_use(os.path.join(app.config['OUTPUT_FOLDER'], secure_filename(filename))))
+    return response
+
+@app.route('/health/reaper')
+def health_reaper():
+    return jsonify(reaper_metrics())
 
 if __name__ == '__main__':
+    start_reaper()
     app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
@@ -11,6 +11,8 @@ from urllib.parse import unquote
 # Local imports
 from adobe_converter import AdobePDFConverter
 from ocr_helper import extract_text_with_ocr
+from scratch_space import scratch_dir
+from document_scan import scan_document, analyze_page_orientation, detect_official_document
 
 def get_safe_filename(pdf_path):
     """원본 파일명에서 안전한 파일명 추출 (확장자 제거, 특수문자 처리)"""
@@ -66,155 +68,25 @@ def get_unique_filename(file_path):
             new_filename = f"{name}_{timestamp}{ext}"
             return os.path.join(directory, new_filename)
 
-def analyze_page_orientation(pdf_path):
-    """PDF 페이지 방향 분석 (가로형/세로형 자동감지)"""
-    try:
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            if len(pdf_reader.pages) == 0:
-                return "unknown"
-            
-            landscape_pages = 0
-            portrait_pages = 0
-            
-            for page in pdf_reader.pages:
-                # 페이지 크기 정보 가져오기
-                mediabox = page.mediabox
-                width = float(mediabox.width)
-                height = float(mediabox.height)
-                
-                # 회전 정보 고려
-                rotation = page.get('/Rotate', 0)
-                if rotation in [90, 270]:
-                    width, height = height, width
-                
-                # 가로형/세로형 판단
-                if width > height:
-                    landscape_pages += 1
-                else:
-                    portrait_pages += 1
-            
-            # 주요 방향 결정
-            if landscape_pages > portrait_pages:
-                orientation = "landscape"
-                ratio = landscape_pages / (landscape_pages + portrait_pages)
-            else:
-                orientation = "portrait"
-                ratio = portrait_pages / (landscape_pages + portrait_pages)
-            
-            logging.info(f"페이지 방향 분석: {orientation} ({ratio:.2f} 비율)")
-            return {
-                "orientation": orientation,
-                "ratio": ratio,
-                "landscape_pages": landscape_pages,
-                "portrait_pages": portrait_pages
-            }
-            
-    except Exception as e:
-        logging.error(f"페이지 방향 분석 중 오류 발생: {e}")
-        return {"orientation": "unknown", "ratio": 0}
-
-def detect_official_document(pdf_path):
-    """공문서 자동감지 (텍스트 패턴, 레이아웃 분석)"""
-    try:
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            if len(pdf_reader.pages) == 0:
-                return False
-            
-            # 첫 페이지에서 텍스트 추출
-            first_page_text = pdf_reader.pages[0].extract_text()
-            
-            # 공문서 키워드 패턴
-            official_keywords = [
-                '공문', '시행', '수신', '발신', '시행일자', '문서번호', '담당부서',
-                '결재', '시장', '구청장', '과장', '팀장', '담당자',
-                '붙임', '끝.', '협조사항', '시행근거', '추진계획',
-                '○', '가.', '나.', '다.', '라.', '마.',
-                '1.', '2.', '3.', '4.', '5.',
-                '기안자', '검토자', '결재권자', '시행자'
-            ]
-            
-            # 공문서 레이아웃 패턴
-            layout_patterns = [
-                r'문서번호\s*:', r'시행일자\s*:', r'수신\s*:', r'발신\s*:',
-                r'제\s*목\s*:', r'담당부서\s*:', r'담당자\s*:',
-                r'\d{4}-\d+', r'\d{4}\.\d{1,2}\.\d{1,2}',  # 문서번호, 날짜 패턴
-                r'붙임\s*\d*\s*부', r'끝\s*\.',
-                r'[가-힣]+시장|[가-힣]+구청장|[가-힣]+과장'
-            ]
-            
-            keyword_count = 0
-            pattern_count = 0
-            
-            # 키워드 검사
-            for keyword in official_keywords:
-                if keyword in first_page_text:
-                    keyword_count += 1
-            
-            # 패턴 검사
-            for pattern in layout_patterns:
-                if re.search(pattern, first_page_text):
-                    pattern_count += 1
-            
-            # 공문서 판단 기준
-            is_official = (keyword_count >= 3 or pattern_count >= 2)
-            confidence = (keyword_count * 0.3 + pattern_count * 0.7) / 10
-            
-            logging.info(f"공문서 감지: {'예' if is_official else '아니오'} (키워드: {keyword_count}, 패턴: {pattern_count}, 신뢰도: {confidence:.2f})")
-            
-            return {
-                "is_official": is_official,
-                "confidence": min(confidence, 1.0),
-                "keyword_count": keyword_count,
-                "pattern_count": pattern_count
-            }
-            
-    except Exception as e:
-        logging.error(f"공문서 감지 중 오류 발생: {e}")
-        return {"is_official": False, "confidence": 0}
-
 def analyze_pdf_content(pdf_path):
-    """PDF 내용 분석하여 타입 결정 (방향 및 공문서 정보 포함)"""
-    try:
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            total_pages = len(pdf_reader.pages)
-            if total_pages == 0:
-                return {"type": "empty"}
+    """PDF 내용 분석하여 타입 결정 (방향 및 공문서 정보 포함)
 
-            text_pages = 0
-            for page in pdf_reader.pages:
-                # 페이지에서 텍스트 추출 시도
-                text = page.extract_text()
-                if text and len(text.strip()) > 50:  # 50자 이상이면 텍스트 페이지로 간주
-                    text_pages += 1
-            
-            text_ratio = text_pages / total_pages
-            
-            # 페이지 방향 분석
-            orientation_info = analyze_page_orientation(pdf_path)
-            
-            # 공문서 감지
-            official_info = detect_official_document(pdf_path)
-            
-            # PDF 타입 결정
-            if text_ratio > 0.8:
-                pdf_type = "text_based"
-                logging.info(f"PDF 분석 결과: 텍스트 기반 (텍스트 비율: {text_ratio:.2f})")
-            elif text_ratio < 0.2:
-                pdf_type = "scanned_image"
-                logging.info(f"PDF 분석 결과: 이미지 기반 (텍스트 비율: {text_ratio:.2f})")
-            else:
-                pdf_type = "mixed"
-                logging.info(f"PDF 분석 결과: 혼합형 (텍스트 비율: {text_ratio:.2f})")
-            
-            return {
-                "type": pdf_type,
-                "text_ratio": text_ratio,
-                "orientation": orientation_info,
-                "official_document": official_info
-            }
+    document_scan 사전 분석 한 번으로 표본 페이지의 내용 스트림만 검사 (전체 페이지 텍스트 추출 없음)
+    """
+    try:
+        scan = scan_document(pdf_path)
+        analysis = scan.to_analysis()
+        if scan.pdf_type == "empty":
+            return analysis
+        
+        type_names = {"text_based": "텍스트 기반", "scanned_image": "이미지 기반", "mixed": "혼합형"}
+        logging.info(f"PDF 분석 결과: {type_names[scan.pdf_type]} (텍스트 비율: {scan.text_ratio:.2f}, "
+                     f"표본 {len(scan.sampled_pages)}/{scan.page_count}쪽, {scan.elapsed_seconds * 1000:.0f}ms)")
+        logging.info(f"페이지 방향 분석: {scan.orientation} ({scan.orientation_ratio:.2f} 비율)")
+        logging.info(f"공문서 감지: {'예' if scan.is_official else '아니오'} (키워드: {scan.keyword_count}, 패턴: {scan.pattern_count}, 신뢰도: {scan.official_score:.2f})")
+        if scan.estimated_ocr_pages:
+            logging.info(f"OCR 예상: {scan.estimated_ocr_pages}쪽, 약 {scan.estimated_ocr_seconds:.0f}초")
+        return analysis
             
     except Exception as e:
         logging.error(f"PDF 내용 분석 중 오류 발생: {e}")
@@ -242,7 +114,7 @@ def convert_image_pdf_to_docx(pdf_path, use_ocr=False):
         else:
             logging.info("이미지를 원본 그대로 DOCX에 삽입합니다.")
             for i, image in enumerate(images):
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg") as temp_image:
+                with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg", dir=scratch_dir()) as temp_image:
                     image.save(temp_image.name, 'JPEG')
                     doc.add_picture(temp_image.name, width=Inches(6.0))
                     if i < len(images) - 1:
@@ -331,7 +203,7 @@ def convert_image_pdf_to_docx_optimized(pdf_path, analysis_result, use_ocr=False
         else:
             logging.info(f"{orientation} 이미지를 원본 그대로 DOCX에 삽입합니다.")
             for i, image in enumerate(images):
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg") as temp_image:
+                with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg", dir=scratch_dir()) as temp_image:
                     image.save(temp_image.name, 'JPEG')
                     # 방향에 따른 이미지 크기 조정
                     width = Inches(8.0) if orientation == "landscape" else Inches(6.0)
@@ -363,7 +235,7 @@ def convert_image_pdf_to_docx_official(pdf_path, analysis_result):
         
         logging.info("공문서 고품질 이미지를 DOCX에 삽입합니다.")
         for i, image in enumerate(images):
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg") as temp_image:
+            with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg", dir=scratch_dir()) as temp_image:
                 image.save(temp_image.name, 'JPEG', quality=95)
                 doc.add_picture(temp_image.name, width=Inches(7.5))
                 if i < len(images) - 1:
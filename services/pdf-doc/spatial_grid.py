@@ -0,0 +1,188 @@
+import math
+import random
+import sys
+import time
+
+
+def rect_center(rect):
+    """(x0, y0, x1, y1) 또는 fitz.Rect의 중심점"""
+    x0, y0, x1, y1 = rect
+    return (x0 + x1) / 2, (y0 + y1) / 2
+
+
+def center_distance(rect1, rect2):
+    """두 사각형 중심점 간의 거리"""
+    x1, y1 = rect_center(rect1)
+    x2, y2 = rect_center(rect2)
+    return _distance(x1 - x2, y1 - y2)
+
+
+def _distance(dx, dy):
+    # 기존 거리 계산과 같은 식 (경계값 비교 결과가 달라지지 않도록)
+    return (dx ** 2 + dy ** 2) ** 0.5
+
+
+class SpatialGrid:
+    """
+    사각형 중심점 기준 공간 해시 격자
+
+    항목을 중심점이 속한 셀(cell_size pt 정사각형)에 넣고, 최근접 조회는 질의 지점의 셀부터
+    고리 모양으로 넓혀 가며 더 가까운 항목이 나올 수 없는 고리에서 멈춘다. 페이지의 모든 텍스트
+    블록 x 모든 이미지를 비교하던 이중 루프를 블록마다 주변 셀 몇 개만 보는 조회로 바꾼다.
+
+    거리가 같으면 먼저 넣은 항목을 반환한다 (순서대로 비교하며 더 작을 때만 바꾸던 기존 루프와 동일).
+    """
+
+    def __init__(self, cell_size):
+        if cell_size <= 0:
+            raise ValueError(f"셀 크기는 0보다 커야 합니다: {cell_size}")
+        self.cell_size = float(cell_size)
+        self._cells = {}
+        self._count = 0
+        self._bounds = None
+
+    def __len__(self):
+        return self._count
+
+    def _cell(self, x, y):
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def insert(self, item, rect):
+        x, y = rect_center(rect)
+        col, row = self._cell(x, y)
+        self._cells.setdefault((col, row), []).append((self._count, x, y, item))
+        self._count += 1
+        if self._bounds is None:
+            self._bounds = [col, row, col, row]
+        else:
+            bounds = self._bounds
+            bounds[0], bounds[1] = min(bounds[0], col), min(bounds[1], row)
+            bounds[2], bounds[3] = max(bounds[2], col), max(bounds[3], row)
+
+    def _ring(self, col, row, ring):
+        cells = self._cells
+        if ring == 0:
+            entries = cells.get((col, row))
+            if entries:
+                yield from entries
+            return
+        for dx in range(-ring, ring + 1):
+            for key in ((col + dx, row - ring), (col + dx, row + ring)):
+                entries = cells.get(key)
+                if entries:
+                    yield from entries
+        for dy in range(-ring + 1, ring):
+            for key in ((col - ring, row + dy), (col + ring, row + dy)):
+                entries = cells.get(key)
+                if entries:
+                    yield from entries
+
+    def nearest(self, rect, max_distance=math.inf):
+        """
+        중심점이 가장 가까운 항목
+
+        Returns:
+            tuple: (항목, 거리), max_distance 이상이면 (None, inf)
+        """
+        if not self._count:
+            return None, math.inf
+        x, y = rect_center(rect)
+        col, row = self._cell(x, y)
+        min_col, min_row, max_col, max_row = self._bounds
+        last_ring = max(abs(col - min_col), abs(col - max_col), abs(row - min_row), abs(row - max_row))
+
+        best_distance, best_order, best_item = math.inf, None, None
+        for ring in range(last_ring + 1):
+            # 이 고리의 항목은 최소 (ring - 1) * cell_size 이상 떨어져 있음
+            floor_distance = (ring - 1) * self.cell_size
+            if floor_distance > best_distance or floor_distance >= max_distance:
+                break
+            for order, item_x, item_y, item in self._ring(col, row, ring):
+                distance = _distance(x - item_x, y - item_y)
+                if distance < best_distance or (distance == best_distance and order < best_order):
+                    best_distance, best_order, best_item = distance, order, item
+
+        if best_distance >= max_distance:
+            return None, math.inf
+        return best_item, best_distance
+
+
+def nearest_targets(queries, targets, max_distance, cell_size=None):
+    """
+    질의 사각형마다 중심점이 가장 가까운 대상 (격자 조회)
+
+    Args:
+        queries: 사각형 목록
+        targets: (항목, 사각형) 목록
+        max_distance: 이 거리 미만인 대상만 연결
+        cell_size: 격자 셀 크기(pt), 없으면 max_distance의 절반
+
+    Returns:
+        list: 질의 순서대로 (항목, 거리) 또는 (None, inf)
+    """
+    if not targets:
+        return [(None, math.inf)] * len(queries)
+    if not cell_size:
+        cell_size = max_distance / 2 if math.isfinite(max_distance) and max_distance > 0 else 100.0
+    grid = SpatialGrid(cell_size)
+    for item, rect in targets:
+        grid.insert(item, rect)
+    return [grid.nearest(rect, max_distance) for rect in queries]
+
+
+def nearest_targets_legacy(queries, targets, max_distance):
+    """모든 질의 x 모든 대상을 비교하는 기존 방식 (회귀 테스트/벤치마크 비교용)"""
+    results = []
+    for rect in queries:
+        best_item, best_distance = None, math.inf
+        for item, target_rect in targets:
+            distance = center_distance(rect, target_rect)
+            if distance < best_distance:
+                best_item, best_distance = item, distance
+        results.append((best_item, best_distance) if best_distance < max_distance else (None, math.inf))
+    return results
+
+
+def benchmark(query_count=5000, target_count=1000, page_width=842.0, page_height=595.0, seed=7):
+    """
+    임의 배치한 텍스트 블록/도형으로 이중 루프와 격자 조회 시간 비교
+
+    Returns:
+        dict: 개수, 각 방식 시간(초), 속도 향상 배율, 결과 일치 여부
+    """
+    rng = random.Random(seed)
+
+    def boxes(count, max_size):
+        result = []
+        for _ in range(count):
+            x, y = rng.uniform(0, page_width), rng.uniform(0, page_height)
+            result.append((x, y, x + rng.uniform(5, max_size), y + rng.uniform(5, max_size)))
+        return result
+
+    queries = boxes(query_count, 200)
+    targets = list(enumerate(boxes(target_count, 150)))
+    max_distance = page_width * 0.3
+
+    started = time.perf_counter()
+    legacy = nearest_targets_legacy(queries, targets, max_distance)
+    legacy_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    gridded = nearest_targets(queries, targets, max_distance)
+    grid_seconds = time.perf_counter() - started
+
+    return {
+        'queries': query_count,
+        'targets': target_count,
+        'legacy_seconds': round(legacy_seconds, 3),
+        'grid_seconds': round(grid_seconds, 3),
+        'speedup': round(legacy_seconds / grid_seconds, 2) if grid_seconds else None,
+        'identical': [item for item, _ in legacy] == [item for item, _ in gridded],
+    }
+
+
+if __name__ == '__main__':
+    result = benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5000,
+                       int(sys.argv[2]) if len(sys.argv) > 2 else 1000)
+    print(f"텍스트 {result['queries']}개 x 도형 {result['targets']}개: 이중 루프 {result['legacy_seconds']}s, "
+          f"격자 {result['grid_seconds']}s, 속도 향상: {result['speedup']}배, 결과 일치: {result['identical']}")
@@ -0,0 +1,197 @@
+import codecs
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+# 환경변수 기반 설정
+# structuredData.json을 한 번에 읽어 디코딩할 크기
+STRUCTURED_DATA_CHUNK_BYTES = int(os.environ.get('STRUCTURED_DATA_CHUNK_BYTES', str(64 * 1024)))
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+class _StreamBuffer:
+    """스트림에서 필요한 만큼만 읽어 두는 텍스트 버퍼 (이미 읽은 앞부분은 버림)"""
+
+    def __init__(self, stream, chunk_size):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.text = ''
+        self.pos = 0
+        self.eof = False
+        self._decode = None
+        if not isinstance(stream, io.TextIOBase):
+            self._decode = codecs.getincrementaldecoder('utf-8-sig')().decode
+
+    def fill(self, size):
+        data = self.stream.read(size)
+        # 바이트 청크가 멀티바이트 문자 중간에서 끝나면 디코딩 결과가 비어 있을 수 있으므로 원본으로 끝 판단
+        self.eof = not data
+        if self._decode is not None:
+            data = self._decode(data, final=self.eof)
+        if self.pos > self.chunk_size:
+            self.text, self.pos = self.text[self.pos:], 0
+        self.text += data
+
+    def peek(self):
+        """공백을 건너뛴 다음 문자 (끝이면 빈 문자열)"""
+        while True:
+            text, pos = self.text, self.pos
+            while pos < len(text) and text[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(text) or self.eof:
+                return text[pos] if pos < len(text) else ''
+            self.fill(self.chunk_size)
+
+    def take(self, expected):
+        char = self.peek()
+        if char not in expected:
+            raise json.JSONDecodeError(f"'{expected}' 필요", self.text, self.pos)
+        self.pos += 1
+        return char
+
+    def value(self):
+        """값 하나를 디코딩 (버퍼 끝에서 잘린 값이면 더 읽고 다시 시도)"""
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+                # 버퍼 끝에서 끝난 값은 숫자처럼 뒤가 더 있을 수 있음
+                if end < len(self.text) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            # 큰 값은 읽는 양을 늘려 재시도 횟수를 줄임
+            self.fill(size)
+            size *= 2
+
+
+def iter_elements(stream, chunk_size=None):
+    """
+    structuredData.json 스트림에서 elements 배열 요소를 하나씩 반환
+
+    전체 JSON 트리를 만들지 않고 요소 단위로 디코딩하므로 메모리 사용량은 요소 하나와 읽기
+    버퍼 크기로 제한된다. elements 외의 최상위 값(version, pages 등)은 읽고 버린다.
+
+    Args:
+        stream: 바이너리(UTF-8) 또는 텍스트 파일 객체
+        chunk_size: 한 번에 읽을 크기 (기본 STRUCTURED_DATA_CHUNK_BYTES)
+    """
+    buffer = _StreamBuffer(stream, chunk_size or STRUCTURED_DATA_CHUNK_BYTES)
+    buffer.take('{')
+    if buffer.peek() == '}':
+        return
+    while True:
+        key = buffer.value()
+        buffer.take(':')
+        if key == 'elements' and buffer.peek() == '[':
+            buffer.take('[')
+            if buffer.peek() == ']':
+                buffer.take(']')
+            else:
+                while True:
+                    yield buffer.value()
+                    if buffer.take(',]') == ']':
+                        break
+        else:
+            buffer.value()
+        if buffer.take(',}') == '}':
+            return
+
+
+def iter_pages(elements):
+    """연속된 같은 페이지 요소를 묶어 (페이지 번호, 요소 목록)으로 반환 (Adobe 요소는 페이지 순서)"""
+    page, page_elements = None, []
+    for element in elements:
+        number = element.get('Page', 0)
+        if page_elements and number != page:
+            yield page, page_elements
+            page_elements = []
+        page = number
+        page_elements.append(element)
+    if page_elements:
+        yield page, page_elements
+
+
+def sample_structured_data(page_count=200, elements_per_page=150):
+    """벤치마크용 structuredData.json 바이트 (Adobe Extract 결과 형식)"""
+    elements = []
+    for page in range(page_count):
+        for index in range(elements_per_page):
+            y = 800 - index * 5
+            if index % 50 == 49:
+                elements.append({'Path': f'//Document/Figure[{index}]', 'Page': page, 'Bounds': [72, y - 40, 300, y],
+                                 'filePaths': [f'figures/fileoutpart{page}_{index}.png'], 'attributes': {'BBox': [72, y - 40, 300, y]}})
+            else:
+                elements.append({'Path': f'//Document/P[{index}]', 'Page': page, 'Bounds': [72, y - 12, 520, y],
+                                 'Text': f'{page + 1}쪽 {index + 1}번째 문단 본문 텍스트 sample paragraph text ',
+                                 'Font': {'name': 'MalgunGothic', 'family_name': 'Malgun Gothic', 'embedded': True,
+                                          'weight': 400, 'italic': False, 'monospaced': False},
+                                 'TextSize': 10.5, 'attributes': {'LineHeight': 13.125}})
+    data = {'version': {'json_export': '1.1.0', 'page_segmentation': '1.0.0'},
+            'extended_metadata': {'page_count': page_count, 'language': 'ko'},
+            'elements': elements,
+            'pages': [{'page_number': page, 'width': 595, 'height': 842} for page in range(page_count)]}
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def benchmark(page_count=200, elements_per_page=150):
+    """
+    json.load 후 요소 목록을 종류별로 세 번 순회하는 방식과 스트리밍 1회 순회 비교
+
+    Returns:
+        dict: JSON 크기(MB), 각 방식 시간(초)과 최대 추가 메모리(MB)
+    """
+    payload = sample_structured_data(page_count, elements_per_page)
+
+    def whole():
+        data = json.load(io.BytesIO(payload))
+        elements = data.get('elements', [])
+        texts = [e for e in elements if e.get('Text')]
+        figures = [e for e in elements if '/Figure' in e.get('Path', '')]
+        tables = [e for e in elements if '/Table' in e.get('Path', '')]
+        return len(texts) + len(figures) + len(tables)
+
+    def streaming():
+        count = 0
+        for _, page_elements in iter_pages(iter_elements(io.BytesIO(payload))):
+            for element in page_elements:
+                if element.get('Text') or '/Figure' in element.get('Path', '') or '/Table' in element.get('Path', ''):
+                    count += 1
+        return count
+
+    def measure(func):
+        tracemalloc.start()
+        started = time.perf_counter()
+        count = func()
+        seconds = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return count, round(seconds, 3), round(peak / 1024 / 1024, 1)
+
+    whole_count, whole_seconds, whole_peak = measure(whole)
+    stream_count, stream_seconds, stream_peak = measure(streaming)
+    return {
+        'json_mb': round(len(payload) / 1024 / 1024, 1),
+        'elements': whole_count,
+        'identical': whole_count == stream_count,
+        'load_seconds': whole_seconds,
+        'load_peak_mb': whole_peak,
+        'stream_seconds': stream_seconds,
+        'stream_peak_mb': stream_peak,
+    }
+
+
+if __name__ == '__main__':
+    result = benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
+    print(f"structuredData.json {result['json_mb']}MB, 요소 {result['elements']}개: "
+          f"json.load {result['load_seconds']}s / 최대 {result['load_peak_mb']}MB, "
+          f"스트리밍 {result['stream_seconds']}s / 최대 {result['stream_peak_mb']}MB, 결과 일치: {result['identical']}")
@@ -0,0 +1,142 @@
+import io
+import threading
+import time
+
+import pytest
+
+fitz = pytest.importorskip('fitz')
+docx = pytest.importorskip('docx')
+
+from docx.enum.section import WD_ORIENT, WD_SECTION
+from docx.shared import Pt
+from PIL import Image
+
+import adobe_chunked
+
+
+class FakeAdobeExport:
+    """Adobe ExportPDF 대신 쓰는 로컬 가짜 엔드포인트 (페이지 텍스트/방향/이미지를 DOCX로 기록)"""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, pdf_path, docx_path):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.calls.append(pdf_path)
+        try:
+            time.sleep(self.delay)
+            document = docx.Document()
+            with fitz.open(pdf_path) as pdf:
+                for index, page in enumerate(pdf):
+                    section = document.sections[0] if index == 0 else document.add_section(WD_SECTION.NEW_PAGE)
+                    landscape = page.rect.width > page.rect.height
+                    section.orientation = WD_ORIENT.LANDSCAPE if landscape else WD_ORIENT.PORTRAIT
+                    section.page_width = Pt(page.rect.width)
+                    section.page_height = Pt(page.rect.height)
+                    document.add_paragraph(page.get_text().strip())
+                    image = io.BytesIO()
+                    Image.new('RGB', (4, 4), (index * 40 % 255, 0, 0)).save(image, 'PNG')
+                    image.seek(0)
+                    document.add_picture(image)
+            document.save(docx_path)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _make_pdf(path, page_count, landscape_pages=()):
+    pdf = fitz.open()
+    for i in range(page_count):
+        width, height = (842, 595) if i in landscape_pages else (595, 842)
+        pdf.new_page(width=width, height=height).insert_text((72, 72), f'page {i + 1}')
+    pdf.save(str(path))
+    pdf.close()
+
+
+def test_plan_chunks_respects_page_and_size_limits():
+    assert adobe_chunked.plan_chunks(10, 1000, max_pages=4) == [(0, 3), (4, 7), (8, 9)]
+    # 페이지당 30MB -> 90MB 청크에는 3페이지까지
+    mb = 1024 * 1024
+    assert adobe_chunked.plan_chunks(7, 7 * 30 * mb, max_pages=40, max_bytes=90 * mb) == [(0, 2), (3, 5), (6, 6)]
+    assert adobe_chunked.plan_chunks(0, 0) == []
+
+
+def test_chunked_conversion_merges_parts_in_order(tmp_path):
+    pdf_path = tmp_path / 'big.pdf'
+    output_path = tmp_path / 'big.docx'
+    _make_pdf(pdf_path, 9, landscape_pages={4, 5})
+    fake = FakeAdobeExport()
+
+    ok, info = adobe_chunked.chunked_pdf_to_docx(str(pdf_path), str(output_path), exporter=fake,
+                                                  concurrency=2, max_pages=2)
+
+    assert ok and info['chunks'] == 5
+    assert fake.max_active == 2
+    merged = docx.Document(str(output_path))
+    texts = [p.text for p in merged.paragraphs if p.text]
+    assert texts == [f'page {i + 1}' for i in range(9)]
+    orientations = [s.orientation for s in merged.sections]
+    assert len(orientations) == 9
+    assert [i for i, o in enumerate(orientations) if o == WD_ORIENT.LANDSCAPE] == [4, 5]
+    assert len(merged.inline_shapes) == 9
+
+
+def test_chunk_failure_reports_pages(tmp_path):
+    pdf_path = tmp_path / 'doc.pdf'
+    _make_pdf(pdf_path, 4)
+
+    def failing(pdf_path, docx_path):
+        raise RuntimeError('quota exceeded')
+
+    ok, info = adobe_chunked.chunked_pdf_to_docx(str(pdf_path), str(tmp_path / 'out.docx'), exporter=failing,
+                                                  max_pages=2)
+    assert not ok
+    assert info['error'] == 'CHUNK_EXPORT_FAILED'
+    assert [f['pages'] for f in info['failures']] == ['1-2', '3-4']
+
+
+def test_failed_chunk_is_split_and_retried(tmp_path):
+    pdf_path = tmp_path / 'doc.pdf'
+    output_path = tmp_path / 'out.docx'
+    _make_pdf(pdf_path, 8)
+    fake = FakeAdobeExport(delay=0)
+    failed = []
+
+    def flaky(pdf_path, docx_path):
+        # 5-8페이지 청크는 한 번에 보내면 실패하고 나눠 보내면 성공
+        with fitz.open(pdf_path) as pdf:
+            pages = [page.get_text().strip() for page in pdf]
+        if len(pages) == 4 and pages[0] == 'page 5':
+            failed.append(pages)
+            raise RuntimeError('timeout')
+        fake(pdf_path, docx_path)
+
+    ok, info = adobe_chunked.chunked_pdf_to_docx(str(pdf_path), str(output_path), exporter=flaky, max_pages=4)
+
+    assert ok and info['chunks'] == 2 and info['retries'] == 1
+    assert len(failed) == 1 and len(fake.calls) == 3
+    merged = docx.Document(str(output_path))
+    assert [p.text for p in merged.paragraphs if p.text] == [f'page {i + 1}' for i in range(8)]
+
+
+def test_single_page_chunk_retried_until_limit(tmp_path):
+    pdf_path = tmp_path / 'doc.pdf'
+    _make_pdf(pdf_path, 1)
+    calls = []
+
+    def failing(pdf_path, docx_path):
+        calls.append(pdf_path)
+        raise RuntimeError('server error')
+
+    ok, info = adobe_chunked.chunked_pdf_to_docx(str(pdf_path), str(tmp_path / 'out.docx'), exporter=failing,
+                                                  retries=2)
+    assert not ok and info['retries'] == 2
+    # 1페이지 청크는 나눌 수 없으므로 같은 범위로 처음 1번 + 재시도 2번
+    assert len(calls) == 3
+    assert info['failures'] == [{'pages': '1-1', 'message': 'server error'}]
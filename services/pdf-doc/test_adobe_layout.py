@@ -0,0 +1,46 @@
+import pytest
+
+import working_server
+from working_server import parse_adobe_elements
+
+
+def _elements():
+    # Adobe Bounds: [left, bottom, right, top] (PDF 좌표, 원점 좌하단)
+    return {'elements': [
+        {'Path': '//Document/P', 'Page': 0, 'Text': '본문 첫 줄', 'Bounds': [72, 700, 300, 712]},
+        {'Path': '//Document/P[2]', 'Page': 0, 'Text': '2024. 1. 1.', 'Bounds': [480, 100, 560, 112]},
+        {'Path': '//Document/H1', 'Page': 0, 'Text': '안내 문서', 'Bounds': [250, 780, 350, 800]},
+        {'Path': '//Document/P[3]', 'Page': 2, 'Text': '셋째 페이지', 'Bounds': [72, 400, 200, 412]},
+    ]}
+
+
+def test_extract_backup_maps_bounds_without_rendering(tmp_path, monkeypatch):
+    fitz = pytest.importorskip('fitz')
+    docx = pytest.importorskip('docx')
+
+    pdf_path = str(tmp_path / 'doc.pdf')
+    pdf = fitz.open()
+    for _ in range(3):
+        pdf.new_page(width=612, height=842)
+    pdf.save(pdf_path)
+    pdf.close()
+
+    def no_render(*args, **kwargs):
+        raise AssertionError('페이지 렌더링이 필요하지 않아야 함')
+
+    monkeypatch.setattr(working_server, 'convert_from_path', no_render)
+    monkeypatch.setattr(working_server, 'ADOBE_SDK_AVAILABLE', True)
+    monkeypatch.setattr(working_server, 'convert_pdf_to_docx_with_adobe', lambda *args: False)
+    monkeypatch.setattr(working_server, 'extract_with_adobe', lambda path: parse_adobe_elements(_elements()))
+
+    output_path = str(tmp_path / 'doc.docx')
+    assert working_server.pdf_to_docx(pdf_path, output_path)
+
+    paragraphs = [p for p in docx.Document(output_path).paragraphs
+                  if p.text.strip() and not p.text.startswith('※')]
+    texts = [p.text for p in paragraphs]
+    # 페이지 위쪽(PDF y가 큰) 블록부터 순서대로
+    assert texts[:4] == ['안내 문서', '본문 첫 줄', '2024. 1. 1.', '셋째 페이지']
+    alignments = {p.text: p.alignment for p in paragraphs}
+    assert alignments['2024. 1. 1.'] == docx.enum.text.WD_ALIGN_PARAGRAPH.RIGHT
+    assert alignments['본문 첫 줄'] == docx.enum.text.WD_ALIGN_PARAGRAPH.LEFT
@@ -0,0 +1,58 @@
+from block_store import (TextBlockStore, TextBlockBuilder, as_block_store,
+                         BOX_SCHEMA, LAYOUT_SCHEMA)
+
+
+def _boxes():
+    return as_block_store([
+        {'text': '둘째 줄', 'left': 10, 'top': 40, 'width': 50, 'height': 12, 'confidence': 90},
+        {'text': '제목', 'left': 80, 'top': 10, 'width': 40, 'height': 12, 'confidence': 95},
+        {'text': '첫 줄', 'left': 10, 'top': 11, 'width': 30, 'height': 12, 'confidence': 80},
+    ], BOX_SCHEMA)
+
+
+def test_views_behave_like_dicts_and_columns_round_trip():
+    blocks = _boxes()
+    first = blocks[0]
+    assert first['text'] == '둘째 줄'
+    assert first['left'] == 10 and first['width'] == 50 and first['confidence'] == 90
+    assert set(first) == set(BOX_SCHEMA)
+    assert dict(first) == first.copy()
+
+    builder = TextBlockBuilder(LAYOUT_SCHEMA)
+    builder.add('가운데', 0, 0, 100, 20, page=1, alignment='center', style={'bold': True})
+    restored = TextBlockStore.from_columns(builder.build().to_columns())
+    block = restored[0]
+    assert block['bbox'] == [0, 0, 100, 20]
+    assert block['page'] == 1 and block['alignment'] == 'center'
+    assert block['style'] == {'bold': True}
+
+
+def test_sort_group_and_page_split():
+    blocks = _boxes()
+    assert blocks.sorted('top', 'left').texts() == ['제목', '첫 줄', '둘째 줄']
+
+    lines = [[blocks.text(i) for i in indices] for indices in blocks.group_lines(8)]
+    assert lines == [['첫 줄', '제목'], ['둘째 줄']]
+
+    builder = TextBlockBuilder(LAYOUT_SCHEMA)
+    for page, text in [(1, 'b'), (0, 'a'), (1, 'c')]:
+        builder.add(text, 0, 0, 10, 10, page=page)
+    pages = {number: store.texts() for number, store in builder.build().page_groups()}
+    assert pages == {0: ['a'], 1: ['b', 'c']}
+
+
+def test_prevent_text_overlap_moves_blocks_down():
+    from working_server import _prevent_text_overlap
+
+    blocks = as_block_store([
+        {'text': 'A', 'left': 0, 'top': 0, 'width': 100, 'height': 20, 'confidence': 90},
+        {'text': 'B', 'left': 0, 'top': 5, 'width': 100, 'height': 20, 'confidence': 90},
+        {'text': 'C', 'left': 300, 'top': 100, 'width': 50, 'height': 20, 'confidence': 90},
+    ], BOX_SCHEMA)
+    image = {'left': 290, 'top': 90, 'width': 100, 'height': 60, 'type': 'photo'}
+    result = _prevent_text_overlap(blocks, [image], min_distance_pt=15)
+
+    tops = {block['text']: block['top'] for block in result}
+    # 앞 블록과 겹치는 B는 A 아래로, 이미지 위의 C는 이미지 아래로 이동
+    assert tops == {'A': 0, 'B': 35, 'C': 165}
+    assert [block['height'] for block in result] == [20, 20, 20]
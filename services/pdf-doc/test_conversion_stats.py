@@ -0,0 +1,76 @@
+import os
+import tempfile
+from datetime import date, timedelta
+
+from conversion_stats import (ConversionStatsStore, LATENCY_BUCKETS, bucket_index,
+                              percentile_from_histogram)
+
+
+def _store():
+    tmp_dir = tempfile.mkdtemp()
+    return ConversionStatsStore(os.path.join(tmp_dir, "stats.db"))
+
+
+def test_bucket_index():
+    """버킷 경계 확인"""
+    assert bucket_index(0.0) == 0
+    assert bucket_index(0.5) == 0
+    assert bucket_index(0.51) == 1
+    assert bucket_index(10000) == len(LATENCY_BUCKETS)
+
+
+def test_true_average_and_extremes():
+    """평균이 지수 감쇠가 아닌 실제 산술 평균인지 확인"""
+    store = _store()
+    for t in (1.0, 1.0, 1.0, 9.0):
+        store.record(True, 'text', t)
+
+    summary = store.latency_summary(date.today(), date.today())
+    text = summary['text']
+    assert text['count'] == 4
+    assert abs(text['avg'] - 3.0) < 1e-9
+    assert text['min'] == 1.0
+    assert text['max'] == 9.0
+
+
+def test_outcome_and_method_rows():
+    """결과/방식별로 분리 집계되고 일자 합계로 합쳐지는지 확인"""
+    store = _store()
+    store.record(True, 'text', 2.0)
+    store.record(False, 'text', 4.0)
+    store.record(True, 'ocr', 6.0)
+
+    totals = store.daily_totals(days=1)
+    assert len(totals) == 1
+    assert totals[0]['total_conversions'] == 3
+    assert totals[0]['successful_conversions'] == 2
+    assert totals[0]['text_based_conversions'] == 2
+    assert totals[0]['ocr_based_conversions'] == 1
+    assert abs(totals[0]['avg_processing_time'] - 4.0) < 1e-9
+
+    only_success = store.latency_summary(date.today(), date.today(), outcome='success')
+    assert only_success['text']['count'] == 1
+
+
+def test_percentiles_over_window():
+    """여러 날에 걸친 p50/p95/p99 추정"""
+    store = _store()
+    today = date.today()
+    for i in range(90):
+        store.record(True, 'ocr', 1.5, day=today - timedelta(days=1))
+    for i in range(10):
+        store.record(True, 'ocr', 50.0, day=today)
+
+    summary = store.latency_summary(today - timedelta(days=1), today)['ocr']
+    assert summary['count'] == 100
+    assert 1.0 <= summary['p50'] <= 2.0
+    assert 30.0 <= summary['p95'] <= 50.0
+    assert summary['p99'] <= 50.0
+
+    # 기간 밖 데이터는 제외
+    assert store.latency_summary(today, today)['ocr']['count'] == 10
+
+
+def test_percentile_empty_histogram():
+    """빈 히스토그램은 None"""
+    assert percentile_from_histogram([0] * (len(LATENCY_BUCKETS) + 1), 50) is None
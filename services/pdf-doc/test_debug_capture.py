@@ -0,0 +1,51 @@
+import os
+import threading
+
+from PIL import Image
+
+import debug_capture
+from debug_capture import DebugWriter
+
+
+def test_capture_is_off_by_default_and_enabled_by_header(monkeypatch):
+    assert debug_capture.capture_text('text', 'doc_extracted_text.txt') is None
+
+    monkeypatch.setattr(debug_capture, 'DEBUG_CAPTURE_SAMPLE_RATE', 0)
+    assert not debug_capture.capture_requested({})
+    assert debug_capture.capture_requested({'X-Debug-Capture': '1'})
+    monkeypatch.setattr(debug_capture, 'DEBUG_CAPTURE_SAMPLE_RATE', 1)
+    assert debug_capture.capture_requested({})
+    assert not debug_capture.capture_requested({'X-Debug-Capture': 'off'})
+
+
+def test_writer_encodes_in_background(tmp_path, monkeypatch):
+    writer = DebugWriter(output_dir=str(tmp_path), queue_size=4)
+    monkeypatch.setattr(debug_capture, '_writer', writer)
+
+    with debug_capture.debug_capture(True):
+        image_path = debug_capture.capture_image(Image.new('RGB', (8, 8)), 'doc_page_1.png')
+        text_path = debug_capture.capture_text('안녕하세요', 'doc_extracted_text.txt')
+    debug_capture.flush()
+
+    assert os.path.exists(image_path)
+    with open(text_path, encoding='utf-8') as f:
+        assert f.read() == '안녕하세요'
+    assert writer.stats()['written'] == 2
+
+
+def test_writer_drops_when_queue_is_full(tmp_path):
+    writer = DebugWriter(output_dir=str(tmp_path), queue_size=1)
+    release = threading.Event()
+
+    class SlowImage:
+        def save(self, path, fmt):
+            release.wait(5)
+
+    assert writer.submit('image', SlowImage(), 'slow.png')
+    # 첫 작업이 기록 스레드에서 처리 중이거나 큐에 남아 있으므로 가득 찰 때까지 넣으면 버려짐
+    results = [writer.submit('text', 'x', f'{i}.txt') for i in range(3)]
+    release.set()
+    writer.flush()
+
+    assert None in results
+    assert writer.stats()['dropped'] >= 1
@@ -0,0 +1,92 @@
+import shutil
+
+import pytest
+
+import document_ir
+from block_store import TextBlockBuilder, LAYOUT_SCHEMA
+
+
+@pytest.fixture
+def ir_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(document_ir, 'DOCUMENT_IR_CACHE_DIR', str(tmp_path / 'ir_cache'))
+    monkeypatch.setattr(document_ir, 'DOCUMENT_IR_CACHE_ENABLED', True)
+    monkeypatch.setattr(document_ir.file_reaper, 'add_directories', lambda directories: None)
+    document_ir._memory.clear()
+    yield tmp_path
+    document_ir._memory.clear()
+
+
+def _make_ir():
+    ir = document_ir.new_document_ir('layout')
+    ir['pages'] = [{'number': 0, 'width': 595.0, 'height': 842.0, 'orientation': 'portrait'}]
+    blocks = TextBlockBuilder(LAYOUT_SCHEMA)
+    blocks.add('제목', 0, 0, 595.0, 12, alignment='center')
+    ir['text_blocks'] = blocks.build().to_columns()
+    ir['images'] = [{'page': 0, 'name': 'page_1.jpg', 'bbox': [0, 0, 595.0, 842.0],
+                     'format': 'jpeg', 'pixel_size': [992, 1403], 'data': b'\xff\xd8\x00\xff\xd9'}]
+    return ir
+
+
+def test_serialization_round_trip_keeps_bytes():
+    ir = _make_ir()
+    blob = document_ir.dumps(ir)
+    assert document_ir.loads(blob) == ir
+    with pytest.raises(ValueError):
+        document_ir.loads(b'X' + blob[1:])
+
+
+def test_second_format_reuses_ir_across_uploads(ir_cache):
+    source = ir_cache / 'upload_a.pdf'
+    source.write_bytes(b'%PDF-1.4 same content')
+    # 같은 문서를 다른 이름으로 다시 업로드한 경우
+    copy = ir_cache / 'upload_b.pdf'
+    shutil.copyfile(source, copy)
+    calls = []
+
+    def build(path):
+        calls.append(path)
+        return _make_ir()
+
+    first = document_ir.cached_document_ir(str(source), 'layout', build, variant='medium')
+    second = document_ir.cached_document_ir(str(copy), 'layout', build, variant='medium')
+    assert calls == [str(source)]
+    assert second == first
+
+    # 다른 워커 프로세스: 메모리 캐시 없이 디스크 캐시에서 읽음
+    document_ir._memory.clear()
+    third = document_ir.cached_document_ir(str(copy), 'layout', build, variant='medium')
+    assert calls == [str(source)]
+    assert third['images'][0]['data'] == b'\xff\xd8\x00\xff\xd9'
+
+    # 추출 옵션이 다르면 별도로 추출
+    document_ir.cached_document_ir(str(copy), 'layout', build, variant='high')
+    assert len(calls) == 2
+
+
+def test_transient_ir_is_not_cached(ir_cache):
+    source = ir_cache / 'doc.pdf'
+    source.write_bytes(b'%PDF-1.4 fallback')
+    calls = []
+
+    def build(path):
+        calls.append(path)
+        ir = _make_ir()
+        ir['transient'] = True
+        return ir
+
+    document_ir.cached_document_ir(str(source), 'adobe_layer', build)
+    document_ir.cached_document_ir(str(source), 'adobe_layer', build)
+    assert len(calls) == 2
+    assert not (ir_cache / 'ir_cache').exists() or not list((ir_cache / 'ir_cache').iterdir())
+
+
+def test_cache_dir_registers_with_running_reaper(tmp_path, monkeypatch):
+    import file_reaper
+    reaper = file_reaper.FileReaper([str(tmp_path / 'uploads')])
+    monkeypatch.setattr(file_reaper, '_reaper', reaper)
+    monkeypatch.setattr(file_reaper, 'REAPER_ENABLED', True)
+    monkeypatch.setattr(document_ir, 'DOCUMENT_IR_CACHE_DIR', str(tmp_path / 'ir_cache'))
+    monkeypatch.setattr(document_ir, '_reaper_pid', None)
+
+    document_ir._ensure_cache_dir()
+    assert str(tmp_path / 'ir_cache') in reaper.directories
@@ -0,0 +1,97 @@
+import sqlite3
+import tempfile
+
+from document_manager import DocumentManager, SCHEMA_VERSION
+from document_queries import decode_cursor, encode_cursor
+
+
+def _manager_with_failures(count):
+    manager = DocumentManager(tempfile.mkdtemp())
+    with sqlite3.connect(manager.db_file) as conn:
+        for i in range(count):
+            cursor = conn.execute(
+                "INSERT INTO documents (filename, conversion_method, success, created_at) VALUES (?, ?, 0, ?)",
+                (f"doc_{i}.pdf", 'ocr' if i % 2 else 'text', f"2025-01-{1 + i % 28:02d} 10:00:00"))
+            conn.execute(
+                "INSERT INTO extraction_failures (document_id, failure_reason, failure_type) VALUES (?, ?, ?)",
+                (cursor.lastrowid, 'Conversion failed', 'conversion_failure'))
+        conn.commit()
+    return manager
+
+
+def test_migration_adds_indexes():
+    """마이그레이션으로 인덱스와 스키마 버전이 설정되는지 확인"""
+    manager = DocumentManager(tempfile.mkdtemp())
+    with sqlite3.connect(manager.db_file) as conn:
+        assert conn.execute('PRAGMA user_version').fetchone()[0] == SCHEMA_VERSION
+        indexes = {row[1] for row in conn.execute("SELECT type, name FROM sqlite_master WHERE type = 'index'")}
+    assert 'idx_documents_created_at' in indexes
+    assert 'idx_failures_review_status' in indexes
+    assert 'idx_failures_document_id' in indexes
+
+    # 재실행해도 안전
+    manager.migrate_database()
+
+
+def test_cursor_roundtrip():
+    cursor = encode_cursor("2025-01-02 10:00:00", 42)
+    assert decode_cursor(cursor) == ("2025-01-02 10:00:00", 42)
+    assert decode_cursor(encode_cursor("2025-01-02 10:00:00", 42, 7)) == ("2025-01-02 10:00:00", 42, 7)
+
+
+def test_keyset_pagination_covers_all_rows_once():
+    """커서를 따라가면 모든 실패 문서를 중복 없이 정렬된 순서로 조회"""
+    manager = _manager_with_failures(57)
+
+    seen = []
+    cursor = None
+    while True:
+        page = manager.get_failed_documents_page(limit=10, cursor=cursor)
+        assert len(page['items']) <= 10
+        seen.extend((row['created_at'], row['id']) for row in page['items'])
+        cursor = page['next_cursor']
+        if not cursor:
+            break
+
+    assert len(seen) == 57
+    assert len(set(seen)) == 57
+    assert seen == sorted(seen, reverse=True)
+    assert len(manager.get_failed_documents()) == 57
+
+
+def test_pagination_keeps_all_failures_of_a_document():
+    """문서 하나의 실패 기록이 페이지 경계에 걸려도 나머지 기록을 다음 페이지에서 반환"""
+    manager = _manager_with_failures(5)
+    with sqlite3.connect(manager.db_file) as conn:
+        for document_id in (2, 4):
+            for _ in range(3):
+                conn.execute(
+                    "INSERT INTO extraction_failures (document_id, failure_reason, failure_type) VALUES (?, ?, ?)",
+                    (document_id, 'Retry failed', 'conversion_failure'))
+        conn.commit()
+
+    seen = []
+    cursor = None
+    while True:
+        page = manager.get_failed_documents_page(limit=3, cursor=cursor)
+        seen.extend(row['failure_id'] for row in page['items'])
+        cursor = page['next_cursor']
+        if not cursor:
+            break
+
+    assert len(seen) == 11
+    assert len(set(seen)) == 11
+
+
+def test_filters():
+    """변환 방식/날짜 필터"""
+    manager = _manager_with_failures(28)
+
+    ocr_only = manager.get_failed_documents_page(limit=100, method='ocr')
+    assert ocr_only['items'] and all(row['conversion_method'] == 'ocr' for row in ocr_only['items'])
+
+    window = manager.get_documents_page(limit=100, date_from='2025-01-05', date_to='2025-01-06')
+    assert sorted(row['created_at'][:10] for row in window['items']) == ['2025-01-05', '2025-01-06']
+
+    reviewed = manager.get_failed_documents_page(status='done')
+    assert reviewed['items'] == []
@@ -0,0 +1,116 @@
+import io
+
+import pytest
+
+fitz = pytest.importorskip('fitz')
+
+from document_scan import (analyze_page_orientation, content_text_stats, detect_official_document, sample_pages,
+                           scan_document)
+
+
+def _png():
+    Image = pytest.importorskip('PIL.Image')
+    buffer = io.BytesIO()
+    Image.new('RGB', (40, 60), (200, 200, 200)).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def _pdf(tmp_path, pages):
+    pdf = fitz.open()
+    for kind in pages:
+        if kind == 'official':
+            page = pdf.new_page(width=595, height=842)
+            page.insert_text((72, 72), '문서번호: 2024-123\n수신: 시장\n발신: 담당부서\n시행일자: 2024.1.2.\n붙임 1부. 끝.',
+                             fontname='korea')
+        elif kind == 'text':
+            page = pdf.new_page(width=842, height=595)
+            page.insert_text((72, 72), 'This page has more than fifty characters of body text on it.')
+        else:
+            page = pdf.new_page(width=842, height=595)
+            page.insert_image(page.rect, stream=_png())
+    path = str(tmp_path / 'doc.pdf')
+    pdf.save(path)
+    pdf.close()
+    return path
+
+
+def test_classifies_from_content_streams(tmp_path):
+    scan = scan_document(_pdf(tmp_path, ['official', 'text', 'text', 'scan', 'scan']), time_budget=10)
+    assert scan.sampled_pages == [0, 1, 2, 3, 4]
+    assert (scan.text_pages, scan.image_pages) == (3, 2)
+    assert scan.pdf_type == 'mixed' and scan.text_ratio == pytest.approx(0.6)
+    assert (scan.orientation, scan.landscape_pages, scan.portrait_pages) == ('landscape', 4, 1)
+    assert scan.is_official and scan.official_score > 0.5
+    assert scan.estimated_ocr_pages == 2
+
+    analysis = scan.to_analysis()
+    assert analysis['type'] == 'mixed'
+    assert analysis['orientation']['orientation'] == 'landscape'
+    assert analysis['official_document']['is_official']
+
+    scanned = scan_document(_pdf(tmp_path, ['scan', 'scan']))
+    assert scanned.pdf_type == 'scanned_image' and not scanned.is_official
+    assert content_text_stats(b'BT /F1 12 Tf (Hello) Tj [<00480069>] TJ ET') == (2, 9)
+
+
+def test_samples_long_documents_within_budget(tmp_path):
+    pages = sample_pages(1000, limit=12, seed='x')
+    assert pages[:2] == [0, 999] and len(set(pages)) == 12
+    # 나머지 10개는 각 구간(약 100쪽)마다 하나씩
+    assert [(page - 1) // 100 for page in pages[2:]] == list(range(10))
+    assert sample_pages(1000, limit=12, seed='x') == pages
+
+    path = _pdf(tmp_path, ['text'] * 40)
+    scan = scan_document(path, sample_limit=6)
+    assert len(scan.sampled_pages) == 6 and scan.pdf_type == 'text_based'
+    # 시간 한도를 넘으면 첫 페이지만 보고 판단
+    hurried = scan_document(path, sample_limit=6, time_budget=0)
+    assert hurried.sampled_pages == [0] and hurried.budget_exhausted
+
+
+def test_sample_limit_below_two():
+    assert sample_pages(10, limit=1) == [0]
+    assert sample_pages(10, limit=0) == [0]
+    assert sample_pages(10, limit=2) == [0, 9]
+    assert sample_pages(1, limit=1) == [0]
+
+
+def test_literal_strings_with_nested_parentheses():
+    # 균형 잡힌 중첩 괄호와 이스케이프된 괄호는 문자열 일부
+    assert content_text_stats(b'BT (a(b)c) Tj ET') == (1, 5)
+    assert content_text_stats(rb'BT (a\)b) Tj [(x(y)) -20 <0041>] TJ ET') == (2, 4 + 4 + 2)
+    assert content_text_stats(b'BT /F1 12 Tf <</MCID 0>> BDC (ab) Tj EMC ET') == (1, 2)
+
+
+def test_shared_image_resources_are_not_image_pages(tmp_path):
+    pdf = fitz.open()
+    pdf.new_page().insert_image(fitz.Rect(0, 0, 595, 842), stream=_png())
+    pdf.new_page()
+    # 두 번째 페이지는 이미지가 든 리소스를 공유하지만 내용에서 그리지 않음
+    pdf.xref_set_key(pdf[1].xref, 'Resources', pdf.xref_get_key(pdf[0].xref, 'Resources')[1])
+    path = str(tmp_path / 'shared.pdf')
+    pdf.save(path)
+    pdf.close()
+
+    with fitz.open(path) as doc:
+        assert doc[1].get_images()
+    scan = scan_document(path, time_budget=10)
+    assert scan.sampled_pages == [0, 1]
+    assert (scan.text_pages, scan.image_pages) == (0, 1)
+
+
+def test_orientation_and_official_wrappers(tmp_path, monkeypatch):
+    import document_scan
+
+    path = _pdf(tmp_path, ['official', 'text', 'text'])
+    scan = scan_document(path, time_budget=10)
+    # 이미 분석한 결과를 넘기면 다시 검사하지 않음
+    monkeypatch.setattr(document_scan, 'scan_document', lambda pdf_path: pytest.fail('rescanned'))
+    assert analyze_page_orientation(path, scan)['orientation'] == 'landscape'
+    official = detect_official_document(path, scan)
+    assert official['is_official'] and official['keyword_count'] >= 3
+
+    # 빈 PDF는 방향/공문서 정보가 없어도 같은 형식의 dict를 돌려줌
+    monkeypatch.setattr(document_scan, 'scan_document', lambda pdf_path: document_scan.DocumentScan('empty', 0))
+    assert analyze_page_orientation(path) == {'orientation': 'unknown', 'ratio': 0}
+    assert detect_official_document(path) == {'is_official': False, 'confidence': 0}
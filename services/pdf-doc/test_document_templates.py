@@ -0,0 +1,34 @@
+import pytest
+
+docx = pytest.importorskip('docx')
+
+import document_templates
+from document_templates import new_document, new_presentation
+
+
+def test_document_copies_are_configured_and_independent():
+    first = new_document('a4_landscape')
+    first.add_paragraph('첫 요청')
+    first.core_properties.title = '첫 문서'
+    second = new_document('a4_landscape')
+
+    section = second.sections[0]
+    assert section.orientation == docx.enum.section.WD_ORIENT.LANDSCAPE
+    assert (round(section.page_width.mm), round(section.page_height.mm)) == (297, 210)
+    assert second.styles['Normal'].font.name == document_templates.DOCX_BODY_FONT
+    assert second.styles['Converted Body'] is not None
+    assert second.core_properties.author == 'Document Converter'
+    # 앞 요청에서 수정한 내용이 템플릿에 남지 않음
+    assert not [p for p in second.paragraphs if p.text]
+    assert second.core_properties.title != '첫 문서'
+
+    with pytest.raises(ValueError):
+        new_document('b5')
+
+
+def test_presentation_profiles_set_slide_size():
+    pptx_util = pytest.importorskip('pptx.util')
+    prs = new_presentation('slides_9_16')
+    assert (prs.slide_width, prs.slide_height) == (pptx_util.Inches(7.5), pptx_util.Inches(13.33))
+    prs.slides.add_slide(prs.slide_layouts[6])
+    assert len(new_presentation('slides_9_16').slides) == 0
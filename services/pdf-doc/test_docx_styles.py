@@ -0,0 +1,95 @@
+import io
+
+import pytest
+
+docx = pytest.importorskip('docx')
+
+from docx_styles import ParagraphWriter, install_styles, BODY, TITLE, HEADING, STRONG, _STYLES
+
+
+def _reopen(doc):
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    buffer.seek(0)
+    return docx.Document(buffer)
+
+
+def test_styles_are_defined_once_and_referenced_by_id():
+    doc = docx.Document()
+    with ParagraphWriter(doc, batch_size=2) as writer:
+        writer.add('안내 문서', HEADING)
+        writer.add('제목: 회의', TITLE, alignment='right')
+        writer.page_break()
+        writer.add('긴 가운데 문장', BODY, alignment='center', char_style=STRONG)
+        writer.add('들여쓴 본문', BODY, left_indent_pt=18, space_before_pt=4)
+    install_styles(doc)
+
+    style_ids = [s.style_id for s in doc.styles if s.style_id.startswith('Conv')]
+    assert len(style_ids) == len(set(style_ids)) == len(_STYLES)
+
+    reopened = _reopen(doc)
+    paragraphs = [p for p in reopened.paragraphs if p.text]
+    assert [p.text for p in paragraphs] == ['안내 문서', '제목: 회의', '긴 가운데 문장', '들여쓴 본문']
+    assert [p.style.name for p in paragraphs] == ['Converted Centered Heading', 'Converted Title',
+                                                  'Converted Body', 'Converted Body']
+    assert paragraphs[1].alignment == docx.enum.text.WD_ALIGN_PARAGRAPH.RIGHT
+    assert paragraphs[2].runs[0].style.name == 'Converted Strong'
+    assert paragraphs[3].paragraph_format.left_indent == docx.shared.Pt(18)
+    assert paragraphs[3].paragraph_format.space_before == docx.shared.Pt(4)
+    assert reopened.styles['Converted Title'].font.size == docx.shared.Pt(13)
+    # 본문은 구역 속성(sectPr) 앞에 추가됨
+    assert reopened.element.body[-1].tag.endswith('sectPr')
+
+
+def test_run_text_matches_python_docx():
+    text = 'a\tb\nc <&> "d"\x00\x0b 한글'
+    reference = docx.Document()
+    reference.add_paragraph().add_run(text.replace('\x00', '').replace('\x0b', ''))
+
+    doc = docx.Document()
+    with ParagraphWriter(doc) as writer:
+        writer.add(text)
+    assert _reopen(doc).paragraphs[-1].text == _reopen(reference).paragraphs[-1].text
+
+
+def _run_level_fonts(doc):
+    return doc.element.body.xpath('.//w:r/w:rPr/w:rFonts | .//w:r/w:rPr/w:sz')
+
+
+def test_working_server_writers_reference_styles():
+    """Adobe/텍스트 전용/하이브리드 작성기는 런마다 글꼴·크기를 지정하지 않고 변환 스타일을 참조"""
+    working_server = pytest.importorskip('working_server')
+    from PIL import Image
+
+    # Adobe Bounds는 좌하단 원점이므로 위쪽 블록일수록 top 값이 큼
+    adobe_blocks = [
+        {'type': 'text', 'text': '안내 공문', 'left': 200, 'top': 800, 'width': 200, 'height': 20, 'confidence': 100},
+        {'type': 'text', 'text': '수신: 각 부서', 'left': 50, 'top': 760, 'width': 100, 'height': 14, 'confidence': 100},
+        {'type': 'table', 'text': '[표 영역]', 'left': 50, 'top': 600, 'width': 400, 'height': 100,
+         'confidence': 100, 'table_description': '표 영역 (400x100px)'},
+    ]
+    doc = docx.Document()
+    assert working_server.add_editable_text_with_adobe(doc, (595, 842), doc.sections[0], adobe_blocks)
+    reopened = _reopen(doc)
+    paragraphs = [p for p in reopened.paragraphs if p.text]
+    assert [p.style.name for p in paragraphs] == ['Converted Centered Heading', 'Converted Body',
+                                                  'Converted Body', 'Converted Note']
+    assert paragraphs[1].runs[0].style.name == 'Converted Strong'
+    assert [run.style.name for run in paragraphs[2].runs] == ['Converted Table Label', 'Converted Caption']
+    assert paragraphs[2].text == '[표 영역]\n표 영역 (400x100px)'
+    assert not _run_level_fonts(doc)
+
+    image = Image.new('RGB', (1000, 1400), 'white')
+    ocr_blocks = [
+        {'text': '본문 첫 줄', 'left': 100, 'top': 100, 'width': 300, 'height': 30, 'confidence': 90},
+        {'text': '흐린 줄', 'left': 100, 'top': 300, 'width': 200, 'height': 30, 'confidence': 40},
+    ]
+    for writer in (working_server.add_text_only_conversion, working_server.add_hybrid_conversion):
+        doc = docx.Document()
+        assert writer(doc, image, doc.sections[0], ocr_blocks)
+        lines = [p for p in _reopen(doc).paragraphs if p.text]
+        assert [p.text for p in lines] == ['본문 첫 줄', '흐린 줄']
+        assert [p.style.name for p in lines] == ['Converted OCR Line',
+                                                 'Converted OCR Line (Low Confidence)']
+        assert lines[0].paragraph_format.left_indent > 0
+        assert not _run_level_fonts(doc)
@@ -0,0 +1,50 @@
+import json
+import os
+import subprocess
+import sys
+
+import engine_registry
+from engine_registry import engine_available, lazy_module, load_engine, register_engine
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_lazy_module_imports_on_first_attribute_access():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return json
+
+    register_engine('test_json_engine', loader)
+    proxy = lazy_module('test_json_engine')
+    assert calls == []
+
+    assert proxy.dumps([1]) == '[1]'
+    assert proxy.loads('2') == 2
+    assert calls == [1]
+    assert load_engine('test_json_engine') is json
+    assert 'test_json_engine' in engine_registry.boot_report()['loaded_engines']
+
+
+def test_engine_available_does_not_import():
+    sys.modules.pop('colorsys', None)
+    assert engine_available('colorsys')
+    assert 'colorsys' not in sys.modules
+    assert not engine_available('no_such_engine_module')
+
+
+def test_server_boot_defers_heavy_engines(tmp_path):
+    """서버 모듈 import만으로는 무거운 엔진이 로드되지 않고 /health가 응답"""
+    script = (
+        "import sys, json, app\n"
+        "client = app.app.test_client()\n"
+        "assert client.get('/health').status_code == 200\n"
+        "heavy = ['cv2', 'numpy', 'fitz', 'pdf2docx', 'pptx', 'pytesseract', 'pdfplumber']\n"
+        "print(json.dumps([m for m in heavy if m in sys.modules]))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=HERE)
+    result = subprocess.run([sys.executable, '-c', script], cwd=tmp_path, env=env,
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == []
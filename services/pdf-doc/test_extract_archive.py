@@ -0,0 +1,82 @@
+import io
+import json
+import os
+import zipfile
+
+import pytest
+
+from extract_archive import ExtractArchive
+
+
+def _result_zip():
+    structured = {'elements': [
+        {'Path': '//Document/P', 'Page': 0, 'Text': '본문', 'Bounds': {'x': 72, 'y': 80, 'width': 228, 'height': 12}},
+        {'Path': '//Document/Figure', 'Page': 0, 'Bounds': {'x': 100, 'y': 100, 'width': 100, 'height': 80},
+         'filePaths': ['figures/fileoutpart0.png']},
+    ]}
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('structuredData.json', json.dumps(structured))
+        archive.writestr('figures/', b'')
+        archive.writestr('figures/fileoutpart0.png', b'\x89PNG-figure')
+    return buffer.getvalue()
+
+
+def test_reads_entries_without_extracting(tmp_path):
+    zip_path = tmp_path / 'result.zip'
+    zip_path.write_bytes(_result_zip())
+
+    with ExtractArchive(str(zip_path), remove=True) as archive:
+        # 열자마자 ZIP 파일은 삭제되고 열린 핸들로 계속 읽음
+        assert os.listdir(tmp_path) == []
+        assert archive.has_structured_data()
+        assert archive.structured_data()['elements'][0]['Text'] == '본문'
+        assert archive.figures() == {'fileoutpart0.png': 'figures/fileoutpart0.png'}
+        assert archive.read('figures/fileoutpart0.png') == b'\x89PNG-figure'
+
+    with ExtractArchive(_result_zip()) as archive:
+        assert 'structuredData.json' in archive.names()
+
+
+def test_html_layer_streams_figures_from_archive(tmp_path, monkeypatch):
+    adobe_layer_converter = pytest.importorskip('adobe_layer_converter')
+    converter = adobe_layer_converter.AdobeLayerConverter()
+    archive = ExtractArchive(_result_zip())
+
+    def extract(pdf_path):
+        return {'json_data': None, 'elements': archive.iter_elements(), 'images': archive.figures(),
+                'archive': archive, 'source': 'adobe'}
+
+    monkeypatch.setattr(converter, 'extract_pdf_data', extract)
+
+    html_path = converter.generate_html_layer('unused.pdf', str(tmp_path), compress=False, split_pages=0)
+    assert (tmp_path / 'fileoutpart0.png').read_bytes() == b'\x89PNG-figure'
+    content = open(html_path, encoding='utf-8-sig').read()
+    assert '<img src="fileoutpart0.png"' in content and 'width: 100px;' in content
+    # HTML 작성 후 ZIP 리더는 닫힘
+    with pytest.raises(Exception):
+        archive.read('figures/fileoutpart0.png')
+
+
+def test_saved_extract_result_is_reused(tmp_path, monkeypatch):
+    adobe_layer_converter = pytest.importorskip('adobe_layer_converter')
+    import document_ir
+    monkeypatch.setattr(document_ir, 'DOCUMENT_IR_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setattr(document_ir, 'DOCUMENT_IR_CACHE_ENABLED', True)
+    monkeypatch.setattr(document_ir, '_reaper_pid', None)
+    monkeypatch.setattr(document_ir.file_reaper, 'add_directories', lambda directories: None)
+    pdf_path = tmp_path / 'in.pdf'
+    pdf_path.write_bytes(b'%PDF-1.4')
+    with open(document_ir.cached_source_path(str(pdf_path), 'adobe_extract', '.zip'), 'wb') as f:
+        f.write(_result_zip())
+
+    converter = adobe_layer_converter.AdobeLayerConverter()
+    # 보관된 결과가 있으면 Adobe를 다시 호출하지 않음
+    monkeypatch.setattr(converter, '_ensure_sdk_availability', lambda: pytest.fail('Adobe 호출'))
+    result = converter.extract_pdf_data(str(pdf_path))
+    try:
+        assert result['source'] == 'adobe'
+        assert [element['Text'] for element in result['elements'] if 'Text' in element] == ['본문']
+        assert result['images'] == {'fileoutpart0.png': 'figures/fileoutpart0.png'}
+    finally:
+        result['archive'].close()
@@ -0,0 +1,100 @@
+import os
+import time
+
+import file_reaper
+from file_reaper import FileReaper, mark_in_use
+from file_utils import cleanup_temp_files
+
+
+def _make_file(directory, name, size, age_hours):
+    path = directory / name
+    path.write_bytes(b'x' * size)
+    mtime = time.time() - age_hours * 3600
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_cleanup_temp_files_reports_reclaimed_bytes(tmp_path):
+    old = _make_file(tmp_path, 'old.png', 100, 48)
+    fresh = _make_file(tmp_path, 'fresh.png', 100, 1)
+    other = _make_file(tmp_path, 'old.txt', 100, 48)
+
+    assert cleanup_temp_files(str(tmp_path), '*.png', 24) == 100
+    assert not old.exists()
+    assert fresh.exists() and other.exists()
+    assert cleanup_temp_files(str(tmp_path / 'missing')) == 0
+
+
+def test_reaper_evicts_oldest_first_over_size_cap(tmp_path):
+    mb = 1024 * 1024
+    oldest = _make_file(tmp_path, 'a.docx', mb, 3)
+    middle = _make_file(tmp_path, 'b.docx', mb, 2)
+    newest = _make_file(tmp_path, 'c.docx', mb, 1)
+
+    reaper = FileReaper([str(tmp_path)], ttl_hours=24, max_total_mb=2)
+    assert reaper.reap_once() == mb
+    assert not oldest.exists()
+    assert middle.exists() and newest.exists()
+    assert reaper.metrics()['reclaimed_bytes_total'] == mb
+    assert reaper.metrics()['evicted_files_total'] == 1
+
+
+def test_reaper_skips_files_being_downloaded(tmp_path):
+    expired = _make_file(tmp_path, 'expired.pdf', 10, 10)
+    downloading = _make_file(tmp_path, 'downloading.pdf', 10, 10)
+
+    release = mark_in_use(str(downloading))
+    reaper = FileReaper([str(tmp_path)], ttl_hours=1, max_total_mb=0)
+    try:
+        assert reaper.reap_once() == 10
+        assert not expired.exists()
+        assert downloading.exists()
+    finally:
+        release()
+
+    assert reaper.reap_once() == 10
+    assert not downloading.exists()
+    assert reaper.metrics()['reclaimed_bytes_total'] == 20
+
+
+def test_later_registration_reaches_running_reaper(tmp_path, monkeypatch):
+    uploads, cache = tmp_path / 'uploads', tmp_path / 'ir_cache'
+    uploads.mkdir()
+    cache.mkdir()
+    stale = _make_file(cache, 'stale.ir', 10, 48)
+
+    reaper = FileReaper([], ttl_hours=24, interval_seconds=3600)
+    monkeypatch.setattr(file_reaper, '_reaper', reaper)
+    monkeypatch.setattr(file_reaper, 'REAPER_ENABLED', True)
+    try:
+        # 앱이 먼저 정리기를 시작한 뒤 다른 모듈이 자기 폴더를 등록해도 정리 대상에 포함
+        assert file_reaper.start_reaper([str(uploads)]) is reaper
+        assert file_reaper.add_directories([str(cache), str(uploads)]) is reaper
+        assert reaper.directories == [str(uploads), str(cache)]
+        reaper.reap_once()
+        assert not stale.exists()
+        assert reaper.metrics()['expired_bytes_total'] == 10
+    finally:
+        reaper.stop()
+
+
+def test_registration_does_not_start_thread(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_reaper, '_reaper', None)
+    monkeypatch.setattr(file_reaper, 'REAPER_ENABLED', True)
+    # 모듈 import 시 등록만 하고, 스레드는 post_fork/__main__의 start_reaper에서 시작
+    reaper = file_reaper.add_directories([str(tmp_path)])
+    assert reaper._thread is None
+    assert file_reaper.reaper_metrics()['directories'] == [str(tmp_path)]
+
+
+def test_start_in_forked_child_creates_new_thread(tmp_path, monkeypatch):
+    reaper = FileReaper([str(tmp_path)], interval_seconds=3600)
+    inherited = reaper._run_lock
+    # 부모 프로세스에서 만든 정리기를 자식(pid가 다른 프로세스)에서 시작하는 경우
+    monkeypatch.setattr(reaper, '_pid', -1)
+    try:
+        reaper.start()
+        assert reaper._run_lock is not inherited
+        assert reaper._thread.is_alive()
+    finally:
+        reaper.stop()
@@ -0,0 +1,118 @@
+import os
+import time
+
+import pytest
+
+from font_registry import FontRegistry
+
+
+def _make_font_dir(tmp_path, *names):
+    font_dir = tmp_path / 'fonts'
+    (font_dir / 'nested').mkdir(parents=True)
+    for name in names:
+        (font_dir / 'nested' / name).write_bytes(b'')
+    return font_dir
+
+
+def test_scan_finds_candidates_in_priority_order(tmp_path):
+    font_dir = _make_font_dir(tmp_path, 'UnDotum.ttf', 'NanumGothic.ttf', 'other.ttf')
+    registry = FontRegistry([str(font_dir)], str(tmp_path / 'index.json'))
+
+    available = registry.available_fonts()
+    assert list(available) == ['NanumGothic', 'UnDotum']
+    assert available['NanumGothic']['path'].endswith('NanumGothic.ttf')
+
+
+def test_index_is_reused_until_directory_changes(tmp_path, monkeypatch):
+    """인덱스가 유효하면 스캔을 생략하고, 디렉토리 mtime이 바뀌면 다시 스캔"""
+    font_dir = _make_font_dir(tmp_path, 'NanumGothic.ttf')
+    index_path = str(tmp_path / 'index.json')
+    FontRegistry([str(font_dir)], index_path).discover()
+    assert os.path.exists(index_path)
+
+    def fail_scan(self):
+        raise AssertionError("인덱스가 유효한데 스캔함")
+
+    monkeypatch.setattr(FontRegistry, '_scan', fail_scan)
+    assert 'nanumgothic.ttf' in FontRegistry([str(font_dir)], index_path).discover()
+    monkeypatch.undo()
+
+    new_font = font_dir / 'nested' / 'malgun.ttf'
+    new_font.write_bytes(b'')
+    future = time.time() + 10
+    os.utime(font_dir / 'nested', (future, future))
+
+    assert 'malgun.ttf' in FontRegistry([str(font_dir)], index_path).discover()
+
+
+def test_no_fonts_falls_back_to_default(tmp_path):
+    registry = FontRegistry([str(tmp_path / 'missing')], str(tmp_path / 'index.json'))
+    assert registry.korean_font() is None
+    assert registry.korean_font_name() == 'Helvetica'
+
+
+def _build_hangul_font(path, cff=False):
+    """'한글' 두 글자를 가진 작은 폰트 생성 (cff=True면 reportlab이 읽지 못하는 CFF 외곽선)"""
+    fontBuilder = pytest.importorskip('fontTools.fontBuilder')
+    from fontTools.pens.t2CharStringPen import T2CharStringPen
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+    glyph_order = ['.notdef', 'han', 'geul']
+    builder = fontBuilder.FontBuilder(1000, isTTF=not cff)
+    builder.setupGlyphOrder(glyph_order)
+    builder.setupCharacterMap({ord('한'): 'han', ord('글'): 'geul'})
+
+    def draw(pen):
+        pen.moveTo((100, 0))
+        pen.lineTo((100, 700))
+        pen.lineTo((800, 700))
+        pen.lineTo((800, 0))
+        pen.closePath()
+
+    if cff:
+        charstrings = {}
+        for name in glyph_order:
+            pen = T2CharStringPen(900, None)
+            draw(pen)
+            charstrings[name] = pen.getCharString()
+        builder.setupCFF('TestHangul', {'FullName': 'TestHangul'}, charstrings, {})
+    else:
+        glyphs = {}
+        for name in glyph_order:
+            pen = TTGlyphPen(None)
+            draw(pen)
+            glyphs[name] = pen.glyph()
+        builder.setupGlyf(glyphs)
+    builder.setupHorizontalMetrics({name: (900, 100) for name in glyph_order})
+    builder.setupHorizontalHeader(ascent=800, descent=-200)
+    builder.setupNameTable({'familyName': 'TestHangul', 'styleName': 'Regular'})
+    builder.setupOS2()
+    builder.setupPost()
+    builder.save(str(path))
+
+
+def test_registered_font_draws_hangul(tmp_path):
+    """CFF 외곽선 폰트는 건너뛰고 TrueType 폰트를 등록해 한글을 그 폰트로 그림"""
+    pytest.importorskip('reportlab')
+    from reportlab.pdfgen import canvas
+
+    font_dir = tmp_path / 'fonts'
+    font_dir.mkdir()
+    # 우선순위가 높은 후보가 CFF 외곽선이면 등록에 실패하고 다음 후보를 사용
+    _build_hangul_font(font_dir / 'NanumGothic.ttf', cff=True)
+    _build_hangul_font(font_dir / 'UnDotum.ttf')
+    registry = FontRegistry([str(font_dir)], str(tmp_path / 'index.json'))
+
+    font = registry.korean_font()
+    assert font is not None and font[0] == 'UnDotum'
+
+    pdf_path = tmp_path / 'hangul.pdf'
+    c = canvas.Canvas(str(pdf_path))
+    c.setFont(registry.korean_font_name(), 12)
+    c.drawString(72, 720, '한글')
+    c.save()
+
+    data = pdf_path.read_bytes()
+    # 기본 Helvetica가 아니라 등록한 TrueType 폰트가 임베드되어 사용됨
+    assert b'/FontFile2' in data
+    assert b'/F2+0' in data and b'TestHangul' in data
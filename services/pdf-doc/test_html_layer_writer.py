@@ -0,0 +1,88 @@
+import gzip
+import os
+
+import pytest
+
+from html_layer_writer import HtmlLayerBuilder, HtmlLayerWriter
+
+# 스트리밍 작성 이전의 _generate_html_content가 같은 요소로 만든 HTML (BOM 포함)
+LEGACY_HTML = os.path.join(os.path.dirname(__file__), 'testdata', 'layered_document_legacy.html')
+
+_STYLE = {'font_name': 'Malgun "Gothic"', 'font_size': 11, 'font_weight': 'bold', 'color': '#333333'}
+
+
+def _add_elements(layer):
+    layer.add_text(0, 72, 50, 228, 12, _STYLE, '첫 페이지 <제목> & 본문')
+    layer.add_figure(2, 'fig 1.png', 10, 20, 100, 50, b'\x89PNG')
+    layer.add_text(1, 72, 80, 228.5, 12, dict(_STYLE, font_name=''), '둘째 페이지')
+
+
+def test_streamed_output_matches_saved_legacy_html(tmp_path):
+    with open(LEGACY_HTML, 'rb') as f:
+        expected = f.read()
+
+    with HtmlLayerBuilder(str(tmp_path), compress=False, split_pages=0) as layer:
+        _add_elements(layer)
+        path = layer.finish()
+    assert os.path.basename(path) == 'layered_document.html'
+    with open(path, 'rb') as f:
+        assert f.read() == expected
+    assert (tmp_path / 'fig 1.png').read_bytes() == b'\x89PNG'
+    # 스풀 파일은 남지 않음
+    assert sorted(os.listdir(tmp_path)) == ['fig 1.png', 'layered_document.html']
+
+    with HtmlLayerBuilder(str(tmp_path), compress=True, split_pages=0) as layer:
+        _add_elements(layer)
+        gz_path = layer.finish()
+    assert gz_path.endswith('layered_document.html.gz')
+    assert gzip.decompress(open(gz_path, 'rb').read()) == expected
+
+
+def test_split_pages_writes_one_file_per_page(tmp_path):
+    with HtmlLayerBuilder(str(tmp_path), compress=False, split_pages=2) as layer:
+        _add_elements(layer)
+        index_path = layer.finish(page_count=3)
+    names = sorted(os.listdir(tmp_path))
+    assert names == ['fig 1.png', 'layered_document.html', 'layered_document_p0001.html',
+                     'layered_document_p0002.html', 'layered_document_p0003.html']
+
+    index = open(index_path, encoding='utf-8-sig').read()
+    assert all(f'href="layered_document_p000{page}.html"' in index for page in (1, 2, 3))
+    first = open(tmp_path / 'layered_document_p0001.html', encoding='utf-8-sig').read()
+    assert '첫 페이지 &lt;제목&gt; &amp; 본문' in first and '둘째 페이지' not in first
+    assert "font-family: 'Malgun &quot;Gothic&quot;'" in first
+    third = open(tmp_path / 'layered_document_p0003.html', encoding='utf-8-sig').read()
+    assert '<img src="fig 1.png"' in third and 'text-layer" style' not in third
+
+
+def test_failed_split_write_removes_every_file(tmp_path, monkeypatch):
+    (tmp_path / 'keep.txt').write_text('이전 파일')
+    original_write = HtmlLayerWriter.write
+
+    def failing_write(self, markup):
+        # 두 번째 페이지 파일을 쓰는 도중 실패
+        if self.path.endswith('_p0002.html'):
+            raise OSError('디스크 공간 부족')
+        original_write(self, markup)
+
+    monkeypatch.setattr(HtmlLayerWriter, 'write', failing_write)
+    with pytest.raises(OSError):
+        with HtmlLayerBuilder(str(tmp_path), compress=False, split_pages=2) as layer:
+            _add_elements(layer)
+            layer.finish(page_count=3)
+    # 앞서 끝난 페이지 파일과 그림도 함께 삭제되고 원래 있던 파일만 남음
+    assert os.listdir(tmp_path) == ['keep.txt']
+
+
+def test_failed_write_leaves_no_partial_document(tmp_path):
+    path = tmp_path / 'layered_document.html'
+    with pytest.raises(RuntimeError):
+        with HtmlLayerWriter(str(path)) as writer:
+            writer.write('<div>첫 요소</div>')
+            raise RuntimeError('변환 실패')
+    # 꼬리말만 붙은 잘린 문서가 완성본처럼 남으면 안 됨
+    assert not path.exists()
+
+    with HtmlLayerWriter(str(path)) as writer:
+        writer.write('<div>첫 요소</div>')
+    assert path.read_text(encoding='utf-8-sig').rstrip().endswith('</html>')
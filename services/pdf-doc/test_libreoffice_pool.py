@@ -0,0 +1,207 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import libreoffice_pool
+from libreoffice_pool import LibreOfficePool, SofficeInstance, pipe_name
+
+
+def test_pipe_names_are_per_process():
+    # gunicorn 워커마다 다른 파이프를 써야 다른 워커의 soffice에 연결하지 않음
+    assert pipe_name(0, pid=101) != pipe_name(0, pid=102)
+    assert pipe_name(0, pid=101) != pipe_name(1, pid=101)
+    assert str(libreoffice_pool.os.getpid()) in pipe_name(0)
+
+
+def test_instance_accepts_on_its_pipe(monkeypatch):
+    commands = []
+
+    class FakeProcess:
+        pid = 1
+
+        def poll(self):
+            return 0
+
+        def wait(self, timeout=None):
+            return 0
+
+    monkeypatch.setattr(libreoffice_pool.subprocess, 'Popen',
+                        lambda cmd, **kwargs: commands.append(cmd) or FakeProcess())
+    monkeypatch.setattr(libreoffice_pool, 'NoConnectException', Exception, raising=False)
+    instance = SofficeInstance('soffice', pipe_name(0, pid=101))
+    try:
+        instance.start()
+    except RuntimeError:
+        pass
+    finally:
+        instance.stop()
+    assert '--accept=pipe,name=lo_pool_101_0;urp;StarOffice.ComponentContext' in commands[0]
+
+
+class _Soffice:
+    """UNO 연결을 흉내 내는 가짜 soffice 프로세스들 (Popen 호출마다 하나씩 생성)"""
+
+    def __init__(self):
+        self.processes = []
+        self.stored = []
+        self.gate = None    # 설정되면 storeToURL이 이 이벤트를 기다림 (변환 지연/멈춤)
+
+    def popen(self, cmd, **kwargs):
+        process = _FakeProcess(len(self.processes) + 1)
+        self.processes.append(process)
+        return process
+
+
+class _FakeProcess:
+    def __init__(self, pid):
+        self.pid = pid
+        self.returncode = None
+        self.killed = False
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        return self.returncode
+
+    def kill(self):
+        self.killed = True
+        self.returncode = -9
+
+
+def _fake_uno(monkeypatch, soffice):
+    class Document:
+        def storeToURL(self, url, props):
+            if soffice.gate is not None:
+                soffice.gate.wait()
+            with open(url[len('file://'):], 'wb') as f:
+                f.write(b'%PDF-1.4')
+            soffice.stored.append(url)
+
+        def close(self, deliver):
+            pass
+
+    class Desktop:
+        def __init__(self, process):
+            self.process = process
+
+        def loadComponentFromURL(self, url, frame, flags, props):
+            return Document()
+
+        def terminate(self):
+            self.process.returncode = 0
+
+    def create_instance(name, ctx):
+        if name == 'com.sun.star.bridge.UnoUrlResolver':
+            return SimpleNamespace(resolve=lambda url: SimpleNamespace(
+                ServiceManager=SimpleNamespace(createInstanceWithContext=create_instance)))
+        return Desktop(soffice.processes[-1])
+
+    uno = SimpleNamespace(
+        getComponentContext=lambda: SimpleNamespace(
+            ServiceManager=SimpleNamespace(createInstanceWithContext=create_instance)),
+        systemPathToFileUrl=lambda path: 'file://' + path)
+    monkeypatch.setattr(libreoffice_pool, 'uno', uno, raising=False)
+    monkeypatch.setattr(libreoffice_pool, 'PropertyValue', SimpleNamespace, raising=False)
+    monkeypatch.setattr(libreoffice_pool, 'NoConnectException', ConnectionError, raising=False)
+    monkeypatch.setattr(libreoffice_pool, 'UNO_AVAILABLE', True)
+    monkeypatch.setattr(libreoffice_pool.subprocess, 'Popen', soffice.popen)
+
+
+def _docx(tmp_path, name='in.docx'):
+    path = tmp_path / name
+    path.write_bytes(b'PK')
+    return str(path)
+
+
+def test_checkout_waits_for_idle_instance(tmp_path, monkeypatch):
+    soffice = _Soffice()
+    _fake_uno(monkeypatch, soffice)
+    soffice.gate = threading.Event()
+    pool = LibreOfficePool('soffice', size=1, timeout=5)
+    results = {}
+
+    def convert(name):
+        results[name] = pool.convert(_docx(tmp_path), str(tmp_path / f'{name}.pdf'))
+
+    first = threading.Thread(target=convert, args=('first',))
+    second = threading.Thread(target=convert, args=('second',))
+    try:
+        first.start()
+        time.sleep(0.1)
+        second.start()
+        time.sleep(0.2)
+        # 인스턴스가 하나뿐이므로 두 번째 요청은 첫 변환이 끝날 때까지 대기
+        assert soffice.stored == [] and second.is_alive()
+        soffice.gate.set()
+        first.join(5)
+        second.join(5)
+    finally:
+        soffice.gate.set()
+        pool.shutdown()
+    assert results == {'first': True, 'second': True}
+    assert len(soffice.processes) == 1
+
+
+def test_instance_recycled_after_max_docs(tmp_path, monkeypatch):
+    soffice = _Soffice()
+    _fake_uno(monkeypatch, soffice)
+    pool = LibreOfficePool('soffice', size=1, max_docs=2, timeout=5)
+    try:
+        for index in range(3):
+            assert pool.convert(_docx(tmp_path), str(tmp_path / f'{index}.pdf'))
+    finally:
+        pool.shutdown()
+    # 2건 처리한 인스턴스는 세 번째 요청 전에 종료 후 재시작
+    assert len(soffice.processes) == 2
+    assert soffice.processes[0].returncode == 0 and not soffice.processes[0].killed
+
+
+def test_hung_instance_is_killed_and_restarted(tmp_path, monkeypatch):
+    soffice = _Soffice()
+    _fake_uno(monkeypatch, soffice)
+    soffice.gate = threading.Event()
+    pool = LibreOfficePool('soffice', size=1, timeout=0.2)
+    try:
+        assert not pool.convert(_docx(tmp_path), str(tmp_path / 'hung.pdf'))
+        assert soffice.processes[0].killed
+        assert len(soffice.processes) == 2
+
+        # 재시작된 인스턴스로 다음 변환은 정상 처리
+        soffice.gate.set()
+        soffice.gate = None
+        assert pool.convert(_docx(tmp_path), str(tmp_path / 'next.pdf'))
+    finally:
+        if soffice.gate is not None:
+            soffice.gate.set()
+        pool.shutdown()
+
+
+def test_reportlab_fallback_without_uno(tmp_path, monkeypatch, capsys):
+    app = pytest.importorskip('app')
+    final_server = pytest.importorskip('final_server')
+    monkeypatch.setattr(libreoffice_pool, 'UNO_AVAILABLE', False)
+    monkeypatch.setattr(libreoffice_pool, '_pool', None)
+    monkeypatch.setattr(libreoffice_pool, 'find_soffice', lambda: '/usr/bin/soffice')
+    # UNO 없이 1회성 soffice 변환도 실패하면 reportlab 렌더러 사용
+    monkeypatch.setattr(libreoffice_pool.subprocess, 'run',
+                        lambda cmd, **kwargs: SimpleNamespace(returncode=1, stderr='no display'))
+    rendered = []
+
+    def reportlab(docx_path, output_path, temp_files):
+        rendered.append(docx_path)
+        with open(output_path, 'wb') as f:
+            f.write(b'%PDF-1.4')
+        return True
+
+    monkeypatch.setattr(final_server, 'docx_to_pdf_reportlab', reportlab)
+
+    assert libreoffice_pool.get_pool() is None
+    assert not libreoffice_pool.log_pool_status()
+    assert 'LibreOffice 상주 풀 비활성화' in capsys.readouterr().out
+
+    docx_path = _docx(tmp_path)
+    assert app.docx_to_pdf(docx_path, str(tmp_path / 'out.pdf'))
+    assert rendered == [docx_path]
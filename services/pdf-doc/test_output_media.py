@@ -0,0 +1,61 @@
+import io
+import zipfile
+
+import pytest
+
+docx = pytest.importorskip('docx')
+from PIL import Image
+
+from output_media import OutputMedia, media_for
+
+
+def _png(size, color=(200, 30, 30)):
+    buffer = io.BytesIO()
+    Image.new('RGB', size, color).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def _media_parts(doc):
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    with zipfile.ZipFile(buffer) as package:
+        return [name for name in package.namelist() if name.startswith('word/media/')]
+
+
+def test_repeated_image_is_stored_once_and_downsampled_to_placement():
+    logo = _png((2000, 1000))
+    doc = docx.Document()
+    media = media_for(doc)
+    assert media_for(doc) is media
+    for _ in range(5):
+        media.add_docx_picture(doc, logo, width=docx.shared.Inches(2))
+    media.add_docx_picture(doc, _png((50, 50), (0, 0, 255)), width=docx.shared.Inches(1))
+
+    assert len(_media_parts(doc)) == 2
+    assert media.stats['unique_images'] == 2 and media.stats['reused'] == 4
+    assert media.stats['downsampled'] == 1
+    # 2인치 x 220dpi = 440px 까지만 유지 (작은 이미지는 그대로)
+    stored = Image.open(io.BytesIO(media.prepare(logo, 2)))
+    assert stored.size == (440, 220)
+    assert media.prepare(_png((50, 50), (0, 0, 255)), 1) == _png((50, 50), (0, 0, 255))
+
+
+def test_size_budget_recompresses_without_alpha():
+    noisy = Image.effect_noise((600, 600), 80).convert('RGB')
+    buffer = io.BytesIO()
+    noisy.save(buffer, 'PNG')
+    data = buffer.getvalue()
+
+    media = OutputMedia(max_dpi=300, max_bytes=len(data) // 4)
+    prepared = media.prepare(data, 2)
+    assert Image.open(io.BytesIO(prepared)).format == 'JPEG'
+    assert len(prepared) < len(data) // 4
+    assert media.stats['recompressed'] == 1
+
+    # 필요한 크기보다 크게 요청하면 더 큰 버전으로 교체, 이후 작은 배치는 큰 버전 재사용
+    small = OutputMedia()
+    first = small.prepare(_png((1000, 1000)), 1)
+    larger = small.prepare(_png((1000, 1000)), 4)
+    assert Image.open(io.BytesIO(first)).size == (220, 220)
+    assert larger == _png((1000, 1000))
+    assert small.prepare(_png((1000, 1000)), 1) == larger
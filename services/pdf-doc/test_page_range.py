@@ -0,0 +1,105 @@
+import time
+
+import pytest
+
+import conversion_jobs
+from engine_registry import engine_lock
+from page_range import page_runs, page_subset, parse_page_range
+
+
+def test_parse_page_range():
+    assert parse_page_range('', 4) == [0, 1, 2, 3]
+    assert parse_page_range('1-2, 4', 5) == [0, 1, 3]
+    assert parse_page_range('3-', 5) == [2, 3, 4]
+    assert parse_page_range('-2,2', 5) == [0, 1]
+    assert page_runs([0, 1, 3, 5, 6]) == [(0, 1), (3, 3), (5, 6)]
+    for spec in ('0', '2-1', '6', 'a'):
+        with pytest.raises(ValueError):
+            parse_page_range(spec, 5)
+
+
+def test_page_subset_contains_only_selected_pages(tmp_path):
+    fitz = pytest.importorskip('fitz')
+    pdf_path = str(tmp_path / 'doc.pdf')
+    doc = fitz.open()
+    for i in range(5):
+        doc.new_page().insert_text((72, 72), f'page {i + 1}')
+    doc.save(pdf_path)
+    doc.close()
+
+    with page_subset(pdf_path, None) as path:
+        assert path == pdf_path
+    with page_subset(pdf_path, [0, 1, 2, 3, 4]) as path:
+        assert path == pdf_path
+    with page_subset(pdf_path, [1, 3, 4]) as path:
+        with fitz.open(path) as subset:
+            assert [p.get_text().strip() for p in subset] == ['page 2', 'page 4', 'page 5']
+    assert not (tmp_path / path).exists()
+
+
+def test_background_job_reports_status_and_output(tmp_path, monkeypatch):
+    monkeypatch.setattr(conversion_jobs, 'JOB_OUTPUT_FOLDER', str(tmp_path))
+    monkeypatch.setattr(conversion_jobs.file_reaper, 'add_directories', lambda directories: None)
+    monkeypatch.setattr(conversion_jobs, '_executor', None)
+    source = tmp_path / 'in.pdf'
+    source.write_bytes(b'%PDF-1.4')
+
+    def convert(input_path, output_path):
+        with open(input_path, 'rb') as src, open(output_path, 'wb') as dst:
+            dst.write(src.read())
+        return True
+
+    job_id = conversion_jobs.submit_job(convert, str(source), 'in.docx')
+    for _ in range(100):
+        state = conversion_jobs.job_status(job_id)
+        if state['status'] != 'running':
+            break
+        time.sleep(0.02)
+
+    assert state['status'] == 'done'
+    assert state['download_name'] == 'in.docx'
+    with open(conversion_jobs.job_output_path(job_id), 'rb') as f:
+        assert f.read() == b'%PDF-1.4'
+    assert conversion_jobs.job_status('../etc/passwd') is None
+
+
+def test_convert_not_blocked_by_background_adobe_job(tmp_path, monkeypatch):
+    app = pytest.importorskip('app')
+    monkeypatch.setattr(conversion_jobs, 'JOB_OUTPUT_FOLDER', str(tmp_path))
+    monkeypatch.setattr(conversion_jobs.file_reaper, 'add_directories', lambda directories: None)
+    monkeypatch.setattr(conversion_jobs, '_executor', None)
+    source = tmp_path / 'in.pdf'
+    source.write_bytes(b'%PDF-1.4')
+
+    # 백그라운드 작업은 Adobe 네트워크 변환에 오래 머무름
+    def slow_adobe(input_path, output_path):
+        time.sleep(1.0)
+        with open(output_path, 'wb') as f:
+            f.write(b'docx')
+        return True
+
+    def quick_fallback(pdf_path, output_path, quality='medium', pages=None):
+        # 요청 스레드의 변환은 PyMuPDF/pdf2docx 잠금을 바로 얻어야 함
+        assert engine_lock.acquire(timeout=0.2)
+        engine_lock.release()
+        return True
+
+    monkeypatch.setattr(app, 'adobe_pdf_to_docx', slow_adobe)
+    monkeypatch.setattr(app, 'pdf_to_docx', quick_fallback)
+
+    job_id = conversion_jobs.submit_job(
+        lambda src, dst: app.convert_pdf_to_docx(src, dst, 'medium', True)[0], str(source), 'in.docx')
+    time.sleep(0.1)
+
+    started = time.perf_counter()
+    ok, error = app.convert_pdf_to_docx(str(source), str(tmp_path / 'sync.docx'), 'medium', False)
+    elapsed = time.perf_counter() - started
+    assert ok and error is None
+    assert conversion_jobs.job_status(job_id)['status'] == 'running'
+    assert elapsed < 0.5
+
+    for _ in range(100):
+        if conversion_jobs.job_status(job_id)['status'] != 'running':
+            break
+        time.sleep(0.02)
+    assert conversion_jobs.job_status(job_id)['status'] == 'done'
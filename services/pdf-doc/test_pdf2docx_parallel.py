@@ -0,0 +1,139 @@
+import time
+
+import pytest
+
+import pdf2docx_parallel
+from pdf2docx_parallel import partition_pages, should_parallelize
+
+
+def test_partition_pages_keeps_order_and_balances():
+    parts = partition_pages(range(10), workers=2, min_pages_per_part=2)
+    assert [len(part) for part in parts] == [3, 3, 2, 2]
+    assert [page for part in parts for page in part] == list(range(10))
+    assert partition_pages([4, 7], workers=4, min_pages_per_part=3) == [[4, 7]]
+    assert partition_pages([], workers=2) == []
+
+
+def test_should_parallelize_needs_workers_and_pages(monkeypatch):
+    monkeypatch.setattr(pdf2docx_parallel, 'PDF2DOCX_PARALLEL_MIN_PAGES', 10)
+    assert should_parallelize(10, workers=2)
+    assert not should_parallelize(9, workers=2)
+    assert not should_parallelize(100, workers=1)
+
+
+def test_parallel_output_matches_serial_text(tmp_path):
+    fitz = pytest.importorskip('fitz')
+    pytest.importorskip('pdf2docx')
+    docx = pytest.importorskip('docx')
+
+    pdf_path = str(tmp_path / 'doc.pdf')
+    pdf = fitz.open()
+    for i in range(6):
+        pdf.new_page().insert_text((72, 72), f'Page {i + 1} text')
+    pdf.save(pdf_path)
+    pdf.close()
+
+    pdf2docx_parallel.convert_serial(pdf_path, str(tmp_path / 'serial.docx'))
+    pdf2docx_parallel.convert_parallel(pdf_path, str(tmp_path / 'parallel.docx'), workers=2)
+
+    def texts(path):
+        return [p.text.strip() for p in docx.Document(path).paragraphs if p.text.strip()]
+
+    assert texts(str(tmp_path / 'parallel.docx')) == texts(str(tmp_path / 'serial.docx'))
+    assert texts(str(tmp_path / 'parallel.docx'))[0] == 'Page 1 text'
+
+
+def test_broken_pool_is_discarded(monkeypatch, tmp_path):
+    from concurrent.futures.process import BrokenProcessPool
+
+    class BrokenPool:
+        shut_down = False
+
+        def map(self, *args):
+            raise BrokenProcessPool('worker died')
+
+        def shutdown(self, wait=True, cancel_futures=False):
+            self.shut_down = True
+
+    broken = BrokenPool()
+    monkeypatch.setattr(pdf2docx_parallel, '_pool', broken)
+    monkeypatch.setattr(pdf2docx_parallel, '_pool_pid', pdf2docx_parallel.os.getpid())
+    monkeypatch.setattr(pdf2docx_parallel, '_pool_workers', 2)
+
+    with pytest.raises(BrokenProcessPool):
+        pdf2docx_parallel.convert_parallel(str(tmp_path / 'doc.pdf'), str(tmp_path / 'out.docx'),
+                                           pages=list(range(12)), workers=2)
+    # 다음 변환은 깨진 풀 대신 새 풀을 만듦
+    assert broken.shut_down
+    assert pdf2docx_parallel._pool is None
+
+
+def test_merge_remaps_list_numbering(tmp_path):
+    docx = pytest.importorskip('docx')
+    from docx_merge import merge_docx, _numbering_part, _w
+
+    paths = []
+    for index in range(2):
+        document = docx.Document()
+        for item in range(2):
+            document.add_paragraph(f'part {index} item {item}', style='List Number')
+        # 조각마다 같은 numId를 쓰는 직접 번호 매기기 목록
+        paragraph = document.add_paragraph(f'part {index} direct')
+        num_pr = paragraph._p.get_or_add_pPr().get_or_add_numPr()
+        num_pr.get_or_add_ilvl().val = 0
+        num_pr.get_or_add_numId().val = 1
+        path = str(tmp_path / f'part_{index}.docx')
+        document.save(path)
+        paths.append(path)
+
+    merge_docx(paths, str(tmp_path / 'merged.docx'))
+    merged = docx.Document(str(tmp_path / 'merged.docx'))
+    numbering = _numbering_part(merged).element
+    defined = {num.get(_w('numId')) for num in numbering.iterchildren(_w('num'))}
+    used = [num_id.get(_w('val')) for num_id in merged.element.body.iter(_w('numId'))]
+    assert len(used) == 2 and used[0] != used[1]
+    assert set(used) <= defined
+    abstract_ids = [a.get(_w('abstractNumId')) for a in numbering.iterchildren(_w('abstractNum'))]
+    assert len(abstract_ids) == len(set(abstract_ids))
+
+
+class _FakePool:
+    def __init__(self, max_workers=None, mp_context=None):
+        self.shut_down = False
+
+    def map(self, fn, *iterables):
+        return map(fn, *iterables)
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+def test_idle_pool_is_shut_down(monkeypatch):
+    monkeypatch.setattr(pdf2docx_parallel, 'ProcessPoolExecutor', _FakePool)
+    monkeypatch.setattr(pdf2docx_parallel, 'PDF2DOCX_POOL_IDLE_SECONDS', 0.1)
+    monkeypatch.setattr(pdf2docx_parallel, '_pool', None)
+
+    with pdf2docx_parallel._checkout_pool(2) as first:
+        pass
+    # 유휴 시간 안에 다시 빌리면 같은 풀을 재사용하고, 쓰는 동안에는 종료하지 않음
+    with pdf2docx_parallel._checkout_pool(2) as second:
+        time.sleep(0.3)
+        assert second is first and not first.shut_down
+    time.sleep(0.3)
+    assert first.shut_down
+    assert pdf2docx_parallel._pool is None
+
+    # 종료 후 다음 변환은 새 풀을 만듦
+    with pdf2docx_parallel._checkout_pool(2) as third:
+        assert third is not first
+    pdf2docx_parallel._cancel_idle_timer()
+
+
+def test_zero_idle_seconds_shuts_down_after_each_use(monkeypatch):
+    monkeypatch.setattr(pdf2docx_parallel, 'ProcessPoolExecutor', _FakePool)
+    monkeypatch.setattr(pdf2docx_parallel, 'PDF2DOCX_POOL_IDLE_SECONDS', 0)
+    monkeypatch.setattr(pdf2docx_parallel, '_pool', None)
+
+    with pdf2docx_parallel._checkout_pool(2) as pool:
+        assert not pool.shut_down
+    assert pool.shut_down and pdf2docx_parallel._pool is None
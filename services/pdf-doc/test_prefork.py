@@ -0,0 +1,41 @@
+import gc
+import sys
+
+import pytest
+
+import cv_kernels
+import prefork
+
+
+def test_cv_kernels_are_cached_and_read_only():
+    pytest.importorskip('cv2')
+    kernel = cv_kernels.structuring_element('MORPH_RECT', (30, 1))
+    assert kernel is cv_kernels.structuring_element('MORPH_RECT', (30, 1))
+    assert kernel.shape == (1, 30)
+    assert not kernel.flags.writeable
+
+    ones = cv_kernels.ones_kernel((3, 3))
+    assert ones is cv_kernels.ones_kernel((3, 3))
+    assert ones.sum() == 9
+
+
+def test_warm_up_loads_shared_resources(monkeypatch):
+    monkeypatch.setenv('PREFORK_ENGINES', '')
+    try:
+        report = prefork.warm_up()
+    finally:
+        if hasattr(gc, 'unfreeze'):
+            gc.unfreeze()
+
+    assert {'fonts', 'filters', 'document_templates'} <= set(report['timings'])
+    for module in prefork.FILTER_MODULES:
+        assert module in sys.modules
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="/proc 필요")
+def test_memory_report_for_current_process():
+    report = prefork.memory_report()
+    assert len(report['workers']) == 1
+    worker = report['workers'][0]
+    assert worker['rss_kb'] > 0
+    assert worker['shared_kb'] + worker['private_kb'] <= worker['rss_kb'] + 4
@@ -0,0 +1,65 @@
+import os
+import tempfile
+
+import pytest
+
+from scratch_space import ScratchSpace, current_scratch, scratch_dir, scratch_space
+
+
+def test_scratch_space_is_removed_on_exit(tmp_path):
+    with scratch_space('test', root=str(tmp_path)) as scratch:
+        path = scratch.path('sub/input.pdf')
+        with open(path, 'wb') as f:
+            f.write(b'%PDF')
+        assert os.path.dirname(path) == scratch.ram_dir
+        assert current_scratch() is scratch
+        assert scratch_dir() == scratch.ram_dir
+        job_dir = scratch.ram_dir
+
+    assert not os.path.exists(job_dir)
+    assert current_scratch() is None
+    assert scratch_dir() is None
+
+
+def test_files_over_quota_spill_to_disk(tmp_path):
+    spill_root = tmp_path / 'spill'
+    spill_root.mkdir()
+    with ScratchSpace('test', root=str(tmp_path), quota_mb=1, spill_root=str(spill_root)) as scratch:
+        small = scratch.path('small.png', size_hint=1024)
+        large = scratch.path('large.pdf', size_hint=2 * 1024 * 1024)
+        assert os.path.dirname(small) == scratch.ram_dir
+        assert os.path.dirname(large) == scratch.spill_dir
+        assert scratch.spilled_files == 1
+        spill_dir = scratch.spill_dir
+
+    assert not os.path.exists(spill_dir)
+
+
+def test_nested_scratch_space_reuses_parent(tmp_path):
+    with scratch_space('outer', root=str(tmp_path)) as outer:
+        with scratch_space('inner') as inner:
+            assert inner is outer
+            extract_dir = tempfile.mkdtemp(dir=scratch_dir())
+        assert os.path.isdir(extract_dir)
+    assert not os.path.exists(extract_dir)
+
+
+def test_usage_is_a_running_count(tmp_path, monkeypatch):
+    def allocate(scratch, name, size_hint):
+        # 할당마다 디렉토리 트리를 다시 읽지 않음
+        with monkeypatch.context() as patch:
+            patch.setattr(os, 'scandir', lambda path: pytest.fail('scanned scratch tree'))
+            return os.path.dirname(scratch.path(name, size_hint=size_hint))
+
+    with ScratchSpace('test', root=str(tmp_path), quota_mb=1) as scratch:
+        assert allocate(scratch, 'a.pdf', 300 * 1024) == scratch.ram_dir
+        with scratch.subdir(prefix='parts_', size_hint=500 * 1024) as parts:
+            assert scratch.usage() == 800 * 1024
+            # 한도(1MB)를 넘는 할당은 spill
+            assert allocate(scratch, 'b.pdf', 300 * 1024) == scratch.spill_dir
+        assert not os.path.exists(parts)
+        assert scratch.usage() == 300 * 1024
+
+        scratch.release(os.path.join(scratch.ram_dir, 'a.pdf'))
+        assert scratch.usage() == 0
+        assert allocate(scratch, 'c.pdf', 900 * 1024) == scratch.ram_dir
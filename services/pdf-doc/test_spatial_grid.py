@@ -0,0 +1,71 @@
+import io
+import random
+
+import pytest
+
+from spatial_grid import SpatialGrid, nearest_targets, nearest_targets_legacy
+
+
+def test_grid_matches_nested_loop_including_ties_and_limit():
+    rng = random.Random(3)
+    targets = []
+    for index in range(300):
+        x, y = rng.uniform(0, 800), rng.uniform(0, 600)
+        targets.append((index, (x, y, x + rng.uniform(5, 120), y + rng.uniform(5, 120))))
+    # 같은 중심점의 대상이 여러 개면 먼저 넣은 대상이 선택되어야 함
+    targets.append(('duplicate', targets[10][1]))
+    queries = [target_rect for _, target_rect in targets[:50]]
+    for _ in range(1000):
+        x, y = rng.uniform(-100, 900), rng.uniform(-100, 700)
+        queries.append((x, y, x + rng.uniform(5, 200), y + rng.uniform(5, 60)))
+
+    for max_distance in (15.0, 120.0, 250.0):
+        assert nearest_targets(queries, targets, max_distance) == nearest_targets_legacy(queries, targets, max_distance)
+
+    grid = SpatialGrid(50)
+    assert grid.nearest((0, 0, 1, 1)) == (None, float('inf'))
+    grid.insert('a', (100, 100, 110, 110))
+    assert grid.nearest((0, 0, 10, 10), max_distance=100)[0] is None
+    assert grid.nearest((0, 0, 10, 10))[0] == 'a'
+
+
+def test_presentation_layout_associations_unchanged():
+    fitz = pytest.importorskip('fitz')
+    Image = pytest.importorskip('PIL.Image')
+    from ultimate_image_converter import UltimateImageConverter
+
+    pdf = fitz.open()
+    page = pdf.new_page(width=842, height=595)
+    # 좌우 가장자리 캐릭터 이미지 2개와 가운데 말풍선 크기 이미지 1개
+    for color, rect in (((255, 0, 0), (20, 150, 170, 350)), ((0, 0, 255), (670, 200, 820, 400)),
+                        ((0, 255, 0), (320, 200, 520, 300))):
+        buffer = io.BytesIO()
+        Image.new('RGB', (30, 30), color).save(buffer, 'PNG')
+        page.insert_image(fitz.Rect(rect), stream=buffer.getvalue())
+
+    rng = random.Random(5)
+    text_blocks = []
+    for _ in range(200):
+        x, y = rng.uniform(0, 800), rng.uniform(0, 560)
+        text_blocks.append({'text': 't', 'x': x, 'y': y, 'width': rng.uniform(10, 200), 'height': 14})
+
+    converter = UltimateImageConverter()
+    analysis = converter._analyze_presentation_layout(page, text_blocks, page.get_images(full=True))
+    assert len(analysis['character_regions']) == 2
+    assert len(analysis['speech_bubble_regions']) == 1
+    assert analysis['layout_type'] == 'comic_presentation'
+
+    # 기존 이중 루프(모든 텍스트 x 모든 캐릭터 영역)와 같은 연결
+    expected = []
+    for block in text_blocks:
+        text_rect = fitz.Rect(block['x'], block['y'], block['x'] + block['width'], block['y'] + block['height'])
+        distances = [converter._calculate_distance(text_rect, region['rect'])
+                     for region in analysis['character_regions']]
+        distance = min(distances)
+        if distance < page.rect.width * 0.3:
+            expected.append((block['x'], distances.index(distance), distance,
+                             'dialogue' if distance < page.rect.width * 0.15 else 'related'))
+    actual = [(a['text_block']['x'], analysis['character_regions'].index(a['character_region']),
+               a['distance'], a['relationship']) for a in analysis['text_image_associations']]
+    assert actual == expected and expected
+    pdf.close()
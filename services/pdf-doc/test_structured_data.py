@@ -0,0 +1,49 @@
+import codecs
+import io
+import json
+
+import pytest
+
+from structured_data import iter_elements, iter_pages, sample_structured_data
+
+
+def _payload():
+    data = {
+        'version': {'json_export': '1.1.0'},
+        'extended_metadata': {'note': 'elements: [ "}" 아님 ]', 'count': 1234567},
+        'elements': [
+            {'Path': '//Document/P', 'Page': 0, 'Text': '중괄호 } 와 대괄호 ] 그리고 "따옴표" \\ 역슬래시', 'TextSize': 10.25},
+            {'Path': '//Document/Figure', 'Page': 0, 'Bounds': [72, 100, 300.5, 180], 'filePaths': ['figures/a.png']},
+            {'Path': '//Document/Table', 'Page': 1, 'Bounds': [1e2, 2.5e-1, 3, 4], 'attributes': {'NumRow': 3}},
+            {'Path': '//Document/P[2]', 'Page': 1, 'Text': '🎯 이모지와 한글', 'Empty': [], 'Flag': None},
+        ],
+        'pages': [{'page_number': 0}, {'page_number': 1}],
+    }
+    return data, json.dumps(data, ensure_ascii=False, indent=1).encode('utf-8')
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 64, 1 << 16])
+def test_stream_matches_json_load(chunk_size):
+    data, payload = _payload()
+    # 청크 경계가 멀티바이트 문자/숫자/문자열 중간에 걸려도 같은 결과
+    assert list(iter_elements(io.BytesIO(payload), chunk_size)) == data['elements']
+    assert list(iter_elements(io.BytesIO(codecs.BOM_UTF8 + payload), chunk_size)) == data['elements']
+    assert list(iter_elements(io.StringIO(payload.decode('utf-8')), chunk_size)) == data['elements']
+
+    assert list(iter_elements(io.BytesIO(b'{}'))) == []
+    assert list(iter_elements(io.BytesIO(b'{"version": 1, "elements": []}'))) == []
+    with pytest.raises(ValueError):
+        list(iter_elements(io.BytesIO(payload[:-40]), chunk_size))
+
+
+def test_pages_and_adobe_parser_in_one_pass():
+    payload = sample_structured_data(page_count=3, elements_per_page=60)
+    pages = [(page, len(elements)) for page, elements in iter_pages(iter_elements(io.BytesIO(payload)))]
+    assert pages == [(0, 60), (1, 60), (2, 60)]
+
+    working_server = pytest.importorskip('working_server')
+    streamed = working_server.parse_adobe_elements(iter_elements(io.BytesIO(payload)))
+    loaded = working_server.parse_adobe_elements(json.loads(payload))
+    assert [blocks.kind_counts() for blocks in streamed] == [blocks.kind_counts() for blocks in loaded]
+    assert [list(blocks.texts()) for blocks in streamed] == [list(blocks.texts()) for blocks in loaded]
+    assert streamed[0].kind_counts() == {'text': 59, 'vector_image': 1, 'table': 0}
@@ -0,0 +1,59 @@
+import io
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfgen import canvas
+
+from text_layout import draw_text_lines, glyph_widths, wrap_text
+
+FONT = 'Helvetica'
+
+
+def test_wraps_at_word_boundaries_within_width():
+    """단어 경계에서 줄바꿈하며 모든 줄이 최대 폭 이내"""
+    text = "the quick brown fox jumps over the lazy dog " * 20
+    lines = wrap_text(text, FONT, 11, 200)
+
+    assert len(lines) > 1
+    for line in lines:
+        assert pdfmetrics.stringWidth(line, FONT, 11) <= 200
+        assert not line.startswith(' ') and not line.endswith(' ')
+    assert ' '.join(lines).split() == text.split()
+
+
+def test_long_word_is_hard_broken():
+    """나눌 곳이 없는 긴 단어는 글자 단위로 분할"""
+    lines = wrap_text("x" * 500, FONT, 11, 100)
+    assert ''.join(lines) == "x" * 500
+    assert all(pdfmetrics.stringWidth(line, FONT, 11) <= 100 for line in lines)
+
+
+def test_hangul_breaks_between_syllables():
+    """공백 없는 한글은 음절 경계에서 분할되어 내용 손실이 없음"""
+    text = "가나다라마바사아자차카타파하" * 10
+    lines = wrap_text(text, FONT, 11, 120)
+    assert len(lines) > 1
+    assert ''.join(lines) == text
+
+
+def test_explicit_newlines_and_empty_text():
+    assert wrap_text("", FONT, 11, 100) == []
+    assert wrap_text("a\nb", FONT, 11, 100) == ["a", "b"]
+
+
+def test_glyph_width_cache_matches_reportlab():
+    text = "Hello, World"
+    expected = pdfmetrics.stringWidth(text, FONT, 13)
+    assert abs(glyph_widths.string_width(text, FONT, 13) - expected) < 1e-6
+
+
+def test_draw_text_lines_paginates():
+    """페이지 하단에 닿으면 새 페이지에서 이어서 출력"""
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer)
+    lines = [f"line {i}" for i in range(100)]
+
+    y = draw_text_lines(c, 50, 792, lines, FONT, 11, 18, top=792, bottom=50, fake_bold=True)
+    c.save()
+
+    assert c.getPageNumber() > 1
+    assert 50 <= y + 18 <= 792
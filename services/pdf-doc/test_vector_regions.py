@@ -0,0 +1,63 @@
+import io
+
+import pytest
+
+fitz = pytest.importorskip('fitz')
+Image = pytest.importorskip('PIL.Image')
+
+from ultimate_image_converter import UltimateImageConverter
+
+
+def _page():
+    pdf = fitz.open()
+    page = pdf.new_page(width=600, height=800)
+    # 서로 가까운 두 도형(한 영역)과 멀리 떨어진 원 하나, 영역으로 만들지 않는 가는 선
+    page.draw_rect(fitz.Rect(50, 50, 150, 120), color=(1, 0, 0), fill=(1, 1, 0))
+    page.draw_rect(fitz.Rect(152, 60, 200, 110), color=(0, 0, 1))
+    page.draw_circle(fitz.Point(400, 600), 40, color=(0, 0, 0), fill=(0, 1, 0))
+    page.draw_line(fitz.Point(0, 400), fitz.Point(600, 400))
+    return pdf, page
+
+
+def test_renders_only_clustered_regions(monkeypatch):
+    pdf, page = _page()
+    converter = UltimateImageConverter()
+    monkeypatch.setattr(converter, '_detect_speech_bubbles', lambda drawings: drawings[2:3])
+    monkeypatch.setattr(converter, '_detect_character_shapes', lambda drawings: [])
+
+    regions = sorted(converter._extract_vector_graphics(page), key=lambda r: r['bbox'][1])
+    assert len(regions) == 2
+
+    top, bottom = regions
+    assert top['bbox'][0] == pytest.approx(49.5, abs=1) and top['bbox'][2] == pytest.approx(200.5, abs=1)
+    assert bottom['bbox'][1] == pytest.approx(560, abs=1)
+    # 원래 위치의 잘린 영역만 3배로 렌더링 (페이지 전체 캔버스 아님)
+    width, height = Image.open(io.BytesIO(top['data'])).size
+    assert width == pytest.approx((top['bbox'][2] - top['bbox'][0]) * 3, abs=2)
+    assert height == pytest.approx((top['bbox'][3] - top['bbox'][1]) * 3, abs=2)
+    assert [top['kind'], bottom['kind']] == ['vector', 'speech_bubble']
+    assert converter.vector_graphics_found == 3
+    pdf.close()
+
+
+def test_page_border_and_text_are_not_rendered_into_regions():
+    pdf = fitz.open()
+    page = pdf.new_page(width=595, height=842)
+    # 페이지 테두리와 배경이 모든 도형을 한 영역으로 묶으면 안 됨
+    page.draw_rect(fitz.Rect(20, 20, 575, 822), color=(0, 0, 0))
+    page.draw_rect(fitz.Rect(0, 0, 595, 842), color=None, fill=(0.95, 0.95, 0.95), overlay=False)
+    page.draw_rect(fitz.Rect(100, 100, 300, 200), color=(0, 0, 1), fill=(1, 1, 1))
+    page.draw_circle(fitz.Point(400, 600), 40, color=(0, 0, 0), fill=(0, 1, 0))
+    # 도형 영역 안의 텍스트는 별도 텍스트 요소로 배치되므로 영역 이미지에 찍히면 안 됨
+    page.insert_text(fitz.Point(120, 150), 'duplicated text', fontsize=14, color=(1, 0, 0))
+
+    converter = UltimateImageConverter()
+    regions = sorted(converter._extract_vector_graphics(page), key=lambda r: r['bbox'][1])
+    assert len(regions) == 2
+    top = regions[0]
+    assert top['bbox'][2] - top['bbox'][0] < 210 and top['bbox'][3] - top['bbox'][1] < 110
+
+    # 빨간 텍스트 픽셀이 없어야 함
+    pixels = Image.open(io.BytesIO(top['data'])).convert('RGB').tobytes()
+    assert not any(pixels[i] > 200 and pixels[i + 1] < 80 and pixels[i + 2] < 80 for i in range(0, len(pixels), 3))
+    pdf.close()
@@ -0,0 +1,147 @@
+from reportlab.pdfbase import pdfmetrics
+
+# 가짜 굵게(fill + stroke) 표현 시 외곽선 두께 (기존 0.5pt 이중 그리기와 비슷한 굵기)
+FAKE_BOLD_STROKE = 0.5
+
+# 글리프 폭은 1000 단위로 캐시하고 글자 크기에 비례해 환산
+_UNITS = 1000.0
+
+
+class GlyphWidthCache:
+    """폰트별 문자 폭 캐시 (pdfmetrics.stringWidth 호출을 문자당 1회로 제한)"""
+
+    def __init__(self):
+        self._fonts = {}
+
+    def widths_for(self, font_name):
+        widths = self._fonts.get(font_name)
+        if widths is None:
+            widths = self._fonts[font_name] = {}
+        return widths
+
+    def char_width(self, font_name, ch):
+        widths = self.widths_for(font_name)
+        width = widths.get(ch)
+        if width is None:
+            width = widths[ch] = pdfmetrics.stringWidth(ch, font_name, _UNITS)
+        return width
+
+    def string_width(self, text, font_name, font_size):
+        widths = self.widths_for(font_name)
+        total = 0.0
+        for ch in text:
+            width = widths.get(ch)
+            if width is None:
+                width = widths[ch] = pdfmetrics.stringWidth(ch, font_name, _UNITS)
+            total += width
+        return total * font_size / _UNITS
+
+
+glyph_widths = GlyphWidthCache()
+
+
+def is_wide_char(ch):
+    """한글 음절/자모, 가나, 한자 - 글자 사이 어디서든 줄바꿈 가능"""
+    return ('\uac00' <= ch <= '\ud7a3' or '\u1100' <= ch <= '\u11ff' or
+            '\u3130' <= ch <= '\u318f' or '\u3040' <= ch <= '\u30ff' or
+            '\u4e00' <= ch <= '\u9fff')
+
+
+def wrap_text(text, font_name, font_size, max_width, cache=glyph_widths):
+    """
+    실제 글리프 폭 기준 줄바꿈 (단일 선형 패스)
+
+    공백 뒤와 한글/CJK 글자 경계에서 줄을 나누며, 나눌 곳이 없는 긴 단어는
+    글자 단위로 강제 분할한다.
+
+    Returns:
+        list: 줄 문자열 목록
+    """
+    if not text:
+        return []
+
+    widths = cache.widths_for(font_name)
+    scale = font_size / _UNITS
+    lines = []
+    start = 0          # 현재 줄 시작 인덱스
+    width = 0.0        # text[start:i] 폭
+    brk = -1           # 마지막 줄바꿈 가능 위치
+    brk_width = 0.0    # text[start:brk] 폭
+    prev = ''
+
+    for i, ch in enumerate(text):
+        if ch == '\n':
+            lines.append(text[start:i].rstrip())
+            start, width, brk, prev = i + 1, 0.0, -1, ''
+            continue
+
+        # 자동 줄바꿈 직후 줄 첫머리 공백은 버림
+        if ch == ' ' and i == start and lines:
+            start = i + 1
+            prev = ch
+            continue
+
+        if i > start and (prev == ' ' or is_wide_char(ch) or is_wide_char(prev)):
+            brk, brk_width = i, width
+
+        w = widths.get(ch)
+        if w is None:
+            w = widths[ch] = pdfmetrics.stringWidth(ch, font_name, _UNITS)
+        w *= scale
+
+        if width + w > max_width and i > start:
+            if brk > start:
+                lines.append(text[start:brk].rstrip())
+                width -= brk_width
+                start = brk
+            else:
+                lines.append(text[start:i])
+                width = 0.0
+                start = i
+            brk = -1
+
+        width += w
+        prev = ch
+
+    tail = text[start:].rstrip()
+    if tail or not lines:
+        lines.append(tail)
+    return lines
+
+
+def draw_text_lines(canvas_obj, x, y, lines, font_name, font_size, leading,
+                    top, bottom, fake_bold=False):
+    """
+    여러 줄을 페이지 단위 텍스트 객체 하나로 출력 (페이지 넘김 처리 포함)
+
+    Returns:
+        float: 다음 출력 y 좌표
+    """
+    index = 0
+    while index < len(lines):
+        if y < bottom + leading:
+            canvas_obj.showPage()
+            y = top
+
+        fit = max(1, int((y - bottom - leading) // leading) + 1)
+        chunk = lines[index:index + fit]
+
+        text_obj = canvas_obj.beginText(x, y)
+        text_obj.setFont(font_name, font_size, leading)
+        if fake_bold:
+            text_obj.setTextRenderMode(2)
+        for line in chunk:
+            text_obj.textLine(line)
+
+        if fake_bold:
+            canvas_obj.saveState()
+            canvas_obj.setLineWidth(FAKE_BOLD_STROKE)
+            canvas_obj.drawText(text_obj)
+            canvas_obj.restoreState()
+        else:
+            canvas_obj.drawText(text_obj)
+
+        y -= leading * len(chunk)
+        index += len(chunk)
+
+    return y
@@ -8,12 +8,26 @@ from docx import Document
 from docx.shared import Inches, Cm
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.section import WD_ORIENT
-from PIL import Image, ImageDraw
+from PIL import Image
 import io
 import os
 import logging
-import tempfile
 import re
+from output_media import media_for
+from spatial_grid import SpatialGrid, center_distance
+
+# 환경변수 기반 설정
+# 벡터 그래픽 영역 렌더링 배율
+VECTOR_RENDER_ZOOM = float(os.environ.get('VECTOR_RENDER_ZOOM', '3'))
+# 이 거리(pt) 이내의 도형은 한 영역으로 묶음
+VECTOR_CLUSTER_GAP_PT = float(os.environ.get('VECTOR_CLUSTER_GAP_PT', '6'))
+# 이보다 작은 도형(가는 선 등)과 영역은 렌더링하지 않음
+VECTOR_MIN_SHAPE_PT = float(os.environ.get('VECTOR_MIN_SHAPE_PT', '5'))
+VECTOR_MIN_REGION_PT = float(os.environ.get('VECTOR_MIN_REGION_PT', '12'))
+VECTOR_MAX_REGIONS = int(os.environ.get('VECTOR_MAX_REGIONS', '12'))
+# 페이지 면적 대비 이 비율을 넘는 도형(페이지 테두리/배경)과 영역은 렌더링하지 않음
+VECTOR_MAX_PAGE_FRACTION = float(os.environ.get('VECTOR_MAX_PAGE_FRACTION', '0.5'))
+
 
 class UltimateImageConverter:
     def __init__(self):
@@ -117,13 +131,14 @@ class UltimateImageConverter:
             try:
                 # 말풍선 특징 감지
                 if 'items' in drawing:
-                    paths = drawing['items']
+                    # 경로마다 문자열 변환은 한 번만
+                    paths = [str(path).lower() for path in drawing['items']]
                     
                     # 곡선이 포함된 경로 찾기 (말풍선의 둥근 모서리)
-                    has_curves = any('c' in str(path).lower() or 'q' in str(path).lower() for path in paths)
+                    has_curves = any('c' in path or 'q' in path for path in paths)
                     
                     # 닫힌 경로인지 확인 (말풍선은 보통 닫힌 도형)
-                    is_closed = any('z' in str(path).lower() for path in paths)
+                    is_closed = any('z' in path for path in paths)
                     
                     # 적절한 크기인지 확인 (너무 작거나 크지 않은)
                     if 'rect' in drawing:
@@ -172,92 +187,154 @@ class UltimateImageConverter:
                 
         return character_shapes
 
+    @staticmethod
+    def _is_page_sized(rect, page_area):
+        """페이지 테두리/배경처럼 페이지 면적의 VECTOR_MAX_PAGE_FRACTION을 넘는 상자인지"""
+        area = abs(rect[2] - rect[0]) * abs(rect[3] - rect[1])
+        return page_area > 0 and area > page_area * VECTOR_MAX_PAGE_FRACTION
+
+    def _cluster_vector_regions(self, drawings, page_area=0):
+        """그리기 명령 경계 상자를 가까운 것끼리 묶어 영역 목록을 만듭니다 (각 영역: 경계 상자 + 포함된 drawing 목록).
+
+        page_area가 주어지면 페이지 크기 도형(테두리/배경)은 다른 도형을 모두 한 영역으로 끌어들이므로 제외합니다.
+        """
+        gap = VECTOR_CLUSTER_GAP_PT
+        clusters = []
+        candidates = [d for d in drawings
+                      if 'rect' in d and abs(d['rect'][2] - d['rect'][0]) > VECTOR_MIN_SHAPE_PT
+                      and abs(d['rect'][3] - d['rect'][1]) > VECTOR_MIN_SHAPE_PT
+                      and not self._is_page_sized(d['rect'], page_area)]
+        for drawing in sorted(candidates, key=lambda d: d['rect'][1]):
+            x0, y0, x1, y1 = drawing['rect']
+            members = [drawing]
+            # 새 상자와 겹치거나 gap 이내로 가까운 기존 영역을 모두 흡수
+            merged = True
+            while merged:
+                merged = False
+                for cluster in clusters:
+                    cx0, cy0, cx1, cy1 = cluster['bbox']
+                    if cx0 - gap <= x1 and x0 <= cx1 + gap and cy0 - gap <= y1 and y0 <= cy1 + gap:
+                        x0, y0, x1, y1 = min(x0, cx0), min(y0, cy0), max(x1, cx1), max(y1, cy1)
+                        members.extend(cluster['drawings'])
+                        clusters.remove(cluster)
+                        merged = True
+                        break
+            clusters.append({'bbox': (x0, y0, x1, y1), 'drawings': members})
+        return clusters
+
+    def _replay_drawings(self, page, drawings, page_area):
+        """페이지 크기 도형을 뺀 그리기 경로만 같은 크기의 빈 페이지에 다시 그립니다 (텍스트/이미지 제외).
+
+        Returns:
+            tuple: (임시 문서, 경로만 그려진 페이지) - 렌더링 후 문서를 닫아야 합니다.
+        """
+        canvas_doc = fitz.open()
+        canvas = canvas_doc.new_page(width=page.rect.width, height=page.rect.height)
+        shape = canvas.new_shape()
+        for drawing in drawings:
+            if 'rect' in drawing and self._is_page_sized(drawing['rect'], page_area):
+                continue
+            try:
+                for item in drawing.get('items', []):
+                    if item[0] == 'l':
+                        shape.draw_line(item[1], item[2])
+                    elif item[0] == 're':
+                        shape.draw_rect(item[1])
+                    elif item[0] == 'qu':
+                        shape.draw_quad(item[1])
+                    elif item[0] == 'c':
+                        shape.draw_bezier(item[1], item[2], item[3], item[4])
+                line_cap = drawing.get('lineCap')
+                shape.finish(
+                    fill=drawing.get('fill'),
+                    color=drawing.get('color'),
+                    dashes=drawing.get('dashes'),
+                    even_odd=drawing.get('even_odd', False),
+                    closePath=drawing.get('closePath', False),
+                    lineJoin=drawing.get('lineJoin') or 0,
+                    lineCap=max(line_cap) if line_cap else 0,
+                    width=drawing.get('width') or 0,
+                    stroke_opacity=1 if drawing.get('stroke_opacity') is None else drawing['stroke_opacity'],
+                    fill_opacity=1 if drawing.get('fill_opacity') is None else drawing['fill_opacity'],
+                )
+            except Exception as replay_error:
+                self.logger.warning(f"    - 벡터 경로 복사 실패: {replay_error}")
+        shape.commit()
+        return canvas_doc, canvas
+
     def _extract_vector_graphics(self, page):
-        """페이지에서 벡터 그래픽(선, 도형, 말풍선 등)을 추출하여 이미지로 변환합니다."""
+        """페이지의 벡터 그래픽(선, 도형, 말풍선 등) 영역만 잘라 렌더링합니다.
+
+        그리기 명령 경계 상자를 영역으로 묶고, 그리기 경로만 빈 페이지에 옮겨 그린 뒤 각 영역을
+        get_pixmap(clip=...)으로 렌더링합니다. 원본 페이지를 잘라 렌더링하면 영역 안의 텍스트와
+        래스터 이미지가 함께 찍혀 따로 배치되는 텍스트/이미지와 중복되므로 경로만 렌더링합니다.
+
+        Returns:
+            list: [{'data': PNG bytes, 'bbox': (x0, y0, x1, y1), 'kind': 'speech_bubble'|'character'|'vector'}]
+        """
         if not FITZ_AVAILABLE:
             self.logger.warning("PyMuPDF (fitz) 라이브러리를 사용할 수 없어 벡터 그래픽 추출을 건너뜁니다.")
-            return None
+            return []
             
+        regions = []
         try:
             # 페이지의 모든 그리기 명령어 추출
             drawings = page.get_drawings()
             if not drawings:
-                return None
+                return []
                 
             self.logger.info(f"    - {len(drawings)}개의 벡터 그래픽 발견")
             
-            # 말풍선과 캐릭터 도형 감지
+            # 말풍선과 캐릭터 도형 감지 (우선순위 분류는 id 집합으로 조회)
             speech_bubbles = self._detect_speech_bubbles(drawings)
             character_shapes = self._detect_character_shapes(drawings)
+            speech_ids = {id(drawing) for drawing in speech_bubbles}
+            character_ids = {id(drawing) for drawing in character_shapes}
             
             self.logger.info(f"    - 말풍선 {len(speech_bubbles)}개, 캐릭터 도형 {len(character_shapes)}개 감지")
             
-            # 페이지 크기 가져오기
-            page_rect = page.rect
-            canvas_width = int(page_rect.width * 3)  # 고해상도를 위해 3배 확대
-            canvas_height = int(page_rect.height * 3)
-            
-            # 빈 캔버스 생성 (투명 배경)
-            canvas = Image.new('RGBA', (canvas_width, canvas_height), (255, 255, 255, 0))
-            draw = ImageDraw.Draw(canvas)
-            
+            page_area = page.rect.width * page.rect.height
+            clusters = [cluster for cluster in self._cluster_vector_regions(drawings, page_area)
+                        if not self._is_page_sized(cluster['bbox'], page_area)]
+            if not clusters:
+                return []
+            # 영역이 너무 많으면 큰 영역부터 렌더링
+            clusters.sort(key=lambda c: (c['bbox'][2] - c['bbox'][0]) * (c['bbox'][3] - c['bbox'][1]), reverse=True)
+            matrix = fitz.Matrix(VECTOR_RENDER_ZOOM, VECTOR_RENDER_ZOOM)
             vector_count = 0
+            canvas_doc, canvas = self._replay_drawings(page, drawings, page_area)
             
-            # 우선순위: 말풍선 > 캐릭터 도형 > 일반 벡터 그래픽
-            priority_drawings = speech_bubbles + character_shapes
-            
-            for drawing in drawings:
+            for cluster in clusters[:VECTOR_MAX_REGIONS]:
                 try:
-                    # 벡터 그래픽의 경계 상자 확인
-                    if 'rect' in drawing:
-                        rect = drawing['rect']
-                        # 좌표를 3배로 확대
-                        x1, y1, x2, y2 = int(rect[0]*3), int(rect[1]*3), int(rect[2]*3), int(rect[3]*3)
-                        
-                        # 우선순위 그래픽인지 확인
-                        is_priority = drawing in priority_drawings
-                        
-                        # 선 그리기 (기본적인 벡터 그래픽 표현)
-                        if 'stroke' in drawing or 'fill' in drawing:
-                            # 크기 확인
-                            width = abs(x2-x1)
-                            height = abs(y2-y1)
-                            
-                            if width > 15 and height > 15:  # 최소 크기 확인
-                                # 우선순위 그래픽은 더 두껍게 그리기
-                                line_width = 4 if is_priority else 2
-                                color = (255, 0, 0, 255) if drawing in speech_bubbles else (0, 0, 255, 255) if drawing in character_shapes else (0, 0, 0, 255)
-                                
-                                # 복잡한 경로가 있는 경우 더 정교하게 처리
-                                if 'items' in drawing and len(drawing['items']) > 1:
-                                    # 복잡한 도형은 채우기로 표현
-                                    draw.rectangle([x1, y1, x2, y2], fill=(*color[:3], 128), outline=color, width=line_width)
-                                else:
-                                    # 단순한 도형은 테두리만
-                                    draw.rectangle([x1, y1, x2, y2], outline=color, width=line_width)
-                                
-                                vector_count += 1
-                                
-                except Exception as draw_error:
-                    self.logger.warning(f"    - 개별 벡터 그래픽 처리 실패: {draw_error}")
+                    clip = fitz.Rect(cluster['bbox']) & canvas.rect
+                    if clip.is_empty or clip.width < VECTOR_MIN_REGION_PT or clip.height < VECTOR_MIN_REGION_PT:
+                        continue
+                    # 우선순위: 말풍선 > 캐릭터 도형 > 일반 벡터 그래픽
+                    member_ids = {id(drawing) for drawing in cluster['drawings']}
+                    if member_ids & speech_ids:
+                        kind = 'speech_bubble'
+                    elif member_ids & character_ids:
+                        kind = 'character'
+                    else:
+                        kind = 'vector'
+                    
+                    pix = canvas.get_pixmap(matrix=matrix, clip=clip, alpha=False)
+                    regions.append({'data': pix.tobytes('png'), 'bbox': tuple(clip), 'kind': kind})
+                    vector_count += len(cluster['drawings'])
+                    
+                except Exception as render_error:
+                    self.logger.warning(f"    - 벡터 영역 렌더링 실패: {render_error}")
                     continue
+            canvas_doc.close()
             
-            if vector_count > 0:
-                # 투명 배경을 흰색으로 변경
-                white_bg = Image.new('RGB', (canvas_width, canvas_height), (255, 255, 255))
-                white_bg.paste(canvas, mask=canvas.split()[-1] if canvas.mode == 'RGBA' else None)
-                
-                # PNG로 변환
-                output_stream = io.BytesIO()
-                white_bg.save(output_stream, format="PNG", optimize=True)
+            if regions:
                 self.vector_graphics_found += vector_count
-                self.logger.info(f"    - {vector_count}개의 벡터 그래픽을 이미지로 변환 완료 (말풍선: {len(speech_bubbles)}, 캐릭터: {len(character_shapes)})")
-                return output_stream.getvalue()
+                self.logger.info(f"    - {vector_count}개의 벡터 그래픽을 {len(regions)}개 영역 이미지로 변환 완료 (말풍선: {len(speech_bubbles)}, 캐릭터: {len(character_shapes)})")
                 
         except Exception as e:
             self.logger.warning(f"    - 벡터 그래픽 추출 실패: {e}")
             
-        return None
+        return regions
 
     def _verify_and_process_image(self, img_data):
         """이미지를 검증하고 DOCX 삽입에 안전한 형식으로 처리합니다."""
@@ -387,38 +464,28 @@ class UltimateImageConverter:
             self.logger.error(f"    ❌ 텍스트 우선 모드 페이지 추가 실패: {e}")
     
     def _insert_image_to_docx(self, doc, img_data):
-        """DOCX 문서에 이미지를 삽입합니다."""
+        """DOCX 문서에 이미지를 삽입합니다 (같은 이미지는 문서에 한 번만 저장)."""
         try:
-            # 임시 파일로 이미지 저장
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as temp_file:
-                temp_file.write(img_data)
-                temp_path = temp_file.name
-            
-            # DOCX에 이미지 추가
             paragraph = doc.add_paragraph()
             run = paragraph.add_run()
             
             # 이미지 크기 조정
             try:
-                from PIL import Image
-                with Image.open(temp_path) as img:
+                with Image.open(io.BytesIO(img_data)) as img:
                     width, height = img.size
-                    # 최대 크기 제한 (A4 용지 기준)
-                    max_width = Inches(6)
-                    max_height = Inches(8)
-                    
-                    if width > height:
-                        new_width = min(max_width, Inches(width/100))
-                        run.add_picture(temp_path, width=new_width)
-                    else:
-                        new_height = min(max_height, Inches(height/100))
-                        run.add_picture(temp_path, height=new_height)
+                # 최대 크기 제한 (A4 용지 기준)
+                max_width = Inches(6)
+                max_height = Inches(8)
+                
+                if width > height:
+                    new_width = min(max_width, Inches(width/100))
+                    media_for(doc).add_docx_picture(run, img_data, width=new_width)
+                else:
+                    new_height = min(max_height, Inches(height/100))
+                    media_for(doc).add_docx_picture(run, img_data, height=new_height)
             except Exception:
-                # PIL이 없거나 이미지 처리 실패 시 기본 크기로 삽입
-                run.add_picture(temp_path, width=Inches(4))
-            
-            # 임시 파일 삭제
-            os.unlink(temp_path)
+                # 이미지 처리 실패 시 기본 크기로 삽입
+                media_for(doc).add_docx_picture(run, img_data, width=Inches(4))
             
         except Exception as e:
              self.logger.warning(f"    - 이미지 삽입 실패: {e}")
@@ -470,23 +537,20 @@ class UltimateImageConverter:
                 except Exception as e:
                     self.logger.warning(f"    - 이미지 {i} 분석 실패: {e}")
             
-            # 텍스트와 이미지의 연관성 분석
+            # 텍스트와 이미지의 연관성 분석 (캐릭터 영역을 격자에 넣고 블록마다 주변 셀만 조회)
+            character_grid = SpatialGrid(max(page_width * 0.15, 1.0))
+            for char_region in layout_analysis['character_regions']:
+                character_grid.insert(char_region, char_region['rect'])
+            
             for text_block in text_blocks:
-                text_rect = fitz.Rect(text_block['x'], text_block['y'], 
-                                    text_block['x'] + text_block['width'], 
-                                    text_block['y'] + text_block['height'])
+                text_rect = (text_block['x'], text_block['y'],
+                             text_block['x'] + text_block['width'],
+                             text_block['y'] + text_block['height'])
                 
-                # 가장 가까운 캐릭터 이미지 찾기
-                closest_character = None
-                min_distance = float('inf')
+                # 가장 가까운 캐릭터 이미지 찾기 (페이지 너비의 30% 이내)
+                closest_character, min_distance = character_grid.nearest(text_rect, page_width * 0.3)
                 
-                for char_region in layout_analysis['character_regions']:
-                    distance = self._calculate_distance(text_rect, char_region['rect'])
-                    if distance < min_distance:
-                        min_distance = distance
-                        closest_character = char_region
-                
-                if closest_character and min_distance < page_width * 0.3:  # 페이지 너비의 30% 이내
+                if closest_character:
                     layout_analysis['text_image_associations'].append({
                         'text_block': text_block,
                         'character_region': closest_character,
@@ -564,17 +628,14 @@ class UltimateImageConverter:
         """두 사각형 간의 거리를 계산합니다."""
         try:
             # 중심점 간의 거리 계산
-            center1_x = (rect1.x0 + rect1.x1) / 2
-            center1_y = (rect1.y0 + rect1.y1) / 2
-            center2_x = (rect2.x0 + rect2.x1) / 2
-            center2_y = (rect2.y0 + rect2.y1) / 2
-            
-            return ((center1_x - center2_x) ** 2 + (center1_y - center2_y) ** 2) ** 0.5
+            return center_distance(rect1, rect2)
         except Exception:
             return float('inf')
 
-    def convert_with_guaranteed_images(self, pdf_path, output_path, mode='balanced'):
-        """이미지 누락을 방지하고 원본 레이아웃을 최대한 보존하는 PDF 변환 메서드 (다중화된 추출 시스템)"""
+    def convert_with_guaranteed_images(self, pdf_path, output_path, mode='balanced', pages=None):
+        """이미지 누락을 방지하고 원본 레이아웃을 최대한 보존하는 PDF 변환 메서드 (다중화된 추출 시스템)
+
+        pages: 처리할 페이지 번호 목록 (0부터 시작, None이면 전체)"""
         if not FITZ_AVAILABLE:
             self.logger.error("PyMuPDF (fitz) 라이브러리를 사용할 수 없어 convert_with_guaranteed_images 메서드를 사용할 수 없습니다.")
             self.logger.info("대체 변환 방법을 사용하거나 PyMuPDF를 설치해주세요.")
@@ -605,10 +666,11 @@ class UltimateImageConverter:
                 
             pdf_doc = fitz.open(pdf_path)
             docx_doc = Document()
+            page_numbers = list(pages) if pages is not None else list(range(len(pdf_doc)))
             
             # 첫 번째 페이지로 문서 방향 설정
-            if len(pdf_doc) > 0:
-                first_page = pdf_doc.load_page(0)
+            if page_numbers:
+                first_page = pdf_doc.load_page(page_numbers[0])
                 page_rect = first_page.rect
                 page_width = page_rect.width
                 page_height = page_rect.height
@@ -635,7 +697,10 @@ class UltimateImageConverter:
                 section.right_margin = Inches(0.8)
             
             images_added = 0
-            for page_num in range(len(pdf_doc)):
+            # 여러 페이지에 반복되는 이미지(로고, 도장 등)는 xref별로 한 번만 추출/처리
+            processed_images = {}
+            media = media_for(docx_doc)
+            for page_num in page_numbers:
                 page = pdf_doc.load_page(page_num)
                 self.logger.info(f"\n📄 페이지 {page_num + 1} 처리 중...")
 
@@ -668,10 +733,10 @@ class UltimateImageConverter:
                             })
                 
                 # 프레젠테이션 레이아웃 분석 (캐릭터와 텍스트 연관성 분석)
+                image_list = page.get_images(full=True)
                 layout_analysis = self._analyze_presentation_layout(page, text_blocks_info, image_list)
                 
                 # 이미지들의 위치 정보 수집
-                image_list = page.get_images(full=True)
                 for img_index, img_info in enumerate(image_list):
                     # 이미지의 위치 정보 가져오기
                     img_rects = page.get_image_rects(img_info[0])
@@ -685,15 +750,13 @@ class UltimateImageConverter:
                             "index": img_index
                         })
                 
-                # 벡터 그래픽도 위치 정보와 함께 처리
-                vector_img_data = self._extract_vector_graphics(page)
-                if vector_img_data:
-                    # 벡터 그래픽을 적절한 위치에 배치
+                # 벡터 그래픽도 위치 정보와 함께 처리 (영역별로 원래 위치에 배치)
+                for region in self._extract_vector_graphics(page):
                     page_elements.append({
                         "type": "vector",
-                        "content": vector_img_data,
-                        "y_position": page.rect.height * 0.1,  # 페이지 상단 근처
-                        "bbox": (0, 0, page.rect.width, page.rect.height * 0.2)
+                        "content": region['data'],
+                        "y_position": region['bbox'][1],
+                        "bbox": region['bbox']
                     })
                 
                 # y 좌표 기준으로 정렬 (위에서 아래로)
@@ -722,13 +785,14 @@ class UltimateImageConverter:
                         img_index = element["index"]
                         self.logger.info(f"  - 이미지 {img_index + 1} 처리 시작 (위치 기반 배치)...")
                         
-                        # 강력한 이미지 추출
-                        raw_img_data = self._robust_image_extraction(pdf_doc, page, img_info)
-                        if not raw_img_data:
-                            continue
-
-                        # 안전한 이미지 처리
-                        processed_img_data = self._verify_and_process_image(raw_img_data)
+                        # 강력한 이미지 추출 + 안전한 이미지 처리 (이미 처리한 xref는 재사용)
+                        xref = img_info[0]
+                        if xref not in processed_images:
+                            raw_img_data = self._robust_image_extraction(pdf_doc, page, img_info)
+                            processed_images[xref] = self._verify_and_process_image(raw_img_data) if raw_img_data else None
+                        else:
+                            self.logger.info(f"    - 이미 추출한 이미지 재사용 (xref {xref})")
+                        processed_img_data = processed_images[xref]
                         if not processed_img_data:
                             continue
 
@@ -750,11 +814,6 @@ class UltimateImageConverter:
                             
                             run = paragraph.add_run()
                             
-                            # 임시 파일로 이미지 저장
-                            with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as temp_file:
-                                temp_file.write(processed_img_data)
-                                temp_filepath = temp_file.name
-                            
                             # 원본 이미지 크기 정보 활용
                             img = Image.open(io.BytesIO(processed_img_data))
                             aspect_ratio = img.width / img.height
@@ -794,23 +853,13 @@ class UltimateImageConverter:
                             # 최소/최대 크기 제한
                             img_width = max(Inches(0.8), min(img_width, max_width))
                             
-                            run.add_picture(temp_filepath, width=img_width)
-                            
-                            # 임시 파일 정리
-                            try:
-                                os.remove(temp_filepath)
-                            except Exception:
-                                pass
+                            # 같은 이미지는 한 번만 저장하고 배치 크기에 필요한 해상도까지만 유지
+                            media.add_docx_picture(run, processed_img_data, width=img_width)
                             
                             images_added += 1
                             self.logger.info(f"    ✅ 이미지 {img_index + 1} 삽입 성공 (위치 기반 배치)!")
                         except Exception as e:
                             self.logger.error(f"    ❌ 이미지 {img_index + 1} 삽입 실패: {e}")
-                            try:
-                                if 'temp_filepath' in locals() and os.path.exists(temp_filepath):
-                                    os.remove(temp_filepath)
-                            except Exception:
-                                pass
 
                     elif element["type"] == "vector":
                         # 벡터 그래픽 처리
@@ -831,10 +880,6 @@ class UltimateImageConverter:
                             
                             run = paragraph.add_run()
                             
-                            with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as temp_file:
-                                temp_file.write(element["content"])
-                                temp_filepath = temp_file.name
-                            
                             # 벡터 그래픽 크기를 원본 비율에 맞게 조정
                             vector_width_ratio = (bbox[2] - bbox[0]) / page.rect.width
                             section = docx_doc.sections[0]
@@ -846,12 +891,7 @@ class UltimateImageConverter:
                             vector_width = max_vector_width * min(vector_width_ratio * 1.2, 0.9)
                             vector_width = max(Inches(2), min(vector_width, max_vector_width))
                             
-                            run.add_picture(temp_filepath, width=vector_width)
-                            
-                            try:
-                                os.remove(temp_filepath)
-                            except Exception:
-                                pass
+                            media.add_docx_picture(run, element["content"], width=vector_width)
                                 
                             self.logger.info("    ✅ 벡터 그래픽 삽입 성공 (위치 기반 배치)!")
                         except Exception as e:
@@ -863,11 +903,12 @@ class UltimateImageConverter:
                 vector_count = len([e for e in page_elements if e['type'] == 'vector'])
                 self.logger.info(f"  - 총 {img_count}개의 이미지, {text_count}개의 텍스트 블록, {vector_count}개의 벡터 그래픽을 위치 기반으로 배치")
 
-                if page_num < len(pdf_doc) - 1:
+                if page_num != page_numbers[-1]:
                     docx_doc.add_page_break()
 
             pdf_doc.close()
             docx_doc.save(output_path)
+            self.logger.info(f"🗜️ {media.summary()}")
             
             # 변환 통계 출력
             success_rate = (extraction_stats['successful_extractions'] / max(extraction_stats['total_images'], 1)) * 100
@@ -1,72 +1,51 @@
+# 부팅 시간 측정을 위해 가장 먼저 import
+from engine_registry import lazy_module, engine_available, boot_report, mark_boot_complete
 from flask import Flask, request, render_template, send_file, jsonify
 from dotenv import load_dotenv
+import io
 import os
-import tempfile
 import subprocess
 import platform
 from werkzeug.utils import secure_filename
 from pdf2image import convert_from_path
 from docx import Document
-from docx.shared import Inches, Pt, RGBColor
+from docx.shared import Inches, Pt
 from docx.enum.section import WD_ORIENT, WD_SECTION
 from docx.shared import Mm
 from docx.oxml.shared import OxmlElement, qn
 from docx.oxml import parse_xml
-from docx.enum.text import WD_ALIGN_PARAGRAPH
 from PIL import Image
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
-import pytesseract
-import cv2
-import numpy as np
-import json
 import logging
 import zipfile
 
-# Adobe SDK 임포트 - 선택적 로딩 (SDK 4.2 구조)
-try:
-    # 올바른 Credentials 클래스 import (SDK 4.2)
-    from adobe.pdfservices.operation.auth.service_principal_credentials import ServicePrincipalCredentials
-    from adobe.pdfservices.operation.pdf_services import PDFServices
-    from adobe.pdfservices.operation.pdfjobs.jobs.extract_pdf_job import ExtractPDFJob
-    from adobe.pdfservices.operation.pdfjobs.params.extract_pdf.extract_pdf_params import ExtractPDFParams
-    from adobe.pdfservices.operation.pdfjobs.params.extract_pdf.extract_element_type import ExtractElementType
-    from adobe.pdfservices.operation.pdfjobs.result.extract_pdf_result import ExtractPDFResult
-    from adobe.pdfservices.operation.io.stream_asset import StreamAsset
-    from adobe.pdfservices.operation.io.cloud_asset import CloudAsset
-    
-    # ExportPDFOperation 관련 import (SDK 4.2)
-    from adobe.pdfservices.operation.pdfjobs.jobs.export_pdf_job import ExportPDFJob
-    from adobe.pdfservices.operation.pdfjobs.params.export_pdf.export_pdf_params import ExportPDFParams
-    from adobe.pdfservices.operation.pdfjobs.params.export_pdf.export_pdf_target_format import ExportPDFTargetFormat
-    from adobe.pdfservices.operation.pdfjobs.result.export_pdf_result import ExportPDFResult
-    try:
-        from adobe.pdfservices.operation.io.media_type import MediaType
-    except ImportError:
-        # SDK 버전에 따라 MediaType 경로가 다를 수 있음
-        try:
-            from adobe.pdfservices.operation.io.asset import MediaType
-        except ImportError:
-            # MediaType을 직접 정의
-            class MediaType:
-                PDF = "application/pdf"
-    # Exception 클래스들 (SDK 4.2 올바른 경로)
-    try:
-        from adobe.pdfservices.operation.exception.exceptions import ServiceApiException
-        from adobe.pdfservices.operation.exception.exceptions import ServiceUsageException
-    except ImportError:
-        # SDK 버전에 따라 exception 경로가 다를 수 있음
-        ServiceApiException = Exception
-        ServiceUsageException = Exception
-    ADOBE_SDK_AVAILABLE = True
-    print("✅ Adobe PDF Services SDK 4.2.0 로드 완료")
-except ImportError as e:
-    ADOBE_SDK_AVAILABLE = False
-    ServiceApiException = Exception
-    ServiceUsageException = Exception
-    print(f"ℹ️ Adobe PDF Services SDK 미설치 - 고급 OCR 모드로 동작: {e}")
+from font_registry import get_font_registry
+from cv_kernels import structuring_element, ones_kernel
+from scratch_space import scratch_space, current_scratch
+from extract_archive import ExtractArchive
+from structured_data import iter_pages
+from block_store import (TextBlockStore, TextBlockBuilder, as_block_store, box_overlaps,
+                         ADOBE_SCHEMA, BOX_SCHEMA)
+from document_ir import page_geometry
+from docx_styles import (ParagraphWriter, BODY, HEADING, OCR_LINE, OCR_FAINT, NOTE, STRONG, LARGE, SMALL,
+                         VECTOR_LABEL, TABLE_LABEL, CAPTION)
+from document_templates import new_document
+from output_media import media_for
+import adobe_chunked
+
+# 무거운 변환 엔진은 첫 사용 시 로드 (워커 부팅 및 헬스체크 지연 방지)
+pytesseract = lazy_module('pytesseract')
+cv2 = lazy_module('cv2')
+np = lazy_module('numpy')
+
+# Adobe SDK - 설치 여부만 확인하고 실제 import는 첫 Adobe 호출 시 수행 (SDK 4.2 구조)
+adobe = lazy_module('adobe_sdk')
+ADOBE_SDK_AVAILABLE = engine_available('adobe_sdk')
+if not ADOBE_SDK_AVAILABLE:
+    print("ℹ️ Adobe PDF Services SDK 미설치 - 고급 OCR 모드로 동작")
 
 load_dotenv()
 app = Flask(__name__, static_folder='static', static_url_path='/static')
@@ -88,12 +67,6 @@ ADOBE_CLIENT_ID = os.getenv("ADOBE_CLIENT_ID")
 ADOBE_CLIENT_SECRET = os.getenv("ADOBE_CLIENT_SECRET")
 ADOBE_ORGANIZATION_ID = os.getenv("ADOBE_ORGANIZATION_ID")
 
-# 폴더 생성
-UPLOAD_FOLDER = 'uploads'
-OUTPUT_FOLDER = 'outputs'
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-os.makedirs(OUTPUT_FOLDER, exist_ok=True)
-
 def allowed_file(filename, content_type=None):
     """파일 형식 확인 (확장자 또는 MIME 타입 기반)"""
     # 확장자로 확인
@@ -110,28 +83,9 @@ def allowed_file(filename, content_type=None):
     return False
 
 def setup_korean_fonts():
-    """한글 폰트 설정"""
+    """한글 폰트 설정 (공용 폰트 레지스트리에서 첫 사용 시 등록)"""
     try:
-        # Windows 시스템 폰트 경로들
-        font_paths = [
-            r"C:\Windows\Fonts\malgun.ttf",  # 맑은 고딕
-            r"C:\Windows\Fonts\gulim.ttc",   # 굴림
-            r"C:\Windows\Fonts\batang.ttc",  # 바탕
-            r"C:\Windows\Fonts\dotum.ttc",   # 돋움
-        ]
-        
-        for font_path in font_paths:
-            if os.path.exists(font_path):
-                try:
-                    pdfmetrics.registerFont(TTFont('Korean', font_path))
-                    print(f"한글 폰트 등록 성공: {font_path}")
-                    return True
-                except Exception as e:
-                    print(f"폰트 등록 실패: {font_path} - {e}")
-                    continue
-        
-        print("한글 폰트를 찾을 수 없습니다. 기본 폰트를 사용합니다.")
-        return False
+        return get_font_registry().korean_font() is not None
     except Exception as e:
         print(f"폰트 설정 오류: {e}")
         return False
@@ -175,11 +129,12 @@ def convert_pdf_to_docx_with_adobe(pdf_path, output_path):
             print(f"❌ PDF 파일이 존재하지 않습니다: {pdf_path}")
             return False
             
-        # 파일 크기 확인 (100MB 제한)
+        # 100MB 초과 또는 페이지가 많은 문서는 청크로 나눠 동시 변환 후 병합
         file_size = os.path.getsize(pdf_path)
-        if file_size > 100 * 1024 * 1024:
-            print(f"❌ 파일 크기가 너무 큽니다: {file_size / (1024*1024):.1f}MB")
-            return False
+        if adobe_chunked.should_chunk(pdf_path):
+            print(f"📦 대용량 PDF ({file_size / (1024*1024):.1f}MB) - 청크 분할 변환")
+            ok, _ = adobe_chunked.chunked_pdf_to_docx(pdf_path, output_path)
+            return ok
         
         # 1. Adobe API 자격 증명 설정 (SDK 4.2)
         client_id = ADOBE_CLIENT_ID
@@ -190,13 +145,13 @@ def convert_pdf_to_docx_with_adobe(pdf_path, output_path):
             return False
         
         # ServicePrincipalCredentials 사용 (SDK 4.2 올바른 방식)
-        credentials = ServicePrincipalCredentials(
+        credentials = adobe.ServicePrincipalCredentials(
             client_id=client_id,
             client_secret=client_secret
         )
         
         # 2. PDF Services 클라이언트 생성
-        pdf_services = PDFServices(credentials=credentials)
+        pdf_services = adobe.PDFServices(credentials=credentials)
         
         # 3. PDF 파일을 업로드하여 Asset 생성 (SDK 4.2 권장 방식)
         with open(pdf_path, 'rb') as file:
@@ -204,10 +159,10 @@ def convert_pdf_to_docx_with_adobe(pdf_path, output_path):
         input_asset = pdf_services.upload(input_stream=input_stream, mime_type='application/pdf')
         
         # 4. Export 파라미터 설정: DOCX 포맷으로 지정
-        export_pdf_params = ExportPDFParams(target_format=ExportPDFTargetFormat.DOCX)
+        export_pdf_params = adobe.ExportPDFParams(target_format=adobe.ExportPDFTargetFormat.DOCX)
         
         # 5. ExportPDFJob 생성
-        export_pdf_job = ExportPDFJob(
+        export_pdf_job = adobe.ExportPDFJob(
             input_asset=input_asset,
             export_pdf_params=export_pdf_params
         )
@@ -220,12 +175,12 @@ def convert_pdf_to_docx_with_adobe(pdf_path, output_path):
             
             # 6. 작업 제출 및 결과 대기 - 실제 Adobe API 실행 지점
             location = pdf_services.submit(export_pdf_job)
-            pdf_services_response = pdf_services.get_job_result(location, ExportPDFResult)
+            pdf_services_response = pdf_services.get_job_result(location, adobe.ExportPDFResult)
             
             print(">>> [DEBUG 3] execute() 호출 성공")
             conversion_success = True  # 성공했음을 표시
             
-        except ServiceApiException as e:
+        except adobe.ServiceApiException as e:
             # Adobe API 관련 에러 (가장 흔함)
             print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
             print(f"❌ Adobe ServiceApiException 발생: {e}")
@@ -332,7 +287,7 @@ def convert_pdf_to_docx_with_adobe(pdf_path, output_path):
         print(f"✅ Adobe SDK 4.2 변환 성공: {pdf_path} -> {output_path} (편집 가능한 DOCX)")
         return True
         
-    except ServiceApiException as api_error:
+    except adobe.ServiceApiException as api_error:
         print(f"❌ Adobe ExportPDF ServiceApiException 발생:")
         print(f"   - 에러 메시지: {api_error}")
         print(f"   - 에러 타입: {type(api_error)}")
@@ -397,21 +352,21 @@ def extract_with_adobe(pdf_path):
             return None
         
         # ServicePrincipalCredentials 사용 (SDK 4.2 정확한 클래스)
-        credentials = ServicePrincipalCredentials(
+        credentials = adobe.ServicePrincipalCredentials(
             client_id=client_id,
             client_secret=client_secret
         )
         
         # PDF Services 클라이언트 생성
-        pdf_services = PDFServices(credentials=credentials)
+        pdf_services = adobe.PDFServices(credentials=credentials)
         
         print(f"📤 Adobe SDK 4.2로 파일 처리 중... ({file_size / 1024:.1f}KB)")
         
         # Extract 파라미터 설정 - 텍스트와 테이블 추출 (FIGURES 오류 방지)
-        extract_pdf_params = ExtractPDFParams(
+        extract_pdf_params = adobe.ExtractPDFParams(
             elements_to_extract=[
-                ExtractElementType.TEXT,    # 텍스트 추출
-                ExtractElementType.TABLES   # 테이블 추출
+                adobe.ExtractElementType.TEXT,    # 텍스트 추출
+                adobe.ExtractElementType.TABLES   # 테이블 추출
             ]
         )
         
@@ -422,7 +377,7 @@ def extract_with_adobe(pdf_path):
         print("✅ Asset 생성 성공")
         
         # Extract 작업 생성
-        extract_pdf_job = ExtractPDFJob(
+        extract_pdf_job = adobe.ExtractPDFJob(
             input_asset=input_asset, 
             extract_pdf_params=extract_pdf_params
         )
@@ -432,8 +387,8 @@ def extract_with_adobe(pdf_path):
         # 작업 제출 및 결과 대기 (SDK 4.2 호환성 개선)
         try:
             location = pdf_services.submit(extract_pdf_job)
-            pdf_services_response = pdf_services.get_job_result(location, ExtractPDFResult)
-        except ServiceApiException as api_error:
+            pdf_services_response = pdf_services.get_job_result(location, adobe.ExtractPDFResult)
+        except adobe.ServiceApiException as api_error:
             print(f"❌ Adobe API ServiceApiException 발생:")
             print(f"   - 에러 메시지: {api_error}")
             print(f"   - 에러 타입: {type(api_error)}")
@@ -449,7 +404,7 @@ def extract_with_adobe(pdf_path):
                 print("💡 추출 가능한 텍스트가 없는 PDF (스캔된 이미지) - OCR 백업 모드로 전환")
                 return None
             return None
-        except ServiceUsageException as usage_error:
+        except adobe.ServiceUsageException as usage_error:
             print(f"❌ Adobe 사용량 오류: {usage_error}")
             return None
         except Exception as submit_error:
@@ -475,11 +430,8 @@ def extract_with_adobe(pdf_path):
             print("❌ Adobe Extract 결과 에셋이 없습니다")
             return None
         
-        # 결과를 임시 파일로 저장
-        temp_dir = tempfile.mkdtemp()
-        temp_zip_path = os.path.join(temp_dir, "extract_result.zip")
-        
-        # 결과 스트림을 파일로 저장 (SDK 4.2 올바른 방식)
+        # 결과 ZIP은 임시 파일로 저장하지 않고 메모리에서 바로 읽음
+        zip_data = None
         download_success = False
         
         # SDK 4.2의 올바른 방법: StreamAsset의 get_input_stream() 사용
@@ -502,8 +454,7 @@ def extract_with_adobe(pdf_path):
                 
                 # bytes 타입 확인 및 변환
                 if isinstance(stream_data, bytes):
-                    with open(temp_zip_path, 'wb') as temp_file:
-                        temp_file.write(stream_data)
+                    zip_data = stream_data
                     download_success = True
                     print("✅ StreamAsset.get_input_stream() 성공")
                 else:
@@ -513,8 +464,7 @@ def extract_with_adobe(pdf_path):
                     elif hasattr(stream_data, 'encode'):
                         stream_data = stream_data.encode()
                     
-                    with open(temp_zip_path, 'wb') as temp_file:
-                        temp_file.write(stream_data)
+                    zip_data = stream_data
                     download_success = True
                     print("✅ StreamAsset 데이터 변환 후 저장 성공")
             else:
@@ -535,8 +485,7 @@ def extract_with_adobe(pdf_path):
                     # bytes 데이터 확인 및 저장
                     content_data = response.content
                     if isinstance(content_data, bytes):
-                        with open(temp_zip_path, 'wb') as temp_file:
-                            temp_file.write(content_data)
+                        zip_data = content_data
                         download_success = True
                         print("✅ CloudAsset download_uri 성공")
                     else:
@@ -565,8 +514,7 @@ def extract_with_adobe(pdf_path):
                         # 다른 타입인 경우 str로 변환 후 bytes로
                         final_data = str(raw_data).encode('utf-8')
                     
-                    with open(temp_zip_path, 'wb') as temp_file:
-                        temp_file.write(final_data)
+                    zip_data = final_data
                     download_success = True
                     print("✅ Asset get_stream 성공")
                     
@@ -582,21 +530,19 @@ def extract_with_adobe(pdf_path):
             print(f"📋 result_asset 속성: {dir(result_asset)}")
             return None
         
-        print(f"📥 Adobe 결과 다운로드 완료: {os.path.getsize(temp_zip_path) / 1024:.1f}KB")
+        print(f"📥 Adobe 결과 다운로드 완료: {len(zip_data) / 1024:.1f}KB")
         
-        # ZIP에서 structuredData.json 추출 및 파싱
+        # ZIP에서 structuredData.json을 압축 해제 없이 바로 파싱
         page_blocks = []
         
         try:
-            with zipfile.ZipFile(temp_zip_path, 'r') as zip_ref:
-                file_list = zip_ref.namelist()
+            with ExtractArchive(zip_data) as archive:
+                file_list = archive.names()
                 print(f"📋 Adobe 결과 파일 목록: {file_list}")
                 
-                if 'structuredData.json' in file_list:
-                    with zip_ref.open('structuredData.json') as json_file:
-                        data = json.load(json_file)
-                        page_blocks = parse_adobe_elements(data)
-                        print(f"✅ Adobe 텍스트 추출 성공: {len(page_blocks)} 페이지")
+                if archive.has_structured_data():
+                    page_blocks = parse_adobe_elements(archive.iter_elements())
+                    print(f"✅ Adobe 텍스트 추출 성공: {len(page_blocks)} 페이지")
                 else:
                     print("⚠️ structuredData.json이 Adobe 응답에 없습니다")
                     # 다른 JSON 파일 확인
@@ -606,16 +552,6 @@ def extract_with_adobe(pdf_path):
         except zipfile.BadZipFile:
             print("❌ Adobe 응답이 유효한 ZIP 파일이 아닙니다")
         
-        # 임시 파일 정리 (안전한 정리)
-        try:
-            if os.path.exists(temp_zip_path):
-                os.unlink(temp_zip_path)
-            if os.path.exists(temp_dir):
-                import shutil
-                shutil.rmtree(temp_dir, ignore_errors=True)
-        except Exception as cleanup_error:
-            print(f"⚠️ 임시 파일 정리 오류: {cleanup_error}")
-        
         if page_blocks:
             print(f"✅ Adobe Extract 완료: {len(page_blocks)} 페이지, 총 {sum(len(blocks) for blocks in page_blocks)} 텍스트 블록")
             return page_blocks
@@ -639,262 +575,189 @@ def extract_with_adobe(pdf_path):
         elif "memory" in error_msg.lower() or "out of memory" in error_msg.lower():
             print("💡 메모리 부족 오류 - 파일 크기를 줄이거나 시스템 메모리를 확인해주세요")
         
-        # 임시 파일 정리 (오류 발생 시에도)
-        try:
-            if 'temp_zip_path' in locals() and os.path.exists(temp_zip_path):
-                os.unlink(temp_zip_path)
-            if 'temp_dir' in locals() and os.path.exists(temp_dir):
-                import shutil
-                shutil.rmtree(temp_dir, ignore_errors=True)
-        except Exception:
-            pass
-        
         return None
 
 def parse_adobe_elements(data):
-    """Adobe structuredData.json을 페이지별 텍스트 블록으로 파싱 (하이브리드 모드: 텍스트 + 벡터 이미지)"""
+    """Adobe structuredData.json을 페이지별 텍스트 블록 저장소로 파싱 (하이브리드 모드: 텍스트 + 벡터 이미지)
+
+    Args:
+        data: structuredData.json 딕셔너리 또는 요소 iterable (ExtractArchive.iter_elements 스트림)
+              - 요소를 한 번만 순회하며 페이지가 끝날 때마다 해당 페이지 저장소를 완성함
+    """
     page_blocks = []
     
     try:
-        elements = data.get('elements', [])
-        current_page_blocks = []
-        current_page = 0
-        
-        for element in elements:
-            if element.get('Page') != current_page:
-                if current_page_blocks:
-                    page_blocks.append(current_page_blocks)
-                current_page_blocks = []
-                current_page = element.get('Page', 0)
-            
-            # 텍스트 요소 처리
-            if element.get('Path') and element.get('Text'):  
-                bounds = element.get('Bounds', [])
-                text = element.get('Text', '').strip()
-                
-                if text and len(bounds) >= 4:
-                    block = {
-                        'type': 'text',
-                        'text': text,
-                        'left': bounds[0],
-                        'top': bounds[1], 
-                        'width': bounds[2] - bounds[0],
-                        'height': bounds[3] - bounds[1],
-                        'confidence': 100  # Adobe는 높은 신뢰도로 가정
-                    }
-                    current_page_blocks.append(block)
-            
-            # 이미지/그림 요소 처리 (벡터로 변환)
-            elif element.get('Path') and '/Figure' in element.get('Path', ''):
-                bounds = element.get('Bounds', [])
-                file_paths = element.get('filePaths', [])
-                
-                if len(bounds) >= 4:
-                    # 벡터 이미지 블록 생성
-                    vector_block = {
-                        'type': 'vector_image',
-                        'text': '[벡터 이미지]',  # 편집 가능한 텍스트 표현
-                        'left': bounds[0],
-                        'top': bounds[1],
-                        'width': bounds[2] - bounds[0],
-                        'height': bounds[3] - bounds[1],
-                        'confidence': 100,
-                        'file_paths': file_paths,
-                        'vector_description': f'이미지 영역 ({bounds[2] - bounds[0]:.0f}x{bounds[3] - bounds[1]:.0f}px)'
-                    }
-                    current_page_blocks.append(vector_block)
-                    print(f"🎨 벡터 이미지 요소 추가: {bounds[2] - bounds[0]:.0f}x{bounds[3] - bounds[1]:.0f}px")
-            
-            # 테이블 요소 처리
-            elif element.get('Path') and '/Table' in element.get('Path', ''):
-                bounds = element.get('Bounds', [])
-                
-                if len(bounds) >= 4:
-                    table_block = {
-                        'type': 'table',
-                        'text': '[표 영역]',  # 편집 가능한 텍스트 표현
-                        'left': bounds[0],
-                        'top': bounds[1],
-                        'width': bounds[2] - bounds[0],
-                        'height': bounds[3] - bounds[1],
-                        'confidence': 100,
-                        'table_description': f'표 영역 ({bounds[2] - bounds[0]:.0f}x{bounds[3] - bounds[1]:.0f}px)'
-                    }
-                    current_page_blocks.append(table_block)
-                    print(f"📊 테이블 요소 추가: {bounds[2] - bounds[0]:.0f}x{bounds[3] - bounds[1]:.0f}px")
-        
-        # 마지막 페이지 추가
-        if current_page_blocks:
-            page_blocks.append(current_page_blocks)
+        elements = data.get('elements', []) if isinstance(data, dict) else data
+        
+        for current_page, page_elements in iter_pages(elements):
+            current_page_blocks = TextBlockBuilder(ADOBE_SCHEMA)
+            for element in page_elements:
+                _add_adobe_element(current_page_blocks, element, current_page)
+            if len(current_page_blocks):
+                page_blocks.append(current_page_blocks.build())
             
         # 하이브리드 처리 결과 요약
-        total_text = sum(1 for page in page_blocks for block in page if block.get('type') == 'text')
-        total_vectors = sum(1 for page in page_blocks for block in page if block.get('type') == 'vector_image')
-        total_tables = sum(1 for page in page_blocks for block in page if block.get('type') == 'table')
-        print(f"🎯 하이브리드 파싱 완료: 텍스트 {total_text}개, 벡터 이미지 {total_vectors}개, 테이블 {total_tables}개")
+        totals = {'text': 0, 'vector_image': 0, 'table': 0}
+        for blocks in page_blocks:
+            for kind, count in blocks.kind_counts().items():
+                totals[kind] += count
+        print(f"🎯 하이브리드 파싱 완료: 텍스트 {totals['text']}개, 벡터 이미지 {totals['vector_image']}개, 테이블 {totals['table']}개")
             
     except Exception as e:
         print(f"Adobe 데이터 파싱 오류: {e}")
         
     return page_blocks
 
-def add_editable_text_with_adobe(doc, image, section, adobe_blocks):
-    """Adobe Extract로 추출한 텍스트를 완전히 편집 가능한 순수 텍스트로 Word 문서에 추가 (하이브리드 모드: 텍스트 + 벡터 이미지)"""
+def _add_adobe_element(current_page_blocks, element, current_page):
+    """요소 하나를 종류(텍스트/그림/표)에 따라 페이지 블록 저장소에 추가"""
+    path = element.get('Path')
+    bounds = element.get('Bounds', [])
+    if not path or len(bounds) < 4:
+        return
+    
+    # 텍스트 요소 처리 (Adobe는 높은 신뢰도로 가정)
+    if element.get('Text'):
+        text = element.get('Text', '').strip()
+        if text:
+            current_page_blocks.add(text, bounds[0], bounds[1], bounds[2], bounds[3],
+                                    page=current_page, conf=100)
+    
+    # 이미지/그림 요소 처리 (벡터로 변환, 편집 가능한 텍스트 표현)
+    elif '/Figure' in path:
+        size = f'{bounds[2] - bounds[0]:.0f}x{bounds[3] - bounds[1]:.0f}px'
+        current_page_blocks.add('[벡터 이미지]', bounds[0], bounds[1], bounds[2], bounds[3],
+                                page=current_page, conf=100, kind='vector_image',
+                                file_paths=element.get('filePaths', []),
+                                vector_description=f'이미지 영역 ({size})')
+        print(f"🎨 벡터 이미지 요소 추가: {size}")
+    
+    # 테이블 요소 처리
+    elif '/Table' in path:
+        size = f'{bounds[2] - bounds[0]:.0f}x{bounds[3] - bounds[1]:.0f}px'
+        current_page_blocks.add('[표 영역]', bounds[0], bounds[1], bounds[2], bounds[3],
+                                page=current_page, conf=100, kind='table',
+                                table_description=f'표 영역 ({size})')
+        print(f"📊 테이블 요소 추가: {size}")
+
+def add_editable_text_with_adobe(doc, page_size, section, adobe_blocks):
+    """Adobe Extract로 추출한 텍스트를 완전히 편집 가능한 순수 텍스트로 Word 문서에 추가 (하이브리드 모드: 텍스트 + 벡터 이미지)
+
+    Args:
+        page_size: PDF 페이지 크기 (width, height) pt - Adobe Bounds 좌표 변환 기준 (렌더링 불필요)
+    """
     try:
         print(f"  - 📝 Adobe 하이브리드 편집 가능 변환 시작: {len(adobe_blocks)}개 블록")
         
         if not adobe_blocks:
             print("  - ⚠️ Adobe 텍스트 블록이 없어 빈 문서 생성")
-            para = doc.add_paragraph("Adobe SDK에서 텍스트를 추출할 수 없었습니다.")
-            para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            with ParagraphWriter(doc) as writer:
+                writer.add("Adobe SDK에서 텍스트를 추출할 수 없었습니다.", BODY, alignment='center')
             return True
         
         # 블록 타입별 통계
-        text_blocks = [b for b in adobe_blocks if b.get('type') == 'text']
-        vector_blocks = [b for b in adobe_blocks if b.get('type') == 'vector_image']
-        table_blocks = [b for b in adobe_blocks if b.get('type') == 'table']
+        adobe_blocks = as_block_store(adobe_blocks, ADOBE_SCHEMA)
+        counts = adobe_blocks.kind_counts()
         
-        print(f"  - 🎯 하이브리드 처리: 텍스트 {len(text_blocks)}개, 벡터 이미지 {len(vector_blocks)}개, 테이블 {len(table_blocks)}개")
+        # Adobe Bounds는 원점이 좌하단인 PDF 좌표(pt) -> 페이지 높이로 위에서 아래로 증가하는 좌표로 변환
+        page_width, page_height = page_size or (0, 0)
+        if page_height > 0:
+            columns = adobe_blocks.columns
+            adobe_blocks = adobe_blocks.with_columns(y0=page_height - columns['y1'],
+                                                     y1=page_height - columns['y0'])
         
-        # 텍스트 블록을 Y 좌표 기준으로 정렬 (위에서 아래로)
-        sorted_blocks = sorted(adobe_blocks, key=lambda x: (x.get('top', 0), x.get('left', 0)))
+        print(f"  - 🎯 하이브리드 처리: 텍스트 {counts['text']}개, 벡터 이미지 {counts['vector_image']}개, 테이블 {counts['table']}개")
         
-        # 이미지 크기 정보 (좌표 변환용)
-        img_width, img_height = image.size if image else (1, 1)
+        # 텍스트 블록을 Y 좌표 기준으로 정렬 (위에서 아래로)
+        sorted_blocks = adobe_blocks.sorted('top', 'left')
         
         print(f"  - 📄 순수 텍스트 모드: 이미지 배경 없이 완전 편집 가능한 텍스트만 생성")
-        print(f"  - 📊 원본 이미지 크기: {img_width}x{img_height}px (좌표 변환 참조용)")
-        
-        # 문서 제목 추가 (첫 번째 텍스트 블록이 제목인 경우)
-        if sorted_blocks:
-            first_block = sorted_blocks[0]
-            first_text = first_block.get('text', '').strip()
-            
-            # 제목으로 보이는 첫 번째 텍스트 처리
-            if any(keyword in first_text for keyword in ['공문', '통지', '안내', '요청', '회신', '발명']):
-                title_para = doc.add_paragraph()
-                title_run = title_para.add_run(first_text)
-                title_run.font.name = "맑은 고딕"
-                title_run.font.size = Pt(14)
-                title_run.font.bold = True
-                title_run.font.color.rgb = RGBColor(0, 0, 0)
-                title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                title_para.paragraph_format.space_after = Pt(12)
+        print(f"  - 📊 페이지 크기: {page_width:.0f}x{page_height:.0f}pt (좌표 변환 참조용)")
+        
+        # 글꼴/크기/색은 문서에 한 번 정의한 변환 스타일로 참조 (런마다 서식을 지정하지 않음)
+        with ParagraphWriter(doc) as writer:
+            # 문서 제목 추가 (첫 번째 텍스트 블록이 제목인 경우)
+            if sorted_blocks:
+                first_block = sorted_blocks[0]
+                first_text = first_block.get('text', '').strip()
                 
-                # 제목 처리했으므로 나머지 블록만 처리
-                sorted_blocks = sorted_blocks[1:]
-                print(f"  - 📋 문서 제목 설정: '{first_text[:30]}...'")
-        
-        # 하이브리드 블록을 순수 편집 가능한 텍스트로 변환 (텍스트 + 벡터 이미지 + 테이블)
-        for i, block in enumerate(sorted_blocks):
-            text_content = block.get('text', '').strip()
-            block_type = block.get('type', 'text')
-            
-            if not text_content:
-                continue
-            
-            # 새 문단 생성 (완전 편집 가능)
-            para = doc.add_paragraph()
-            run = para.add_run(text_content)
-            
-            # 블록 타입별 서식 설정
-            if block_type == 'text':
-                # 일반 텍스트 블록
-                run.font.name = "맑은 고딕"
-                run.font.size = Pt(11)
-                run.font.color.rgb = RGBColor(0, 0, 0)
+                # 제목으로 보이는 첫 번째 텍스트 처리
+                if any(keyword in first_text for keyword in ['공문', '통지', '안내', '요청', '회신', '발명']):
+                    writer.add(first_text, HEADING)
+                    
+                    # 제목 처리했으므로 나머지 블록만 처리
+                    sorted_blocks = sorted_blocks[1:]
+                    print(f"  - 📋 문서 제목 설정: '{first_text[:30]}...'")
+            
+            # 하이브리드 블록을 순수 편집 가능한 텍스트로 변환 (텍스트 + 벡터 이미지 + 테이블)
+            for i, block in enumerate(sorted_blocks):
+                text_content = block.get('text', '').strip()
+                block_type = block.get('type', 'text')
                 
-            elif block_type == 'vector_image':
-                # 벡터 이미지 블록 - 편집 가능한 텍스트로 표현
-                run.font.name = "맑은 고딕"
-                run.font.size = Pt(10)
-                run.font.color.rgb = RGBColor(51, 102, 204)  # 파란색
-                run.font.bold = True
-                para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                if not text_content:
+                    continue
                 
-                # 벡터 설명 추가
-                if block.get('vector_description'):
-                    desc_run = para.add_run(f"\n{block['vector_description']}")
-                    desc_run.font.name = "맑은 고딕"
-                    desc_run.font.size = Pt(9)
-                    desc_run.font.color.rgb = RGBColor(102, 102, 102)  # 회색
-                    desc_run.font.italic = True
+                left_indent_pt = None
+                space_before_pt = None
+                bold = False
+                size = 11
                 
-            elif block_type == 'table':
-                # 테이블 블록 - 편집 가능한 텍스트로 표현
-                run.font.name = "맑은 고딕"
-                run.font.size = Pt(10)
-                run.font.color.rgb = RGBColor(204, 102, 51)  # 주황색
-                run.font.bold = True
-                para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                # Adobe 좌표를 기반으로 한 레이아웃 추정
+                left_ratio = block.get('left', 0) / page_width if page_width > 0 else 0
                 
-                # 테이블 설명 추가
-                if block.get('table_description'):
-                    desc_run = para.add_run(f"\n{block['table_description']}")
-                    desc_run.font.name = "맑은 고딕"
-                    desc_run.font.size = Pt(9)
-                    desc_run.font.color.rgb = RGBColor(102, 102, 102)  # 회색
-                    desc_run.font.italic = True
-            
-            # Adobe 좌표를 기반으로 한 레이아웃 추정
-            left_ratio = block.get('left', 0) / img_width if img_width > 0 else 0
-            
-            # 텍스트 정렬 및 서식 결정 (좌표 기반)
-            if left_ratio > 0.75:  # 우측 정렬 (날짜, 서명 등)
-                para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-                run.font.size = Pt(10)
-            elif 0.25 <= left_ratio <= 0.75:  # 중앙 정렬 (제목, 부제목 등)
-                para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                if any(keyword in text_content for keyword in ['제목', 'MARS', 'CONTEST']):
-                    run.font.bold = True
-                    run.font.size = Pt(12)
-            else:  # 좌측 정렬 (본문)
-                para.alignment = WD_ALIGN_PARAGRAPH.LEFT
+                # 텍스트 정렬 및 서식 결정 (좌표 기반)
+                if left_ratio > 0.75:  # 우측 정렬 (날짜, 서명 등)
+                    alignment = 'right'
+                    size = 10
+                elif 0.25 <= left_ratio <= 0.75:  # 중앙 정렬 (제목, 부제목 등)
+                    alignment = 'center'
+                    if any(keyword in text_content for keyword in ['제목', 'MARS', 'CONTEST']):
+                        bold, size = True, 12
+                else:  # 좌측 정렬 (본문)
+                    alignment = 'left'
+                    
+                    # 들여쓰기 적용 (본문 구조 반영)
+                    if text_content.startswith(('1.', '2.', '3.', '가.', '나.', '다.')):
+                        left_indent_pt = 18
+                    elif text_content.startswith(('•', '-', '○')):
+                        left_indent_pt = 36
                 
-                # 들여쓰기 적용 (본문 구조 반영)
-                if text_content.startswith(('1.', '2.', '3.', '가.', '나.', '다.')):
-                    para.paragraph_format.left_indent = Pt(18)
-                elif text_content.startswith(('•', '-', '○')):
-                    para.paragraph_format.left_indent = Pt(36)
-            
-            # 특수 텍스트 서식 적용
-            if any(keyword in text_content for keyword in ['수신', '발신', '제목', '내용']):
-                run.font.bold = True
-            elif any(keyword in text_content for keyword in ['연구소', '기관', '부서']):
-                run.font.size = Pt(12)
-                run.font.bold = True
-            elif text_content.startswith('붙임'):
-                run.font.size = Pt(10)
-                para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-            
-            # 문단 간격 설정 (자연스러운 레이아웃)
-            para.paragraph_format.line_spacing = 1.15
-            para.paragraph_format.space_after = Pt(6)
-            
-            # Y 좌표 기반 상단 여백 조정
-            if i > 0:
-                prev_block = sorted_blocks[i-1]
-                prev_bottom = prev_block.get('top', 0) + prev_block.get('height', 0)
-                current_top = block.get('top', 0)
-                y_gap = current_top - prev_bottom
+                # 특수 텍스트 서식 적용
+                if any(keyword in text_content for keyword in ['수신', '발신', '제목', '내용']):
+                    bold = True
+                elif any(keyword in text_content for keyword in ['연구소', '기관', '부서']):
+                    bold, size = True, 12
+                elif text_content.startswith('붙임'):
+                    size = 10
+                    alignment = 'left'
+                
+                # Y 좌표 기반 상단 여백 조정 (큰 간격이 있는 경우 문단 간격 추가)
+                if i > 0:
+                    prev_block = sorted_blocks[i-1]
+                    prev_bottom = prev_block.get('top', 0) + prev_block.get('height', 0)
+                    y_gap = block.get('top', 0) - prev_bottom
+                    if y_gap > 30:
+                        space_before_pt = 8
+                    elif y_gap > 15:
+                        space_before_pt = 4
                 
-                # 큰 간격이 있는 경우 문단 간격 추가
-                if y_gap > 30:
-                    para.paragraph_format.space_before = Pt(8)
-                elif y_gap > 15:
-                    para.paragraph_format.space_before = Pt(4)
+                # 블록 타입별 서식: 벡터 이미지/테이블은 편집 가능한 라벨과 설명으로 표현
+                if block_type == 'vector_image':
+                    runs = [(text_content, VECTOR_LABEL)]
+                    description = block.get('vector_description')
+                elif block_type == 'table':
+                    runs = [(text_content, TABLE_LABEL)]
+                    description = block.get('table_description')
+                else:
+                    runs = [(text_content, LARGE if size == 12 else STRONG if bold else SMALL if size == 10 else None)]
+                    description = None
+                if description:
+                    runs.append((f"\n{description}", CAPTION))
+                writer.add(runs, BODY, alignment=alignment, left_indent_pt=left_indent_pt,
+                           space_before_pt=space_before_pt)
             
-            # 완전 편집 가능하도록 표준 스타일 적용
-            para.style = doc.styles['Normal']
-        
-        # 문서 하단에 편집 안내 추가
-        footer_para = doc.add_paragraph()
-        footer_para.paragraph_format.space_before = Pt(20)
-        footer_run = footer_para.add_run("※ 이 문서의 모든 텍스트는 완전히 편집 가능합니다.")
-        footer_run.font.name = "맑은 고딕"
-        footer_run.font.size = Pt(9)
-        footer_run.font.color.rgb = RGBColor(128, 128, 128)
-        footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            # 문서 하단에 편집 안내 추가
+            writer.add("※ 이 문서의 모든 텍스트는 완전히 편집 가능합니다.", NOTE, alignment='center',
+                       space_before_pt=20)
         
         print(f"  - ✅ Adobe 순수 텍스트 변환 완료: {len(sorted_blocks)}개 블록을 완전 편집 가능한 텍스트로 변환")
         print(f"  - 🎯 편집성: 100% (이미지 배경 없음, 순수 텍스트만)")
@@ -905,8 +768,8 @@ def add_editable_text_with_adobe(doc, image, section, adobe_blocks):
         return False
 
 def add_image_with_adobe_text(doc, image, section, adobe_blocks):
-    """하위 호환성을 위한 래퍼 함수 - 새로운 편집 가능 텍스트 변환 사용"""
-    return add_editable_text_with_adobe(doc, image, section, adobe_blocks)
+    """하위 호환성을 위한 래퍼 함수 - 새로운 편집 가능 텍스트 변환 사용 (이미지 크기를 페이지 크기로 사용)"""
+    return add_editable_text_with_adobe(doc, image.size if image else None, section, adobe_blocks)
 
 def setup_tesseract():
     """Tesseract OCR 설정"""
@@ -945,28 +808,8 @@ def ocr_image_to_blocks(pil_image):
         config = r"--oem 3 --psm 6 -l kor+eng"
         data = pytesseract.image_to_data(gray, config=config,
                                          output_type=pytesseract.Output.DICT)
-        blocks = []
-        n = len(data["text"])
-        for i in range(n):
-            text = data["text"][i].strip()
-            # conf 값 안전하게 처리 (정수, 문자열, 실수 모두 고려)
-            conf_val = data["conf"][i]
-            if isinstance(conf_val, (int, float)):
-                conf = int(conf_val)
-            elif isinstance(conf_val, str) and conf_val.replace('.', '').replace('-', '').isdigit():
-                conf = int(float(conf_val))
-            else:
-                conf = -1
-            if text and conf >= 0:
-                blocks.append({
-                    "text": text,
-                    "x": data["left"][i],
-                    "y": data["top"][i],
-                    "w": data["width"][i],
-                    "h": data["height"][i],
-                    "conf": conf,
-                })
-        return blocks
+        # 단어별 dict 대신 열 기반 저장소로 변환 (conf 값은 정수/문자열/실수 모두 처리)
+        return TextBlockStore.from_tesseract(data, min_conf=0)
     except Exception as e:
         error_msg = str(e)
         print(f"❌ OCR 블록 추출 오류: {error_msg}")
@@ -1086,11 +929,11 @@ def extract_text_blocks_with_ocr(image):
         thresh = cv2.adaptiveThreshold(sharpened, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2)
         
         # 7. 모폴로지 연산으로 문자 연결성 개선 (한글 특성 고려)
-        kernel_close = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 1))  # 가로 연결
+        kernel_close = structuring_element('MORPH_RECT', (2, 1))  # 가로 연결
         closed = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel_close)
         
         # 8. 작은 노이즈 제거 (한글 문자는 보존)
-        kernel_open = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (2, 2))
+        kernel_open = structuring_element('MORPH_ELLIPSE', (2, 2))
         processed = cv2.morphologyEx(closed, cv2.MORPH_OPEN, kernel_open)
         
         # 전처리된 이미지로 OCR 수행
@@ -1117,90 +960,34 @@ def extract_text_blocks_with_ocr(image):
             print(f"  - ❌ OCR 처리 오류: {ocr_error}")
             return []
         
-        blocks = []
-        
-        # 텍스트 블록을 라인별로 그룹화 (한글 공문서 최적화)
-        lines = {}
-        valid_texts = []
-        
-        # 1단계: 유효한 텍스트만 필터링 (신뢰도 및 품질 기준 강화)
-        for i in range(len(data['text'])):
-            text = data['text'][i].strip()
-            conf = int(data['conf'][i])
-            
-            # 한글 공문서 특화 필터링 조건
-            if (conf > 30 and text and  # 신뢰도 30% 이상으로 상향
-                len(text) >= 1 and  # 1글자 이상 (한글 특성 고려)
-                not text.isspace() and  # 공백만 있는 텍스트 제외
-                len([c for c in text if c.isalnum() or c in '가-힣ㄱ-ㅎㅏ-ㅣ']) > 0):  # 의미있는 문자 포함
-                
-                valid_texts.append({
-                    'text': text,
-                    'left': data['left'][i],
-                    'top': data['top'][i],
-                    'width': data['width'][i],
-                    'height': data['height'][i],
-                    'confidence': conf
-                })
-        
-        # 2단계: 라인별 그룹화 (한글 공문서 레이아웃 고려)
-        for item in valid_texts:
-            text = item['text']
-            left = item['left']
-            top = item['top']
-            width = item['width']
-            height = item['height']
-            conf = item['confidence']
-            
-            # 동적 라인 그룹화 (텍스트 높이 기준)
-            line_tolerance = max(8, height // 3)  # 텍스트 높이의 1/3 또는 최소 8픽셀
-            line_key = round(top / line_tolerance) * line_tolerance
-            
-            if line_key not in lines:
-                lines[line_key] = {
-                    'texts': [],
-                    'positions': [],
-                    'top': top,
-                    'left': left,
-                    'width': width,
-                    'height': height,
-                    'confidence': conf
-                }
-            
-            lines[line_key]['texts'].append(text)
-            lines[line_key]['positions'].append({'left': left, 'text': text})
-            lines[line_key]['left'] = min(lines[line_key]['left'], left)
-            lines[line_key]['width'] = max(lines[line_key]['width'], left + width - lines[line_key]['left'])
-            lines[line_key]['height'] = max(lines[line_key]['height'], height)
-            lines[line_key]['confidence'] = max(lines[line_key]['confidence'], conf)
-        
-        # 3단계: 라인별 블록 생성 (한글 공문서 텍스트 순서 보존)
-        for line_key, line_data in sorted(lines.items()):
-            if line_data['texts'] and line_data['positions']:
-                # 같은 라인 내에서 좌측부터 정렬 (한글 공문서 읽기 순서)
-                sorted_positions = sorted(line_data['positions'], key=lambda x: x['left'])
-                ordered_texts = [pos['text'] for pos in sorted_positions]
-                
-                # 텍스트 결합 (한글 공문서 특성 고려)
-                combined_text = ' '.join(ordered_texts).strip()
-                
-                # 품질 검증 및 블록 생성
-                if (len(combined_text) >= 1 and  # 최소 1글자 이상
-                    not combined_text.isspace() and  # 공백만 있는 텍스트 제외
-                    line_data['confidence'] > 25):  # 신뢰도 25% 이상
-                    
-                    # 한글 공문서 특화 텍스트 정제
-                    cleaned_text = clean_korean_text(combined_text)
-                    
-                    if cleaned_text:  # 정제 후에도 유효한 텍스트가 있는 경우
-                        blocks.append({
-                            'left': line_data['left'],
-                            'top': line_data['top'],
-                            'width': line_data['width'],
-                            'height': line_data['height'],
-                            'confidence': line_data['confidence'],
-                            'text': cleaned_text
-                        })
+        # 1단계: 유효한 텍스트만 필터링 (신뢰도 30% 초과, 의미있는 문자 포함)
+        words = TextBlockStore.from_tesseract(data, min_conf=31, schema=BOX_SCHEMA)
+        meaningful = np.fromiter((any(c.isalnum() or c in '가-힣ㄱ-ㅎㅏ-ㅣ' for c in text) for text in words.texts()),
+                                 dtype=bool, count=len(words))
+        words = words.filter(meaningful)
+        
+        # 2단계: 라인별 그룹화 (동적 허용오차: 텍스트 높이의 1/3 또는 최소 8픽셀)
+        heights = words.heights
+        line_tolerance = np.maximum(8, heights // 3)
+        lines = words.group_lines(line_tolerance)
+        
+        # 3단계: 라인별 블록 생성 (한글 공문서 텍스트 순서 보존, 라인 내에서는 좌측부터)
+        columns = words.columns
+        builder = TextBlockBuilder(BOX_SCHEMA)
+        for line in lines:
+            combined_text = ' '.join(words.text(index) for index in line.tolist()).strip()
+            
+            # 품질 검증 및 블록 생성
+            if not combined_text or combined_text.isspace():
+                continue
+            # 한글 공문서 특화 텍스트 정제
+            cleaned_text = clean_korean_text(combined_text)
+            if cleaned_text:  # 정제 후에도 유효한 텍스트가 있는 경우
+                top = columns['y0'][line.min()]  # 라인에서 먼저 인식된 단어의 위치
+                builder.add(cleaned_text, columns['x0'][line].min(), top,
+                            columns['x1'][line].max(), top + heights[line].max(),
+                            conf=columns['conf'][line].max())
+        blocks = builder.build()
         
         print(f"  - OCR 텍스트 블록 {len(blocks)}개 추출됨")
         for i, block in enumerate(blocks[:3]):  # 처음 3개만 로그 출력
@@ -1357,8 +1144,7 @@ def pdf_to_docx(pdf_path, output_path):
                 adobe_blocks_per_page = extract_with_adobe(pdf_path)
                 if adobe_blocks_per_page and len(adobe_blocks_per_page) > 0:
                     total_blocks = sum(len(page_blocks) for page_blocks in adobe_blocks_per_page)
-                    text_blocks = sum(1 for page_blocks in adobe_blocks_per_page 
-                                    for block in page_blocks if block.get('type') == 'text' and block.get('text', '').strip())
+                    text_blocks = sum(page_blocks.kind_counts()['text'] for page_blocks in adobe_blocks_per_page)
                     if text_blocks > 0:
                         print(f"✅ Adobe Extract 백업 성공: {len(adobe_blocks_per_page)}페이지, {total_blocks}개 블록 추출")
                     else:
@@ -1374,20 +1160,18 @@ def pdf_to_docx(pdf_path, output_path):
             print("   - 벡터 이미지: 고품질 설명 + 편집 가능 텍스트")
             print("   - 테이블: 구조화된 편집 가능 텍스트")
             
-            # 새 Word 문서 생성 (하이브리드 모드)
-            doc = Document()
+            # 새 Word 문서 생성 (하이브리드 모드, 한글 폰트가 설정된 A4 템플릿 복사)
+            doc = new_document('a4_portrait')
             
-            # 한글 폰트 설정
-            setup_korean_font(doc)
+            # 좌표 변환용 페이지 크기 (PDF에서 직접 읽음 - 페이지 렌더링 없음)
+            pages = page_geometry(pdf_path)
             
             for i, page_blocks in enumerate(adobe_blocks_per_page):
                 print(f"페이지 {i+1}/{len(adobe_blocks_per_page)} Adobe 하이브리드 처리 중...")
                 
                 # 페이지별 블록 타입 통계
-                text_count = sum(1 for block in page_blocks if block.get('type') == 'text')
-                vector_count = sum(1 for block in page_blocks if block.get('type') == 'vector_image')
-                table_count = sum(1 for block in page_blocks if block.get('type') == 'table')
-                print(f"  - 블록 구성: 텍스트 {text_count}개, 벡터 {vector_count}개, 테이블 {table_count}개")
+                counts = page_blocks.kind_counts()
+                print(f"  - 블록 구성: 텍스트 {counts['text']}개, 벡터 {counts['vector_image']}개, 테이블 {counts['table']}개")
                 
                 # 섹션 설정 (A4 세로형 기본)
                 if i == 0:
@@ -1397,15 +1181,13 @@ def pdf_to_docx(pdf_path, output_path):
                 _set_section_orientation(section, "portrait")
                 
                 # Adobe 하이브리드 블록을 편집 가능한 텍스트로 추가
-                # 페이지별로 처리하되 첫 번째 페이지의 이미지와 섹션 정보 사용
-                if adobe_blocks_per_page:
-                    # 첫 번째 페이지 이미지 생성 (좌표 변환용)
-                    from pdf2image import convert_from_path
-                    temp_images = convert_from_path(pdf_path, dpi=200, first_page=i+1, last_page=i+1)
-                    page_image = temp_images[0] if temp_images else None
-                    
-                    add_editable_text_with_adobe(doc, page_image, section, page_blocks)
-                    print(f"  - ✅ Adobe 하이브리드 {len(page_blocks)}개 블록 편집 가능하게 추가")
+                # 블록이 없는 페이지는 건너뛰므로 페이지 번호는 블록에서 읽음
+                page_number = int(page_blocks.columns['page'][0]) if len(page_blocks) else i
+                page = pages[page_number] if 0 <= page_number < len(pages) else None
+                page_size = (page['width'], page['height']) if page else None
+                
+                add_editable_text_with_adobe(doc, page_size, section, page_blocks)
+                print(f"  - ✅ Adobe 하이브리드 {len(page_blocks)}개 블록 편집 가능하게 추가")
             
             # Adobe Extract 백업 성공 시 바로 저장하고 반환
             doc.save(output_path)
@@ -1416,8 +1198,8 @@ def pdf_to_docx(pdf_path, output_path):
             # 이미지 렌더링 (하이브리드 모드용)
             images = convert_from_path(pdf_path, dpi=200)
             
-            # 새 Word 문서 생성
-            doc = Document()
+            # 새 Word 문서 생성 (A4 템플릿 복사)
+            doc = new_document('a4_portrait')
             
             for i, image in enumerate(images):
                 print(f"페이지 {i+1}/{len(images)} 하이브리드 처리 중...")
@@ -1448,102 +1230,70 @@ def pdf_to_docx(pdf_path, output_path):
         return False
 
 def _prevent_text_overlap(text_blocks, image_regions=None, min_distance_pt=15):
-    """텍스트 블록 간 겹침 방지 및 이미지 영역과의 충돌 회피 - 개선된 분리 로직"""
-    if len(text_blocks) <= 1:
-        return text_blocks
+    """
+    텍스트 블록 간 겹침 방지 및 이미지 영역과의 충돌 회피 - 개선된 분리 로직
+
+    겹침(IoU)과 이미지 충돌 비율은 블록 저장소의 좌표 배열로 한 번에 계산한다.
+
+    Returns:
+        TextBlockStore: Y 좌표 순으로 정렬하고 위치를 조정한 블록
+    """
+    blocks = as_block_store(text_blocks)
+    if len(blocks) <= 1:
+        return blocks
     
     # Y 좌표 기준으로 정렬
-    sorted_blocks = sorted(text_blocks, key=lambda x: x['top'])
-    adjusted_blocks = []
+    blocks = blocks.sorted('top')
+    count = len(blocks)
+    x0, y0, x1 = blocks.columns['x0'], blocks.columns['y0'], blocks.columns['x1']
+    heights = blocks.heights
+    areas = blocks.areas()
     
-    print(f"  - 🔧 텍스트 블록 겹침 방지 처리: {len(sorted_blocks)}개 블록")
+    print(f"  - 🔧 텍스트 블록 겹침 방지 처리: {count}개 블록")
     
-    for i, block in enumerate(sorted_blocks):
-        overlap_detected = False
-        image_conflict = False
-        
-        # 1. 이전 텍스트 블록들과 겹침 확인
-        for prev_block in adjusted_blocks:
-            # IoU 계산을 위한 겹침 영역 확인
-            x_overlap = max(0, min(block['left'] + block['width'], prev_block['left'] + prev_block['width']) - 
-                           max(block['left'], prev_block['left']))
-            y_overlap = max(0, min(block['top'] + block['height'], prev_block['top'] + prev_block['height']) - 
-                           max(block['top'], prev_block['top']))
-            
-            if x_overlap > 0 and y_overlap > 0:
-                # 겹침 영역이 있으면 IoU 계산
-                intersection = x_overlap * y_overlap
-                block_area = block['width'] * block['height']
-                prev_area = prev_block['width'] * prev_block['height']
-                union = block_area + prev_area - intersection
-                iou = intersection / union if union > 0 else 0
-                
-                # IoU가 0.15 이상이면 겹침으로 판단 (더 엄격하게)
-                if iou > 0.15:
-                    overlap_detected = True
-                    print(f"    ⚠️ 텍스트 블록 겹침 감지: IoU={iou:.2f}")
-                    break
-        
-        # 2. 이미지 영역과의 충돌 확인 (새로 추가)
-        if image_regions and not overlap_detected:
-            for img_region in image_regions:
-                # 배경 이미지는 제외 (전체 레이아웃)
-                if img_region.get('type') == 'background':
-                    continue
-                    
-                # 이미지 영역과 텍스트 블록의 겹침 확인
-                img_x_overlap = max(0, min(block['left'] + block['width'], img_region['left'] + img_region['width']) - 
-                               max(block['left'], img_region['left']))
-                img_y_overlap = max(0, min(block['top'] + block['height'], img_region['top'] + img_region['height']) - 
-                               max(block['top'], img_region['top']))
-                
-                if img_x_overlap > 0 and img_y_overlap > 0:
-                    # 이미지 영역과 겹침 비율 계산
-                    img_intersection = img_x_overlap * img_y_overlap
-                    text_area = block['width'] * block['height']
-                    overlap_ratio = img_intersection / text_area if text_area > 0 else 0
-                    
-                    # 텍스트가 이미지 영역과 30% 이상 겹치면 충돌로 판단
-                    if overlap_ratio > 0.3:
-                        image_conflict = True
-                        print(f"    🖼️ 이미지 영역 충돌 감지: {img_region.get('type', 'unknown')} 영역과 {overlap_ratio:.1%} 겹침")
-                        break
-        
-        # 3. 겹침이나 충돌이 없으면 그대로 추가
-        if not overlap_detected and not image_conflict:
-            adjusted_blocks.append(block)
-        else:
-            # 4. 겹침이나 충돌이 있으면 위치 조정
-            adjusted_block = block.copy()
-            
-            if overlap_detected and adjusted_blocks:
-                # 텍스트 겹침: 이전 블록 아래로 이동
-                prev_block = adjusted_blocks[-1]
-                adjusted_block['top'] = prev_block['top'] + prev_block['height'] + min_distance_pt
-                print(f"    📝 텍스트 위치 조정: Y={block['top']} → Y={adjusted_block['top']}")
-            
-            elif image_conflict:
-                # 이미지 충돌: 텍스트를 이미지 영역 밖으로 이동
-                # 충돌하는 이미지 영역 찾기
-                for img_region in image_regions:
-                    if img_region.get('type') == 'background':
-                        continue
-                    
-                    img_x_overlap = max(0, min(block['left'] + block['width'], img_region['left'] + img_region['width']) - 
-                                   max(block['left'], img_region['left']))
-                    img_y_overlap = max(0, min(block['top'] + block['height'], img_region['top'] + img_region['height']) - 
-                                   max(block['top'], img_region['top']))
-                    
-                    if img_x_overlap > 0 and img_y_overlap > 0:
-                        # 이미지 영역 아래로 텍스트 이동
-                        adjusted_block['top'] = img_region['top'] + img_region['height'] + min_distance_pt
-                        print(f"    🔄 이미지 회피 조정: Y={block['top']} → Y={adjusted_block['top']}")
-                        break
-            
-            adjusted_blocks.append(adjusted_block)
+    # 1. 이미지 영역과의 충돌 (원래 위치 기준이므로 전체 블록 x 영역을 한 번에 계산, 배경 이미지는 제외)
+    regions = [r for r in (image_regions or []) if r.get('type') != 'background']
+    image_conflict = np.zeros(count, dtype=bool)
+    if regions:
+        rx0 = np.array([r['left'] for r in regions], dtype=np.float64)
+        ry0 = np.array([r['top'] for r in regions], dtype=np.float64)
+        rx1 = rx0 + np.array([r['width'] for r in regions], dtype=np.float64)
+        ry1 = ry0 + np.array([r['height'] for r in regions], dtype=np.float64)
+        x_overlap, y_overlap = box_overlaps(x0[:, None], y0[:, None], x1[:, None], (y0 + heights)[:, None],
+                                            (rx0, ry0, rx1, ry1))
+        intersection = x_overlap * y_overlap
+        with np.errstate(divide='ignore', invalid='ignore'):
+            overlap_ratio = np.where(areas[:, None] > 0, intersection / areas[:, None], 0)
+        # 텍스트가 이미지 영역과 30% 이상 겹치면 충돌로 판단
+        image_conflict = (overlap_ratio > 0.3).any(axis=1)
+        # 충돌 시 처음으로 겹치는 이미지 영역 아래로 이동
+        first_touch = np.argmax((x_overlap > 0) & (y_overlap > 0), axis=1)
+        image_escape_top = ry1[first_touch] + min_distance_pt
     
-    print(f"  - ✅ 텍스트 블록 정리 완료: {len(adjusted_blocks)}개 블록 (겹침 해결)")
-    return adjusted_blocks
+    # 2. 이전(조정된) 텍스트 블록과의 겹침 - 조정 결과가 다음 블록에 영향을 주므로 블록 순서대로 처리
+    adjusted_top = y0.copy()
+    text_moves = image_moves = 0
+    if image_conflict[0]:
+        adjusted_top[0] = image_escape_top[0]
+        image_moves += 1
+    for i in range(1, count):
+        x_overlap, y_overlap = box_overlaps(x0[i], y0[i], x1[i], y0[i] + heights[i],
+                                            (x0[:i], adjusted_top[:i], x1[:i], adjusted_top[:i] + heights[:i]))
+        intersection = x_overlap * y_overlap
+        union = areas[i] + areas[:i] - intersection
+        with np.errstate(divide='ignore', invalid='ignore'):
+            iou = np.where(union > 0, intersection / union, 0)
+        
+        # IoU가 0.15 이상이면 겹침으로 판단 (더 엄격하게): 이전 블록 아래로 이동
+        if (iou > 0.15).any():
+            adjusted_top[i] = adjusted_top[i - 1] + heights[i - 1] + min_distance_pt
+            text_moves += 1
+        elif image_conflict[i]:
+            adjusted_top[i] = image_escape_top[i]
+            image_moves += 1
+    
+    print(f"  - ✅ 텍스트 블록 정리 완료: {count}개 블록 (텍스트 겹침 조정 {text_moves}개, 이미지 회피 조정 {image_moves}개)")
+    return blocks.with_columns(y0=adjusted_top, y1=adjusted_top + heights)
 
 def _calculate_textbox_dimensions(text: str, font_size_pt=12):
     """텍스트 길이에 따른 텍스트박스 크기 계산"""
@@ -1589,9 +1339,9 @@ def detect_image_regions(image):
         logo_edges = cv2.Canny(logo_blur, 15, 60)  # 더 민감한 엣지 감지
         
         # 모폴로지 연산으로 연결된 영역 강화
-        kernel = np.ones((4, 4), np.uint8)
+        kernel = ones_kernel((4, 4))
         logo_edges = cv2.morphologyEx(logo_edges, cv2.MORPH_CLOSE, kernel)
-        logo_edges = cv2.morphologyEx(logo_edges, cv2.MORPH_DILATE, np.ones((2, 2), np.uint8))
+        logo_edges = cv2.morphologyEx(logo_edges, cv2.MORPH_DILATE, ones_kernel((2, 2)))
         
         logo_contours, _ = cv2.findContours(logo_edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
@@ -1629,9 +1379,9 @@ def detect_image_regions(image):
         stamp_edges = cv2.Canny(stamp_blur, 25, 100)
         
         # 모폴로지 연산으로 도장 형태 강화
-        kernel_stamp = np.ones((3, 3), np.uint8)
+        kernel_stamp = ones_kernel((3, 3))
         stamp_edges = cv2.morphologyEx(stamp_edges, cv2.MORPH_CLOSE, kernel_stamp)
-        stamp_edges = cv2.morphologyEx(stamp_edges, cv2.MORPH_DILATE, np.ones((2, 2), np.uint8))
+        stamp_edges = cv2.morphologyEx(stamp_edges, cv2.MORPH_DILATE, ones_kernel((2, 2)))
         
         stamp_contours, _ = cv2.findContours(stamp_edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
@@ -1657,7 +1407,7 @@ def detect_image_regions(image):
         
         # 3. 벡터 그래픽 요소 감지 (선, 도형, 표)
         # 수평선 감지 (개선)
-        horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (30, 1))
+        horizontal_kernel = structuring_element('MORPH_RECT', (30, 1))
         horizontal_lines = cv2.morphologyEx(gray, cv2.MORPH_OPEN, horizontal_kernel)
         horizontal_contours, _ = cv2.findContours(horizontal_lines, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
@@ -1677,7 +1427,7 @@ def detect_image_regions(image):
                     print(f"  - ➖ 수평선 감지: {w}x{h} at ({x},{y})")
         
         # 수직선 감지 (개선)
-        vertical_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, 30))
+        vertical_kernel = structuring_element('MORPH_RECT', (1, 30))
         vertical_lines = cv2.morphologyEx(gray, cv2.MORPH_OPEN, vertical_kernel)
         vertical_contours, _ = cv2.findContours(vertical_lines, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
@@ -1699,7 +1449,7 @@ def detect_image_regions(image):
         # 4. 기타 벡터 요소 감지 (도형, 아이콘 등)
         # 엣지 기반 도형 감지
         edges = cv2.Canny(gray, 20, 100)
-        kernel_shape = np.ones((3, 3), np.uint8)
+        kernel_shape = ones_kernel((3, 3))
         edges = cv2.morphologyEx(edges, cv2.MORPH_CLOSE, kernel_shape)
         
         shape_contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -1761,9 +1511,7 @@ def detect_document_type(image, text_blocks):
         total_area = img_width * img_height
         
         # 텍스트 영역 비율 계산
-        text_area = 0
-        for block in text_blocks:
-            text_area += block['width'] * block['height']
+        text_area = float(as_block_store(text_blocks).areas().sum())
         
         text_ratio = text_area / total_area if total_area > 0 else 0
         
@@ -1787,12 +1535,12 @@ def add_text_only_conversion(doc, image, section, text_blocks):
         
         if not text_blocks:
             print("  - ⚠️ 텍스트 블록이 없어 빈 문서 생성")
-            para = doc.add_paragraph("텍스트를 추출할 수 없었습니다.")
-            para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            with ParagraphWriter(doc) as writer:
+                writer.add("텍스트를 추출할 수 없었습니다.", BODY, alignment='center')
             return True
         
         # 텍스트 블록을 Y 좌표 기준으로 정렬
-        sorted_blocks = sorted(text_blocks, key=lambda x: (x['top'], x['left']))
+        sorted_blocks = as_block_store(text_blocks).sorted('top', 'left')
         
         # 이미지 영역 감지 (텍스트와 충돌 방지용)
         image_regions = detect_image_regions(image)
@@ -1802,64 +1550,51 @@ def add_text_only_conversion(doc, image, section, text_blocks):
         
         print(f"  - 📄 {len(adjusted_blocks)}개 텍스트 블록 처리 (공문서 특화 서식 적용)")
         
-        # 공문서 특화 텍스트 배치
-        for i, block in enumerate(adjusted_blocks):
-            para = doc.add_paragraph()
-            run = para.add_run(block['text'])
-            
-            # 공문서 표준 폰트 설정
-            run.font.name = "맑은 고딕"
-            run.font.size = Pt(11)  # 공문서 표준 크기
-            
-            # 신뢰도에 따른 색상 (편집 시 참고용)
-            if block.get('confidence', 85) < 70:
-                run.font.color.rgb = RGBColor(64, 64, 64)  # 회색 (낮은 신뢰도)
-            else:
-                run.font.color.rgb = RGBColor(0, 0, 0)  # 검정 (높은 신뢰도)
-            
-            # 원본 위치를 정확히 반영한 들여쓰기 계산
-            img_width = image.size[0]
-            page_width_pt = section.page_width.pt - section.left_margin.pt - section.right_margin.pt
-            
-            # X 좌표 비율을 페이지 너비에 적용
-            left_ratio = block['left'] / img_width if img_width > 0 else 0
-            left_indent = Pt(left_ratio * page_width_pt * 0.9)  # 90% 비율로 정확한 위치
-            
-            # 공문서 특화 문단 서식 설정
-            para.paragraph_format.left_indent = left_indent
-            para.paragraph_format.line_spacing = 1.2  # 공문서 표준 줄간격
-            para.paragraph_format.space_after = Pt(2)  # 문단 간격
-            
-            # Y 좌표를 고려한 상단 여백 설정
-            if i > 0:
-                prev_block = adjusted_blocks[i-1]
-                y_distance = block['top'] - (prev_block['top'] + prev_block['height'])
-                if y_distance > 15:  # 충분한 간격이 있는 경우
-                    para.paragraph_format.space_before = Pt(min(y_distance * 0.08, 8))
-            
-            # 텍스트 정렬 (공문서 특화)
-            text_content = block['text'].strip()
-            
-            # 제목이나 중요 텍스트 감지 (중앙 정렬)
-            if (left_ratio > 0.3 and left_ratio < 0.7) or any(keyword in text_content for keyword in ['공문', '통지', '안내', '요청', '회신']):
-                para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                run.font.bold = True  # 제목은 굵게
-            elif left_ratio > 0.7:  # 우측에 위치 (날짜, 서명 등)
-                para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-            else:  # 좌측에 위치 (본문)
-                para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-            
-            # 공문서 특수 서식 감지 및 적용
-            if '기관명' in text_content or '부서명' in text_content:
-                run.font.size = Pt(12)  # 기관명은 조금 크게
-                run.font.bold = True
-            elif any(keyword in text_content for keyword in ['수신', '발신', '제목', '내용']):
-                run.font.bold = True  # 항목명은 굵게
-            
-            # 편집 가능성을 위한 스타일 설정
-            para.style = doc.styles['Normal']  # 기본 스타일 사용으로 완전 편집 가능
-            
-            print(f"    텍스트 {i+1}: '{block['text'][:25]}...' (위치: {left_indent.pt:.1f}pt, 신뢰도: {block.get('confidence', 85)}%)")
+        # 공문서 표준 글꼴(11pt)/줄간격(1.2)/문단 간격(2pt)은 OCR 줄 스타일로 참조 (편집 가능한 표준 스타일)
+        img_width = image.size[0]
+        page_width_pt = section.page_width.pt - section.left_margin.pt - section.right_margin.pt
+        with ParagraphWriter(doc) as writer:
+            for i, block in enumerate(adjusted_blocks):
+                # 신뢰도에 따른 색상 (편집 시 참고용 - 낮은 신뢰도는 회색)
+                style = OCR_FAINT if block.get('confidence', 85) < 70 else OCR_LINE
+                
+                # X 좌표 비율을 페이지 너비에 적용 (90% 비율로 정확한 위치)
+                left_ratio = block['left'] / img_width if img_width > 0 else 0
+                left_indent_pt = left_ratio * page_width_pt * 0.9
+                
+                # Y 좌표를 고려한 상단 여백 설정 (충분한 간격이 있는 경우)
+                space_before_pt = None
+                if i > 0:
+                    prev_block = adjusted_blocks[i-1]
+                    y_distance = block['top'] - (prev_block['top'] + prev_block['height'])
+                    if y_distance > 15:
+                        space_before_pt = min(y_distance * 0.08, 8)
+                
+                # 텍스트 정렬 (공문서 특화)
+                text_content = block['text'].strip()
+                bold = False
+                
+                # 제목이나 중요 텍스트 감지 (중앙 정렬, 굵게)
+                if (left_ratio > 0.3 and left_ratio < 0.7) or any(keyword in text_content for keyword in ['공문', '통지', '안내', '요청', '회신']):
+                    alignment = 'center'
+                    bold = True
+                elif left_ratio > 0.7:  # 우측에 위치 (날짜, 서명 등)
+                    alignment = 'right'
+                else:  # 좌측에 위치 (본문)
+                    alignment = 'left'
+                
+                # 공문서 특수 서식 감지 (기관명은 조금 크게, 항목명은 굵게)
+                if '기관명' in text_content or '부서명' in text_content:
+                    char_style = LARGE
+                elif bold or any(keyword in text_content for keyword in ['수신', '발신', '제목', '내용']):
+                    char_style = STRONG
+                else:
+                    char_style = None
+                
+                writer.add(block['text'], style, alignment=alignment, char_style=char_style,
+                           left_indent_pt=left_indent_pt, space_before_pt=space_before_pt)
+                
+                print(f"    텍스트 {i+1}: '{block['text'][:25]}...' (위치: {left_indent_pt:.1f}pt, 신뢰도: {block.get('confidence', 85)}%)")
         
         print(f"  - ✅ 공문서 텍스트 전용 변환 완료: {len(adjusted_blocks)}개 블록 (완벽한 서식 보존 + 완전 편집 가능)")
         return True
@@ -1886,28 +1621,18 @@ def add_hybrid_conversion(doc, image, section, text_blocks):
         
         # 1. 배경 이미지 추가 (원본 레이아웃 보존)
         print("  - 🖼️ 배경 이미지 추가 (원본 레이아웃 보존)")
-        temp_path = None
-        try:
-            with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as tmp:
-                temp_path = tmp.name
-                image.save(temp_path, 'JPEG', quality=95, optimize=True)
-            
-            # 배경 이미지를 문서에 추가
-            doc.add_picture(temp_path, width=fit_w, height=fit_h)
-            
-        finally:
-            if temp_path and os.path.exists(temp_path):
-                try:
-                    os.unlink(temp_path)
-                except Exception:
-                    pass
+        buffer = io.BytesIO()
+        image.save(buffer, 'JPEG', quality=95, optimize=True)
+        
+        # 배경 이미지를 문서에 추가 (같은 페이지 이미지는 한 번만 저장, 배치 크기보다 큰 이미지만 축소)
+        media_for(doc).add_docx_picture(doc, buffer.getvalue(), width=fit_w, height=fit_h)
         
         # 2. 편집 가능한 텍스트 블록 추가
         if text_blocks:
             print(f"  - ✏️ 편집 가능한 텍스트 블록 {len(text_blocks)}개 추가")
             
             # 텍스트 블록을 Y 좌표 기준으로 정렬
-            sorted_blocks = sorted(text_blocks, key=lambda x: (x['top'], x['left']))
+            sorted_blocks = as_block_store(text_blocks).sorted('top', 'left')
             
             # 이미지 영역 감지 (텍스트와 충돌 방지용)
             image_regions = detect_image_regions(image)
@@ -1915,97 +1640,64 @@ def add_hybrid_conversion(doc, image, section, text_blocks):
             # 겹침 방지 및 이미지 영역 충돌 회피 적용
             adjusted_blocks = _prevent_text_overlap(sorted_blocks, image_regions)
             
-            # 각 텍스트 블록을 편집 가능한 문단으로 추가
-            for i, block in enumerate(adjusted_blocks):
-                para = doc.add_paragraph()
-                run = para.add_run(block['text'])
-                
-                # 한글 폰트 설정
-                run.font.name = "맑은 고딕"
-                run.font.size = Pt(11)  # 공문서 표준 크기
-                
-                # 신뢰도에 따른 색상 (편집 시 참고용)
-                if block.get('confidence', 85) < 70:
-                    run.font.color.rgb = RGBColor(64, 64, 64)  # 회색 (낮은 신뢰도)
-                else:
-                    run.font.color.rgb = RGBColor(0, 0, 0)  # 검정 (높은 신뢰도)
-                
-                # 정확한 위치 매핑을 위한 고정밀 스케일링 계산
-                img_width, img_height = image.size
-                page_width_pt = section.page_width.pt - section.left_margin.pt - section.right_margin.pt
-                page_height_pt = section.page_height.pt - section.top_margin.pt - section.bottom_margin.pt
-                
-                # 이미지가 페이지에 맞춰진 실제 크기 계산 (고정밀)
-                dpi = 200
-                img_w_in = img_width / dpi
-                img_h_in = img_height / dpi
-                max_w_in = page_width_pt / 72.0  # pt to inch (정확한 변환)
-                max_h_in = page_height_pt / 72.0  # pt to inch (정확한 변환)
-                
-                # 비율 유지하며 맞춤 (고정밀 계산)
-                scale_x = max_w_in / img_w_in
-                scale_y = max_h_in / img_h_in
-                scale = min(scale_x, scale_y)  # 비율 유지를 위한 최소값 사용
-                
-                actual_img_width_pt = img_w_in * scale * 72.0  # inch to pt (정확한 변환)
-                actual_img_height_pt = img_h_in * scale * 72.0  # inch to pt (정확한 변환)
-                
-                # 정확한 X, Y 좌표 매핑 (픽셀 단위 정밀도)
-                x_scale = actual_img_width_pt / img_width
-                y_scale = actual_img_height_pt / img_height
-                
-                # 텍스트 블록의 실제 위치 계산 (픽셀 → pt 고정밀 변환)
-                actual_left_pt = block['left'] * x_scale
-                actual_top_pt = block['top'] * y_scale
-                
-                # 위치 정확도 보정 (공문서 특화)
-                # 좌측 여백 보정 (공문서 표준 여백 고려)
-                left_margin_correction = 5.0  # pt 단위 미세 조정
-                actual_left_pt = max(0, actual_left_pt - left_margin_correction)
-                
-                # 들여쓰기 설정 (페이지 여백 고려)
-                left_indent = Pt(min(actual_left_pt, page_width_pt * 0.95))  # 최대 95%까지만
-                
-                # 문단 서식 설정 (공문서 특화)
-                para.paragraph_format.left_indent = left_indent
-                para.paragraph_format.line_spacing = 1.2  # 공문서 표준 줄간격
-                para.paragraph_format.space_after = Pt(2)  # 문단 간격
-                
-                # Y 좌표를 고려한 정확한 상단 여백 설정
-                if i > 0:
-                    prev_block = adjusted_blocks[i-1]
-                    prev_actual_top = prev_block['top'] * y_scale
-                    prev_actual_height = prev_block['height'] * y_scale
-                    current_actual_top = actual_top_pt
+            # 정확한 위치 매핑을 위한 고정밀 스케일링 계산 (모든 블록에 공통)
+            img_width, img_height = image.size
+            page_width_pt = section.page_width.pt - section.left_margin.pt - section.right_margin.pt
+            page_height_pt = section.page_height.pt - section.top_margin.pt - section.bottom_margin.pt
+            
+            # 이미지가 페이지에 맞춰진 실제 크기 계산 (비율 유지를 위해 작은 배율 사용)
+            img_w_in = img_width / dpi
+            img_h_in = img_height / dpi
+            scale = min((page_width_pt / 72.0) / img_w_in, (page_height_pt / 72.0) / img_h_in)
+            
+            # 정확한 X, Y 좌표 매핑 (픽셀 → pt)
+            x_scale = img_w_in * scale * 72.0 / img_width
+            y_scale = img_h_in * scale * 72.0 / img_height
+            
+            # 각 텍스트 블록을 편집 가능한 문단으로 추가 (글꼴/줄간격/문단 간격은 OCR 줄 스타일로 참조)
+            with ParagraphWriter(doc) as writer:
+                for i, block in enumerate(adjusted_blocks):
+                    # 신뢰도에 따른 색상 (편집 시 참고용 - 낮은 신뢰도는 회색)
+                    style = OCR_FAINT if block.get('confidence', 85) < 70 else OCR_LINE
                     
-                    # 실제 픽셀 거리를 pt로 변환
-                    y_distance_pt = current_actual_top - (prev_actual_top + prev_actual_height)
-                    if y_distance_pt > 10:  # 10pt 이상 간격이 있는 경우
-                        para.paragraph_format.space_before = Pt(min(y_distance_pt * 0.6, 15))  # 최대 15pt
-                
-                # 정확한 위치 기반 텍스트 정렬 결정
-                left_ratio = actual_left_pt / page_width_pt if page_width_pt > 0 else 0
-                text_width_pt = len(block['text']) * 6  # 대략적인 텍스트 폭 추정
-                text_center_ratio = (actual_left_pt + text_width_pt/2) / page_width_pt
-                
-                # 더 정확한 정렬 판단
-                if 0.4 <= text_center_ratio <= 0.6:  # 텍스트 중심이 페이지 중앙 부근
-                    para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                elif left_ratio > 0.75:  # 우측에 위치 (날짜, 서명 등)
-                    para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-                else:  # 좌측에 위치 (본문)
-                    para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                
-                # 공문서 특수 텍스트 감지 및 서식 적용
-                text_content = block['text'].strip()
-                if any(keyword in text_content for keyword in ['공문', '통지', '안내', '요청', '제목']):
-                    para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    run.font.bold = True
-                    run.font.size = Pt(12)
-                elif any(keyword in text_content for keyword in ['수신', '발신', '내용']):
-                    run.font.bold = True
-                
-                print(f"    텍스트 {i+1}: '{block['text'][:25]}...' (위치: {left_indent.pt:.1f}pt, Y: {actual_top_pt:.1f}pt, 신뢰도: {block.get('confidence', 85)}%)")
+                    # 텍스트 블록의 실제 위치 계산 (좌측 여백 5pt 미세 보정, 최대 95%까지만 들여쓰기)
+                    actual_left_pt = max(0, block['left'] * x_scale - 5.0)
+                    actual_top_pt = block['top'] * y_scale
+                    left_indent_pt = min(actual_left_pt, page_width_pt * 0.95)
+                    
+                    # Y 좌표를 고려한 정확한 상단 여백 설정 (10pt 이상 간격이 있는 경우, 최대 15pt)
+                    space_before_pt = None
+                    if i > 0:
+                        prev_block = adjusted_blocks[i-1]
+                        y_distance_pt = actual_top_pt - (prev_block['top'] + prev_block['height']) * y_scale
+                        if y_distance_pt > 10:
+                            space_before_pt = min(y_distance_pt * 0.6, 15)
+                    
+                    # 정확한 위치 기반 텍스트 정렬 결정
+                    left_ratio = actual_left_pt / page_width_pt if page_width_pt > 0 else 0
+                    text_width_pt = len(block['text']) * 6  # 대략적인 텍스트 폭 추정
+                    text_center_ratio = (actual_left_pt + text_width_pt/2) / page_width_pt
+                    
+                    if 0.4 <= text_center_ratio <= 0.6:  # 텍스트 중심이 페이지 중앙 부근
+                        alignment = 'center'
+                    elif left_ratio > 0.75:  # 우측에 위치 (날짜, 서명 등)
+                        alignment = 'right'
+                    else:  # 좌측에 위치 (본문)
+                        alignment = 'left'
+                    
+                    # 공문서 특수 텍스트 감지 및 서식 적용
+                    text_content = block['text'].strip()
+                    char_style = None
+                    if any(keyword in text_content for keyword in ['공문', '통지', '안내', '요청', '제목']):
+                        alignment = 'center'
+                        char_style = LARGE
+                    elif any(keyword in text_content for keyword in ['수신', '발신', '내용']):
+                        char_style = STRONG
+                    
+                    writer.add(block['text'], style, alignment=alignment, char_style=char_style,
+                               left_indent_pt=left_indent_pt, space_before_pt=space_before_pt)
+                    
+                    print(f"    텍스트 {i+1}: '{block['text'][:25]}...' (위치: {left_indent_pt:.1f}pt, Y: {actual_top_pt:.1f}pt, 신뢰도: {block.get('confidence', 85)}%)")
         
         print(f"  - ✅ 공문서 하이브리드 변환 완료: 원본 레이아웃 완벽 보존 + {len(text_blocks)}개 텍스트 블록 편집 가능")
         return True
@@ -2031,76 +1723,17 @@ def add_image_only_conversion(doc, image, section):
         fit_w, fit_h = _fit_dimensions_within(max_w_in, max_h_in, img_w_in, img_h_in)
         
         # 원본 이미지만 추가 (편집 불가)
-        temp_path = None
-        try:
-            with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as tmp:
-                temp_path = tmp.name
-                image.save(temp_path, 'JPEG', quality=90, optimize=True)
-            
-            # 이미지를 직접 문서에 추가
-            doc.add_picture(temp_path, width=fit_w, height=fit_h)
-            print("  - ✅ 이미지 전용 변환 완료: 원본 이미지만 유지")
-            
-        finally:
-            if temp_path and os.path.exists(temp_path):
-                try:
-                    os.unlink(temp_path)
-                except Exception:
-                    pass
-                    
-        return True
-        
-    except Exception as e:
-        print(f"  - ❌ 이미지 전용 변환 오류: {e}")
-        return False
-
-def _add_textbox_paragraph(doc, left_pt: float, top_pt: float, width_pt: float, height_pt: float, text: str):
-    """완전 편집 가능한 텍스트 문단 추가 (공문서 특화)"""
-    try:
-        # 텍스트 정리
-        clean_text = (text or "").strip()
-        if not clean_text:
-            return True
+        buffer = io.BytesIO()
+        image.save(buffer, 'JPEG', quality=90, optimize=True)
         
-        # 문단 생성
-        para = doc.add_paragraph()
-        run = para.add_run(clean_text)
-        
-        # 공문서 표준 폰트 설정
-        run.font.name = "맑은 고딕"
-        run.font.size = Pt(11)  # 공문서 표준 크기
-        run.font.color.rgb = RGBColor(0, 0, 0)  # 검정색
-        
-        # 위치 기반 들여쓰기 계산 (left_pt를 기준으로)
-        # A4 페이지 기준 (595pt 너비)
-        page_width_pt = 595
-        left_ratio = left_pt / page_width_pt if page_width_pt > 0 else 0
-        left_indent = Pt(left_ratio * page_width_pt * 0.85)  # 85% 비율로 정확한 위치
-        
-        # 문단 서식 설정 (공문서 특화)
-        para.paragraph_format.left_indent = left_indent
-        para.paragraph_format.line_spacing = 1.2  # 공문서 표준 줄간격
-        para.paragraph_format.space_after = Pt(2)  # 문단 간격
-        
-        # 텍스트 정렬 (위치에 따른 자동 정렬)
-        if left_ratio > 0.3 and left_ratio < 0.7:  # 중앙 부근
-            para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        elif left_ratio > 0.7:  # 우측
-            para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        else:  # 좌측
-            para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        
-        # Y 위치에 따른 상단 여백 설정
-        if top_pt > 50:  # 페이지 상단이 아닌 경우
-            para.paragraph_format.space_before = Pt(min(top_pt * 0.02, 8))
-        
-        # 편집 가능성을 위한 스타일 설정
-        para.style = doc.styles['Normal']  # 기본 스타일 사용으로 완전 편집 가능
+        # 이미지를 직접 문서에 추가 (같은 페이지 이미지는 한 번만 저장, 배치 크기보다 큰 이미지만 축소)
+        media_for(doc).add_docx_picture(doc, buffer.getvalue(), width=fit_w, height=fit_h)
+        print("  - ✅ 이미지 전용 변환 완료: 원본 이미지만 유지")
         
         return True
         
     except Exception as e:
-        print(f"텍스트 문단 추가 오류: {e}")
+        print(f"  - ❌ 이미지 전용 변환 오류: {e}")
         return False
 
 def docx_to_pdf(docx_path, output_path):
@@ -2110,6 +1743,7 @@ def docx_to_pdf(docx_path, output_path):
         
         # 한글 폰트 설정
         font_setup = setup_korean_fonts()
+        korean_font = get_font_registry().korean_font_name()
         
         # DOCX 문서 읽기
         doc = Document(docx_path)
@@ -2121,7 +1755,7 @@ def docx_to_pdf(docx_path, output_path):
         
         # 한글 폰트 사용
         if font_setup:
-            c.setFont("Korean", 12)
+            c.setFont(korean_font, 12)
         else:
             c.setFont("Helvetica", 12)
         
@@ -2145,7 +1779,7 @@ def docx_to_pdf(docx_path, output_path):
                         c.showPage()
                         y_position = height - 50
                         if font_setup:
-                            c.setFont("Korean", 12)
+                            c.setFont(korean_font, 12)
                         else:
                             c.setFont("Helvetica", 12)
                     
@@ -2173,6 +1807,11 @@ def static_files(filename):
 
 @app.route('/convert', methods=['POST'])
 def convert_file():
+    # 요청 전용 스크래치 디렉토리 (tmpfs, 용량 초과 시 디스크) - 응답 후 모두 삭제
+    with scratch_space('convert'):
+        return _convert_file()
+
+def _convert_file():
     try:
         print("=== 변환 요청 시작 ===")
         
@@ -2245,7 +1884,7 @@ def convert_file():
                 filename = filename.rsplit('.', 1)[0] + '.docx'
             print(f"확장자 보정: {filename}")
         
-        file_path = os.path.join(UPLOAD_FOLDER, filename)
+        file_path = current_scratch().path(filename, size_hint=request.content_length or 0)
         file.save(file_path)
         print(f"파일 저장 완료: {file_path}")
         
@@ -2278,14 +1917,14 @@ def convert_file():
             if file_ext == 'pdf':
                 # PDF → DOCX
                 output_filename = base_name + '.docx'
-                output_path = os.path.join(OUTPUT_FOLDER, output_filename)
+                output_path = current_scratch().path(output_filename)
                 print(f"PDF → DOCX 변환: {file_path} → {output_path}")
                 success = pdf_to_docx(file_path, output_path)
                 
             elif file_ext == 'docx':
                 # DOCX → PDF
                 output_filename = base_name + '.pdf'
-                output_path = os.path.join(OUTPUT_FOLDER, output_filename)
+                output_path = current_scratch().path(output_filename)
                 print(f"DOCX → PDF 변환: {file_path} → {output_path}")
                 success = docx_to_pdf(file_path, output_path)
             else:
@@ -2336,10 +1975,22 @@ def convert_file():
         traceback.print_exc()
         return jsonify({'success': False, 'error': f'서버 오류: {str(e)}'}), 500
 
+@app.route('/health')
+def health():
+    """헬스체크 (변환 엔진을 로드하지 않음)"""
+    return 'ok', 200
+
+@app.route('/health/boot')
+def health_boot():
+    """워커 부팅 보고서 (부팅 소요 시간, 로드된/지연된 변환 엔진)"""
+    return jsonify(boot_report())
+
 @app.errorhandler(413)
 def too_large(e):
     return jsonify({'success': False, 'error': '파일 크기가 100MB를 초과합니다.'}), 413
 
+mark_boot_complete()
+
 if __name__ == '__main__':
     print("🚀 PDF ↔ DOCX 변환기 시작")
     print("📍 서버 주소: http://127.0.0.1:5000")